@@ -18,17 +18,32 @@ along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 """
 import json
+import time
 
 from django.conf import settings
 from django.utils import timezone
 
-from app.utils import get_location_from_ip
-from dashboard.models import Tip, UserAction
+from dashboard.unclaimed import get_unclaimed_counts, get_unclaimed_kudos, get_unclaimed_tips
 from dashboard.utils import _get_utm_from_cookie
-from kudos.models import KudosTransfer
+from dashboard.visits import RECORD_VISIT_EVERY_N_SECONDS, record_visit
 from retail.helpers import get_ip
 
-RECORD_VISIT_EVERY_N_SECONDS = 60 * 60
+STAT_CACHE_SECONDS = 60 * 5
+
+_stats = {}
+
+
+def get_cached_stat(key):
+    """Get the latest value of a stat, kept in the memory of the process for `STAT_CACHE_SECONDS`."""
+    value, expires_at = _stats.get(key, (None, 0))
+    if time.time() >= expires_at:
+        from marketing.utils import get_stat
+        try:
+            value = get_stat(key)
+        except Exception:
+            value = None
+        _stats[key] = (value, time.time() + STAT_CACHE_SECONDS)
+    return value
 
 
 def preprocess(request):
@@ -38,9 +53,8 @@ def preprocess(request):
     if request.path == '/lbcheck':
         return {}
 
-    from marketing.utils import get_stat
     try:
-        num_slack = int(get_stat('slack_users'))
+        num_slack = int(get_cached_stat('slack_users'))
     except Exception:
         num_slack = 0
     if num_slack > 1000:
@@ -48,24 +62,14 @@ def preprocess(request):
 
     user_is_authenticated = request.user.is_authenticated
     profile = request.user.profile if user_is_authenticated and hasattr(request.user, 'profile') else None
-    email_subs = profile.email_subscriptions if profile else None
-    email_key = email_subs.first().priv if user_is_authenticated and email_subs and email_subs.exists() else ''
+    email_sub = profile.email_subscriptions.first() if profile else None
+    email_key = email_sub.priv if email_sub else ''
     if user_is_authenticated and profile and profile.pk:
-        record_visit = not profile.last_visit or profile.last_visit < (
+        record_visit_now = not profile.last_visit or profile.last_visit < (
             timezone.now() - timezone.timedelta(seconds=RECORD_VISIT_EVERY_N_SECONDS)
         )
-        if record_visit:
-            ip_address = get_ip(request)
-            profile.last_visit = timezone.now()
-            profile.save()
-            UserAction.objects.create(
-                user=request.user,
-                profile=profile,
-                action='Visit',
-                location_data=get_location_from_ip(ip_address),
-                ip_address=ip_address,
-                utm=_get_utm_from_cookie(request),
-            )
+        if record_visit_now:
+            record_visit(profile, get_ip(request), _get_utm_from_cookie(request))
     context = {
         'STATIC_URL': settings.STATIC_URL,
         'MEDIA_URL': settings.MEDIA_URL,
@@ -93,18 +97,8 @@ def preprocess(request):
     context['json_context'] = json.dumps(context)
 
     if context['github_handle']:
-        context['unclaimed_tips'] = Tip.objects.filter(
-            expires_date__gte=timezone.now(),
-            receive_txid='',
-            username__iexact=context['github_handle'],
-            web3_type='v3',
-        ).send_happy_path()
-        context['unclaimed_kudos'] = KudosTransfer.objects.filter(
-            receive_txid='', username__iexact="@" + context['github_handle'], web3_type='v3',
-        ).send_happy_path()
-
-        if not settings.DEBUG:
-            context['unclaimed_tips'] = context['unclaimed_tips'].filter(network='mainnet')
-            context['unclaimed_kudos'] = context['unclaimed_kudos'].filter(network='mainnet')
+        num_tips, num_kudos = get_unclaimed_counts(context['github_handle'])
+        context['unclaimed_tips'] = get_unclaimed_tips(context['github_handle']) if num_tips else []
+        context['unclaimed_kudos'] = get_unclaimed_kudos(context['github_handle']) if num_kudos else []
 
     return context
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""Define the shared GeoIP resolver.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import logging
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.gis.geoip2.resources import City
+
+import geoip2.database
+from geoip2.errors import AddressNotFoundError
+from maxminddb import MODE_MMAP
+
+logger = logging.getLogger(__name__)
+
+
+class GeoIPResolver:
+    """Resolve IP addresses to locations with database readers opened once per process.
+
+    Each MaxMind database is opened the first time it is needed and memory mapped, and
+    the last `max_entries` lookups are kept in an LRU cache keyed by database and IP.
+
+    Args:
+        path (str): The directory holding the databases. Defaults to `settings.GEOIP_PATH`.
+        max_entries (int): The number of lookups to keep.
+
+    """
+
+    def __init__(self, path=None, max_entries=10000):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.RLock()
+        self._readers = {}
+        self._lookups = OrderedDict()
+
+    def get_db_path(self, name):
+        path = self.path if self.path is not None else settings.GEOIP_PATH
+        return f'{path}{name}'
+
+    def get_reader(self, db):
+        reader = self._readers.get(db)
+        if reader is None:
+            with self._lock:
+                reader = self._readers.get(db)
+                if reader is None:
+                    reader = self._readers[db] = geoip2.database.Reader(db, mode=MODE_MMAP)
+        return reader
+
+    def lookup(self, db, method, ip_address):
+        key = (db, ip_address)
+        with self._lock:
+            if key in self._lookups:
+                self._lookups.move_to_end(key)
+                return self._lookups[key]
+        try:
+            result = getattr(self.get_reader(db), method)(ip_address)
+        except AddressNotFoundError:
+            result = None
+        with self._lock:
+            self._lookups[key] = result
+            while len(self._lookups) > self.max_entries:
+                self._lookups.popitem(last=False)
+        return result
+
+    def city(self, ip_address):
+        """Get the location of an IP address, as `django.contrib.gis.geoip2.GeoIP2.city` does.
+
+        Returns:
+            dict: The location, or an empty dict if it is unknown or can't be read.
+
+        """
+        if not ip_address:
+            return {}
+        try:
+            response = self.lookup(self.get_db_path(getattr(settings, 'GEOIP_CITY', 'GeoLite2-City.mmdb')), 'city',
+                                   ip_address)
+        except Exception as e:
+            logger.warning(f'Encountered ({e}) while attempting to retrieve a user\'s geolocation')
+            return {}
+        return City(response) if response else {}
+
+    def country(self, ip_address, db=None):
+        """Get the geoip2 country record of an IP address.
+
+        Returns:
+            geoip2.models.Country: The record, or an empty dict if it is unknown or can't be read.
+
+        """
+        if not ip_address:
+            return {}
+        try:
+            response = self.lookup(db or self.get_db_path('GeoLite2-Country.mmdb'), 'country', ip_address)
+        except Exception as e:
+            logger.warning(f'Encountered ({e}) while attempting to retrieve a user\'s geolocation')
+            return {}
+        return response or {}
+
+    def lookup_many(self, ip_addresses):
+        """Get the locations of many IP addresses.
+
+        Returns:
+            dict: IP address => location, as `city` returns it.
+
+        """
+        return {ip_address: self.city(ip_address) for ip_address in set(ip_addresses)}
+
+    def clear(self):
+        with self._lock:
+            for reader in self._readers.values():
+                reader.close()
+            self._readers = {}
+            self._lookups = OrderedDict()
+
+
+geoip_resolver = GeoIPResolver()
@@ -0,0 +1,62 @@
+'''
+    Copyright (C) 2019 Gitcoin Core
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+'''
+
+import random
+import time
+
+from django.contrib.gis.geoip2 import GeoIP2
+from django.core.management.base import BaseCommand
+
+from app.geoip import GeoIPResolver
+from geoip2.errors import AddressNotFoundError
+
+
+def city_per_call(ip_address):
+    # what get_location_from_ip did: open the city database on every call
+    try:
+        return GeoIP2().city(ip_address)
+    except AddressNotFoundError:
+        return {}
+
+
+class Command(BaseCommand):
+
+    help = 'benchmarks GeoIP lookups with a database opened per call against the shared resolver'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--lookups', default=2000, type=int, help="The number of lookups per run")
+        parser.add_argument('--ips', default=500, type=int, help="The number of distinct IP addresses")
+
+    def handle(self, *args, **options):
+        rng = random.Random(0)
+        ip_addresses = [
+            '.'.join(str(rng.randint(1, 223)) for __ in range(4)) for __ in range(options['ips'])
+        ]
+        lookups = [rng.choice(ip_addresses) for __ in range(options['lookups'])]
+
+        unmemoized, memoized, batched = GeoIPResolver(max_entries=0), GeoIPResolver(), GeoIPResolver()
+        for name, fn in [
+            ('database opened per call', lambda: [city_per_call(ip_address) for ip_address in lookups]),
+            ('shared reader, no memoization', lambda: [unmemoized.city(ip_address) for ip_address in lookups]),
+            ('shared reader, memoized', lambda: [memoized.city(ip_address) for ip_address in lookups]),
+            ('lookup_many', lambda: batched.lookup_many(lookups)),
+        ]:
+            start_time = time.time()
+            fn()
+            elapsed = time.time() - start_time
+            print(f'{name}: {len(lookups)} lookups in {round(elapsed, 2)}s => {round(len(lookups) / elapsed)}/sec')
@@ -532,6 +532,9 @@ X_FRAME_OPTIONS = env('X_FRAME_OPTIONS', default='DENY')
 CONTACT_EMAIL = env('CONTACT_EMAIL', default='')  # TODO
 PERSONAL_CONTACT_EMAIL = env('PERSONAL_CONTACT_EMAIL', default='you@foo.bar')
 SENDGRID_API_KEY = env('SENDGRID_API_KEY', default='')  # TODO - Required to send email.
+SENDGRID_API_HOST = env('SENDGRID_API_HOST', default='https://api.sendgrid.com')
+BULK_MAIL_REQUESTS_PER_SECOND = env.float('BULK_MAIL_REQUESTS_PER_SECOND', default=10)
+BULK_MAIL_MAX_WORKERS = env.int('BULK_MAIL_MAX_WORKERS', default=4)
 EMAIL_HOST = env('EMAIL_HOST', default='smtp.sendgrid.net')
 EMAIL_HOST_USER = env('EMAIL_HOST_USER', default='')  # TODO
 EMAIL_HOST_PASSWORD = env('EMAIL_HOST_PASSWORD', default='')  # TODO
@@ -691,6 +694,10 @@ GITHUB_EVENT_HOOK_URL = env('GITHUB_EVENT_HOOK_URL', default='github/payload/')
 
 # Web3
 WEB3_HTTP_PROVIDER = env('WEB3_HTTP_PROVIDER', default='https://rinkeby.infura.io')
+WEB3_TIMEOUT = env.int('WEB3_TIMEOUT', default=10)
+WEB3_POOL_SIZE = env.int('WEB3_POOL_SIZE', default=20)
+WEB3_MAX_RETRIES = env.int('WEB3_MAX_RETRIES', default=3)
+WEB3_RETRY_BACKOFF = env.float('WEB3_RETRY_BACKOFF', default=0.3)
 
 # COLO Coin
 COLO_ACCOUNT_ADDRESS = env('COLO_ACCOUNT_ADDRESS', default='')  # TODO
@@ -705,9 +712,20 @@ IPFS_GATEWAY_PORT = env.int('IPFS_GATEWAY_PORT', default=8080)
 IPFS_SWARM_WS_PORT = env.int('IPFS_SWARM_WS_PORT', default=8081)
 IPFS_API_ROOT = env('IPFS_API_ROOT', default='/api/v0')
 IPFS_API_SCHEME = env('IPFS_API_SCHEME', default='https')
+IPFS_CACHE_MAX_LOCAL_ENTRIES = env.int('IPFS_CACHE_MAX_LOCAL_ENTRIES', default=10000)
+IPFS_CACHE_TIMEOUT = env.int('IPFS_CACHE_TIMEOUT', default=60 * 60 * 24 * 30)
 
 STABLE_COINS = ['DAI', 'USDT', 'TUSD']
 
+# How often (in seconds) each process checks for new conversion rates
+CONVERSION_RATE_INDEX_CHECK_INTERVAL = env.int('CONVERSION_RATE_INDEX_CHECK_INTERVAL', default=60)
+
+# How long (in seconds) each process keeps the approved tokens in memory
+TOKEN_REGISTRY_TTL = env.int('TOKEN_REGISTRY_TTL', default=300)
+
+# Keep leaderboards up to date in redis as bounties, tips and kudos change state
+LEADERBOARD_INCREMENTAL = env.bool('LEADERBOARD_INCREMENTAL', default=True)
+
 # Silk Profiling and Performance Monitoring
 ENABLE_SILK = env.bool('ENABLE_SILK', default=False)
 if ENABLE_SILK:
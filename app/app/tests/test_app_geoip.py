@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""Handle GeoIP resolver related tests.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import geoip2.models
+from app.geoip import GeoIPResolver
+from dashboard.models import Profile, UserAction
+from geoip2.errors import AddressNotFoundError
+from test_plus.test import TestCase
+
+BERLIN = {
+    'city': {'names': {'en': 'Berlin'}},
+    'continent': {'code': 'EU', 'names': {'en': 'Europe'}},
+    'country': {'iso_code': 'DE', 'names': {'en': 'Germany'}},
+}
+
+
+class FakeReader:
+
+    def __init__(self):
+        self.lookups = []
+
+    def city(self, ip_address):
+        self.lookups.append(ip_address)
+        if ip_address == '10.0.0.1':
+            raise AddressNotFoundError(ip_address)
+        return geoip2.models.City(BERLIN)
+
+
+class GeoIPResolverTest(TestCase):
+    """Define tests for the GeoIP resolver."""
+
+    def setUp(self):
+        self.reader = FakeReader()
+        self.resolver = GeoIPResolver(path='/geoip/', max_entries=2)
+        self.resolver._readers['/geoip/GeoLite2-City.mmdb'] = self.reader
+
+    def test_city(self):
+        """Test that lookups return the GeoIP2.city dicts and are memoized in a bounded LRU."""
+        location = self.resolver.city('1.2.3.4')
+        assert location['city'] == 'Berlin'
+        assert location['country_name'] == 'Germany'
+        assert location['continent_code'] == 'EU'
+        assert self.resolver.city('10.0.0.1') == {}
+        assert self.resolver.city(None) == {}
+
+        self.resolver.city('1.2.3.4')
+        self.resolver.city('5.6.7.8')  # evicts 10.0.0.1
+        self.resolver.city('10.0.0.1')
+        assert self.reader.lookups == ['1.2.3.4', '10.0.0.1', '5.6.7.8', '10.0.0.1']
+
+    def test_lookup_many(self):
+        """Test that lookup_many resolves each distinct address once."""
+        locations = self.resolver.lookup_many(['1.2.3.4', '1.2.3.4', '10.0.0.1'])
+        assert locations['1.2.3.4']['city'] == 'Berlin'
+        assert locations['10.0.0.1'] == {}
+        assert sorted(self.reader.lookups) == ['1.2.3.4', '10.0.0.1']
+
+    def test_user_action_location_columns(self):
+        """Test that the location columns of user actions follow their location data."""
+        profile = Profile.objects.create(handle='fred', data={})
+        action = UserAction.objects.create(
+            profile=profile, action='Login', location_data=self.resolver.city('1.2.3.4'), ip_address='1.2.3.4',
+        )
+        assert (action.city, action.country_name, action.continent_code) == ('Berlin', 'Germany', 'EU')
+        assert profile.is_eu
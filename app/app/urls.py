@@ -50,6 +50,7 @@ import revenue.views
 import tdi.views
 from avatar.router import router as avatar_router
 from dashboard.router import router as dbrouter
+from dashboard.router import router_v1 as dbrouter_v1
 from grants.router import router as grant_router
 from kudos.router import router as kdrouter
 from wagtail.admin import urls as wagtailadmin_urls
@@ -102,6 +103,7 @@ urlpatterns = [
     ),
     url(r'^api/v0.1/faucet/save/?', faucet.views.save_faucet, name='save_faucet'),
     url(r'^api/v0.1/', include(dbrouter.urls)),
+    url(r'^api/v1/', include(dbrouter_v1.urls)),
     url(r'^api/v0.1/', include(kdrouter.urls)),
     url(r'^api/v0.1/', include(grant_router.urls)),
     url(r'^api/v0.1/', include(avatar_router.urls)),
@@ -7,18 +7,16 @@ from hashlib import sha1
 
 from django.conf import settings
 from django.contrib.auth.models import User
-from django.contrib.gis.geoip2 import GeoIP2
 from django.db.models import Lookup
 from django.db.models.fields import Field
 from django.utils import timezone
 from django.utils.translation import LANGUAGE_SESSION_KEY
 
-import geoip2.database
 import requests
+from app.geoip import geoip_resolver
 from avatar.models import SocialAvatar
 from avatar.utils import get_user_github_avatar_image
 from dashboard.models import Profile
-from geoip2.errors import AddressNotFoundError
 from git.utils import _AUTH, HEADERS, get_user
 from ipware.ip import get_real_ip
 from marketing.utils import get_or_save_email_subscriber
@@ -336,39 +334,12 @@ def get_location_from_ip(ip_address):
         dict: The GeoIP location data dictionary.
 
     """
-    city = {}
-    if not ip_address:
-        return city
-
-    try:
-        geo = GeoIP2()
-        try:
-            city = geo.city(ip_address)
-        except AddressNotFoundError:
-            pass
-    except Exception as e:
-        logger.warning(f'Encountered ({e}) while attempting to retrieve a user\'s geolocation')
-    return city
+    return geoip_resolver.city(ip_address)
 
 
 def get_country_from_ip(ip_address, db=None):
     """Get the user's country information from the provided IP address."""
-    country = {}
-    if db is None:
-        db = f'{settings.GEOIP_PATH}GeoLite2-Country.mmdb'
-
-    if not ip_address:
-        return country
-
-    try:
-        reader = geoip2.database.Reader(db)
-        country = reader.country(ip_address)
-    except AddressNotFoundError:
-        pass
-    except Exception as e:
-        logger.warning(f'Encountered ({e}) while attempting to retrieve a user\'s geolocation')
-
-    return country
+    return geoip_resolver.country(ip_address, db=db)
 
 
 def clean_str(string):
@@ -23,9 +23,9 @@ from django.utils.html import format_html
 from django.utils.safestring import mark_safe
 
 from .models import (
-    Activity, BlockedUser, Bounty, BountyFulfillment, BountySyncRequest, CoinRedemption, CoinRedemptionRequest,
-    Interest, LabsResearch, Profile, SearchHistory, Tip, TokenApproval, Tool, ToolVote, UserAction,
-    UserVerificationModel,
+    Activity, BlockedUser, Bounty, BountyFulfillment, BountyKeyword, BountyStats, BountySyncRequest, CoinRedemption,
+    CoinRedemptionRequest, Interest, LabsResearch, Profile, ProfileQuarterlyStats, ProfileStats, SearchHistory, Tip,
+    TokenApproval, Tool, ToolVote, UserAction, UserVerificationModel,
 )
 
 
@@ -36,6 +36,31 @@ class BountyFulfillmentAdmin(admin.ModelAdmin):
     ordering = ['-id']
 
 
+class BountyKeywordAdmin(admin.ModelAdmin):
+    raw_id_fields = ['bounty']
+    search_fields = ['normalized_keyword']
+    ordering = ['-id']
+    list_display = ['created_on', '__str__']
+
+
+class BountyStatsAdmin(admin.ModelAdmin):
+    raw_id_fields = ['bounty']
+    ordering = ['-id']
+    list_display = ['created_on', '__str__']
+
+
+class ProfileStatsAdmin(admin.ModelAdmin):
+    raw_id_fields = ['profile']
+    ordering = ['-id']
+    list_display = ['modified_on', '__str__', 'stale']
+
+
+class ProfileQuarterlyStatsAdmin(admin.ModelAdmin):
+    raw_id_fields = ['profile']
+    ordering = ['-id']
+    list_display = ['modified_on', '__str__']
+
+
 class GeneralAdmin(admin.ModelAdmin):
     ordering = ['-id']
     list_display = ['created_on', '__str__']
@@ -165,8 +190,12 @@ admin.site.register(BlockedUser, GeneralAdmin)
 admin.site.register(UserAction, UserActionAdmin)
 admin.site.register(Interest, InterestAdmin)
 admin.site.register(Profile, ProfileAdmin)
+admin.site.register(ProfileStats, ProfileStatsAdmin)
+admin.site.register(ProfileQuarterlyStats, ProfileQuarterlyStatsAdmin)
 admin.site.register(Bounty, BountyAdmin)
 admin.site.register(BountyFulfillment, BountyFulfillmentAdmin)
+admin.site.register(BountyKeyword, BountyKeywordAdmin)
+admin.site.register(BountyStats, BountyStatsAdmin)
 admin.site.register(BountySyncRequest, GeneralAdmin)
 admin.site.register(Tip, TipAdmin)
 admin.site.register(TokenApproval, TokenApprovalAdmin)
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""Define the concurrent, batched StandardBounties fetcher used by sync_geth.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+
+import requests
+from dashboard.rpc import (
+    JSONRPCBatchClient, JSONRPCError, decode_contract_result, encode_contract_call, get_endpoint_uri,
+)
+from dashboard.utils import BountyNotFoundException, assemble_bounty, getBountyContract, ipfs_cat
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+BOUNTY_CALLS = ['getBounty', 'getBountyData', 'getBountyArbiter', 'getBountyToken', 'getNumFulfillments']
+
+
+class BountyFetcher:
+    """Fetch bounties from the StandardBounties contract and IPFS concurrently.
+
+    `get_bounty` makes 5 + N sequential RPC calls and N + 1 blocking IPFS reads per
+    bounty.  This fetcher reads the contract state for `batch_size` bounties in two
+    JSON-RPC batch requests (bounty fields, then fulfillments), spreads those batches and
+    the IPFS reads over a pool of `workers` threads, and assembles the same dicts that
+    `get_bounty` returns so that `web3_process_bounty` semantics are unchanged.
+
+    """
+
+    def __init__(self, network, workers=8, batch_size=25, contract=None, rpc_client=None, ipfs_cat_fn=None):
+        self.network = network
+        self.workers = max(1, int(workers))
+        self.batch_size = max(1, int(batch_size))
+        self.contract = contract or getBountyContract(network)
+        if rpc_client is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            rpc_client = JSONRPCBatchClient(get_endpoint_uri(self.contract.web3), session=session)
+        self.rpc = rpc_client
+        self.ipfs_cat = ipfs_cat_fn or ipfs_cat
+
+    def fetch(self, bounty_ids):
+        """Fetch the provided bounty ids.
+
+        Returns:
+            list: (bounty_id, result) tuples in the order requested, where result is either
+                the bounty dict or the exception raised while fetching it.
+
+        """
+        if (settings.DEBUG or settings.ENV != 'prod') and self.network == 'mainnet':
+            # mirror get_bounty, which returns {} if env isn't prod and the network is mainnet.
+            return [(bounty_id, {}) for bounty_id in bounty_ids]
+
+        groups = [bounty_ids[i:i + self.batch_size] for i in range(0, len(bounty_ids), self.batch_size)]
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            raw = {}
+            for group_raw in executor.map(self._read_contract, groups):
+                raw.update(group_raw)
+
+            # IPFS payloads are immutable, so each hash only needs to be read once
+            hashes = set()
+            for item in raw.values():
+                if isinstance(item, dict):
+                    hashes.add(item['data'])
+                    hashes.update(fulfillment[3] for fulfillment in item['fulfillments'])
+            hashes = list(hashes)
+            payloads = dict(zip(hashes, executor.map(self.ipfs_cat, hashes)))
+
+        results = []
+        for bounty_id in bounty_ids:
+            item = raw[bounty_id]
+            if isinstance(item, Exception):
+                results.append((bounty_id, item))
+                continue
+            try:
+                fulfillments = [fulfillment + (payloads.get(fulfillment[3]), ) for fulfillment in item['fulfillments']]
+                bounty = assemble_bounty(
+                    bounty_id, self.network, item['details'], item['arbiter'], item['token'],
+                    payloads.get(item['data']), fulfillments
+                )
+                results.append((bounty_id, bounty))
+            except Exception as e:
+                results.append((bounty_id, e))
+        return results
+
+    def iter_bounties(self, start_id, end_id):
+        """Yield (bounty_id, result) for every bounty from start_id to end_id inclusive.
+
+        Iteration stops after the first BountyNotFoundException, which is yielded so the
+        caller can react to the end of the bounty list the same way it would with get_bounty.
+
+        """
+        chunk_size = self.workers * self.batch_size
+        bounty_id = int(start_id)
+        while bounty_id <= int(end_id):
+            chunk = list(range(bounty_id, min(bounty_id + chunk_size, int(end_id) + 1)))
+            for _id, result in self.fetch(chunk):
+                yield _id, result
+                if isinstance(result, BountyNotFoundException):
+                    return
+            bounty_id += chunk_size
+
+    def _read_contract(self, bounty_ids):
+        calls = []
+        for bounty_id in bounty_ids:
+            calls += [encode_contract_call(self.contract, fn_name, [bounty_id]) for fn_name in BOUNTY_CALLS]
+
+        raw = {}
+        try:
+            responses = self.rpc.batch(calls)
+        except Exception as e:
+            return {bounty_id: e for bounty_id in bounty_ids}
+
+        fulfillment_calls = []
+        for i, bounty_id in enumerate(bounty_ids):
+            try:
+                response = responses[i * len(BOUNTY_CALLS)]
+                if isinstance(response, JSONRPCError):
+                    # past the last bounty the call reverts, which some nodes report as an error, others as 0x
+                    if response.is_reverted:
+                        raise BountyNotFoundException
+                    # e.g. rate limits or timeouts, which only fail this bounty
+                    raise response
+                decoded = [
+                    decode_contract_result(self.contract, fn_name, responses[i * len(BOUNTY_CALLS) + j])
+                    for j, fn_name in enumerate(BOUNTY_CALLS)
+                ]
+                details, data, arbiter, token, num_fulfillments = decoded
+                if details is None:
+                    raise BountyNotFoundException
+                raw[bounty_id] = {
+                    'details': details,
+                    'data': data,
+                    'arbiter': arbiter,
+                    'token': token,
+                    'fulfillments': [],
+                }
+                for fulfill_enum in range(int(num_fulfillments or 0)):
+                    fulfillment_calls.append((bounty_id, fulfill_enum))
+            except Exception as e:
+                raw[bounty_id] = e
+
+        if fulfillment_calls:
+            try:
+                responses = self.rpc.batch([
+                    encode_contract_call(self.contract, 'getFulfillment', [bounty_id, fulfill_enum])
+                    for bounty_id, fulfill_enum in fulfillment_calls
+                ])
+            except Exception as e:
+                responses = [e] * len(fulfillment_calls)
+
+            for (bounty_id, fulfill_enum), response in zip(fulfillment_calls, responses):
+                if isinstance(raw[bounty_id], Exception):
+                    continue
+                try:
+                    accepted, fulfiller, data = decode_contract_result(self.contract, 'getFulfillment', response)
+                    raw[bounty_id]['fulfillments'].append((fulfill_enum, accepted, fulfiller, data))
+                except Exception as e:
+                    raw[bounty_id] = e
+
+        return raw
@@ -108,9 +108,8 @@ def embed(request):
     try:
         badge = request.GET.get('badge', False)
         if badge:
-            open_bounties = Bounty.objects.current() \
+            open_bounties = Bounty.objects.current().for_github_url(repo_url) \
                 .filter(
-                    github_url__startswith=repo_url,
                     network='mainnet',
                     idx_status__in=['open']
                 )
@@ -159,9 +158,8 @@ def embed(request):
 
         # get issues
         length = request.GET.get('len', 10)
-        super_bounties = Bounty.objects.current() \
+        super_bounties = Bounty.objects.current().for_github_url(repo_url) \
             .filter(
-                github_url__startswith=repo_url,
                 network='mainnet',
                 idx_status__in=['open', 'started', 'submitted']
             ).order_by('-_val_usd_db')
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""Define the content-addressed IPFS payload cache.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import logging
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+class IPFSCache:
+    """Cache IPFS payloads by their content hash.
+
+    The payload behind an IPFS hash never changes, so once it has been read it can be
+    served from memory (an in-process LRU) or from the shared django cache (redis)
+    instead of going back to the network.
+
+    """
+
+    key_prefix = 'ipfs_cat'
+
+    def __init__(self, max_local_entries=None, timeout=None):
+        self.max_local_entries = max_local_entries or settings.IPFS_CACHE_MAX_LOCAL_ENTRIES
+        self.timeout = timeout or settings.IPFS_CACHE_TIMEOUT
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    def stats(self):
+        total = self.local_hits + self.shared_hits + self.misses
+        return {
+            'local_hits': self.local_hits,
+            'shared_hits': self.shared_hits,
+            'misses': self.misses,
+            'hit_rate': round((self.local_hits + self.shared_hits) / total, 4) if total else 0,
+        }
+
+    def get(self, key, fetch):
+        """Get the payload for an IPFS hash, calling `fetch(key)` on a cache miss.
+
+        Failed fetches (None or an IPFS error message) are never cached.
+
+        """
+        if not key:
+            return fetch(key)
+
+        with self._lock:
+            if key in self._local:
+                self._local.move_to_end(key)
+                self.local_hits += 1
+                return self._local[key]
+
+        cache_key = f'{self.key_prefix}_{key}'
+        try:
+            payload = cache.get(cache_key)
+        except Exception as e:
+            logger.warning(f'IPFS cache read failed - ({e})')
+            payload = None
+
+        if payload is not None:
+            with self._lock:
+                self.shared_hits += 1
+            self._set_local(key, payload)
+            return payload
+
+        with self._lock:
+            self.misses += 1
+        payload = fetch(key)
+        if payload is None or 'Failed to get block' in str(payload):
+            return payload
+
+        try:
+            cache.set(cache_key, payload, self.timeout)
+        except Exception as e:
+            logger.warning(f'IPFS cache write failed - ({e})')
+        self._set_local(key, payload)
+        return payload
+
+    def _set_local(self, key, payload):
+        with self._lock:
+            self._local[key] = payload
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_local_entries:
+                self._local.popitem(last=False)
+
+
+ipfs_cache = IPFSCache()
@@ -0,0 +1,38 @@
+'''
+    Copyright (C) 2019 Gitcoin Core
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+'''
+from django.core.management.base import BaseCommand
+from django.db.models import Max
+
+from dashboard.models import Bounty, BountyKeyword
+
+
+class Command(BaseCommand):
+
+    help = 'tags the bounties with the keywords of their metadata'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', dest='batch_size', default=1000, type=int)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        bounties = Bounty.objects.only('pk', 'metadata')
+        max_pk = bounties.aggregate(Max('pk'))['pk__max'] or 0
+
+        for start in range(0, max_pk + 1, batch_size):
+            BountyKeyword.refresh(bounties.filter(pk__gte=start, pk__lt=start + batch_size))
+        print(f'tagged {BountyKeyword.objects.values("bounty_id").distinct().count()} bounties')
@@ -0,0 +1,50 @@
+'''
+    Copyright (C) 2019 Gitcoin Core
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+'''
+from django.core.management.base import BaseCommand
+from django.db.models import Max
+
+from dashboard.models import Bounty, Tip
+from dashboard.revaluation import bulk_update
+from git.utils import parse_github_url
+
+FIELDS = ['github_org', 'github_repo', 'github_issue_number']
+
+
+class Command(BaseCommand):
+
+    help = 'parses the github org, repo and issue number columns of the bounties and tips from their github url'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', dest='batch_size', default=1000, type=int)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        for model in [Bounty, Tip]:
+            objs = model.objects.only('pk', 'github_url', *FIELDS)
+            max_pk = objs.aggregate(Max('pk'))['pk__max'] or 0
+
+            updated = 0
+            for start in range(0, max_pk + 1, batch_size):
+                changed = []
+                for obj in objs.filter(pk__gte=start, pk__lt=start + batch_size):
+                    parts = parse_github_url(obj.github_url)
+                    if parts != tuple(getattr(obj, field) for field in FIELDS):
+                        obj.github_org, obj.github_repo, obj.github_issue_number = parts
+                        changed.append(obj)
+                updated += bulk_update(model, changed, FIELDS)
+            print(f'updated the github columns of {updated} {model._meta.verbose_name_plural}')
@@ -0,0 +1,43 @@
+'''
+    Copyright (C) 2019 Gitcoin Core
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+'''
+from django.core.management.base import BaseCommand
+from django.db.models import Max
+
+from dashboard.models import Bounty
+
+
+class Command(BaseCommand):
+
+    help = 'computes the full-text search vectors of the bounties'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', dest='batch_size', default=1000, type=int)
+        parser.add_argument('--missing', action='store_true', help="Only compute the vectors which were never computed")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        bounties = Bounty.objects.all()
+        if options['missing']:
+            bounties = bounties.filter(search_vector__isnull=True)
+        max_pk = bounties.aggregate(Max('pk'))['pk__max'] or 0
+
+        updated = 0
+        # one UPDATE per pk range, so that no single transaction locks the whole table
+        for start in range(0, max_pk + 1, batch_size):
+            updated += bounties.filter(pk__gte=start, pk__lt=start + batch_size).update_search_vectors()
+        print(f'computed the search vectors of {updated} bounties')
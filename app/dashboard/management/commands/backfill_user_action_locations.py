@@ -0,0 +1,51 @@
+'''
+    Copyright (C) 2019 Gitcoin Core
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+'''
+from django.core.management.base import BaseCommand
+from django.db.models import Max
+
+from dashboard.models import UserAction
+from dashboard.revaluation import bulk_update
+
+
+class Command(BaseCommand):
+
+    help = 'fills the city, country and continent columns of the user actions, resolving the missing locations'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', dest='batch_size', default=1000, type=int)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        actions = UserAction.objects.only('pk', 'ip_address', 'location_data', *UserAction.LOCATION_FIELDS)
+        max_pk = actions.aggregate(Max('pk'))['pk__max'] or 0
+
+        normalized = resolved = 0
+        for start in range(0, max_pk + 1, batch_size):
+            changed, unresolved = [], []
+            for action in actions.filter(pk__gte=start, pk__lt=start + batch_size):
+                if not action.location_data:
+                    unresolved.append(action)
+                    continue
+                columns = [getattr(action, field) for field in UserAction.LOCATION_FIELDS]
+                action.normalize_location()
+                if columns != [getattr(action, field) for field in UserAction.LOCATION_FIELDS]:
+                    changed.append(action)
+            normalized += bulk_update(UserAction, changed, UserAction.LOCATION_FIELDS)
+            UserAction.resolve_locations(unresolved)
+            resolved += len([action for action in unresolved if action.location_data])
+        print(f'normalized the locations of {normalized} user actions, resolved {resolved} new locations')
@@ -0,0 +1,104 @@
+'''
+    Copyright (C) 2019 Gitcoin Core
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+'''
+
+import random
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from dashboard.models import Bounty, BountyKeyword
+
+WORDS = [
+    'python', 'javascript', 'solidity', 'rust', 'golang', 'react', 'design', 'documentation', 'security', 'audit',
+    'frontend', 'backend', 'wallet', 'token', 'contract', 'bug', 'feature', 'refactor', 'test', 'ui', 'api',
+    'ethereum', 'ipfs', 'layer', 'scaling', 'plasma', 'oracle', 'governance', 'dao', 'bounty', 'grant', 'kudos',
+    'explorer', 'dashboard', 'mobile', 'android', 'ios', 'translation', 'video', 'tutorial', 'blog', 'logo',
+]
+ORGS = ['gitcoinco', 'ethereum', 'MetaMask', 'ipfs', 'status-im', 'makerdao', 'aragon', 'giveth']
+TOKENS = ['ETH', 'DAI', 'GIT', 'USDT', 'ANT', 'SNT']
+
+
+def text(rng, length):
+    return ' '.join(rng.choice(WORDS) for __ in range(length))
+
+
+class Command(BaseCommand):
+
+    help = 'benchmarks bounty keyword search (icontains) against full-text search on a synthetic dataset'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--bounties', default=100000, type=int, help="The number of synthetic bounties")
+        parser.add_argument('--runs', default=3, type=int, help="The number of times each query is timed")
+
+    def handle(self, *args, **options):
+        # everything is rolled back at the end
+        with transaction.atomic():
+            self.create_bounties(options['bounties'])
+            for query in ['solidity', 'documentation', 'plasma oracle']:
+                print(f'query "{query}":')
+                with connection.cursor() as cursor:
+                    # the plan the icontains lookups got before they were backed by trigram indexes
+                    cursor.execute('SET LOCAL enable_bitmapscan = off; SET LOCAL enable_indexscan = off;')
+                self.time('keyword, sequential scan', lambda: Bounty.objects.keyword(query).count(), options['runs'])
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_bitmapscan = on; SET LOCAL enable_indexscan = on;')
+                self.time('keyword, trigram indexes', lambda: Bounty.objects.keyword(query).count(), options['runs'])
+                self.time('search, tsvector index', lambda: Bounty.objects.search(query, rank=False).count(),
+                          options['runs'])
+                self.time('search, ranked top 25', lambda: len(Bounty.objects.search(query)[:25]), options['runs'])
+            transaction.set_rollback(True)
+
+    def create_bounties(self, num_bounties):
+        rng = random.Random(0)
+        now = timezone.now()
+        start_time = time.time()
+        for offset in range(0, num_bounties, 5000):
+            Bounty.objects.bulk_create([
+                Bounty(
+                    title=text(rng, 6),
+                    issue_description=text(rng, 150),
+                    metadata={'issueKeywords': ', '.join(rng.sample(WORDS, 3))},
+                    github_url=f'https://github.com/{rng.choice(ORGS)}/repo/issues/{i}',
+                    token_name=rng.choice(TOKENS),
+                    token_address='0x0',
+                    value_in_token=10 ** 18,
+                    web3_created=now - timedelta(minutes=i),
+                    bounty_owner_github_username='benchmark',
+                    is_open=True,
+                    expires_date=now + timedelta(days=30),
+                    raw_data={},
+                    current_bounty=True,
+                    network='benchmark',
+                ) for i in range(offset, min(offset + 5000, num_bounties))
+            ])
+        Bounty.objects.filter(network='benchmark').update_search_vectors()
+        BountyKeyword.refresh(Bounty.objects.filter(network='benchmark').only('pk', 'metadata'))
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE dashboard_bounty')
+        print(f'created {num_bounties} bounties in {round(time.time() - start_time, 2)}s')
+
+    def time(self, name, fn, runs):
+        timings = []
+        for __ in range(runs):
+            start_time = time.time()
+            result = fn()
+            timings.append(time.time() - start_time)
+        print(f' - {name}: {result} results, best of {runs} {round(min(timings) * 1000, 1)}ms')
@@ -0,0 +1,126 @@
+'''
+    Copyright (C) 2019 Gitcoin Core
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+'''
+
+import time
+import tracemalloc
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from dashboard.models import Activity, Bounty, BountyFulfillment, Interest, Profile, Tip
+from dashboard.router import BountyDictSerializer, BountySerializer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+
+class Command(BaseCommand):
+
+    help = 'benchmarks serializing bounties with BountySerializer against BountyDictSerializer'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--bounties', default=1000, type=int, help="The number of synthetic bounties")
+
+    def handle(self, *args, **options):
+        request = Request(APIRequestFactory().get('/api/v0.1/bounties/'))
+        # everything is rolled back at the end
+        with transaction.atomic():
+            self.create_bounties(options['bounties'])
+            bounties = Bounty.objects.filter(network='benchmark').order_by('-web3_created')
+            old_bounties = bounties.prefetch_related('fulfillments', 'interested', 'interested__profile', 'activities')
+            context = {'request': request}
+            self.measure(
+                'BountySerializer, prefetched relations',
+                lambda: BountySerializer(old_bounties.all(), many=True, context=context).data,
+            )
+            self.measure(
+                'BountySerializer, with_api_relations',
+                lambda: BountySerializer(bounties.with_api_relations(), many=True, context=context).data,
+            )
+            self.measure(
+                'BountyDictSerializer, with_api_relations',
+                lambda: BountyDictSerializer(bounties.with_api_relations(), request).data,
+            )
+            transaction.set_rollback(True)
+
+    def create_bounties(self, num_bounties):
+        now = timezone.now()
+        start_time = time.time()
+        profiles = Profile.objects.bulk_create([
+            Profile(handle=f'benchmark{i}', data={}) for i in range(100)
+        ])
+        bounties = Bounty.objects.bulk_create([
+            Bounty(
+                title=f'bounty {i}',
+                github_url=f'https://github.com/benchmark/repo/issues/{i}',
+                github_org='benchmark',
+                github_repo='repo',
+                github_issue_number=i,
+                token_name='ETH',
+                token_address='0x0',
+                value_in_token=10 ** 18,
+                web3_created=now - timedelta(minutes=i),
+                bounty_owner_github_username='benchmark',
+                is_open=i % 2 == 0,
+                accepted=i % 2 == 1,
+                idx_status='open' if i % 2 == 0 else 'done',
+                expires_date=now + timedelta(days=30),
+                raw_data={},
+                current_bounty=True,
+                network='benchmark',
+            ) for i in range(num_bounties)
+        ])
+        BountyFulfillment.objects.bulk_create([
+            BountyFulfillment(
+                bounty=bounty, profile=profiles[i % 100], fulfiller_github_username=f'benchmark{i % 100}',
+                accepted=bounty.accepted,
+            ) for i, bounty in enumerate(bounties)
+        ])
+        Activity.objects.bulk_create([
+            Activity(activity_type='start_work', bounty=bounty, profile=profiles[(i + j) % 100])
+            for i, bounty in enumerate(bounties) for j in range(3)
+        ])
+        interests = Interest.objects.bulk_create([Interest(profile=profiles[i % 100]) for i in range(len(bounties))])
+        Bounty.interested.through.objects.bulk_create([
+            Bounty.interested.through(bounty_id=bounty.pk, interest_id=interest.pk)
+            for bounty, interest in zip(bounties, interests)
+        ])
+        Tip.objects.bulk_create([
+            Tip(
+                emails=[], github_url=bounty.github_url, github_org='benchmark', github_repo='repo',
+                github_issue_number=bounty.github_issue_number, expires_date=now + timedelta(days=30),
+                tokenName='DAI', amount=1, username='benchmark', network='benchmark', tokenAddress='0x0',
+                txid='0x0', tx_status='success', is_for_bounty_fulfiller=True,
+            ) for bounty in bounties[::2]
+        ])
+        print(f'created {num_bounties} bounties in {round(time.time() - start_time, 2)}s')
+
+    def measure(self, name, fn):
+        tracemalloc.start()
+        start_time = time.time()
+        with CaptureQueriesContext(connection) as queries:
+            data = fn()
+        elapsed = time.time() - start_time
+        __, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f' - {name}: {len(data)} bounties in {round(elapsed, 2)}s, {len(queries)} queries, '
+            f'peak memory {round(peak / 1024 / 1024, 1)}MB'
+        )
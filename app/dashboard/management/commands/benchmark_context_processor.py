@@ -0,0 +1,67 @@
+'''
+    Copyright (C) 2019 Gitcoin Core
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+'''
+
+import time
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from app import context
+from dashboard.models import Profile
+from dashboard.unclaimed import get_unclaimed_counts_key
+
+
+class Command(BaseCommand):
+
+    help = 'reports the time and queries of homepage and explorer requests, with cold and warm context caches'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', default=20, type=int, help="The number of warm requests per page")
+
+    def handle(self, *args, **options):
+        # everything is rolled back at the end
+        with transaction.atomic():
+            user = User.objects.create(username='benchmark-visitor', email='benchmark@localhost')
+            profile = Profile.objects.create(user=user, handle='benchmark-visitor', data={})
+            client = Client()
+            client.force_login(user)
+            for url in ['/', '/explorer']:
+                context._stats.clear()
+                cache.delete_many([get_unclaimed_counts_key(user.username), f'visit_recorded:{profile.pk}'])
+                Profile.objects.filter(pk=profile.pk).update(last_visit=None)
+                self.measure(url, 'cold', client, 1)
+                self.measure(url, 'warm', client, options['requests'])
+            cache.delete(get_unclaimed_counts_key(user.username))
+            transaction.set_rollback(True)
+
+    def measure(self, url, name, client, num_requests):
+        timings, num_queries = [], []
+        for __ in range(num_requests):
+            start_time = time.time()
+            with CaptureQueriesContext(connection) as queries:
+                client.get(url)
+            timings.append(time.time() - start_time)
+            num_queries.append(len(queries))
+        print(
+            f'{url} ({name}): avg {round(sum(timings) / num_requests * 1000, 1)}ms, '
+            f'avg {round(sum(num_queries) / num_requests, 1)} queries over {num_requests} requests'
+        )
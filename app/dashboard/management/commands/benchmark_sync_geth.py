@@ -0,0 +1,164 @@
+'''
+    Copyright (C) 2019 Gitcoin Core
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+'''
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+from django.core.management.base import BaseCommand
+
+import requests
+from dashboard.abi import standard_bounties_abi
+from dashboard.bounty_fetcher import BountyFetcher
+from dashboard.rpc import JSONRPCBatchClient
+from dashboard.utils import BountyNotFoundException, getStandardBountiesContractAddresss
+from eth_abi import decode_abi, encode_abi
+from eth_utils import function_abi_to_4byte_selector
+from hexbytes import HexBytes
+from web3 import HTTPProvider, Web3
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class StubState:
+    """A synthetic StandardBounties contract and IPFS store."""
+
+    def __init__(self, num_bounties, num_fulfillments, latency):
+        self.num_bounties = num_bounties
+        self.num_fulfillments = num_fulfillments
+        self.latency = latency
+        self.functions = {
+            HexBytes(function_abi_to_4byte_selector(item)).hex(): item
+            for item in standard_bounties_abi if item.get('type') == 'function'
+        }
+
+    def call(self, data):
+        item = self.functions[data[:10]]
+        args = decode_abi([_input['type'] for _input in item['inputs']], HexBytes(data[10:]))
+        bounty_id = args[0]
+        if bounty_id >= self.num_bounties:
+            return '0x'
+
+        address = '0x' + f'{bounty_id:040x}'
+        outputs = {
+            'getBounty': [address, 1515699751, 10 ** 18, False, 1, 10 ** 18],
+            'getBountyData': f'bounty-{bounty_id}',
+            'getBountyArbiter': address,
+            'getBountyToken': '0x' + '0' * 40,
+            'getNumFulfillments': self.num_fulfillments,
+            'getFulfillment': [False, address, f'fulfillment-{bounty_id}-{args[-1]}'],
+        }[item['name']]
+        output_types = [output['type'] for output in item['outputs']]
+        if len(output_types) == 1:
+            outputs = [outputs]
+        return HexBytes(encode_abi(output_types, outputs)).hex()
+
+    def cat(self, key):
+        if key.startswith('bounty-'):
+            return {'payload': {'webReferenceURL': f'https://github.com/gitcoinco/web/issues/{key[7:]}'}}
+        return {'payload': {'fulfiller': {'name': key}}}
+
+
+def make_handler(state):
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def log_message(self, *args):
+            pass
+
+        def respond(self, body):
+            time.sleep(state.latency)
+            body = json.dumps(body).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            # IPFS: /api/v0/cat/<key>
+            self.respond(state.cat(self.path.split('/')[-1]))
+
+        def do_POST(self):
+            # JSON-RPC: single requests and batches
+            payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            calls = payload if isinstance(payload, list) else [payload]
+            responses = [{
+                'jsonrpc': '2.0',
+                'id': call['id'],
+                'result': state.call(call['params'][0]['data']),
+            } for call in calls]
+            self.respond(responses if isinstance(payload, list) else responses[0])
+
+    return Handler
+
+
+class Command(BaseCommand):
+
+    help = 'benchmarks the sync_geth bounty fetcher against a local stub RPC/IPFS server'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--bounties', default=200, type=int, help="The number of bounties to sync")
+        parser.add_argument('--fulfillments', default=2, type=int, help="The number of fulfillments per bounty")
+        parser.add_argument('--latency', default=20, type=int, help="The simulated round trip latency in ms")
+        parser.add_argument('--workers', default=8, type=int)
+        parser.add_argument('--batch-size', dest='batch_size', default=25, type=int)
+
+    def handle(self, *args, **options):
+        state = StubState(options['bounties'], options['fulfillments'], options['latency'] / 1000)
+        server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(state))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f'http://127.0.0.1:{server.server_port}'
+
+        session = requests.Session()
+        contract = Web3(HTTPProvider(url)).eth.contract(
+            getStandardBountiesContractAddresss('rinkeby'), abi=standard_bounties_abi
+        )
+
+        def stub_ipfs_cat(key):
+            return session.get(f'{url}/api/v0/cat/{key}').text
+
+        runs = [
+            # one JSON-RPC call per HTTP request and one bounty at a time, as get_bounty does
+            ('sequential', 1, 1, JSONRPCBatchClient(url, batch_size=1)),
+            ('concurrent', options['workers'], options['batch_size'], None),
+        ]
+        try:
+            for name, workers, batch_size, rpc_client in runs:
+                fetcher = BountyFetcher(
+                    'rinkeby', workers=workers, batch_size=batch_size, contract=contract,
+                    rpc_client=rpc_client, ipfs_cat_fn=stub_ipfs_cat,
+                )
+                start_time = time.time()
+                fetched = 0
+                for bounty_id, bounty in fetcher.iter_bounties(0, options['bounties']):
+                    if isinstance(bounty, dict):
+                        fetched += 1
+                    elif not isinstance(bounty, BountyNotFoundException):
+                        print(f'{bounty_id}: {bounty}')
+                elapsed = time.time() - start_time
+                print(
+                    f'{name}: workers={workers} batch_size={batch_size} '
+                    f'fetched {fetched} bounties in {round(elapsed, 2)}s => {round(fetched / elapsed, 2)} bounties/sec'
+                )
+        finally:
+            server.shutdown()
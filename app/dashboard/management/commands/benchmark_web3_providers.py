@@ -0,0 +1,94 @@
+'''
+    Copyright (C) 2019 Gitcoin Core
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+'''
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler
+
+from django.core.management.base import BaseCommand
+
+from dashboard.abi import standard_bounties_abi
+from dashboard.management.commands.benchmark_sync_geth import ThreadingHTTPServer
+from dashboard.utils import getStandardBountiesContractAddresss
+from dashboard.web3_registry import Web3Registry, rpc_metrics
+from web3 import HTTPProvider, Web3
+
+
+def make_handler(latency):
+
+    class Handler(BaseHTTPRequestHandler):
+
+        # keep connections open, like a real node does
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            time.sleep(latency)
+            # every eth_call returns a single zero word
+            body = json.dumps({'jsonrpc': '2.0', 'id': payload['id'], 'result': '0x' + '0' * 64}).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+class Command(BaseCommand):
+
+    help = 'benchmarks contract calls through the pooled web3 registry against a local stub JSON-RPC server'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--calls', default=500, type=int, help="The number of contract calls per run")
+        parser.add_argument('--threads', default=8, type=int)
+        parser.add_argument('--latency', default=0, type=int, help="The simulated node latency in ms")
+
+    def handle(self, *args, **options):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(options['latency'] / 1000))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f'http://127.0.0.1:{server.server_port}'
+        address = getStandardBountiesContractAddresss('rinkeby')
+        registry = Web3Registry(endpoints={'localhost': url})
+
+        def unpooled_call(i):
+            # what get_web3 + getBountyContract did: a new provider and contract on every call
+            contract = Web3(HTTPProvider(url)).eth.contract(address, abi=standard_bounties_abi)
+            return contract.functions.getNumBounties().call()
+
+        def pooled_call(i):
+            return registry.get_contract('localhost', address, standard_bounties_abi).functions.getNumBounties().call()
+
+        try:
+            for name, fn in [('unpooled', unpooled_call), ('pooled', pooled_call)]:
+                start_time = time.time()
+                with ThreadPoolExecutor(max_workers=options['threads']) as executor:
+                    list(executor.map(fn, range(options['calls'])))
+                elapsed = time.time() - start_time
+                print(
+                    f"{name}: {options['calls']} calls with {options['threads']} threads "
+                    f"in {round(elapsed, 2)}s => {round(options['calls'] / elapsed, 2)} calls/sec"
+                )
+            print(rpc_metrics.report())
+        finally:
+            server.shutdown()
@@ -20,6 +20,7 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 
 from economy.models import ConversionRate
+from economy.rate_index import conversion_rate_index
 from gas.models import GasGuzzler, GasProfile
 from marketing.models import LeaderboardRank, Stat
 
@@ -48,6 +49,7 @@ class Command(BaseCommand):
                 from_currency='USDT',
                 to_currency='ETH'
             ).delete()
+        conversion_rate_index.invalidate()
         print(f'ConversionRate: {result}')
 
         result = Stat.objects.filter(
@@ -0,0 +1,42 @@
+'''
+    Copyright (C) 2019 Gitcoin Core
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+'''
+from django.core.management.base import BaseCommand
+
+from dashboard.models import Bounty, BountyStats
+
+
+class Command(BaseCommand):
+
+    help = 'recomputes the per bounty stats behind the results page'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', dest='batch_size', default=500, type=int)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        bounties = []
+        total = 0
+        for bounty in Bounty.objects.current().order_by('pk').iterator(chunk_size=batch_size):
+            bounties.append(bounty)
+            if len(bounties) >= batch_size:
+                BountyStats.refresh(bounties)
+                total += len(bounties)
+                bounties = []
+        BountyStats.refresh(bounties)
+        total += len(bounties)
+        print(f'refreshed stats for {total} bounties')
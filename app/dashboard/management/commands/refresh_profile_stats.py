@@ -0,0 +1,39 @@
+'''
+    Copyright (C) 2019 Gitcoin Core
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+'''
+from django.core.management.base import BaseCommand
+
+from dashboard.models import ProfileStats
+
+
+class Command(BaseCommand):
+
+    help = 'recomputes the stale profile stats snapshots, or all of them to reconcile drift'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', dest='all', action='store_true', help="Recompute every snapshot")
+        parser.add_argument('--batch-size', dest='batch_size', default=500, type=int)
+
+    def handle(self, *args, **options):
+        snapshots = ProfileStats.objects.select_related('profile').order_by('pk')
+        if not options['all']:
+            snapshots = snapshots.filter(stale=True)
+        total = 0
+        for stats in snapshots.iterator(chunk_size=options['batch_size']):
+            ProfileStats.refresh(stats.profile, stats.network)
+            total += 1
+        print(f'refreshed {total} profile stats snapshots')
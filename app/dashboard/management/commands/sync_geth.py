@@ -23,8 +23,10 @@ import warnings
 from django.conf import settings
 from django.core.management.base import BaseCommand
 
+from dashboard.bounty_fetcher import BountyFetcher
 from dashboard.helpers import UnsupportedSchemaException
-from dashboard.utils import BountyNotFoundException, get_bounty, getBountyContract, web3_process_bounty
+from dashboard.ipfs_cache import ipfs_cache
+from dashboard.utils import BountyNotFoundException, getBountyContract, web3_process_bounty
 
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 logging.getLogger("requests").setLevel(logging.WARNING)
@@ -60,6 +62,19 @@ class Command(BaseCommand):
             type=int,
             help="The end id.  If negative or 0, will be set to highest bounty id minus <x>"
         )
+        parser.add_argument(
+            '--workers',
+            default=8,
+            type=int,
+            help="The number of threads used to fetch bounties from web3 and IPFS"
+        )
+        parser.add_argument(
+            '--batch-size',
+            dest='batch_size',
+            default=25,
+            type=int,
+            help="The number of bounties whose contract state is read per JSON-RPC batch request"
+        )
 
     def handle(self, *args, **options):
         # config
@@ -72,28 +87,23 @@ class Command(BaseCommand):
         end_id = get_bounty_id(options['end_id'], network)
 
         # iterate through all the bounties
-        bounty_enum = int(start_id)
+        fetcher = BountyFetcher(network, workers=options['workers'], batch_size=options['batch_size'])
         print(f"syncing from {start_id} to {end_id}")
-        more_bounties = True
-        while more_bounties:
+        for bounty_enum, bounty in fetcher.iter_bounties(start_id, end_id):
             try:
-                # pull and process each bounty
-                print(f"[{month}/{day} {hour}:00] Getting bounty {bounty_enum}")
-                bounty = get_bounty(bounty_enum, network)
+                # process each bounty, in order
+                if isinstance(bounty, Exception):
+                    raise bounty
                 print(f"[{month}/{day} {hour}:00] Processing bounty {bounty_enum}")
                 web3_process_bounty(bounty)
 
             except BountyNotFoundException:
-                more_bounties = False
+                break
             except UnsupportedSchemaException as e:
                 logger.info(f"* Unsupported Schema => {e}")
             except Exception as e:
-                extra_data = {'bounty_enum': bounty_enum, 'more_bounties': more_bounties, 'network': network}
+                extra_data = {'bounty_enum': bounty_enum, 'network': network}
                 logger.error('Failed to fetch github username', exc_info=True, extra=extra_data)
                 logger.error(f"* Exception in sync_geth => {e}")
-            finally:
-                # prepare for next loop
-                bounty_enum += 1
 
-                if bounty_enum > int(end_id):
-                    more_bounties = False
+        print(f"ipfs cache: {ipfs_cache.stats()}")
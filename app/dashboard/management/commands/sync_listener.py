@@ -21,65 +21,138 @@ import time
 
 from django.core.management.base import BaseCommand
 
-from dashboard.utils import (
-    get_bounty, get_web3, getBountyContract, getStandardBountiesContractAddresss, web3_process_bounty,
-)
+from dashboard.bounty_fetcher import BountyFetcher
+from dashboard.utils import get_changed_bounty_ids, get_web3, web3_process_bounty
+from perftools.models import JSONStore
 
 logging.getLogger("requests").setLevel(logging.WARNING)
 logging.getLogger("urllib3").setLevel(logging.WARNING)
 
+logger = logging.getLogger(__name__)
 
-def process_bounty(bounty_id, network):
-    bounty = get_bounty(bounty_id, network)
-    return web3_process_bounty(bounty)
+CHECKPOINT_VIEW = 'sync_listener'
+# how many block ranges a bounty that fails to sync is retried along with, before it is given up on
+MAX_ATTEMPTS = 50
+
+
+def get_checkpoint(network):
+    """Get the last block whose StandardBounties logs were processed, or None.
+
+    Returns:
+        tuple: The block number, and the ids of the bounties changed up to it that still failed to sync,
+            with the number of times they were tried.
+
+    """
+    try:
+        data = JSONStore.objects.get(key=network, view=CHECKPOINT_VIEW).data
+        pending = data[1] if len(data) > 1 else {}
+        return data[0], {int(bounty_id): attempts for bounty_id, attempts in pending.items()}
+    except (JSONStore.DoesNotExist, IndexError, KeyError, TypeError, AttributeError):
+        return None, {}
+
+
+def set_checkpoint(network, block_number, pending=None):
+    pending = {str(bounty_id): attempts for bounty_id, attempts in (pending or {}).items()}
+    JSONStore.objects.update_or_create(
+        key=network, view=CHECKPOINT_VIEW, defaults={'data': [block_number, pending]}
+    )
+
+
+def process_bounties(fetcher, bounty_ids):
+    """Fetch and process the given bounties.
+
+    Returns:
+        list of int: The ids of the bounties that failed to be fetched or processed.
+
+    """
+    failed_ids = []
+    for bounty_id, bounty in fetcher.fetch(bounty_ids):
+        try:
+            if isinstance(bounty, Exception):
+                raise bounty
+            print('process_bounty %d' % bounty_id)
+            web3_process_bounty(bounty)
+            print('done process_bounty %d' % bounty_id)
+        except Exception as e:
+            logger.error(f"* Exception in sync_listener for bounty {bounty_id} => {e}")
+            failed_ids.append(bounty_id)
+    return failed_ids
+
+
+def process_block_range(network, fetcher, from_block, to_block, pending, web3=None):
+    """Process the bounties changed in a block range, along with the ones that failed before, and checkpoint.
+
+    The checkpoint only moves past the range together with the ids that still failed to sync,
+    so that they are retried with the next range rather than dropped.
+
+    Returns:
+        dict: The ids of the bounties still pending, with the number of times they were tried.
+
+    """
+    bounty_ids = get_changed_bounty_ids(network, from_block, to_block, web3=web3)
+    print(f'blocks {from_block}-{to_block}: {len(bounty_ids)} changed bounties, {len(pending)} to retry')
+    bounty_ids = sorted(set(bounty_ids) | set(pending))
+    failed_ids = set(process_bounties(fetcher, bounty_ids)) if bounty_ids else set()
+
+    pending = {bounty_id: pending.get(bounty_id, 0) + 1 for bounty_id in failed_ids}
+    for bounty_id, attempts in list(pending.items()):
+        if attempts >= MAX_ATTEMPTS:
+            logger.error(f"* sync_listener gave up on bounty {bounty_id} after {attempts} attempts")
+            del pending[bounty_id]
+    set_checkpoint(network, to_block, pending)
+    return pending
 
 
 class Command(BaseCommand):
-    help = 'listens for bounty changes '
+    help = 'listens for bounty changes by following the StandardBounties event logs'
 
     def add_arguments(self, parser):
         parser.add_argument('network', default='rinkeby', type=str)
+        parser.add_argument(
+            '--start-block',
+            dest='start_block',
+            default=None,
+            type=int,
+            help="The block to start from.  Defaults to the block after the persisted checkpoint, or latest."
+        )
+        parser.add_argument(
+            '--block-range',
+            dest='block_range',
+            default=1000,
+            type=int,
+            help="The maximum number of blocks whose logs are requested per eth_getLogs call"
+        )
+        parser.add_argument(
+            '--confirmations',
+            default=0,
+            type=int,
+            help="How many blocks behind the chain head to stay, to avoid processing reorged blocks"
+        )
+        parser.add_argument('--poll-interval', dest='poll_interval', default=5, type=int)
 
     def handle(self, *args, **options):
-        # config
-        block = 'latest'
-
         # setup
         network = options['network']
         web3 = get_web3(network)
-        contract_address = getStandardBountiesContractAddresss(network)
-        contract = getBountyContract(network)
-        last_block_hash = None
+        fetcher = BountyFetcher(network)
 
-        while True:
-            # wait for a new block
-            block = web3.eth.getBlock('latest')
-            block_hash = block['hash']
+        last_block, pending = get_checkpoint(network)
+        if options['start_block'] is not None:
+            last_block = options['start_block'] - 1
+        if last_block is None:
+            last_block = web3.eth.blockNumber - options['confirmations'] - 1
 
-            if last_block_hash == block_hash:
-                time.sleep(1)
+        while True:
+            # wait for new blocks
+            head = web3.eth.blockNumber - options['confirmations']
+            if head <= last_block:
+                time.sleep(options['poll_interval'])
                 continue
 
-            print('got new block %s' % web3.toHex(block_hash))
-
-            # get txs
-            transactions = block['transactions']
-            for tx in transactions:
-                tx = web3.eth.getTransaction(tx)
-                if not tx or tx['to'] != contract_address:
-                    continue
-
-                print('found a stdbounties tx')
-                data = tx['input']
-                method_id = data[:10]
-                if method_id == '0x7e9e511d':
-                    # issueAndActivateBounty
-                    bounty_id = contract.functions.getNumBounties().call() - 1
-                else:
-                    # any other method
-                    bounty_id = int(data[10:74], 16)
-                print('process_bounty %d' % bounty_id)
-                process_bounty(bounty_id, network)
-                print('done process_bounty %d' % bounty_id)
-
-            last_block_hash = block_hash
+            # walk every block since the checkpoint, so none are missed between polls
+            from_block = last_block + 1
+            while from_block <= head:
+                to_block = min(from_block + options['block_range'] - 1, head)
+                pending = process_block_range(network, fetcher, from_block, to_block, pending, web3=web3)
+                last_block = to_block
+                from_block = to_block + 1
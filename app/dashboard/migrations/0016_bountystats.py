@@ -0,0 +1,35 @@
+# Generated by Django 2.1.7 on 2019-03-04 12:00
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+import django.db.models.deletion
+import economy.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0015_auto_20190301_1625'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BountyStats',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_on', models.DateTimeField(db_index=True, default=economy.models.get_time)),
+                ('modified_on', models.DateTimeField(default=economy.models.get_time)),
+                ('value_in_usdt', models.FloatField(blank=True, null=True)),
+                ('hourly_rate', models.FloatField(blank=True, null=True)),
+                ('min_hours_worked', models.FloatField(blank=True, help_text='The fewest hours worked reported by an accepted fulfillment', null=True)),
+                ('turnaround_time_started', models.FloatField(blank=True, null=True)),
+                ('turnaround_time_submitted', models.FloatField(blank=True, null=True)),
+                ('turnaround_time_accepted', models.FloatField(blank=True, null=True)),
+                ('keywords', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=200), blank=True, default=list, size=None)),
+                ('bounty', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='dashboard.Bounty')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 2.1.7 on 2019-03-05 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0016_bountystats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bounty',
+            index=models.Index(fields=['-web3_created', '-id'], name='bounty_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bounty',
+            index=models.Index(fields=['network', '-web3_created', '-id'], name='bounty_network_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bounty',
+            index=models.Index(fields=['bounty_owner_address'], name='bounty_owner_address_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bounty',
+            index=models.Index(fields=['bounty_owner_github_username'], name='bounty_owner_github_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bounty',
+            index=models.Index(fields=['standard_bounties_id', 'network'], name='bounty_standard_id_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 2.1.7 on 2019-03-06 12:00
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0017_bounty_search_indexes'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='bounty',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='bounty',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='bounty_search_vector_idx'),
+        ),
+        # trigram indexes on the expressions `BountyQuerySet.keyword`'s icontains lookups compile to
+        migrations.RunSQL(
+            [
+                'CREATE INDEX bounty_title_trgm_idx ON dashboard_bounty USING gin (UPPER(title) gin_trgm_ops);',
+                'CREATE INDEX bounty_description_trgm_idx ON dashboard_bounty '
+                'USING gin (UPPER(issue_description) gin_trgm_ops);',
+                "CREATE INDEX bounty_keywords_trgm_idx ON dashboard_bounty "
+                "USING gin (UPPER(metadata ->> 'issueKeywords') gin_trgm_ops);",
+            ],
+            [
+                'DROP INDEX bounty_title_trgm_idx;',
+                'DROP INDEX bounty_description_trgm_idx;',
+                'DROP INDEX bounty_keywords_trgm_idx;',
+            ],
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 2.1.7 on 2019-03-08 12:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import economy.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0018_bounty_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BountyKeyword',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_on', models.DateTimeField(db_index=True, default=economy.models.get_time)),
+                ('modified_on', models.DateTimeField(default=economy.models.get_time)),
+                ('normalized_keyword', models.CharField(max_length=200)),
+                ('bounty', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='keyword_tags', to='dashboard.Bounty')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='bountykeyword',
+            index=models.Index(fields=['normalized_keyword', 'bounty'], name='bountykeyword_keyword_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='bountykeyword',
+            unique_together={('bounty', 'normalized_keyword')},
+        ),
+        migrations.RemoveField(
+            model_name='bountystats',
+            name='keywords',
+        ),
+        # the issue keywords are looked up through BountyKeyword now
+        migrations.RunSQL(
+            'DROP INDEX bounty_keywords_trgm_idx;',
+            "CREATE INDEX bounty_keywords_trgm_idx ON dashboard_bounty "
+            "USING gin (UPPER(metadata ->> 'issueKeywords') gin_trgm_ops);",
+        ),
+    ]
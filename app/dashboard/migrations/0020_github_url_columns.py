@@ -0,0 +1,57 @@
+# Generated by Django 2.1.7 on 2019-03-09 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0019_bountykeyword'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bounty',
+            name='github_issue_number',
+            field=models.IntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='bounty',
+            name='github_org',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='bounty',
+            name='github_repo',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='tip',
+            name='github_issue_number',
+            field=models.IntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='tip',
+            name='github_org',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='tip',
+            name='github_repo',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name='bounty',
+            index=models.Index(fields=['github_org', 'github_repo', 'github_issue_number'], name='bounty_github_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bounty',
+            index=models.Index(
+                fields=['network', 'github_org', 'github_repo', 'idx_status'], name='bounty_network_github_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='tip',
+            index=models.Index(fields=['github_org', 'github_repo', 'github_issue_number'], name='tip_github_idx'),
+        ),
+    ]
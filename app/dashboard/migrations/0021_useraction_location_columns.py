@@ -0,0 +1,33 @@
+# Generated by Django 2.1.7 on 2019-03-12 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0020_github_url_columns'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='useraction',
+            name='city',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='useraction',
+            name='continent_code',
+            field=models.CharField(blank=True, default='', editable=False, max_length=2),
+        ),
+        migrations.AddField(
+            model_name='useraction',
+            name='continent_name',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='useraction',
+            name='country_name',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+    ]
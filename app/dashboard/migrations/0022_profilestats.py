@@ -0,0 +1,51 @@
+# Generated by Django 2.1.7 on 2019-03-14 12:00
+
+import django.contrib.postgres.fields.jsonb
+import django.db.models.deletion
+from django.db import migrations, models
+
+import economy.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0021_useraction_location_columns'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfileStats',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_on', models.DateTimeField(db_index=True, default=economy.models.get_time)),
+                ('modified_on', models.DateTimeField(default=economy.models.get_time)),
+                ('network', models.CharField(max_length=255)),
+                ('stale', models.BooleanField(db_index=True, default=False)),
+                ('funded_bounties_count', models.IntegerField(default=0)),
+                ('fulfilled_bounties_count', models.IntegerField(default=0)),
+                ('bounties_on_repo_count', models.IntegerField(default=0)),
+                ('sum_eth_funded', models.FloatField(default=0)),
+                ('sum_eth_collected', models.FloatField(default=0)),
+                ('sum_eth_on_repos', models.FloatField(default=0)),
+                ('sum_usdt_funded', models.FloatField(default=0)),
+                ('sum_usdt_collected', models.FloatField(default=0)),
+                ('status_counts', django.contrib.postgres.fields.jsonb.JSONField(blank=True, default=dict, help_text='The number of bounties funded, by status')),
+                ('works_with_funded', django.contrib.postgres.fields.jsonb.JSONField(blank=True, default=list)),
+                ('works_with_collected', django.contrib.postgres.fields.jsonb.JSONField(blank=True, default=list)),
+                ('works_with_org', django.contrib.postgres.fields.jsonb.JSONField(blank=True, default=list)),
+                ('no_times_been_removed', models.IntegerField(default=0)),
+                ('kudos_count', models.IntegerField(default=0)),
+                ('sent_kudos_count', models.IntegerField(default=0)),
+                ('activity_counts', django.contrib.postgres.fields.jsonb.JSONField(blank=True, default=dict, help_text='The number of activities, by activity type')),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='dashboard.Profile')),
+            ],
+            options={
+                'verbose_name_plural': 'Profile stats',
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='profilestats',
+            unique_together={('profile', 'network')},
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 2.1.7 on 2019-03-15 12:00
+
+import django.contrib.postgres.fields.jsonb
+import django.db.models.deletion
+from django.db import migrations, models
+
+import economy.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0022_profilestats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfileQuarterlyStats',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_on', models.DateTimeField(db_index=True, default=economy.models.get_time)),
+                ('modified_on', models.DateTimeField(default=economy.models.get_time)),
+                ('since', models.DateTimeField(help_text='The start of the 90 days the stats cover')),
+                ('stats', django.contrib.postgres.fields.jsonb.JSONField(blank=True, default=dict)),
+                ('profile', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='quarterly_stats', to='dashboard.Profile')),
+            ],
+            options={
+                'verbose_name_plural': 'Profile quarterly stats',
+            },
+        ),
+    ]
@@ -29,9 +29,13 @@ from django.contrib.auth.models import User
 from django.contrib.auth.signals import user_logged_in, user_logged_out
 from django.contrib.humanize.templatetags.humanize import naturalday, naturaltime
 from django.contrib.postgres.fields import ArrayField, JSONField
-from django.db import models
-from django.db.models import Q, Sum
-from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.contrib.postgres.fields.jsonb import KeyTextTransform, KeyTransform
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, SearchVectorField
+from django.db import models, transaction
+from django.db.models import Case, Count, Exists, F, Func, OuterRef, Prefetch, Q, Sum, Value, When
+from django.db.models.functions import Coalesce
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 from django.forms.models import model_to_dict
 from django.templatetags.static import static
@@ -45,11 +49,11 @@ import requests
 from avatar.utils import get_upload_filename
 from dashboard.tokens import addr_to_token
 from economy.models import ConversionRate, SuperModel
-from economy.utils import ConversionRateNotFoundError, convert_amount, convert_token_to_usdt
+from economy.utils import ConversionRateNotFoundError, convert_amount, convert_amounts_to_usdt, convert_token_to_usdt
 from gas.utils import recommend_min_gas_price_to_confirm_in_time
 from git.utils import (
     _AUTH, HEADERS, TOKEN_URL, build_auth_dict, get_gh_issue_details, get_issue_comments, issue_number, org_name,
-    repo_name,
+    parse_github_url, repo_name,
 )
 from marketing.mails import featured_funded_bounty
 from marketing.models import LeaderboardRank
@@ -60,8 +64,49 @@ from .signals import m2m_changed_interested
 
 logger = logging.getLogger(__name__)
 
+SEARCH_CONFIG = 'english'
 
-class BountyQuerySet(models.QuerySet):
+
+def get_bounty_search_vector():
+    """Build the expression `Bounty.search_vector` is computed from."""
+    github_org_name = Func(
+        F('github_url'), Value('/'), Value(4), function='split_part', output_field=models.CharField(),
+    )
+    return (
+        SearchVector('title', KeyTextTransform('issueKeywords', 'metadata'), weight='A', config=SEARCH_CONFIG) +
+        SearchVector(github_org_name, 'token_name', weight='B', config=SEARCH_CONFIG) +
+        SearchVector('issue_description', weight='C', config=SEARCH_CONFIG)
+    )
+
+
+class GithubURLQuerySet(models.QuerySet):
+    """Look up objects by the `github_org`, `github_repo` and `github_issue_number` parsed from their Github URL."""
+
+    def for_org(self, org):
+        """Filter results to the objects of a Github organization."""
+        return self.filter(github_org=org.lower())
+
+    def for_repo(self, org, repo):
+        """Filter results to the objects of a Github repo."""
+        return self.filter(github_org=org.lower(), github_repo=repo.lower())
+
+    def for_issue(self, org, repo, issue_number):
+        """Filter results to the objects of a Github issue."""
+        return self.filter(github_org=org.lower(), github_repo=repo.lower(), github_issue_number=issue_number)
+
+    def for_github_url(self, url):
+        """Filter results to the objects of the Github organization, repo or issue at url."""
+        org, repo, issue_number = parse_github_url(url)
+        if issue_number is not None:
+            return self.for_issue(org, repo, issue_number)
+        if repo:
+            return self.for_repo(org, repo)
+        if org:
+            return self.for_org(org)
+        return self.none()
+
+
+class BountyQuerySet(GithubURLQuerySet):
     """Handle the manager queryset for Bounties."""
 
     def current(self):
@@ -98,12 +143,164 @@ class BountyQuerySet(models.QuerySet):
             dashboard.models.BountyQuerySet: The QuerySet of bounties filtered by keyword.
 
         """
+        tagged = BountyKeyword.objects.filter(normalized_keyword=normalize_keyword(keyword))
         return self.filter(
-            Q(metadata__issueKeywords__icontains=keyword) | \
+            Q(pk__in=tagged.values('bounty_id')) | \
             Q(title__icontains=keyword) | \
             Q(issue_description__icontains=keyword)
         )
 
+    def with_keyword(self, keyword):
+        """Filter results to the bounties tagged with a keyword (see `BountyKeyword`).
+
+        Args:
+            keyword (str): The keyword, in any case.
+
+        Returns:
+            dashboard.models.BountyQuerySet: The QuerySet of bounties tagged with the keyword.
+
+        """
+        tagged = BountyKeyword.objects.filter(normalized_keyword=normalize_keyword(keyword))
+        return self.filter(pk__in=tagged.values('bounty_id'))
+
+    def keyword_counts(self, keywords=None):
+        """Count the bounties of the queryset tagged with each keyword, with a single GROUP BY query.
+
+        Args:
+            keywords (list of str): The keywords to count. Defaults to all of them.
+
+        Returns:
+            OrderedDict: The normalized keywords and their number of bounties, most used first.
+
+        """
+        tags = BountyKeyword.objects.filter(bounty_id__in=self.order_by().values('pk'))
+        if keywords is not None:
+            tags = tags.filter(normalized_keyword__in=[normalize_keyword(keyword) for keyword in keywords])
+        counts = tags.values_list('normalized_keyword').annotate(count=Count('bounty_id'))
+        return collections.OrderedDict(counts.order_by('-count', 'normalized_keyword'))
+
+    def search(self, query, rank=True):
+        """Filter results to the bounties matching a full-text search query.
+
+        Unlike `keyword`, this matches whole (stemmed) words, and uses the `search_vector` index.
+
+        Args:
+            query (str): The words to search title, keywords, org, token and issue description by.
+            rank (bool): Whether to order the results by relevance, best first.
+
+        Returns:
+            dashboard.models.BountyQuerySet: The QuerySet of bounties matching the query.
+
+        """
+        search_query = SearchQuery(query, config=SEARCH_CONFIG)
+        queryset = self.filter(search_vector=search_query)
+        if rank:
+            queryset = queryset.annotate(search_rank=SearchRank(F('search_vector'), search_query)) \
+                .order_by('-search_rank', '-web3_created')
+        return queryset
+
+    def update_search_vectors(self):
+        """Recompute the `search_vector` of the bounties with a single UPDATE."""
+        return self.update(search_vector=get_bounty_search_vector())
+
+    def with_api_relations(self):
+        """Prefetch the relations `BountySerializer` reads, loading only the columns it reads."""
+        from avatar.models import BaseAvatar
+        active_avatars = BaseAvatar.objects.filter(active=True).order_by('pk')
+        return self.prefetch_related(
+            Prefetch('fulfillments', queryset=BountyFulfillment.objects.only(
+                'bounty', 'fulfiller_address', 'fulfiller_email', 'fulfiller_github_username', 'fulfiller_name',
+                'fulfillment_id', 'accepted', 'profile', 'created_on', 'accepted_on', 'fulfiller_github_url',
+            )),
+            Prefetch('interested', queryset=Interest.objects.select_related('profile').only(
+                'created', 'pending', 'profile', 'profile__handle',
+            )),
+            Prefetch('interested__profile__avatar_baseavatar_related', queryset=active_avatars),
+            Prefetch('activities', queryset=Activity.objects.select_related('profile').only(
+                'activity_type', 'created', 'metadata', 'bounty', 'tip', 'needs_review', 'profile', 'profile__handle',
+            )),
+            Prefetch('activities__profile__avatar_baseavatar_related', queryset=active_avatars),
+        )
+
+    def annotate_status(self):
+        """Annotate the results with their status, computed in SQL the way `Bounty.get_status` does.
+
+        Adds `status_has_tips` and `status_has_active_interest`, which `get_status` uses instead
+        of querying, `status_can_submit_late`, the SQL form of `can_submit_after_expiration_date`
+        for standard bounties, and `annotated_status`.
+
+        """
+        tips = Tip.objects.filter(network=OuterRef('network'), is_for_bounty_fulfiller=False).send_happy_path()
+        issue_tips = tips.filter(
+            github_org=OuterRef('github_org'),
+            github_repo=OuterRef('github_repo'),
+            github_issue_number=OuterRef('github_issue_number'),
+        )
+        # bounties whose github url isn't an issue url are matched on the url, as `Bounty.tips` does
+        url_tips = tips.filter(github_url__iexact=OuterRef('github_url'))
+        interests = Interest.objects.filter(bounty=OuterRef('pk'), pending=False)
+        return self.annotate(
+            status_has_tips=Case(
+                When(github_issue_number__isnull=True, then=Exists(url_tips)),
+                default=Exists(issue_tips),
+                output_field=models.BooleanField(),
+            ),
+            status_has_active_interest=Exists(interests),
+            # a missing ipfs deadline compares to NULL, and the bounty can't be submitted late
+            status_can_submit_late=Coalesce(Func(
+                KeyTransform('contract_deadline', 'raw_data'), KeyTransform('ipfs_deadline', 'raw_data'),
+                template='%(expressions)s', arg_joiner=' > ', output_field=models.BooleanField(),
+            ), Value(False)),
+        ).annotate(annotated_status=Case(
+            When(~Q(override_status=''), then=F('override_status')),
+            When(web3_type='legacy_gitcoin', then=F('idx_status')),
+            When(is_open=False, accepted=True, then=Value('done')),
+            # get_status fails to compare a missing expiration date, and falls back to unknown
+            When(is_open=False, expires_date__isnull=True, then=Value('unknown')),
+            When(
+                is_open=False, expires_date__lt=timezone.now(), status_can_submit_late=False,
+                then=Value('expired'),
+            ),
+            When(is_open=False, status_has_tips=True, then=Value('done')),
+            When(is_open=False, then=Value('cancelled')),
+            When(project_type__in=['contest', 'cooperative'], then=Value('open')),
+            When(num_fulfillments=0, status_has_active_interest=True, then=Value('started')),
+            When(num_fulfillments=0, then=Value('open')),
+            default=Value('submitted'),
+            output_field=models.CharField(),
+        ))
+
+    def past_expiration(self):
+        """Filter results to the closed bounties past their expiration date, which may have to become expired."""
+        return self.filter(
+            is_open=False, accepted=False, override_status='', expires_date__lt=timezone.now(),
+        ).exclude(idx_status='expired')
+
+    def refresh_status(self):
+        """Store the status computed by `annotate_status` in `idx_status`, where it changed.
+
+        The value fields depending on the status are recomputed along, the changed rows are
+        written with a single UPDATE, and `post_save` is sent for each of them.
+
+        Returns:
+            list of dashboard.models.Bounty: The bounties whose status changed.
+
+        """
+        from dashboard.revaluation import VALUATION_FIELDS, bulk_update, revalue_bounty
+        changed = list(self.annotate_status().exclude(annotated_status=F('idx_status')))
+        now = timezone.now()
+        for bounty in changed:
+            bounty.idx_status = bounty.annotated_status
+            bounty.modified_on = now
+            revalue_bounty(bounty)
+        fields = ['idx_status', 'modified_on'] + VALUATION_FIELDS
+        bulk_update(Bounty, changed, fields)
+        for bounty in changed:
+            post_save.send(sender=Bounty, instance=bounty, created=False, update_fields=frozenset(fields),
+                           raw=False, using=bounty._state.db)
+        ProfileStats.mark_bounties_stale(changed)
+        return changed
+
     def hidden(self):
         """Filter results to only bounties that have been manually hidden by moderators."""
         return self.filter(admin_override_and_hide=True)
@@ -292,6 +489,12 @@ class Bounty(SuperModel):
         default=False, help_text=_('Admin override to mark as remarketing ready')
     )
     attached_job_description = models.URLField(blank=True, null=True)
+    # maintained by postsave_bounty, see BountyQuerySet.search
+    search_vector = SearchVectorField(null=True, editable=False)
+    # parsed from github_url by psave_bounty, see GithubURLQuerySet
+    github_org = models.CharField(max_length=255, default='', blank=True, editable=False)
+    github_repo = models.CharField(max_length=255, default='', blank=True, editable=False)
+    github_issue_number = models.IntegerField(null=True, blank=True, editable=False)
 
     # Bounty QuerySet Manager
     objects = BountyQuerySet.as_manager()
@@ -303,6 +506,19 @@ class Bounty(SuperModel):
         index_together = [
             ["network", "idx_status"],
         ]
+        # back the keyset pagination and exact-match filters of the v1 search api
+        indexes = [
+            models.Index(fields=['-web3_created', '-id'], name='bounty_created_id_idx'),
+            models.Index(fields=['network', '-web3_created', '-id'], name='bounty_network_created_idx'),
+            models.Index(fields=['bounty_owner_address'], name='bounty_owner_address_idx'),
+            models.Index(fields=['bounty_owner_github_username'], name='bounty_owner_github_idx'),
+            models.Index(fields=['standard_bounties_id', 'network'], name='bounty_standard_id_idx'),
+            GinIndex(fields=['search_vector'], name='bounty_search_vector_idx'),
+            models.Index(fields=['github_org', 'github_repo', 'github_issue_number'], name='bounty_github_idx'),
+            models.Index(
+                fields=['network', 'github_org', 'github_repo', 'idx_status'], name='bounty_network_github_idx',
+            ),
+        ]
 
     def __str__(self):
         """Return the string representation of a Bounty."""
@@ -431,13 +647,6 @@ class Bounty(SuperModel):
         tag_re = re.compile(r'(<!--.*?-->|<[^>]*>)')
         return tag_re.sub('', self.issue_description).strip()
 
-    @property
-    def github_issue_number(self):
-        try:
-            return int(issue_number(self.github_url))
-        except Exception:
-            return None
-
     @property
     def org_name(self):
         return self.github_org_name
@@ -560,7 +769,32 @@ class Bounty(SuperModel):
 
     @property
     def status(self):
-        """Determine the status of the Bounty.
+        """Get the status of the Bounty.
+
+        `idx_status` is the materialized status: it is computed when the bounty is saved, and
+        refreshed when its interests, fulfillments or tips change (see `BountyQuerySet.refresh_status`),
+        so only unsaved bounties have their status computed here.  Expiry, which no write signals,
+        is refreshed by `refresh_bounties --expired` every hour.
+
+        Returns:
+            str: The status of the Bounty.
+
+        """
+        if self.pk:
+            return self.idx_status
+        return self.get_status()
+
+    def get_status(self, has_tips=None, has_active_interest=None):
+        """Compute the status of the Bounty.
+
+        Besides the fields of the bounty, the status depends on whether it was tipped and
+        whether work was started on it. These are read, in order, from the arguments, the
+        annotations of `BountyQuerySet.annotate_status`, the prefetched `interested`
+        relation, or else queried, and only when the status depends on them.
+
+        Args:
+            has_tips (bool): Whether the bounty has tips, not counting the tips for its fulfiller.
+            has_active_interest (bool): Whether the bounty has interests which are not pending.
 
         Raises:
             Exception: Catch whether or not any exception is encountered and
@@ -582,7 +816,10 @@ class Bounty(SuperModel):
                     return 'done'
                 elif self.past_hard_expiration_date:
                     return 'expired'
-                has_tips = self.tips.filter(is_for_bounty_fulfiller=False).send_happy_path().exists()
+                if has_tips is None:
+                    has_tips = getattr(self, 'status_has_tips', None)
+                if has_tips is None:
+                    has_tips = self.tips.filter(is_for_bounty_fulfiller=False).send_happy_path().exists()
                 if has_tips:
                     return 'done'
                 # If its not expired or done, and no tips, it must be cancelled.
@@ -592,9 +829,15 @@ class Bounty(SuperModel):
             if self.pk and self.project_type in ['contest', 'cooperative']:
                 return 'open'
             if self.num_fulfillments == 0:
-                if self.pk and self.interested.filter(pending=False).exists():
-                    return 'started'
-                return 'open'
+                if not self.pk:
+                    return 'open'
+                if has_active_interest is None:
+                    has_active_interest = getattr(self, 'status_has_active_interest', None)
+                if has_active_interest is None and 'interested' in getattr(self, '_prefetched_objects_cache', {}):
+                    has_active_interest = any(not interest.pending for interest in self.interested.all())
+                if has_active_interest is None:
+                    has_active_interest = self.interested.filter(pending=False).exists()
+                return 'started' if has_active_interest else 'open'
             return 'submitted'
         except Exception as e:
             logger.warning(e)
@@ -670,6 +913,30 @@ class Bounty(SuperModel):
             return timezone.now()
         return self.web3_created
 
+    def get_valuation(self, status=None):
+        """Compute the denormalized value fields of the bounty.
+
+        Args:
+            status (str): The status of the bounty. Defaults to the computed `status`.
+
+        Returns:
+            dict: The value fields, by field name.
+
+        """
+        is_open = (status or self.status) in self.OPEN_STATUSES
+        value_in_usdt_now = self.get_value_in_usdt_now
+        value_in_usdt = value_in_usdt_now if is_open else self.value_in_usdt_then
+        return {
+            '_val_usd_db': value_in_usdt if value_in_usdt else 0,
+            '_val_usd_db_now': value_in_usdt_now if value_in_usdt_now else 0,
+            'token_value_time_peg': timezone.now() if is_open else self.web3_created,
+            'token_value_in_usdt': self.token_value_in_usdt_now if is_open else self.token_value_in_usdt_then,
+            'value_in_usdt_now': value_in_usdt_now,
+            'value_in_usdt': value_in_usdt,
+            'value_in_eth': self.get_value_in_eth,
+            'value_true': self.get_value_true,
+        }
+
     @property
     def desc(self):
         return f"{naturaltime(self.web3_created)} {self.idx_project_length} {self.bounty_type} {self.experience_level}"
@@ -888,6 +1155,8 @@ class Bounty(SuperModel):
 
     @property
     def needs_review(self):
+        if 'activities' in getattr(self, '_prefetched_objects_cache', {}):
+            return any(activity.needs_review for activity in self.activities.all())
         if self.activities.filter(needs_review=True).exists():
             return True
         return False
@@ -920,7 +1189,12 @@ class Bounty(SuperModel):
     def tips(self):
         """Return the tips associated with this bounty."""
         try:
-            return Tip.objects.filter(github_url__iexact=self.github_url, network=self.network).order_by('-created_on')
+            if self.github_issue_number is None:
+                # not an issue url, e.g. a repo url
+                tips = Tip.objects.filter(github_url__iexact=self.github_url)
+            else:
+                tips = Tip.objects.for_issue(self.github_org, self.github_repo, self.github_issue_number)
+            return tips.filter(network=self.network).order_by('-created_on')
         except:
             return Tip.objects.none()
 
@@ -931,17 +1205,55 @@ class Bounty(SuperModel):
         return (queryset.filter(from_address=self.bounty_owner_address) |
                 queryset.filter(from_name=self.bounty_owner_github_username))
 
+    def get_happy_path_tips(self, tips=None, is_for_bounty_fulfiller=None):
+        """Get the pending and successful tips of the bounty.
+
+        Args:
+            tips (list of Tip): All the tips of the bounty, newest first, if already loaded.
+            is_for_bounty_fulfiller (bool): Only keep the tips which are (or are not) for the fulfiller.
+
+        Returns:
+            list of Tip: The tips.
+
+        """
+        if tips is None:
+            tips = self.tips.send_happy_path()
+            if is_for_bounty_fulfiller is not None:
+                tips = tips.filter(is_for_bounty_fulfiller=is_for_bounty_fulfiller)
+            return list(tips)
+        return [
+            tip for tip in tips
+            if tip.txid and tip.tx_status in ['pending', 'success'] and
+            is_for_bounty_fulfiller in [None, tip.is_for_bounty_fulfiller]
+        ]
+
     @property
     def paid(self):
         """Return list of users paid for this bounty."""
+        return self.get_paid()
+
+    def get_paid(self, tips=None):
+        """Get the users paid for this bounty.
+
+        Args:
+            tips (list of Tip): All the tips of the bounty, if already loaded.
+
+        Returns:
+            list of str: The usernames.
+
+        """
         if self.status != 'done':
             return []  # to save the db hits
 
         return_list = []
-        for fulfillment in self.fulfillments.filter(accepted=True):
+        if 'fulfillments' in getattr(self, '_prefetched_objects_cache', {}):
+            fulfillments = [fulfillment for fulfillment in self.fulfillments.all() if fulfillment.accepted]
+        else:
+            fulfillments = self.fulfillments.filter(accepted=True)
+        for fulfillment in fulfillments:
             if fulfillment.fulfiller_github_username:
                 return_list.append(fulfillment.fulfiller_github_username)
-        for tip in self.tips.send_happy_path():
+        for tip in self.get_happy_path_tips(tips):
             if tip.username:
                 return_list.append(tip.username)
         return list(set(return_list))
@@ -949,18 +1261,34 @@ class Bounty(SuperModel):
     @property
     def additional_funding_summary(self):
         """Return a dict describing the additional funding from crowdfunding that this object has"""
+        return self.get_additional_funding_summary()
+
+    def get_additional_funding_summary(self, tips=None, conversion_rates=None):
+        """Describe the additional funding from crowdfunding that this object has.
+
+        Args:
+            tips (list of Tip): All the tips of the bounty, if already loaded.
+            conversion_rates (dict): token => latest USDT ConversionRate (or None), if already loaded.
+
+        Returns:
+            dict: token => {amount, ratio, timestamp}.
+
+        """
         ret = {}
-        for tip in self.tips.filter(is_for_bounty_fulfiller=True).send_happy_path():
+        for tip in self.get_happy_path_tips(tips, is_for_bounty_fulfiller=True):
             token = tip.tokenName
             obj = ret.get(token, {})
 
             if not obj:
                 obj['amount'] = 0.0
 
-                conversion_rate = ConversionRate.objects.filter(
-                    from_currency=token,
-                    to_currency='USDT',
-                ).order_by('-timestamp').first()
+                if conversion_rates is not None and token in conversion_rates:
+                    conversion_rate = conversion_rates[token]
+                else:
+                    conversion_rate = ConversionRate.objects.filter(
+                        from_currency=token,
+                        to_currency='USDT',
+                    ).order_by('-timestamp').first()
 
                 if conversion_rate:
                     obj['ratio'] = (float(conversion_rate.to_amount) / float(conversion_rate.from_amount))
@@ -1019,9 +1347,17 @@ class Bounty(SuperModel):
 
 @receiver(post_save, sender=Bounty, dispatch_uid="postsave_bounty")
 def postsave_bounty(sender, instance, created, **kwargs):
+    from marketing.leaderboards import update_incremental_leaderboards
     if created:
         if instance.status == 'open':
             featured_funded_bounty(settings.CONTACT_EMAIL, bounty=instance)
+    update_incremental_leaderboards(instance)
+    BountyStats.refresh([instance])
+    BountyKeyword.refresh([instance])
+    Bounty.objects.filter(pk=instance.pk).update_search_vectors()
+    # the profile numbers depend on the status of bounties, which psave_bounty flags when it changes
+    if getattr(instance, 'status_changed', False):
+        ProfileStats.mark_bounties_stale([instance])
 
 
 class BountyFulfillmentQuerySet(models.QuerySet):
@@ -1090,6 +1426,173 @@ class BountyFulfillment(SuperModel):
         }
 
 
+@receiver(post_save, sender=BountyFulfillment, dispatch_uid="postsave_fulfillment")
+def postsave_fulfillment(sender, instance, **kwargs):
+    from marketing.leaderboards import update_incremental_leaderboards
+    # fulfillments are created after their bounty, so the bounty's earners change here
+    if instance.accepted:
+        update_incremental_leaderboards(instance.bounty)
+    BountyStats.refresh([instance.bounty])
+    Bounty.objects.filter(pk=instance.bounty_id).refresh_status()
+    ProfileStats.mark_stale(
+        handles=[instance.fulfiller_github_username, instance.bounty.bounty_owner_github_username,
+                 instance.bounty.github_org],
+        profile_ids=[instance.profile_id],
+    )
+
+
+class BountyStats(SuperModel):
+    """Materialize the per-bounty numbers behind the results page statistics."""
+
+    bounty = models.OneToOneField(Bounty, on_delete=models.CASCADE, related_name='stats')
+    value_in_usdt = models.FloatField(null=True, blank=True)
+    hourly_rate = models.FloatField(null=True, blank=True)
+    min_hours_worked = models.FloatField(
+        null=True, blank=True, help_text=_('The fewest hours worked reported by an accepted fulfillment'),
+    )
+    turnaround_time_started = models.FloatField(null=True, blank=True)
+    turnaround_time_submitted = models.FloatField(null=True, blank=True)
+    turnaround_time_accepted = models.FloatField(null=True, blank=True)
+
+    FIELDS = [
+        'value_in_usdt', 'hourly_rate', 'min_hours_worked', 'turnaround_time_started', 'turnaround_time_submitted',
+        'turnaround_time_accepted',
+    ]
+
+    def __str__(self):
+        return f"{self.bounty_id}: {self.hourly_rate} / hour"
+
+    @staticmethod
+    def compute(bounty, fulfillments):
+        """Compute the stats of a bounty.
+
+        Args:
+            bounty (dashboard.models.Bounty): The bounty, as saved.
+            fulfillments (list of dashboard.models.BountyFulfillment): Its fulfillments, oldest first.
+
+        Returns:
+            dict: The stats fields, by field name.
+
+        """
+        def turnaround_time(fulfillment_on):
+            if not fulfillment_on or not bounty.web3_created:
+                return None
+            return (fulfillment_on - bounty.web3_created).total_seconds()
+
+        accepted_fulfillments = [fulfillment for fulfillment in fulfillments if fulfillment.accepted]
+        try:
+            hourly_rate = float(bounty.value_in_usdt) / float(accepted_fulfillments[0].fulfiller_hours_worked)
+        except Exception:
+            hourly_rate = None
+        hours_worked = [
+            float(fulfillment.fulfiller_hours_worked) for fulfillment in accepted_fulfillments
+            if fulfillment.fulfiller_hours_worked
+        ]
+        return {
+            'value_in_usdt': float(bounty.value_in_usdt) if bounty.value_in_usdt is not None else None,
+            'hourly_rate': hourly_rate,
+            'min_hours_worked': min(hours_worked) if hours_worked else None,
+            'turnaround_time_started': turnaround_time(bounty.fulfillment_started_on),
+            'turnaround_time_submitted': turnaround_time(fulfillments[0].created_on if fulfillments else None),
+            'turnaround_time_accepted': turnaround_time(
+                accepted_fulfillments[0].accepted_on if accepted_fulfillments else None
+            ),
+        }
+
+    @classmethod
+    def refresh(cls, bounties):
+        """Recompute the stats of the given bounties.
+
+        Args:
+            bounties (iterable of dashboard.models.Bounty): The bounties, as saved.
+
+        """
+        bounties = {bounty.pk: bounty for bounty in bounties}
+        fulfillments = collections.defaultdict(list)
+        for fulfillment in BountyFulfillment.objects.filter(bounty__in=bounties.keys()).order_by('pk'):
+            fulfillments[fulfillment.bounty_id].append(fulfillment)
+        existing = {stats.bounty_id: stats for stats in cls.objects.filter(bounty__in=bounties.keys())}
+
+        new_stats = []
+        for pk, bounty in bounties.items():
+            values = cls.compute(bounty, fulfillments[pk])
+            stats = existing.get(pk)
+            if not stats:
+                new_stats.append(cls(bounty=bounty, **values))
+            elif any(getattr(stats, field) != value for field, value in values.items()):
+                cls.objects.filter(pk=stats.pk).update(modified_on=timezone.now(), **values)
+        cls.objects.bulk_create(new_stats)
+
+
+def normalize_keyword(keyword):
+    """Normalize a keyword the way `BountyKeyword` stores it."""
+    return ' '.join(str(keyword).lower().split())[:200]
+
+
+class BountyKeyword(SuperModel):
+    """Tag a bounty with one of its keywords.
+
+    The keywords come from the issue keywords of the bounty metadata, which the bounty
+    form fills in from the languages of the repository.
+
+    """
+
+    bounty = models.ForeignKey(Bounty, on_delete=models.CASCADE, related_name='keyword_tags')
+    normalized_keyword = models.CharField(max_length=200)
+
+    class Meta:
+        """Define metadata associated with BountyKeyword."""
+
+        unique_together = ('bounty', 'normalized_keyword')
+        indexes = [
+            models.Index(fields=['normalized_keyword', 'bounty'], name='bountykeyword_keyword_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.bounty_id}: {self.normalized_keyword}"
+
+    @staticmethod
+    def get_keywords(bounty):
+        """Get the normalized keywords of a bounty.
+
+        Returns:
+            set of str: The keywords.
+
+        """
+        keywords = bounty.metadata.get('issueKeywords') if isinstance(bounty.metadata, dict) else None
+        if isinstance(keywords, str):
+            keywords = keywords.split(',')
+        if not isinstance(keywords, list):
+            return set()
+        keywords = [normalize_keyword(keyword) for keyword in keywords if isinstance(keyword, str)]
+        return {keyword for keyword in keywords if keyword}
+
+    @classmethod
+    def refresh(cls, bounties):
+        """Make the keyword tags of the given bounties match their metadata.
+
+        Args:
+            bounties (iterable of dashboard.models.Bounty): The bounties, as saved.
+
+        """
+        bounties = {bounty.pk: bounty for bounty in bounties}
+        existing = collections.defaultdict(set)
+        for bounty_id, keyword in cls.objects.filter(bounty__in=bounties.keys()).values_list(
+            'bounty_id', 'normalized_keyword'
+        ):
+            existing[bounty_id].add(keyword)
+
+        new_tags = []
+        stale = Q(pk__in=[])
+        for pk, bounty in bounties.items():
+            keywords = cls.get_keywords(bounty)
+            new_tags += [cls(bounty=bounty, normalized_keyword=keyword) for keyword in keywords - existing[pk]]
+            if existing[pk] - keywords:
+                stale |= Q(bounty_id=pk, normalized_keyword__in=existing[pk] - keywords)
+        cls.objects.filter(stale).delete()
+        cls.objects.bulk_create(new_tags)
+
+
 class BountySyncRequest(SuperModel):
     """Define the structure for bounty syncing."""
 
@@ -1142,6 +1645,26 @@ class SendCryptoAssetQuerySet(models.QuerySet):
         """Filter results down to failed receives only."""
         return self.filter(Q(receive_txid='') | Q(receive_tx_status__in=['dropped', 'unknown', 'na', 'error']))
 
+    def values_in_usdt(self):
+        """Get the value_in_usdt of every send, converting them all at once.
+
+        Returns:
+            list of float: The USDT value of each send, in order. None where no rate was found.
+
+        """
+        sends = list(self.values_list('amount', 'tokenName', 'created_on'))
+        converted = iter(convert_amounts_to_usdt(
+            send for send in sends if send[1] not in settings.STABLE_COINS
+        ))
+        values = []
+        for amount, token_name, __ in sends:
+            if token_name in settings.STABLE_COINS:
+                values.append(float(amount))
+                continue
+            value = next(converted)
+            values.append(None if value is None else round(value, 2))
+        return values
+
 
 class SendCryptoAsset(SuperModel):
     """Abstract Base Class to handle the model for both Tips and Kudos."""
@@ -1326,13 +1849,19 @@ class SendCryptoAsset(SuperModel):
     @property
     def bounty(self):
         try:
-            return Bounty.objects.current().filter(
-                github_url__iexact=self.github_url,
-                network=self.network).order_by('-web3_created').first()
+            if self.github_issue_number is None:
+                return None
+            return Bounty.objects.current().for_issue(
+                self.github_org, self.github_repo, self.github_issue_number,
+            ).filter(network=self.network).order_by('-web3_created').first()
         except Bounty.DoesNotExist:
             return None
 
 
+class TipQuerySet(GithubURLQuerySet, SendCryptoAssetQuerySet):
+    """Handle the manager queryset for Tips."""
+
+
 class Tip(SendCryptoAsset):
     """ Inherit from SendCryptoAsset base class, and extra fields that are needed for Tips. """
     expires_date = models.DateTimeField(null=True, blank=True)
@@ -1343,6 +1872,19 @@ class Tip(SendCryptoAsset):
     sender_profile = models.ForeignKey(
         'dashboard.Profile', related_name='sent_tips', on_delete=models.SET_NULL, null=True, blank=True
     )
+    # parsed from github_url by psave_tip, see GithubURLQuerySet
+    github_org = models.CharField(max_length=255, default='', blank=True, editable=False)
+    github_repo = models.CharField(max_length=255, default='', blank=True, editable=False)
+    github_issue_number = models.IntegerField(null=True, blank=True, editable=False)
+
+    objects = TipQuerySet.as_manager()
+
+    class Meta:
+        """Define metadata associated with Tip."""
+
+        indexes = [
+            models.Index(fields=['github_org', 'github_repo', 'github_issue_number'], name='tip_github_idx'),
+        ]
 
     @property
     def receive_url(self):
@@ -1376,6 +1918,20 @@ class TipPayoutException(Exception):
 def psave_tip(sender, instance, **kwargs):
     # when a new tip is saved, make sure it doesnt have whitespace in it
     instance.username = instance.username.replace(' ', '')
+    instance.github_org, instance.github_repo, instance.github_issue_number = parse_github_url(instance.github_url)
+
+
+@receiver(post_save, sender=Tip, dispatch_uid="postsave_tip")
+def postsave_tip(sender, instance, **kwargs):
+    from dashboard.unclaimed import forget_unclaimed_counts
+    from marketing.leaderboards import update_incremental_leaderboards
+    update_incremental_leaderboards(instance)
+    forget_unclaimed_counts(instance.username)
+    # tips make closed bounties done
+    if instance.github_issue_number is not None:
+        Bounty.objects.for_issue(instance.github_org, instance.github_repo, instance.github_issue_number).filter(
+            network=instance.network, is_open=False,
+        ).refresh_status()
 
 
 # @receiver(pre_save, sender=Bounty, dispatch_uid="normalize_usernames")
@@ -1402,20 +1958,18 @@ def psave_bounty(sender, instance, **kwargs):
         'Months': 5,
     }
 
-    instance.idx_status = instance.status
+    # parsed first, as the tips the status depends on are looked up by issue
+    instance.github_org, instance.github_repo, instance.github_issue_number = parse_github_url(instance.github_url)
+    previous_status = instance.idx_status
+    instance.idx_status = instance.get_status()
+    instance.status_changed = instance._state.adding or instance.idx_status != previous_status
     instance.fulfillment_accepted_on = instance.get_fulfillment_accepted_on
     instance.fulfillment_submitted_on = instance.get_fulfillment_submitted_on
     instance.fulfillment_started_on = instance.get_fulfillment_started_on
-    instance._val_usd_db = instance.get_value_in_usdt if instance.get_value_in_usdt else 0
-    instance._val_usd_db_now = instance.get_value_in_usdt_now if instance.get_value_in_usdt_now else 0
     instance.idx_experience_level = idx_experience_level.get(instance.experience_level, 0)
     instance.idx_project_length = idx_project_length.get(instance.project_length, 0)
-    instance.token_value_time_peg = instance.get_token_value_time_peg
-    instance.token_value_in_usdt = instance.get_token_value_in_usdt
-    instance.value_in_usdt_now = instance.get_value_in_usdt_now
-    instance.value_in_usdt = instance.get_value_in_usdt
-    instance.value_in_eth = instance.get_value_in_eth
-    instance.value_true = instance.get_value_true
+    for field, value in instance.get_valuation(instance.idx_status).items():
+        setattr(instance, field, value)
 
 
 class InterestQuerySet(models.QuerySet):
@@ -1489,12 +2043,20 @@ class Interest(SuperModel):
 
 
 @receiver(post_save, sender=Interest, dispatch_uid="psave_interest")
-@receiver(post_delete, sender=Interest, dispatch_uid="pdel_interest")
 def psave_interest(sender, instance, **kwargs):
     # when a new interest is saved, update the status on frontend
-    print("signal: updating bounties psave_interest")
-    for bounty in Bounty.objects.filter(interested=instance):
-        bounty.save()
+    Bounty.objects.filter(interested=instance).refresh_status()
+
+
+@receiver(pre_delete, sender=Interest, dispatch_uid="predel_interest")
+def predel_interest(sender, instance, **kwargs):
+    # the bounty links are deleted along with the interest, so remember the bounties beforehand
+    instance.bounty_pks = list(Bounty.objects.filter(interested=instance).values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=Interest, dispatch_uid="pdel_interest")
+def pdel_interest(sender, instance, **kwargs):
+    Bounty.objects.filter(pk__in=getattr(instance, 'bounty_pks', [])).refresh_status()
 
 class ActivityQuerySet(models.QuerySet):
     """Handle the manager queryset for Activities."""
@@ -1522,6 +2084,29 @@ class ActivityQuerySet(models.QuerySet):
             activity_type='bounty_abandonment_escalation_to_mods',
         )
 
+    def with_view_props(self):
+        """Get the activities with their `view_props` computed in bulk.
+
+        The related objects, the bounties linked from the metadata and the kudos tokens are
+        loaded with one query each instead of a few queries per activity.
+
+        Returns:
+            list of Activity: The activities, whose `view_props` doesn't query anymore.
+
+        """
+        from kudos.models import Token
+        activities = list(
+            self.select_related('bounty', 'tip', 'kudos', 'profile').prefetch_related('bounty__interested')
+        )
+        metadatas = [activity.get_view_metadata() for activity in activities]
+        bounty_ids = {metadata['id'] for metadata in metadatas if 'id' in metadata}
+        bounties = Bounty.objects.only('github_url', 'standard_bounties_id').in_bulk(bounty_ids)
+        kudos_token_ids = {activity.kudos.kudos_token_cloned_from_id for activity in activities if activity.kudos}
+        kudos_tokens = Token.objects.in_bulk(kudos_token_ids)
+        for activity in activities:
+            activity._view_props = activity.get_view_props(bounties=bounties, kudos_tokens=kudos_tokens)
+        return activities
+
 
 class Activity(SuperModel):
     """Represent Start work/Stop work event.
@@ -1602,10 +2187,32 @@ class Activity(SuperModel):
     def i18n_name(self):
         return _(next((x[1] for x in self.ACTIVITY_TYPES if x[0] == self.activity_type), 'Unknown type'))
 
+    def get_view_metadata(self):
+        if 'new_bounty' in self.metadata:
+            return self.metadata['new_bounty']
+        return self.metadata
+
     @property
     def view_props(self):
+        if hasattr(self, '_view_props'):
+            return self._view_props
+        return self.get_view_props()
+
+    def get_view_props(self, bounties=None, kudos_tokens=None):
+        """Get the data the activity templates render.
+
+        Args:
+            bounties (dict): pk => Bounty, for the bounties linked from the metadata, if already loaded.
+            kudos_tokens (dict): pk => kudos Token, for the kudos tokens, if already loaded.
+
+        Returns:
+            dict: The view props.
+
+        """
         from dashboard.tokens import token_by_name
         from kudos.models import Token
+        bounties = bounties or {}
+        kudos_tokens = kudos_tokens or {}
         icons = {
             'new_tip': 'fa-thumbs-up',
             'start_work': 'fa-lightbulb',
@@ -1633,13 +2240,13 @@ class Activity(SuperModel):
         # in a later release, it couild be refactored such that its just contained in the above code block ^^.
         activity['icon'] = icons.get(self.activity_type, 'fa-check-circle')
         if activity.get('kudos'):
-            activity['kudos_data'] = Token.objects.get(pk=self.kudos.kudos_token_cloned_from_id)
-        obj = self.metadata
-        if 'new_bounty' in self.metadata:
-            obj = self.metadata['new_bounty']
+            token_id = self.kudos.kudos_token_cloned_from_id
+            activity['kudos_data'] = kudos_tokens.get(token_id) or Token.objects.get(pk=token_id)
+        obj = self.get_view_metadata()
         activity['title'] = obj.get('title', '')
         if 'id' in obj:
-            activity['bounty_url'] = Bounty.objects.get(pk=obj['id']).get_relative_url()
+            bounty = bounties.get(obj['id']) or Bounty.objects.get(pk=obj['id'])
+            activity['bounty_url'] = bounty.get_relative_url()
             if activity.get('title'):
                 activity['urled_title'] = f'<a href="{activity["bounty_url"]}">{activity["title"]}</a>'
             else:
@@ -1686,6 +2293,16 @@ class Activity(SuperModel):
         return model_to_dict(self, **kwargs)
 
 
+@receiver(post_save, sender=Activity, dispatch_uid="postsave_activity")
+def postsave_activity(sender, instance, created, **kwargs):
+    # only bounty and tip activities are counted on profiles
+    if created and (instance.bounty_id or instance.tip_id):
+        ProfileStats.mark_stale(
+            handles=[instance.bounty.github_org if instance.bounty_id else instance.tip.github_org],
+            profile_ids=[instance.profile_id],
+        )
+
+
 class LabsResearch(SuperModel):
     """Define the structure of Labs Research object."""
 
@@ -1861,7 +2478,7 @@ class Profile(SuperModel):
     @property
     def bounties(self):
         fulfilled_bounty_ids = self.fulfilled.all().values_list('bounty_id')
-        bounties = Bounty.objects.filter(github_url__istartswith=self.github_url, current_bounty=True)
+        bounties = Bounty.objects.for_org(self.handle).filter(current_bounty=True)
         for interested in self.interested.all():
             bounties = bounties | Bounty.objects.filter(interested=interested, current_bounty=True)
         bounties = bounties | Bounty.objects.filter(pk__in=fulfilled_bounty_ids, current_bounty=True)
@@ -1872,7 +2489,7 @@ class Profile(SuperModel):
 
     @property
     def tips(self):
-        on_repo = Tip.objects.filter(github_url__startswith=self.github_url).order_by('-id')
+        on_repo = Tip.objects.for_org(self.handle).order_by('-id')
         tipped_for = Tip.objects.filter(username__iexact=self.handle).order_by('-id')
         return on_repo | tipped_for
 
@@ -1913,6 +2530,19 @@ class Profile(SuperModel):
         return f"@{self.handle} is a {role} who has participated in {total_funded_participated} " \
                f"funded issue{plural} on Gitcoin"
 
+    def get_desc_from_stats(self, stats):
+        role = 'newbie'
+        if stats.sum_usdt_funded > stats.sum_usdt_collected:
+            role = 'funder'
+        elif stats.sum_usdt_funded < stats.sum_usdt_collected:
+            role = 'coder'
+
+        total_funded_participated = stats.funded_bounties_count + stats.fulfilled_bounties_count
+        plural = 's' if total_funded_participated != 1 else ''
+
+        return f"@{self.handle} is a {role} who has participated in {total_funded_participated} " \
+               f"funded issue{plural} on Gitcoin"
+
     @property
     def desc(self):
         return self.get_desc(self.get_funded_bounties(), self.get_fulfilled_bounties())
@@ -1964,7 +2594,9 @@ class Profile(SuperModel):
 
     @property
     def get_quarterly_stats(self):
-        """Generate last 90 days stats for this user.
+        """Get the last 90 days stats for this user, as materialized by `ProfileQuarterlyStats`.
+
+        Stats older than a day are recomputed first.
 
         Returns:
             dict : containing the following information
@@ -1990,165 +2622,18 @@ class Profile(SuperModel):
             'user_languages': Languages that were used in bounties that were worked on.
             'relevant_bounties': a list of Bounty(s) that would match the skillset input by the user into the Match tab of their settings
         """
-        user_active_in_last_quarter = False
-        user_fulfilled_bounties = False
-        user_funded_bounties = False
-        last_quarter = datetime.now() - timedelta(days=90)
-        bounties = self.bounties.filter(created_on__gte=last_quarter, network='mainnet')
-        fulfilled_bounties = [
-            bounty for bounty in bounties if bounty.is_fulfiller(self.handle) and bounty.status == 'done'
-        ]
-        fulfilled_bounties_count = len(fulfilled_bounties)
-        funded_bounties = self.get_funded_bounties()
-        funded_bounties_count = funded_bounties.count()
-
-        if funded_bounties_count:
-            total_funded_usd = funded_bounties.has_funds().aggregate(Sum('value_in_usdt'))['value_in_usdt__sum']
-            total_funded_hourly_rate = float(0)
-            hourly_rate_bounties_counted = float(0)
-            for bounty in funded_bounties:
-                hourly_rate = bounty.hourly_rate
-                if hourly_rate:
-                    total_funded_hourly_rate += bounty.hourly_rate
-                    hourly_rate_bounties_counted += 1
-            funded_bounty_fulfillments = []
-            for bounty in funded_bounties:
-                fulfillments = bounty.fulfillments.filter(accepted=True)
-                for fulfillment in fulfillments:
-                    if isinstance(fulfillment, BountyFulfillment):
-                        funded_bounty_fulfillments.append(fulfillment)
-            funded_bounty_fulfillments_count = len(funded_bounty_fulfillments)
-
-            total_funded_hours = 0
-            funded_fulfillments_with_hours_counted = 0
-            if funded_bounty_fulfillments_count:
-                from decimal import Decimal
-                for fulfillment in funded_bounty_fulfillments:
-                    if isinstance(fulfillment.fulfiller_hours_worked, Decimal):
-                        total_funded_hours += fulfillment.fulfiller_hours_worked
-                        funded_fulfillments_with_hours_counted += 1
-
-            user_funded_bounty_developers = []
-            for fulfillment in funded_bounty_fulfillments:
-                user_funded_bounty_developers.append(fulfillment.fulfiller_github_username.lstrip('@'))
-            user_funded_bounty_developers = [*{*user_funded_bounty_developers}]
-            if funded_fulfillments_with_hours_counted:
-                avg_hourly_rate_per_funded_bounty = \
-                    float(total_funded_hourly_rate) / float(funded_fulfillments_with_hours_counted)
-                avg_hours_per_funded_bounty = \
-                    float(total_funded_hours) / float(funded_fulfillments_with_hours_counted)
-            else:
-                avg_hourly_rate_per_funded_bounty = 0
-                avg_hours_per_funded_bounty = 0
-            funded_fulfilled_bounties = [
-                bounty for bounty in funded_bounties if bounty.status == 'done'
-            ]
-            num_funded_fulfilled_bounties = len(funded_fulfilled_bounties)
-            funded_fulfilled_percent = float(
-                # Round to 0 places of decimals to be displayed in template
-                round(num_funded_fulfilled_bounties * 1.0 / funded_bounties_count, 2) * 100
-            )
-            user_funded_bounties = True
-        else:
-            num_funded_fulfilled_bounties = 0
-            funded_fulfilled_percent = 0
-            user_funded_bounties = False
-            avg_hourly_rate_per_funded_bounty = 0
-            avg_hours_per_funded_bounty = 0
-            total_funded_usd = 0
-            total_funded_hours = 0
-            user_funded_bounty_developers = []
-
-        total_earned_eth = sum([
-            bounty.value_in_eth if bounty.value_in_eth else 0
-            for bounty in fulfilled_bounties
-        ])
-        total_earned_eth /= 10**18
-        total_earned_usd = sum([
-            bounty.value_in_usdt if bounty.value_in_usdt else 0
-            for bounty in fulfilled_bounties
-        ])
-
-        num_completed_bounties = bounties.filter(idx_status__in=['done']).count()
-        terminal_state_bounties = bounties.filter(idx_status__in=Bounty.TERMINAL_STATUSES).count()
-        completetion_percent = int(
-            round(num_completed_bounties * 1.0 / terminal_state_bounties, 2) * 100
-        ) if terminal_state_bounties != 0 else 0
-
-        avg_eth_earned_per_bounty = 0
-        avg_usd_earned_per_bounty = 0
-
-        if fulfilled_bounties_count:
-            avg_eth_earned_per_bounty = total_earned_eth / fulfilled_bounties_count
-            avg_usd_earned_per_bounty = total_earned_usd / fulfilled_bounties_count
-            user_fulfilled_bounties = True
-
-        user_languages = []
-        for bounty in fulfilled_bounties:
-            user_languages += bounty.keywords.split(',')
-        user_languages = set(user_languages)
-        user_no_of_languages = len(user_languages)
-
-        if num_completed_bounties or fulfilled_bounties_count:
-            user_active_in_last_quarter = True
-            relevant_bounties = []
-        else:
-            from marketing.utils import get_or_save_email_subscriber
-            user_coding_languages = get_or_save_email_subscriber(self.email, 'internal').keywords
-            if user_coding_languages is not None:
-                potential_bounties = Bounty.objects.all()
-                relevant_bounties = Bounty.objects.none()
-                for keyword in user_coding_languages:
-                    relevant_bounties = relevant_bounties.union(potential_bounties.current().filter(
-                            network=Profile.get_network(),
-                            metadata__icontains=keyword,
-                            idx_status__in=['open'],
-                            ).order_by('?')
-                    )
-                relevant_bounties = relevant_bounties[:3]
-                relevant_bounties = list(relevant_bounties)
-        # Round to 2 places of decimals to be diplayed in templates
-        completetion_percent = float('%.2f' % completetion_percent)
-        funded_fulfilled_percent = float('%.2f' % funded_fulfilled_percent)
-        avg_eth_earned_per_bounty = float('%.2f' % avg_eth_earned_per_bounty)
-        avg_usd_earned_per_bounty = float('%.2f' % avg_usd_earned_per_bounty)
-        avg_hourly_rate_per_funded_bounty = float('%.2f' % avg_hourly_rate_per_funded_bounty)
-        avg_hours_per_funded_bounty = float('%.2f' % avg_hours_per_funded_bounty)
-        total_earned_eth = float('%.2f' % total_earned_eth)
-        total_earned_usd = float('%.2f' % total_earned_usd)
-
-        user_languages = []
-        for bounty in fulfilled_bounties:
-            user_languages += bounty.keywords.split(',')
-        user_languages = set(user_languages)
-        user_no_of_languages = len(user_languages)
-
-        return {
-            'user_total_earned_eth': total_earned_eth,
-            'user_total_earned_usd': total_earned_usd,
-            'user_total_funded_usd': total_funded_usd,
-            'user_total_funded_hours': total_funded_hours,
-            'user_fulfilled_bounties_count': fulfilled_bounties_count,
-            'user_fulfilled_bounties': user_fulfilled_bounties,
-            'user_funded_bounties_count': funded_bounties_count,
-            'user_funded_bounties': user_funded_bounties,
-            'user_funded_bounty_developers': user_funded_bounty_developers,
-            'user_avg_hours_per_funded_bounty': avg_hours_per_funded_bounty,
-            'user_avg_hourly_rate_per_funded_bounty': avg_hourly_rate_per_funded_bounty,
-            'user_avg_eth_earned_per_bounty': avg_eth_earned_per_bounty,
-            'user_avg_usd_earned_per_bounty': avg_usd_earned_per_bounty,
-            'user_num_completed_bounties': num_completed_bounties,
-            'user_num_funded_fulfilled_bounties': num_funded_fulfilled_bounties,
-            'user_bounty_completion_percentage': completetion_percent,
-            'user_funded_fulfilled_percentage': funded_fulfilled_percent,
-            'user_active_in_last_quarter': user_active_in_last_quarter,
-            'user_no_of_languages': user_no_of_languages,
-            'user_languages': user_languages,
-            'relevant_bounties': relevant_bounties
-        }
+        try:
+            quarterly_stats = self.quarterly_stats
+        except ProfileQuarterlyStats.DoesNotExist:
+            quarterly_stats = None
+        if not quarterly_stats or quarterly_stats.modified_on < timezone.now() - ProfileQuarterlyStats.MAX_AGE:
+            quarterly_stats = self.quarterly_stats = ProfileQuarterlyStats.refresh([self])[self.handle]
+        return quarterly_stats.to_stats()
 
     @property
     def active_avatar(self):
+        if 'avatar_baseavatar_related' in getattr(self, '_prefetched_objects_cache', {}):
+            return next((avatar for avatar in self.avatar_baseavatar_related.all() if avatar.active), None)
         return self.avatar_baseavatar_related.filter(active=True).first()
 
     @property
@@ -2157,8 +2642,9 @@ class Profile(SuperModel):
 
     @property
     def avatar_url(self):
-        if self.active_avatar:
-            return self.active_avatar.avatar_url
+        active_avatar = self.active_avatar
+        if active_avatar:
+            return active_avatar.avatar_url
         return f"{settings.BASE_URL}dynamic/avatar/{self.handle}"
 
     @property
@@ -2318,6 +2804,24 @@ class Profile(SuperModel):
     def get_network():
         return 'mainnet' if not settings.DEBUG else 'rinkeby'
 
+    def get_stats(self, network=None):
+        """Get the snapshot of this profile's numbers on a network, recomputing it if it is missing or stale.
+
+        Args:
+            network (str): The network to get the numbers for.
+                Defaults to: None (Environment specific).
+
+        Returns:
+            dashboard.models.ProfileStats: The snapshot.
+
+        """
+        network = network or self.get_network()
+        stats = ProfileStats.objects.filter(profile=self, network=network).first()
+        if not stats or stats.stale:
+            stats = ProfileStats.refresh(self, network)
+        stats.profile = self
+        return stats
+
     def get_fulfilled_bounties(self, network=None):
         network = network or self.get_network()
         fulfilled_bounty_ids = self.fulfilled.all().values_list('bounty_id', flat=True)
@@ -2326,8 +2830,7 @@ class Profile(SuperModel):
 
     def get_orgs_bounties(self, network=None):
         network = network or self.get_network()
-        url = f"https://github.com/{self.handle}"
-        bounties = Bounty.objects.current().filter(network=network, github_url__icontains=url)
+        bounties = Bounty.objects.current().filter(network=network).for_org(self.handle)
         return bounties
 
     def get_leaderboard_index(self, key='quarterly_earners'):
@@ -2458,10 +2961,10 @@ class Profile(SuperModel):
         if not self.is_org:
             all_activities = self.activities
         else:
-            url = self.github_url
+            org = self.handle.lower()
             all_activities = Activity.objects.filter(
-                Q(bounty__github_url__startswith=url) |
-                Q(tip__github_url__startswith=url),
+                Q(bounty__github_org=org) |
+                Q(tip__github_org=org),
             )
 
         all_activities = all_activities.filter(
@@ -2494,12 +2997,7 @@ class Profile(SuperModel):
             query_kwargs (dict): The kwargs to be passed to all queries
                 throughout the method.
             bounties (dashboard.models.BountyQuerySet): All bounties referencing this profile.
-            fulfilled_bounties (dashboard.models.BountyQuerySet): All fulfilled bounties for this profile.
-            funded_bounties (dashboard.models.BountyQuerySet): All funded bounties for this profile.
-            orgs_bounties (dashboard.models.BountyQuerySet or None):
-                All bounties belonging to this organization, if applicable.
-            sum_eth_funded (float): The total amount of ETH funded.
-            sum_eth_collected (float): The total amount of ETH collected.
+            stats (dashboard.models.ProfileStats): The snapshot of the profile's numbers on the network.
 
         Returns:
             dict: The profile card context.
@@ -2509,31 +3007,8 @@ class Profile(SuperModel):
         network = network or self.get_network()
         query_kwargs = {'network': network}
         bounties = self.bounties
-        fulfilled_bounties = self.get_fulfilled_bounties(network=network)
-        funded_bounties = self.get_funded_bounties(network=network)
-        orgs_bounties = None
-
-        if self.is_org:
-            orgs_bounties = self.get_orgs_bounties(network=network)
-
-        sum_eth_funded = self.get_eth_sum(sum_type='funded', bounties=funded_bounties)
-        sum_eth_collected = self.get_eth_sum(bounties=fulfilled_bounties)
-        works_with_funded = self.get_who_works_with(work_type='funded', bounties=funded_bounties)
-        works_with_collected = self.get_who_works_with(work_type='collected', bounties=fulfilled_bounties)
-
-        # org only
-        count_bounties_on_repo = 0
-        sum_eth_on_repos = 0
-        works_with_org = []
-        if orgs_bounties:
-            count_bounties_on_repo = orgs_bounties.count()
-            sum_eth_on_repos = self.get_eth_sum(bounties=orgs_bounties)
-            works_with_org = self.get_who_works_with(work_type='org', bounties=orgs_bounties)
-
-        total_funded = funded_bounties.count()
-        total_fulfilled = fulfilled_bounties.count()
-        desc = self.get_desc(funded_bounties, fulfilled_bounties)
-        no_times_been_removed = self.no_times_been_removed_by_funder() + self.no_times_been_removed_by_staff() + self.no_times_slashed_by_staff()
+        stats = self.get_stats(network=network)
+        desc = self.get_desc_from_stats(stats)
         params = {
             'title': f"@{self.handle}",
             'active': 'profile_details',
@@ -2543,16 +3018,18 @@ class Profile(SuperModel):
             'avatar_url': self.avatar_url_with_gitcoin_logo,
             'profile': self,
             'bounties': bounties,
-            'count_bounties_completed': total_fulfilled,
-            'sum_eth_collected': sum_eth_collected,
-            'sum_eth_funded': sum_eth_funded,
-            'works_with_collected': works_with_collected,
-            'works_with_funded': works_with_funded,
-            'funded_bounties_count': total_funded,
-            'no_times_been_removed': no_times_been_removed,
-            'sum_eth_on_repos': sum_eth_on_repos,
-            'works_with_org': works_with_org,
-            'count_bounties_on_repo': count_bounties_on_repo,
+            'profile_stats': stats,
+            'count_bounties_completed': stats.fulfilled_bounties_count,
+            'sum_eth_collected': stats.sum_eth_collected,
+            'sum_eth_funded': stats.sum_eth_funded,
+            'works_with_collected': stats.get_works_with('works_with_collected'),
+            'works_with_funded': stats.get_works_with('works_with_funded'),
+            'funded_bounties_count': stats.funded_bounties_count,
+            'funded_bounties_status_counts': stats.status_counts,
+            'no_times_been_removed': stats.no_times_been_removed,
+            'sum_eth_on_repos': stats.sum_eth_on_repos,
+            'works_with_org': stats.get_works_with('works_with_org'),
+            'count_bounties_on_repo': stats.bounties_on_repo_count,
         }
 
         if activities:
@@ -2571,30 +3048,18 @@ class Profile(SuperModel):
 
     @property
     def locations(self):
-        from app.utils import get_location_from_ip
-        locations = []
-        for login in self.actions.filter(action='Login'):
-            if login.location_data:
-                locations.append(login.location_data)
-            else:
-                location_data = get_location_from_ip(login.ip_address)
-                login.location_data = location_data
-                login.save()
-                locations.append(location_data)
-        return locations
+        logins = list(self.actions.filter(action='Login'))
+        UserAction.resolve_locations([login for login in logins if not login.location_data])
+        return [login.location_data for login in logins]
 
     @property
     def is_eu(self):
-        from app.utils import get_country_from_ip
+        logins = self.actions.filter(action='Login')
         try:
-            ip_addresses = list(set(self.actions.filter(action='Login').values_list('ip_address', flat=True)))
-            for ip_address in ip_addresses:
-                country = get_country_from_ip(ip_address)
-                if country.continent.code == 'EU':
-                    return True
+            UserAction.resolve_locations(logins.filter(location_data={}).exclude(ip_address=None))
         except Exception:
             pass
-        return False
+        return logins.filter(continent_code='EU').exists()
 
 
 # enforce casing / formatting rules for profiles
@@ -2622,6 +3087,223 @@ def post_logout(sender, request, user, **kwargs):
     create_user_action(user, 'Logout', request)
 
 
+class ProfileStats(SuperModel):
+    """Materialize the numbers shown on a profile page, per network.
+
+    A snapshot is marked stale by the signals of the bounties, fulfillments, kudos, activities
+    and user actions of its profile, recomputed the next time it is read, and reconciled in
+    batches by the `refresh_profile_stats` command.
+
+    """
+
+    profile = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name='stats')
+    network = models.CharField(max_length=255)
+    stale = models.BooleanField(default=False, db_index=True)
+    funded_bounties_count = models.IntegerField(default=0)
+    fulfilled_bounties_count = models.IntegerField(default=0)
+    bounties_on_repo_count = models.IntegerField(default=0)
+    sum_eth_funded = models.FloatField(default=0)
+    sum_eth_collected = models.FloatField(default=0)
+    sum_eth_on_repos = models.FloatField(default=0)
+    sum_usdt_funded = models.FloatField(default=0)
+    sum_usdt_collected = models.FloatField(default=0)
+    status_counts = JSONField(default=dict, blank=True, help_text=_('The number of bounties funded, by status'))
+    works_with_funded = JSONField(default=list, blank=True)
+    works_with_collected = JSONField(default=list, blank=True)
+    works_with_org = JSONField(default=list, blank=True)
+    no_times_been_removed = models.IntegerField(default=0)
+    kudos_count = models.IntegerField(default=0)
+    sent_kudos_count = models.IntegerField(default=0)
+    activity_counts = JSONField(default=dict, blank=True, help_text=_('The number of activities, by activity type'))
+
+    REMOVAL_ACTIONS = ['bounty_removed_by_funder', 'bounty_removed_by_staff', 'bounty_removed_slashed_by_staff']
+
+    class Meta:
+        unique_together = ('profile', 'network')
+        verbose_name_plural = 'Profile stats'
+
+    def __str__(self):
+        return f"{self.profile_id} on {self.network}"
+
+    @staticmethod
+    def compute(profile, network):
+        """Compute the stats of a profile on a network, with one aggregate query per number.
+
+        Returns:
+            dict: The stats fields, by field name.
+
+        """
+        def works_with(names):
+            # most_common keeps ties in the order they were first seen, as get_who_works_with does
+            return [[name, count] for name, count in collections.Counter(name for name in names if name).most_common()]
+
+        def eth(wei):
+            return float((wei or 0) / 10**18)
+
+        def org_names(bounties):
+            for github_url in bounties.values_list('github_url', flat=True):
+                try:
+                    yield org_name(github_url)
+                except Exception:
+                    pass
+
+        funded_bounties = profile.get_funded_bounties(network=network)
+        fulfilled_bounties = profile.get_fulfilled_bounties(network=network)
+        funded = funded_bounties.aggregate(count=Count('pk'), usdt=Sum('value_in_usdt'))
+        fulfilled = fulfilled_bounties.aggregate(count=Count('pk'), usdt=Sum('value_in_usdt'), eth=Sum('value_in_eth'))
+        values = {
+            'funded_bounties_count': funded['count'],
+            'fulfilled_bounties_count': fulfilled['count'],
+            'sum_eth_funded': eth(funded_bounties.has_funds().aggregate(eth=Sum('value_in_eth'))['eth']),
+            'sum_eth_collected': eth(fulfilled['eth']),
+            'sum_usdt_funded': float(funded['usdt'] or 0),
+            'sum_usdt_collected': float(fulfilled['usdt'] or 0),
+            'status_counts': dict(
+                funded_bounties.order_by().values_list('idx_status').annotate(count=Count('pk'))
+            ),
+            'works_with_funded': works_with(org_names(funded_bounties)),
+            'works_with_collected': works_with(org_names(fulfilled_bounties)),
+            'bounties_on_repo_count': 0,
+            'sum_eth_on_repos': 0,
+            'works_with_org': [],
+        }
+
+        if profile.is_org:
+            orgs_bounties = profile.get_orgs_bounties(network=network)
+            org = orgs_bounties.aggregate(count=Count('pk'), eth=Sum('value_in_eth'))
+            values['bounties_on_repo_count'] = org['count']
+            values['sum_eth_on_repos'] = eth(org['eth'])
+            values['works_with_org'] = works_with(
+                BountyFulfillment.objects.filter(bounty__in=orgs_bounties, accepted=True)
+                .order_by('bounty_id', 'pk').values_list('fulfiller_github_username', flat=True)
+            )
+
+        values['no_times_been_removed'] = UserAction.objects.filter(
+            profile=profile, action__in=ProfileStats.REMOVAL_ACTIONS,
+        ).count()
+        values['kudos_count'] = profile.get_my_kudos.count()
+        values['sent_kudos_count'] = profile.get_sent_kudos.count()
+        values['activity_counts'] = dict(
+            profile.get_bounty_and_tip_activities(network=network).order_by()
+            .values_list('activity_type').annotate(count=Count('pk'))
+        )
+        return values
+
+    @classmethod
+    def refresh(cls, profile, network):
+        """Recompute and save the snapshot of a profile on a network.
+
+        Returns:
+            ProfileStats: The snapshot.
+
+        """
+        # clear the flag first, so that changes made while computing leave the snapshot stale
+        cls.objects.filter(profile=profile, network=network).update(stale=False)
+        values = cls.compute(profile, network)
+        values['modified_on'] = timezone.now()
+        stats, __ = cls.objects.update_or_create(profile=profile, network=network, defaults=values)
+        return stats
+
+    @classmethod
+    def mark_stale(cls, handles=(), profile_ids=()):
+        """Mark the snapshots of the given profiles stale, with a single UPDATE.
+
+        Args:
+            handles (iterable of str): Github handles, as written on bounties and tips.
+            profile_ids (iterable of int): Profile primary keys.
+
+        """
+        handles = {handle.lstrip('@').lower() for handle in handles if handle}
+        profile_ids = {pk for pk in profile_ids if pk}
+        if not handles and not profile_ids:
+            return
+        cls.objects.filter(
+            Q(profile__handle__in=handles) | Q(profile_id__in=profile_ids), stale=False,
+        ).update(stale=True)
+
+    @classmethod
+    def mark_bounties_stale(cls, bounties):
+        """Mark the snapshots of the funders, orgs and fulfillers of the given bounties stale.
+
+        Args:
+            bounties (list of dashboard.models.Bounty): The bounties whose status changed.
+
+        """
+        if not bounties:
+            return
+        fulfillers = list(BountyFulfillment.objects.filter(
+            bounty__in=[bounty.pk for bounty in bounties],
+        ).values_list('profile_id', 'fulfiller_github_username'))
+        handles = [handle for bounty in bounties for handle in [bounty.bounty_owner_github_username, bounty.github_org]]
+        cls.mark_stale(
+            handles=handles + [handle for __, handle in fulfillers],
+            profile_ids=[profile_id for profile_id, __ in fulfillers],
+        )
+
+    def get_works_with(self, field):
+        return collections.OrderedDict(getattr(self, field))
+
+    def get_activity_count(self, activity_name):
+        """Get the number of activities `dashboard.views.profile_filter_activities` would return."""
+        if not activity_name or activity_name == 'all':
+            return sum(self.activity_counts.values())
+        if activity_name == 'start_work':
+            return self.activity_counts.get('start_work', 0) + self.activity_counts.get('worker_approved', 0)
+        return self.activity_counts.get(activity_name, 0)
+
+
+class ProfileQuarterlyStats(SuperModel):
+    """Materialize the last 90 days stats of a profile, computed in batches by `dashboard.quarterly_stats`."""
+
+    profile = models.OneToOneField(Profile, on_delete=models.CASCADE, related_name='quarterly_stats')
+    since = models.DateTimeField(help_text=_('The start of the 90 days the stats cover'))
+    stats = JSONField(default=dict, blank=True)
+
+    MAX_AGE = timedelta(days=1)
+
+    class Meta:
+        verbose_name_plural = 'Profile quarterly stats'
+
+    def __str__(self):
+        return f"{self.profile_id} since {self.since}"
+
+    @classmethod
+    def refresh(cls, profiles=None, since=None):
+        """Recompute the quarterly stats of the given profiles.
+
+        Args:
+            profiles (iterable of Profile): The profiles. Defaults to: None (every profile).
+            since (datetime): The start of the quarter. Defaults to: 90 days ago.
+
+        Returns:
+            dict: handle => ProfileQuarterlyStats
+
+        """
+        from dashboard.quarterly_stats import QUARTER, compute_quarterly_stats
+        since = since or timezone.now() - QUARTER
+        handles = None if profiles is None else [profile.handle for profile in profiles]
+        computed = compute_quarterly_stats(handles, since)
+        profile_ids = dict(Profile.objects.filter(handle__in=computed.keys()).values_list('handle', 'pk'))
+
+        rows = {
+            handle: cls(profile_id=profile_ids[handle], since=since, stats=stats)
+            for handle, stats in computed.items()
+        }
+        with transaction.atomic():
+            cls.objects.filter(profile_id__in=profile_ids.values()).delete()
+            cls.objects.bulk_create(rows.values(), batch_size=1000)
+        return rows
+
+    def to_stats(self):
+        """Get the stats the way `Profile.get_quarterly_stats` returns them."""
+        stats = dict(self.stats)
+        relevant_bounty_ids = stats.pop('relevant_bounty_ids', [])
+        relevant_bounties = Bounty.objects.in_bulk(relevant_bounty_ids) if relevant_bounty_ids else {}
+        stats['relevant_bounties'] = [relevant_bounties[pk] for pk in relevant_bounty_ids if pk in relevant_bounties]
+        stats['user_languages'] = set(stats['user_languages'])
+        return stats
+
+
 class ProfileSerializer(serializers.BaseSerializer):
     """Handle serializing the Profile object."""
 
@@ -2661,6 +3343,24 @@ def normalize_tip_usernames(sender, instance, **kwargs):
 m2m_changed.connect(m2m_changed_interested, sender=Bounty.interested.through)
 
 
+@receiver(m2m_changed, sender=Bounty.interested.through, dispatch_uid="m2m_changed_bounty_status")
+def m2m_changed_bounty_status(sender, instance, action, reverse, pk_set, **kwargs):
+    """Refresh the status of the bounties whose interests were added or removed."""
+    if reverse and action == 'pre_clear':
+        # pk_set is None when clearing, so remember the bounties beforehand, as predel_interest does
+        instance.cleared_bounty_pks = list(Bounty.objects.filter(interested=instance).values_list('pk', flat=True))
+        return
+    if action not in ['post_add', 'post_remove', 'post_clear']:
+        return
+    if reverse:
+        if action == 'post_clear':
+            pk_set = getattr(instance, 'cleared_bounty_pks', [])
+        bounties = Bounty.objects.filter(pk__in=pk_set or [])
+    else:
+        bounties = Bounty.objects.filter(pk=instance.pk)
+    bounties.refresh_status()
+
+
 class UserAction(SuperModel):
     """Records Actions that a user has taken ."""
 
@@ -2678,12 +3378,52 @@ class UserAction(SuperModel):
     profile = models.ForeignKey('dashboard.Profile', related_name='actions', on_delete=models.CASCADE, null=True)
     ip_address = models.GenericIPAddressField(null=True)
     location_data = JSONField(default=dict)
+    city = models.CharField(max_length=255, blank=True, default='', editable=False)
+    country_name = models.CharField(max_length=255, blank=True, default='', editable=False)
+    continent_code = models.CharField(max_length=2, blank=True, default='', editable=False)
+    continent_name = models.CharField(max_length=255, blank=True, default='', editable=False)
     metadata = JSONField(default=dict)
     utm = JSONField(default=dict, null=True)
 
+    LOCATION_FIELDS = ['city', 'country_name', 'continent_code', 'continent_name']
+
     def __str__(self):
         return f"{self.action} by {self.profile} at {self.created_on}"
 
+    def normalize_location(self):
+        """Copy the city, country and continent of `location_data` to their columns."""
+        location_data = self.location_data or {}
+        for field in self.LOCATION_FIELDS:
+            setattr(self, field, location_data.get(field) or '')
+
+    @classmethod
+    def resolve_locations(cls, actions):
+        """Resolve the locations of actions from their IP address, and save them with a single UPDATE.
+
+        Args:
+            actions (list of UserAction): The actions. Those without an IP address are skipped.
+
+        """
+        from app.geoip import geoip_resolver
+        from dashboard.revaluation import bulk_update
+        actions = [action for action in actions if action.ip_address]
+        locations = geoip_resolver.lookup_many(action.ip_address for action in actions)
+        for action in actions:
+            action.location_data = locations[action.ip_address]
+            action.normalize_location()
+        bulk_update(cls, actions, ['location_data'] + cls.LOCATION_FIELDS)
+
+
+@receiver(pre_save, sender=UserAction, dispatch_uid="psave_useraction")
+def psave_useraction(sender, instance, **kwargs):
+    instance.normalize_location()
+
+
+@receiver(post_save, sender=UserAction, dispatch_uid="postsave_useraction")
+def postsave_useraction(sender, instance, created, **kwargs):
+    if created and instance.action in ProfileStats.REMOVAL_ACTIONS:
+        ProfileStats.mark_stale(profile_ids=[instance.profile_id])
+
 
 class CoinRedemption(SuperModel):
     """Define the coin redemption schema."""
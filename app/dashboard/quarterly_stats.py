@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""Define the batch computation of the quarterly stats emailed to profiles.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import json
+import random
+from collections import defaultdict
+from datetime import timedelta
+
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.contrib.postgres.fields.jsonb import KeyTextTransform
+from django.db.models import Count, Q, Sum, Value
+from django.db.models.functions import Lower, Replace
+from django.utils import timezone
+
+from dashboard.models import Bounty, BountyFulfillment, BountyKeyword, Profile, Tip, normalize_keyword
+from marketing.models import EmailSubscriber
+
+QUARTER = timedelta(days=90)
+NETWORK = 'mainnet'
+NUM_RELEVANT_BOUNTIES = 3
+
+
+def handle_of(field):
+    """Normalize a Github username column the way profile handles are stored."""
+    return Replace(Lower(field), Value('@'), Value(''))
+
+
+def split_keywords(keywords):
+    """Split the issue keywords of a bounty, read as text from its metadata."""
+    if not keywords:
+        return []
+    if keywords.startswith('['):
+        try:
+            return [keyword for keyword in json.loads(keywords) if isinstance(keyword, str)]
+        except ValueError:
+            pass
+    return keywords.split(',')
+
+
+def current_bounties():
+    return Bounty.objects.current().filter(network=NETWORK)
+
+
+def get_funded_totals(handles=None):
+    """Aggregate the bounties funded by each profile, and their accepted fulfillments.
+
+    Hourly rates are read from `BountyStats`, which holds the same rate as `Bounty.hourly_rate`.
+
+    Returns:
+        tuple: (handle => bounty totals, handle => fulfillment totals)
+
+    """
+    bounties = current_bounties().annotate(owner=handle_of('bounty_owner_github_username'))
+    fulfillments = BountyFulfillment.objects.filter(
+        accepted=True, bounty__current_bounty=True, bounty__admin_override_and_hide=False, bounty__network=NETWORK,
+    ).annotate(owner=handle_of('bounty__bounty_owner_github_username'))
+    if handles is not None:
+        bounties = bounties.filter(owner__in=handles)
+        fulfillments = fulfillments.filter(owner__in=handles)
+
+    bounty_totals = bounties.order_by().values('owner').annotate(
+        count=Count('pk'),
+        funded_usd=Sum('value_in_usdt', filter=Q(idx_status__in=Bounty.FUNDED_STATUSES)),
+        done=Count('pk', filter=Q(idx_status='done')),
+        hourly_rate=Sum('stats__hourly_rate'),
+    )
+    fulfillment_totals = fulfillments.order_by().values('owner').annotate(
+        hours=Sum('fulfiller_hours_worked'),
+        with_hours=Count('fulfiller_hours_worked'),
+        developers=ArrayAgg('fulfiller_github_username', distinct=True),
+    )
+    return (
+        {row['owner']: row for row in bounty_totals},
+        {row['owner']: row for row in fulfillment_totals},
+    )
+
+
+def get_quarter_bounties(since, handles=None):
+    """Get the bounties of the quarter and the profiles taking part in each, as `Profile.bounties` selects them.
+
+    Returns:
+        tuple: (pk => bounty values, handle => pks of the bounties of the profile,
+            Github username => pks of the bounties it has an accepted fulfillment on)
+
+    """
+    window = current_bounties().filter(created_on__gte=since)
+    tips = Tip.objects.all()
+    if handles is not None:
+        tips = tips.annotate(username_handle=handle_of('username')).filter(
+            Q(github_org__in=handles) | Q(username_handle__in=handles)
+        )
+        window = window.annotate(owner=handle_of('bounty_owner_github_username')).filter(
+            Q(github_org__in=handles) | Q(owner__in=handles) | Q(interested__profile__handle__in=handles) |
+            Q(fulfillments__profile__handle__in=handles) | Q(fulfillments__fulfiller_github_username__in=handles) |
+            Q(github_url__in=tips.values('github_url'))
+        ).distinct()
+
+    bounties = {
+        bounty['pk']: bounty for bounty in window.values(
+            'pk', 'github_org', 'bounty_owner_github_username', 'github_url', 'idx_status', 'value_in_eth',
+            'value_in_usdt', keywords=KeyTextTransform('issueKeywords', 'metadata'),
+        )
+    }
+    members = defaultdict(set)
+    by_url = defaultdict(set)
+    for pk, bounty in bounties.items():
+        members[bounty['github_org']].add(pk)
+        members[bounty['bounty_owner_github_username'].lower().lstrip('@')].add(pk)
+        by_url[bounty['github_url']].add(pk)
+
+    interests = Bounty.interested.through.objects.filter(bounty_id__in=bounties.keys())
+    for pk, handle in interests.values_list('bounty_id', 'interest__profile__handle'):
+        members[handle].add(pk)
+
+    fulfilled_by = defaultdict(set)
+    fulfillments = BountyFulfillment.objects.filter(bounty_id__in=bounties.keys())
+    for pk, handle, username, accepted in fulfillments.values_list(
+        'bounty_id', 'profile__handle', 'fulfiller_github_username', 'accepted',
+    ):
+        members[handle].add(pk)
+        if accepted:
+            fulfilled_by[username].add(pk)
+
+    for github_url, org, username in tips.filter(github_url__in=by_url.keys()).values_list(
+        'github_url', 'github_org', 'username',
+    ):
+        members[org] |= by_url[github_url]
+        members[(username or '').lower()] |= by_url[github_url]
+
+    return bounties, members, fulfilled_by
+
+
+def get_relevant_bounty_ids(keywords_by_handle):
+    """Pick up to `NUM_RELEVANT_BOUNTIES` open bounties tagged with the keywords of each profile.
+
+    Returns:
+        dict: handle => the pks of the picked bounties.
+
+    """
+    if not any(keywords_by_handle.values()):
+        return {}
+    open_bounties = Bounty.objects.current().filter(network=Profile.get_network(), idx_status='open')
+    tagged = defaultdict(set)
+    for keyword, pk in BountyKeyword.objects.filter(bounty__in=open_bounties).values_list(
+        'normalized_keyword', 'bounty_id',
+    ):
+        tagged[keyword].add(pk)
+
+    relevant_bounty_ids = {}
+    for handle, keywords in keywords_by_handle.items():
+        pks = set()
+        for keyword in keywords:
+            pks |= tagged[normalize_keyword(keyword)]
+        relevant_bounty_ids[handle] = random.sample(sorted(pks), min(len(pks), NUM_RELEVANT_BOUNTIES))
+    return relevant_bounty_ids
+
+
+def compute_quarterly_stats(handles=None, since=None):
+    """Compute the quarterly stats of profiles with a few grouped queries over the whole quarter.
+
+    Args:
+        handles (list of str): The handles of the profiles. Defaults to: None (every profile).
+        since (datetime): The start of the quarter. Defaults to: 90 days ago.
+
+    Returns:
+        dict: handle => stats, as `Profile.get_quarterly_stats` returns them, with the pks
+            of the relevant bounties as `relevant_bounty_ids`.
+
+    """
+    since = since or timezone.now() - QUARTER
+    profiles = Profile.objects.all()
+    if handles is not None:
+        handles = {handle.lower() for handle in handles}
+        profiles = profiles.filter(handle__in=handles)
+    emails = dict(profiles.values_list('handle', 'email'))
+
+    funded_totals, fulfillment_totals = get_funded_totals(handles)
+    bounties, members, fulfilled_by = get_quarter_bounties(since, handles)
+
+    results = {}
+    inactive = {}
+    for handle in emails:
+        funded = funded_totals.get(handle, {})
+        fulfillments = fulfillment_totals.get(handle, {})
+        funded_bounties_count = funded.get('count', 0)
+        with_hours = fulfillments.get('with_hours', 0)
+        total_funded_hours = fulfillments.get('hours') or 0
+        if funded_bounties_count:
+            funded_fulfilled_percent = float(round(funded['done'] * 1.0 / funded_bounties_count, 2) * 100)
+        else:
+            funded_fulfilled_percent = 0
+        if with_hours:
+            avg_hourly_rate_per_funded_bounty = float(funded.get('hourly_rate') or 0) / with_hours
+            avg_hours_per_funded_bounty = float(total_funded_hours) / with_hours
+        else:
+            avg_hourly_rate_per_funded_bounty = 0
+            avg_hours_per_funded_bounty = 0
+
+        quarter_bounties = [bounties[pk] for pk in members.get(handle, ())]
+        fulfilled_bounties = [
+            bounties[pk] for pk in members.get(handle, set()) & fulfilled_by.get(handle, set())
+            if bounties[pk]['idx_status'] == 'done'
+        ]
+        fulfilled_bounties_count = len(fulfilled_bounties)
+        total_earned_eth = float(sum(bounty['value_in_eth'] or 0 for bounty in fulfilled_bounties)) / 10**18
+        total_earned_usd = float(sum(bounty['value_in_usdt'] or 0 for bounty in fulfilled_bounties))
+        num_completed_bounties = len([bounty for bounty in quarter_bounties if bounty['idx_status'] == 'done'])
+        terminal_state_bounties = len([
+            bounty for bounty in quarter_bounties if bounty['idx_status'] in Bounty.TERMINAL_STATUSES
+        ])
+        completetion_percent = int(
+            round(num_completed_bounties * 1.0 / terminal_state_bounties, 2) * 100
+        ) if terminal_state_bounties else 0
+        user_languages = set()
+        for bounty in fulfilled_bounties:
+            user_languages.update(split_keywords(bounty['keywords']))
+
+        user_active_in_last_quarter = bool(num_completed_bounties or fulfilled_bounties_count)
+        if not user_active_in_last_quarter:
+            inactive[handle] = emails[handle]
+
+        results[handle] = {
+            'user_total_earned_eth': float('%.2f' % total_earned_eth),
+            'user_total_earned_usd': float('%.2f' % total_earned_usd),
+            'user_total_funded_usd': float(funded.get('funded_usd') or 0),
+            'user_total_funded_hours': float(total_funded_hours),
+            'user_fulfilled_bounties_count': fulfilled_bounties_count,
+            'user_fulfilled_bounties': bool(fulfilled_bounties_count),
+            'user_funded_bounties_count': funded_bounties_count,
+            'user_funded_bounties': bool(funded_bounties_count),
+            'user_funded_bounty_developers': sorted({
+                developer.lstrip('@') for developer in fulfillments.get('developers', []) if developer
+            }),
+            'user_avg_hours_per_funded_bounty': float('%.2f' % avg_hours_per_funded_bounty),
+            'user_avg_hourly_rate_per_funded_bounty': float('%.2f' % avg_hourly_rate_per_funded_bounty),
+            'user_avg_eth_earned_per_bounty': float(
+                '%.2f' % (total_earned_eth / fulfilled_bounties_count if fulfilled_bounties_count else 0)
+            ),
+            'user_avg_usd_earned_per_bounty': float(
+                '%.2f' % (total_earned_usd / fulfilled_bounties_count if fulfilled_bounties_count else 0)
+            ),
+            'user_num_completed_bounties': num_completed_bounties,
+            'user_num_funded_fulfilled_bounties': funded.get('done', 0),
+            'user_bounty_completion_percentage': float('%.2f' % completetion_percent),
+            'user_funded_fulfilled_percentage': float('%.2f' % funded_fulfilled_percent),
+            'user_active_in_last_quarter': user_active_in_last_quarter,
+            'user_no_of_languages': len(user_languages),
+            'user_languages': sorted(user_languages),
+            'relevant_bounty_ids': [],
+        }
+
+    keywords_by_email = defaultdict(list)
+    subscribers = EmailSubscriber.objects.filter(email__in=[email for email in inactive.values() if email])
+    for email, keywords in subscribers.values_list('email', 'keywords'):
+        keywords_by_email[email].extend(keywords or [])
+    relevant_bounty_ids = get_relevant_bounty_ids({
+        handle: keywords_by_email.get(email, []) for handle, email in inactive.items()
+    })
+    for handle, pks in relevant_bounty_ids.items():
+        results[handle]['relevant_bounty_ids'] = pks
+
+    return results
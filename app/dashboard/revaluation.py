@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Define the bulk bounty revaluation pipeline.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import logging
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import models
+from django.db.models import Case, Value, When
+from django.db.models.functions import Cast
+
+from dashboard.models import Bounty, BountyStats
+from economy.utils import preload_usdt_rates
+
+logger = logging.getLogger(__name__)
+
+# the fields written by Bounty.get_valuation
+VALUATION_FIELDS = [
+    '_val_usd_db', '_val_usd_db_now', 'token_value_time_peg', 'token_value_in_usdt', 'value_in_usdt_now',
+    'value_in_usdt', 'value_in_eth', 'value_true',
+]
+# the fields read by Bounty.get_valuation
+VALUATION_INPUT_FIELDS = ['token_name', 'token_address', 'value_in_token', 'web3_created', 'idx_status']
+# token_value_time_peg is "now" for open bounties, so it always changes; it is only written along with the others
+COMPARED_FIELDS = [field for field in VALUATION_FIELDS if field != 'token_value_time_peg']
+
+
+def to_db_value(field, value):
+    """Round a value the way the database column will store it."""
+    if value is None or not isinstance(field, models.DecimalField):
+        return value
+    exponent = Decimal(1).scaleb(-field.decimal_places)
+    return Decimal(str(value)).quantize(exponent, rounding=ROUND_HALF_UP)
+
+
+def bulk_update(model, objs, fields):
+    """Update the given fields of many objects with a single UPDATE ... CASE query.
+
+    This is what `QuerySet.bulk_update` does from Django 2.2 on. Like it, the CASE is cast
+    to the column type, which postgres needs for values sent as untyped literals (json).
+
+    """
+    if not objs:
+        return 0
+    updates = {}
+    for name in fields:
+        field = model._meta.get_field(name)
+        whens = [When(pk=obj.pk, then=Value(getattr(obj, field.attname), output_field=field)) for obj in objs]
+        updates[field.attname] = Cast(Case(*whens, output_field=field), output_field=field)
+    return model.objects.filter(pk__in=[obj.pk for obj in objs]).update(**updates)
+
+
+def revalue_bounty(bounty):
+    """Recompute the value fields of a bounty in place.
+
+    Returns:
+        bool: Whether any of the stored values changed.
+
+    """
+    try:
+        valuation = bounty.get_valuation(bounty.idx_status)
+    except Exception as e:
+        logger.warning(f'Could not revalue bounty {bounty.pk} - ({e})')
+        valuation = {'_val_usd_db': 0, '_val_usd_db_now': 0}
+
+    changed = False
+    for name, value in valuation.items():
+        value = to_db_value(Bounty._meta.get_field(name), value)
+        if name in COMPARED_FIELDS and value != getattr(bounty, name):
+            changed = True
+        setattr(bounty, name, value)
+    return changed
+
+
+def revalue_bounties(bounties=None, batch_size=500):
+    """Recompute the value fields of many bounties, writing only the rows that changed.
+
+    Bounties are streamed in chunks, every conversion rate they need is loaded up front,
+    and each batch of changed rows is written with a single UPDATE of just the value
+    columns. Unlike `bounty.save()` this doesn't run the `pre_save`/`post_save` chain.
+
+    Args:
+        bounties (dashboard.models.BountyQuerySet): The bounties to revalue. Defaults to all bounties.
+        batch_size (int): The number of rows to read and to write at once.
+
+    Returns:
+        tuple: The number of bounties revalued and the number of bounties updated.
+
+    """
+    if bounties is None:
+        bounties = Bounty.objects.all()
+    preload_usdt_rates(bounties.order_by().values_list('token_name', flat=True).distinct())
+
+    total, updated, changed = 0, 0, []
+    bounties = bounties.only('pk', *VALUATION_FIELDS, *VALUATION_INPUT_FIELDS).order_by('pk')
+    for bounty in bounties.iterator(chunk_size=batch_size):
+        total += 1
+        if revalue_bounty(bounty):
+            changed.append(bounty)
+        if len(changed) >= batch_size:
+            updated += save_valuations(changed)
+            changed = []
+    updated += save_valuations(changed)
+    return total, updated
+
+
+def save_valuations(bounties):
+    """Write the value fields of the given bounties and refresh the stats that depend on them."""
+    updated = bulk_update(Bounty, bounties, VALUATION_FIELDS)
+    if bounties:
+        BountyStats.refresh(Bounty.objects.filter(pk__in=[bounty.pk for bounty in bounties]))
+    return updated
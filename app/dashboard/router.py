@@ -17,14 +17,26 @@ You should have received a copy of the GNU Affero General Public License
 along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 """
-import time
+import base64
+from collections import OrderedDict, defaultdict
 from datetime import datetime
+from functools import lru_cache
+
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 import django_filters.rest_framework
-from rest_framework import routers, serializers, viewsets
+from economy.models import ConversionRate
+from rest_framework import pagination, routers, serializers, viewsets
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
+from rest_framework.utils.urls import replace_query_param
 from retail.helpers import get_ip
 
-from .models import Activity, Bounty, BountyFulfillment, Interest, ProfileSerializer, SearchHistory
+from .models import Activity, Bounty, BountyFulfillment, Interest, ProfileSerializer, Tip
+from .search_history import record_search
 
 
 class BountyFulfillmentSerializer(serializers.ModelSerializer):
@@ -119,13 +131,128 @@ class BountySerializer(serializers.HyperlinkedModelSerializer):
         return bounty
 
 
+@lru_cache(maxsize=None)
+def get_field_formatters(serializer_class):
+    """Get the (name, attribute, format) of each readable field of a serializer.
+
+    format is None for values which are output as they are; related fields read the id
+    column of the relation instead of loading it.
+
+    """
+    formatters = []
+    for name, field in serializer_class().fields.items():
+        if field.write_only:
+            continue
+        attribute = field.source
+        if isinstance(field, serializers.RelatedField):
+            attribute = f'{attribute}_id'
+        formatted = isinstance(field, (serializers.DateTimeField, serializers.DateField, serializers.DecimalField))
+        formatters.append((name, attribute, field.to_representation if formatted else None))
+    return formatters
+
+
+def to_dict(instance, serializer_class, overrides):
+    """Serialize an instance like serializer_class does, with overrides: field name => function of the instance."""
+    ret = OrderedDict()
+    for name, attribute, format in get_field_formatters(serializer_class):
+        if name in overrides:
+            ret[name] = overrides[name](instance)
+            continue
+        value = getattr(instance, attribute)
+        ret[name] = format(value) if format and value is not None else value
+    return ret
+
+
+class BountyDictSerializer:
+    """Serialize bounties to the same data as `BountySerializer`, without DRF's per row machinery.
+
+    Meant for bounties loaded with `BountyQuerySet.with_api_relations`. The tips and the
+    USDT conversion rates of all the bounties are loaded once, with one query each.
+
+    """
+
+    def __init__(self, bounties, request):
+        self.bounties = list(bounties)
+        self.request = request
+        self.tips = self.load_tips()
+        self.conversion_rates = self.load_conversion_rates()
+
+        profile_serializer = ProfileSerializer()
+        profile = lambda obj: None if obj.profile_id is None else profile_serializer.to_representation(obj.profile)
+        bounty_serializer = BountySerializer()
+        self.overrides = {
+            'url': lambda bounty: reverse('bounty-detail', kwargs={'pk': bounty.pk}, request=request),
+            'fulfillments': lambda bounty: [
+                to_dict(fulfillment, BountyFulfillmentSerializer, {}) for fulfillment in bounty.fulfillments.all()
+            ],
+            'interested': lambda bounty: [
+                to_dict(interest, InterestSerializer, {'profile': profile}) for interest in bounty.interested.all()
+            ],
+            'activities': lambda bounty: [
+                to_dict(activity, ActivitySerializer, {'profile': profile}) for activity in bounty.activities.all()
+            ],
+            'bounty_owner_email': bounty_serializer.override_bounty_owner_email,
+            'bounty_owner_name': bounty_serializer.override_bounty_owner_name,
+            'paid': lambda bounty: bounty.get_paid(tips=self.get_tips(bounty)),
+            'additional_funding_summary': lambda bounty: bounty.get_additional_funding_summary(
+                tips=self.get_tips(bounty), conversion_rates=self.conversion_rates,
+            ),
+        }
+
+    @property
+    def data(self):
+        return [self.to_representation(bounty) for bounty in self.bounties]
+
+    @staticmethod
+    def get_tip_key(obj):
+        return obj.network, obj.github_org, obj.github_repo, obj.github_issue_number
+
+    def load_tips(self):
+        keys = {self.get_tip_key(bounty) for bounty in self.bounties if bounty.github_issue_number is not None}
+        tips = defaultdict(list)
+        if not keys:
+            return tips
+        networks, orgs, repos, issue_numbers = (set(values) for values in zip(*keys))
+        candidates = Tip.objects.filter(
+            network__in=networks, github_org__in=orgs, github_repo__in=repos, github_issue_number__in=issue_numbers,
+        ).order_by('-created_on')
+        for tip in candidates:
+            if self.get_tip_key(tip) in keys:
+                tips[self.get_tip_key(tip)].append(tip)
+        return tips
+
+    def load_conversion_rates(self):
+        tokens = {tip.tokenName for tips in self.tips.values() for tip in tips if tip.is_for_bounty_fulfiller}
+        rates = dict.fromkeys(tokens)
+        if tokens:
+            latest_rates = ConversionRate.objects.filter(from_currency__in=tokens, to_currency='USDT') \
+                .order_by('from_currency', '-timestamp').distinct('from_currency')
+            rates.update((rate.from_currency, rate) for rate in latest_rates)
+        return rates
+
+    def get_tips(self, bounty):
+        if bounty.github_issue_number is None:
+            # not an issue url, so matched on the url one by one, as few bounties are
+            return list(bounty.tips)
+        return self.tips.get(self.get_tip_key(bounty), [])
+
+    def to_representation(self, bounty):
+        return to_dict(bounty, BountySerializer, self.overrides)
+
+
 class BountyViewSet(viewsets.ModelViewSet):
     """Handle the Bounty view behavior."""
-    queryset = Bounty.objects.prefetch_related('fulfillments', 'interested', 'interested__profile', 'activities') \
-        .all().order_by('-web3_created')
+    queryset = Bounty.objects.with_api_relations().all().order_by('-web3_created')
     serializer_class = BountySerializer
     filter_backends = (django_filters.rest_framework.DjangoFilterBackend,)
 
+    def list(self, request, *args, **kwargs):
+        """List the bounties, with `BountyDictSerializer` when the `serializer=fast` param is given."""
+        if request.query_params.get('serializer') != 'fast':
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(BountyDictSerializer(queryset, request).data)
+
     def get_queryset(self):
         """Get the queryset for Bounty.
 
@@ -134,8 +261,7 @@ class BountyViewSet(viewsets.ModelViewSet):
 
         """
         param_keys = self.request.query_params.keys()
-        queryset = Bounty.objects.prefetch_related(
-            'fulfillments', 'interested', 'interested__profile', 'activities')
+        queryset = Bounty.objects.with_api_relations()
         if 'not_current' not in param_keys:
             queryset = queryset.current()
 
@@ -205,7 +331,7 @@ class BountyViewSet(viewsets.ModelViewSet):
                 _queryset = queryset.none()
                 for value in values:
                     org = value.strip()
-                    _queryset = _queryset | queryset.filter(github_url__icontains=f'https://github.com/{org}')
+                    _queryset = _queryset | queryset.for_org(org)
                 queryset = _queryset
 
         # Retrieve all fullfilled bounties by fulfiller_username
@@ -282,13 +408,161 @@ class BountyViewSet(viewsets.ModelViewSet):
         # save search history, but only not is_featured
         if 'is_featured' not in param_keys:
             if self.request.user and self.request.user.is_authenticated:
-                data['nonce'] = int(time.time() / 1000)
-                SearchHistory.objects.update_or_create(
-                    user=self.request.user,
-                    data=data,
-                    ip_address=get_ip(self.request)
-                )
+                record_search(self.request.user, data, get_ip(self.request))
+
+        return queryset
+
+
+class BountySearchSerializer(BountySerializer):
+    """Handle serializing the Bounty object, limited to the requested fields."""
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+        if fields:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class BountyKeysetPagination(pagination.BasePagination):
+    """Paginate bounties newest first with a (web3_created, pk) cursor instead of an offset.
+
+    Every page is a single index range scan, however deep it is.
+
+    """
+
+    cursor_query_param = 'cursor'
+    limit_query_param = 'limit'
+    default_limit = 25
+    max_limit = 100
+    ordering = ('-web3_created', '-pk')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        limit = self.get_limit(request)
+        cursor = self.decode_cursor(request)
+        if cursor:
+            web3_created, pk = cursor
+            queryset = queryset.filter(Q(web3_created__lt=web3_created) | Q(web3_created=web3_created, pk__lt=pk))
+
+        results = list(queryset.order_by(*self.ordering)[:limit + 1])
+        self.next_cursor = self.encode_cursor(results[limit - 1]) if len(results) > limit else None
+        return results[:limit]
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([('next', self.get_next_link()), ('results', data)]))
+
+    def get_next_link(self):
+        if not self.next_cursor:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, self.next_cursor)
+
+    def get_limit(self, request):
+        try:
+            limit = int(request.query_params.get(self.limit_query_param, self.default_limit))
+        except ValueError:
+            return self.default_limit
+        return min(max(limit, 1), self.max_limit)
+
+    def encode_cursor(self, bounty):
+        value = f'{bounty.web3_created.isoformat()}|{bounty.pk}'
+        return base64.urlsafe_b64encode(value.encode()).decode()
+
+    def decode_cursor(self, request):
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None
+        try:
+            web3_created, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+            web3_created = parse_datetime(web3_created)
+            if not web3_created:
+                raise ValueError(cursor)
+            return web3_created, int(pk)
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise NotFound('Invalid cursor')
+
+
+class BountySearchViewSet(viewsets.ReadOnlyModelViewSet):
+    """Handle the v1 Bounty search behavior.
+
+    Unlike `BountyViewSet`, filters are exact matches on indexed columns, pages are
+    keyset paginated, and `fields` selects which fields (and so which related rows)
+    are serialized.
+
+    """
+
+    queryset = Bounty.objects.all()
+    serializer_class = BountySearchSerializer
+    pagination_class = BountyKeysetPagination
+
+    # query parameter => column, for comma separated exact matches
+    exact_filters = OrderedDict([
+        ('network', 'network'),
+        ('idx_status', 'idx_status'),
+        ('coinbase', 'bounty_owner_address'),
+        ('bounty_owner_github_username', 'bounty_owner_github_username'),
+        ('standard_bounties_id', 'standard_bounties_id'),
+        ('github_url', 'github_url'),
+        ('experience_level', 'experience_level'),
+        ('project_length', 'project_length'),
+        ('bounty_type', 'bounty_type'),
+        ('permission_type', 'permission_type'),
+        ('project_type', 'project_type'),
+        ('pk', 'pk'),
+    ])
+    # serializer field => the lookups it needs prefetched
+    prefetches = {
+        'fulfillments': ['fulfillments'],
+        'interested': ['interested', 'interested__profile'],
+        'activities': ['activities', 'activities__profile'],
+    }
+
+    def get_fields(self):
+        fields = self.request.query_params.get('fields', '')
+        return [field.strip() for field in fields.split(',') if field.strip()]
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault('fields', self.get_fields())
+        return super().get_serializer(*args, **kwargs)
+
+    def get_queryset(self):
+        """Get the queryset for Bounty.
+
+        Returns:
+            QuerySet: The Bounty queryset.
+
+        """
+        params = self.request.query_params
+        queryset = Bounty.objects.all()
+        if 'not_current' not in params:
+            queryset = queryset.current()
+
+        for param, column in self.exact_filters.items():
+            values = [value.strip() for value in params.get(param, '').split(',') if value.strip()]
+            if values:
+                try:
+                    queryset = queryset.filter(**{f'{column}__in': values})
+                except ValueError:
+                    raise ValidationError({param: 'Invalid value'})
+
+        if 'is_open' in params:
+            queryset = queryset.filter(is_open=params.get('is_open').lower() == 'true', expires_date__gt=timezone.now())
+
+        if 'keyword' in params:
+            queryset = queryset.keyword(params.get('keyword'))
 
+        if params.get('search'):
+            queryset = queryset.search(params.get('search'), rank=False)
+
+        fields = self.get_fields() or self.serializer_class.Meta.fields
+        for field, lookups in self.prefetches.items():
+            if field in fields:
+                queryset = queryset.prefetch_related(*lookups)
+
+        if self.action == 'list' and self.request.user and self.request.user.is_authenticated:
+            data = dict(params)
+            data.pop('cursor', None)
+            record_search(self.request.user, data, get_ip(self.request))
 
         return queryset
 
@@ -296,3 +570,6 @@ class BountyViewSet(viewsets.ModelViewSet):
 # Routers provide an easy way of automatically determining the URL conf.
 router = routers.DefaultRouter()
 router.register(r'bounties', BountyViewSet)
+
+router_v1 = routers.DefaultRouter()
+router_v1.register(r'bounties', BountySearchViewSet, base_name='bounties_v1')
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""Define a minimal JSON-RPC batch client for talking to web3 nodes.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import itertools
+import logging
+
+import requests
+from eth_abi import decode_abi
+from eth_utils import to_checksum_address
+from hexbytes import HexBytes
+
+logger = logging.getLogger(__name__)
+
+
+class JSONRPCError(Exception):
+
+    @property
+    def is_reverted(self):
+        """Tell whether the node ran the call and it reverted, rather than failing to answer it."""
+        error = self.args[0] if self.args and isinstance(self.args[0], dict) else {}
+        # geth reports 'execution reverted', parity 'VM execution error.' with 'Reverted 0x' data
+        return 'revert' in f"{error.get('message', '')} {error.get('data', '')}".lower()
+
+
+class JSONRPCBatchClient:
+    """Send many JSON-RPC requests to a node in as few HTTP round trips as possible.
+
+    web3.py only issues one request per HTTP call, which makes reading contract state
+    for hundreds of bounties dominated by network latency.  This client packs up to
+    `batch_size` calls into a single JSON-RPC batch request and maps the responses back
+    to the order in which they were requested.
+
+    """
+
+    def __init__(self, endpoint_uri, batch_size=100, timeout=30, session=None):
+        self.endpoint_uri = endpoint_uri
+        self.batch_size = max(1, int(batch_size))
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        self._ids = itertools.count()
+
+    def request(self, method, params):
+        """Make a single JSON-RPC request and return its result."""
+        return self.batch([(method, params)])[0]
+
+    def batch(self, calls):
+        """Make the provided (method, params) calls and return their results in order.
+
+        Results for calls which errored are returned as `JSONRPCError` instances rather
+        than raised, so that one bad call doesn't fail the rest of the batch.
+
+        """
+        results = []
+        for offset in range(0, len(calls), self.batch_size):
+            results += self._send(calls[offset:offset + self.batch_size])
+        return results
+
+    def _send(self, calls):
+        payload = [{
+            'jsonrpc': '2.0',
+            'id': next(self._ids),
+            'method': method,
+            'params': params,
+        } for method, params in calls]
+        response = self.session.post(self.endpoint_uri, json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        body = response.json()
+        if isinstance(body, dict):
+            # some nodes answer a batch with a single error object
+            raise JSONRPCError(body.get('error', body))
+
+        by_id = {item.get('id'): item for item in body}
+        results = []
+        for request in payload:
+            item = by_id.get(request['id'])
+            if item is None:
+                results.append(JSONRPCError(f"no response for {request['method']}"))
+            elif item.get('error'):
+                results.append(JSONRPCError(item['error']))
+            else:
+                results.append(item.get('result'))
+        return results
+
+
+def get_endpoint_uri(web3):
+    """Get the HTTP endpoint backing the provided web3 instance."""
+    for provider in web3.providers:
+        endpoint_uri = getattr(provider, 'endpoint_uri', None)
+        if endpoint_uri and str(endpoint_uri).startswith('http'):
+            return endpoint_uri
+    return None
+
+
+def encode_contract_call(contract, fn_name, args, block='latest'):
+    """Build the `eth_call` (method, params) pair for a contract function."""
+    data = contract.encodeABI(fn_name=fn_name, args=args)
+    return 'eth_call', [{'to': contract.address, 'data': data}, block]
+
+
+def get_output_types(contract, fn_name):
+    for item in contract.abi:
+        if item.get('type') == 'function' and item.get('name') == fn_name:
+            return [output['type'] for output in item.get('outputs', [])]
+    raise ValueError(f'{fn_name} is not part of the contract ABI')
+
+
+def decode_contract_result(contract, fn_name, result):
+    """Decode the raw `eth_call` result for a contract function.
+
+    The return value is normalized the same way web3's `.call()` does it: addresses are
+    checksummed, strings are text and single outputs are unwrapped.
+
+    Returns:
+        The decoded output, or None if the call returned no data (a reverted call).
+
+    """
+    if isinstance(result, Exception):
+        raise result
+    if not result or result == '0x':
+        return None
+
+    output_types = get_output_types(contract, fn_name)
+    values = []
+    for _type, value in zip(output_types, decode_abi(output_types, HexBytes(result))):
+        if _type == 'address':
+            value = to_checksum_address(value)
+        elif _type == 'string' and isinstance(value, bytes):
+            value = value.decode('utf-8', errors='replace')
+        values.append(value)
+
+    if len(values) == 1:
+        return values[0]
+    return values
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Define the batched search history writer.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import json
+import logging
+import time
+
+from django.utils import timezone
+
+from dashboard.models import SearchHistory
+
+logger = logging.getLogger(__name__)
+
+QUEUE_KEY = 'search_history_queue'
+
+
+def get_queue_client():
+    from app.utils import get_raw_cache_client
+    return get_raw_cache_client()
+
+
+def record_search(user, data, ip_address):
+    """Queue a search to be written to SearchHistory by `flush_search_history`.
+
+    Falls back to writing the row right away if the queue can't be reached.
+
+    Args:
+        user (User): The user who searched.
+        data (dict): The search parameters.
+        ip_address (str): The IP address of the request.
+
+    """
+    data = dict(data, nonce=int(time.time() / 1000))
+    entry = {'user_id': user.pk, 'data': data, 'ip_address': ip_address}
+    try:
+        get_queue_client().rpush(QUEUE_KEY, json.dumps(entry))
+    except Exception as e:
+        logger.warning(f'Could not queue search history - ({e})')
+        SearchHistory.objects.get_or_create(user=user, data=data, ip_address=ip_address)
+
+
+def entry_key(user_id, data, ip_address):
+    return user_id, json.dumps(data, sort_keys=True), ip_address
+
+
+def flush_search_history(batch_size=1000):
+    """Write the queued searches to SearchHistory, skipping ones already recorded.
+
+    A batch is only removed from the queue once it is written, so a failed write leaves it for the next flush.
+    Searches are pushed to the tail of the queue, so trimming the head only removes the written batch.
+
+    Returns:
+        int: The number of rows created.
+
+    """
+    redis = get_queue_client()
+    created = 0
+    while True:
+        items = redis.lrange(QUEUE_KEY, 0, batch_size - 1)
+        if not items:
+            return created
+
+        entries = {}
+        for item in items:
+            entry = json.loads(item)
+            entries.setdefault(entry_key(entry['user_id'], entry['data'], entry['ip_address']), entry)
+
+        # the nonce changes every ~17 minutes, so older rows can't be duplicates
+        since = timezone.now() - timezone.timedelta(hours=1)
+        existing = SearchHistory.objects.filter(
+            user_id__in={entry['user_id'] for entry in entries.values()}, created_on__gt=since
+        ).values_list('user_id', 'data', 'ip_address')
+        for key in [entry_key(*row) for row in existing]:
+            entries.pop(key, None)
+
+        SearchHistory.objects.bulk_create([SearchHistory(**entry) for entry in entries.values()])
+        redis.ltrim(QUEUE_KEY, len(items), -1)
+        created += len(entries)
@@ -25,8 +25,8 @@ from django.test.client import RequestFactory
 
 import pytz
 import requests_mock
-from dashboard.helpers import amount, issue_details, normalize_url, process_bounty_details
-from dashboard.models import Bounty
+from dashboard.helpers import amount, create_new_bounty, issue_details, normalize_url, process_bounty_details
+from dashboard.models import Bounty, Tip
 from economy.models import ConversionRate
 from marketing.mails import featured_funded_bounty
 from test_plus.test import TestCase
@@ -52,6 +52,37 @@ class DashboardHelpersTest(TestCase):
         request = self.factory.get('/sync/get_amount', params)
         assert amount(request).content == b'{"eth": 5.0, "usdt": 10.0}'
 
+    @patch('dashboard.helpers.get_gh_issue_details')
+    @patch('dashboard.models.Bounty.fetch_issue_item')
+    def test_create_new_bounty_paid_by_tips(self, mock_fetch_issue_item, mock_get_gh_issue_details):
+        """Test that the new version of a closed bounty paid by tips is done rather than cancelled."""
+        github_url = 'https://github.com/gitcoinco/web/issues/12'
+        old_bounty = Bounty.objects.create(
+            title='foo',
+            is_open=True,
+            web3_created=datetime(2008, 10, 31, tzinfo=pytz.UTC),
+            expires_date=datetime(2222, 11, 30, tzinfo=pytz.UTC),
+            github_url=github_url,
+            network='mainnet',
+            raw_data={},
+            standard_bounties_id=12,
+            current_bounty=True,
+        )
+        Tip.objects.create(
+            emails=[],
+            github_url=github_url,
+            expires_date=datetime(2222, 11, 30, tzinfo=pytz.UTC),
+            network='mainnet',
+            txid='0x0',
+            tx_status='success',
+        )
+
+        new_bounty = create_new_bounty(
+            Bounty.objects.filter(pk=old_bounty.pk), {'webReferenceURL': github_url}, {'bountyStage': 2}, 12
+        )
+        assert new_bounty.status == 'done'
+        assert new_bounty.canceled_on is None
+
     def test_normalize_url(self):
         """Test the dashboard helper normalize_url method."""
         assert normalize_url('https://gitcoin.co/') == 'https://gitcoin.co'
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""Handle IPFS cache related tests.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from unittest.mock import MagicMock, patch
+
+from dashboard.ipfs_cache import IPFSCache
+from test_plus.test import TestCase
+
+
+class IPFSCacheTest(TestCase):
+    """Define tests for the IPFS cache."""
+
+    @patch('dashboard.ipfs_cache.cache')
+    def test_payload_is_fetched_once(self, mock_cache):
+        """Test that a payload is only fetched from the network once."""
+        mock_cache.get.return_value = None
+        fetch = MagicMock(return_value='{"payload": {}}')
+        ipfs_cache = IPFSCache(max_local_entries=10, timeout=60)
+
+        assert ipfs_cache.get('QmHash', fetch) == '{"payload": {}}'
+        assert ipfs_cache.get('QmHash', fetch) == '{"payload": {}}'
+        fetch.assert_called_once_with('QmHash')
+        mock_cache.set.assert_called_once_with('ipfs_cat_QmHash', '{"payload": {}}', 60)
+        assert ipfs_cache.stats()['local_hits'] == 1
+        assert ipfs_cache.stats()['misses'] == 1
+
+    @patch('dashboard.ipfs_cache.cache')
+    def test_shared_cache_hit(self, mock_cache):
+        """Test that a payload in the shared cache doesn't hit the network."""
+        mock_cache.get.return_value = '{}'
+        fetch = MagicMock()
+        ipfs_cache = IPFSCache(max_local_entries=10, timeout=60)
+
+        assert ipfs_cache.get('QmHash', fetch) == '{}'
+        fetch.assert_not_called()
+        assert ipfs_cache.stats()['shared_hits'] == 1
+
+    @patch('dashboard.ipfs_cache.cache')
+    def test_failures_are_not_cached(self, mock_cache):
+        """Test that failed IPFS reads are retried on the next call."""
+        mock_cache.get.return_value = None
+        fetch = MagicMock(side_effect=[None, 'Failed to get block', '{}'])
+        ipfs_cache = IPFSCache(max_local_entries=10, timeout=60)
+
+        assert ipfs_cache.get('QmHash', fetch) is None
+        assert ipfs_cache.get('QmHash', fetch) == 'Failed to get block'
+        assert ipfs_cache.get('QmHash', fetch) == '{}'
+        assert fetch.call_count == 3
+        mock_cache.set.assert_called_once()
+
+    @patch('dashboard.ipfs_cache.cache')
+    def test_local_tier_is_bounded(self, mock_cache):
+        """Test that the in-process tier evicts the least recently used payload."""
+        mock_cache.get.return_value = None
+        ipfs_cache = IPFSCache(max_local_entries=2, timeout=60)
+        for key in ['a', 'b', 'c']:
+            ipfs_cache.get(key, lambda key: key)
+
+        assert list(ipfs_cache._local.keys()) == ['b', 'c']
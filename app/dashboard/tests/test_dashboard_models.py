@@ -24,7 +24,8 @@ from django.contrib.humanize.templatetags.humanize import naturaltime
 
 import pytz
 from avatar.models import CustomAvatar, SocialAvatar
-from dashboard.models import Bounty, BountyFulfillment, Interest, Profile, Tip, Tool, ToolVote
+from dashboard.models import Activity, Bounty, BountyFulfillment, BountyStats, Interest, Profile, Tip, Tool, ToolVote
+from dashboard.tokens import token_by_name
 from economy.models import ConversionRate, Token
 from test_plus.test import TestCase
 
@@ -100,6 +101,97 @@ class DashboardModelsTest(TestCase):
         assert bounty_fulfillment.profile.handle == 'fred'
         assert bounty_fulfillment.bounty.title == 'foo'
 
+    @staticmethod
+    def test_bounty_stats():
+        """Test the dashboard BountyStats model."""
+        bounty = Bounty.objects.create(
+            title='foo',
+            value_in_token=3,
+            token_name='ETH',
+            web3_created=datetime(2008, 10, 31, tzinfo=pytz.UTC),
+            github_url='https://github.com/gitcoinco/web/issues/11',
+            token_address='0x0',
+            issue_description='hello world',
+            bounty_owner_github_username='flintstone',
+            is_open=False,
+            accepted=True,
+            expires_date=datetime(2008, 11, 30, tzinfo=pytz.UTC),
+            raw_data={'keywords': 'Python, Solidity'},
+        )
+        assert BountyStats.objects.filter(bounty=bounty).exists()
+
+        bounty.value_in_usdt = 100
+        fulfillments = [
+            BountyFulfillment(created_on=datetime(2008, 11, 1, tzinfo=pytz.UTC), accepted=False),
+            BountyFulfillment(
+                created_on=datetime(2008, 11, 2, tzinfo=pytz.UTC),
+                accepted=True,
+                accepted_on=datetime(2008, 11, 3, tzinfo=pytz.UTC),
+                fulfiller_hours_worked=4,
+            ),
+            BountyFulfillment(accepted=True, fulfiller_hours_worked=2),
+        ]
+        stats = BountyStats.compute(bounty, fulfillments)
+        assert stats['hourly_rate'] == 25
+        assert stats['min_hours_worked'] == 2
+        assert stats['turnaround_time_submitted'] == 24 * 60 * 60
+        assert stats['turnaround_time_accepted'] == 3 * 24 * 60 * 60
+
+    @staticmethod
+    def test_bounty_keywords():
+        """Test the dashboard BountyKeyword model."""
+        bounties = []
+        for title, keywords in [('foo', 'Python, Solidity'), ('bar', ['python', ' Design  Work']), ('baz', None)]:
+            bounties.append(Bounty.objects.create(
+                title=title,
+                value_in_token=3,
+                token_name='ETH',
+                web3_created=datetime(2008, 10, 31, tzinfo=pytz.UTC),
+                github_url='https://github.com/gitcoinco/web/issues/11',
+                token_address='0x0',
+                issue_description='hello world',
+                bounty_owner_github_username='flintstone',
+                is_open=True,
+                expires_date=datetime(2008, 11, 30, tzinfo=pytz.UTC),
+                metadata={'issueKeywords': keywords},
+                raw_data={},
+            ))
+
+        assert set(bounties[0].keyword_tags.values_list('normalized_keyword', flat=True)) == {'python', 'solidity'}
+        assert set(Bounty.objects.with_keyword('PYTHON').values_list('title', flat=True)) == {'foo', 'bar'}
+        assert list(Bounty.objects.with_keyword('design work').values_list('title', flat=True)) == ['bar']
+        assert dict(Bounty.objects.keyword_counts()) == {'python': 2, 'solidity': 1, 'design work': 1}
+        assert dict(Bounty.objects.filter(title='foo').keyword_counts(['Python', 'rust'])) == {'python': 1}
+
+        bounties[0].metadata = {'issueKeywords': 'rust'}
+        bounties[0].save()
+        assert list(bounties[0].keyword_tags.values_list('normalized_keyword', flat=True)) == ['rust']
+        assert not Bounty.objects.filter(title='baz').first().keyword_tags.exists()
+
+    @staticmethod
+    def test_bounty_search():
+        """Test the full-text search over bounties."""
+        for title, keywords in [('Fix the wallet', 'python'), ('Write documentation', 'Solidity, docs')]:
+            Bounty.objects.create(
+                title=title,
+                value_in_token=3,
+                token_name='ETH',
+                web3_created=datetime(2008, 10, 31, tzinfo=pytz.UTC),
+                github_url='https://github.com/gitcoinco/web/issues/11',
+                token_address='0x0',
+                issue_description='hello world',
+                bounty_owner_github_username='flintstone',
+                is_open=True,
+                expires_date=datetime(2008, 11, 30, tzinfo=pytz.UTC),
+                metadata={'issueKeywords': keywords},
+                raw_data={},
+            )
+
+        assert list(Bounty.objects.search('wallets').values_list('title', flat=True)) == ['Fix the wallet']
+        assert list(Bounty.objects.search('solidity').values_list('title', flat=True)) == ['Write documentation']
+        assert Bounty.objects.search('gitcoinco world').count() == 2
+        assert not Bounty.objects.search('rust').exists()
+
     @staticmethod
     def test_exclude_bounty_by_status():
         Bounty.objects.create(
@@ -236,8 +328,38 @@ class DashboardModelsTest(TestCase):
         )
         assert bounty.github_issue_number == 12345678
         bounty.github_url = 'https://github.com/gitcoinco/web/issues/THIS_SHALL_RETURN_NONE'
+        bounty.save()
         assert not bounty.github_issue_number
 
+    @staticmethod
+    def test_github_url_lookups():
+        """Test looking up bounties and tips by the org, repo and issue of their github url."""
+        for url in ['https://github.com/GitcoinCo/Web/issues/11', 'https://github.com/gitcoinco/web/issues/12',
+                    'https://github.com/gitcoinco/webapp/issues/11', 'https://github.com/gitcoincoin/web/issues/11']:
+            Bounty.objects.create(
+                title='TitleTest',
+                idx_status=0,
+                is_open=False,
+                web3_created=datetime(2008, 10, 31, tzinfo=pytz.UTC),
+                expires_date=datetime(2008, 11, 30, tzinfo=pytz.UTC),
+                github_url=url,
+                raw_data={}
+            )
+        tip = Tip.objects.create(
+            emails=[],
+            github_url='https://github.com/gitcoinco/web/issues/11#issuecomment-1',
+            expires_date=datetime(2008, 11, 30, tzinfo=pytz.UTC),
+            network='mainnet',
+        )
+
+        assert Bounty.objects.for_org('gitcoinco').count() == 3
+        assert Bounty.objects.for_repo('GITCOINCO', 'web').count() == 2
+        assert Bounty.objects.for_issue('gitcoinco', 'web', 11).get().github_url.endswith('/Web/issues/11')
+        assert Bounty.objects.for_github_url('https://github.com/gitcoinco/web').count() == 2
+        assert not Bounty.objects.for_github_url('https://gitlab.com/gitcoinco/web').exists()
+        assert (tip.github_org, tip.github_repo, tip.github_issue_number) == ('gitcoinco', 'web', 11)
+        assert list(Tip.objects.for_org('gitcoinco')) == [tip]
+
     @staticmethod
     def test_github_org_name():
         bounty = Bounty.objects.create(
@@ -283,26 +405,105 @@ class DashboardModelsTest(TestCase):
         bounty.web3_type = "legacy_gitcoin"
         assert bounty.is_legacy
         bounty.pk = 12345
-        assert bounty.status == "open"
+        assert bounty.get_status() == "open"
         bounty.web3_type = None
         bounty.is_open = False
         bounty.accepted = False
-        assert bounty.status == "expired"
+        assert bounty.get_status() == "expired"
         bounty.accepted = True
-        assert bounty.status == "done"
+        assert bounty.get_status() == "done"
         bounty.expires_date = datetime(2222, 11, 11, tzinfo=pytz.UTC)
-        assert bounty.status == "done"
+        assert bounty.get_status() == "done"
         bounty.accepted = False
-        assert bounty.status == "cancelled"
+        assert bounty.get_status() == "cancelled"
         bounty.is_open = True
         bounty.num_fulfillments = 1
-        assert bounty.status == "submitted"
+        assert bounty.get_status() == "submitted"
         bounty.is_open = False
         bounty.num_fulfillments = 0
         bounty.expires_date = None
-        assert bounty.status == "unknown"
+        assert bounty.get_status() == "unknown"
         bounty.override_status = "overridden"
-        assert bounty.status == "overridden"
+        assert bounty.get_status() == "overridden"
+
+    def test_bounty_status_materialized(self):
+        """Test that idx_status follows interests and tips, and matches the status computed in SQL."""
+        bounties = []
+        for i, is_open in enumerate([True, False, False]):
+            bounties.append(Bounty.objects.create(
+                title='TitleTest',
+                is_open=is_open,
+                web3_created=datetime(2008, 10, 31, tzinfo=pytz.UTC),
+                expires_date=datetime(2222, 11, 30, tzinfo=pytz.UTC),
+                github_url=f'https://github.com/gitcoinco/web/issues/{i}',
+                network='mainnet',
+                raw_data={}
+            ))
+        assert [bounty.status for bounty in bounties] == ['open', 'cancelled', 'cancelled']
+
+        profile = Profile.objects.create(handle='fred', data={})
+        interest = Interest.objects.create(profile=profile)
+        bounties[0].interested.add(interest)
+        Tip.objects.create(
+            emails=[],
+            github_url='https://github.com/gitcoinco/web/issues/1',
+            expires_date=datetime(2222, 11, 30, tzinfo=pytz.UTC),
+            network='mainnet',
+            txid='0x0',
+            tx_status='success',
+        )
+        statuses = dict(Bounty.objects.values_list('pk', 'idx_status'))
+        assert [statuses[bounty.pk] for bounty in bounties] == ['started', 'done', 'cancelled']
+
+        annotated = Bounty.objects.annotate_status().order_by('pk')
+        assert [bounty.annotated_status for bounty in annotated] == ['started', 'done', 'cancelled']
+        with self.assertNumQueries(0):
+            assert [bounty.get_status() for bounty in annotated] == ['started', 'done', 'cancelled']
+
+        interest.bounty_set.clear()
+        assert Bounty.objects.get(pk=bounties[0].pk).idx_status == 'open'
+
+    def test_bounty_status_without_issue_url(self):
+        """Test that bounties on a repo url are done when tipped on that url, and become expired in bulk."""
+        bounty = Bounty.objects.create(
+            title='TitleTest',
+            is_open=False,
+            web3_created=datetime(2008, 10, 31, tzinfo=pytz.UTC),
+            expires_date=datetime(2222, 11, 30, tzinfo=pytz.UTC),
+            github_url='https://github.com/gitcoinco/web',
+            network='mainnet',
+            raw_data={}
+        )
+        other_bounty = Bounty.objects.create(
+            title='TitleTest',
+            is_open=False,
+            web3_created=datetime(2008, 10, 31, tzinfo=pytz.UTC),
+            expires_date=datetime(2222, 11, 30, tzinfo=pytz.UTC),
+            github_url='https://github.com/gitcoinco/web/issues/2',
+            network='mainnet',
+            raw_data={}
+        )
+        Tip.objects.create(
+            emails=[],
+            github_url='https://github.com/gitcoinco/Web',
+            expires_date=datetime(2222, 11, 30, tzinfo=pytz.UTC),
+            network='mainnet',
+            txid='0x0',
+            tx_status='success',
+        )
+        statuses = dict(Bounty.objects.values_list('pk', 'idx_status'))
+        assert [statuses[bounty.pk], statuses[other_bounty.pk]] == ['done', 'cancelled']
+        annotated = Bounty.objects.annotate_status().order_by('pk')
+        assert [bounty.annotated_status for bounty in annotated] == ['done', 'cancelled']
+
+        Bounty.objects.filter(pk=other_bounty.pk).update(expires_date=datetime(2008, 11, 30, tzinfo=pytz.UTC))
+        assert list(Bounty.objects.past_expiration()) == [other_bounty]
+        assert Bounty.objects.past_expiration().refresh_status() == [other_bounty]
+        assert Bounty.objects.get(pk=other_bounty.pk).idx_status == 'expired'
+
+        # the contract deadline extends past the mocked one, so it can still be submitted
+        Bounty.objects.filter(pk=other_bounty.pk).update(raw_data={'contract_deadline': 2, 'ipfs_deadline': 1})
+        assert Bounty.objects.annotate_status().get(pk=other_bounty.pk).annotated_status == 'cancelled'
 
     @staticmethod
     def test_fetch_issue_comments():
@@ -423,6 +624,40 @@ class DashboardModelsTest(TestCase):
         assert tool.vote_score() == 11
         assert tool.link_url == 'http://gitcoin.co/explorer'
 
+    def test_activity_view_props(self):
+        """Test that the view props of many activities are computed with a constant number of queries."""
+        profile = Profile.objects.create(handle='fred', data={})
+        for i in range(3):
+            bounty = Bounty.objects.create(
+                title=f'foo {i}',
+                github_url=f'https://github.com/gitcoinco/web/issues/{i}',
+                web3_created=datetime.now(tz=pytz.UTC),
+                expires_date=datetime.now(tz=pytz.UTC) + timedelta(days=1),
+                is_open=True,
+                raw_data={},
+                current_bounty=True,
+                network='mainnet',
+                standard_bounties_id=i,
+                token_name='ETH',
+            )
+            Activity.objects.create(
+                activity_type='new_bounty', bounty=bounty, profile=profile, metadata={
+                    'id': bounty.pk, 'title': bounty.title, 'token_name': 'ETH', 'value_in_token': 10 ** 18,
+                },
+            )
+        expected = [activity.view_props for activity in Activity.objects.order_by('pk')]
+        token_by_name('ETH')  # load the token registry
+
+        with self.assertNumQueries(3):
+            view_props = [activity.view_props for activity in Activity.objects.order_by('pk').with_view_props()]
+
+        keys = ['title', 'bounty_url', 'urled_title', 'token', 'value_in_token_disp', 'icon']
+        assert [[props[key] for key in keys] for props in view_props] == \
+            [[props[key] for key in keys] for props in expected]
+        assert view_props[0]['bounty_url'] == '/issue/gitcoinco/web/0/0'
+        assert view_props[0]['value_in_token_disp'] == 1
+        assert view_props[0]['bounty']['interested'] == []
+
     @staticmethod
     def test_profile_activate_avatar():
         """Test the dashboard Profile model activate_avatar method."""
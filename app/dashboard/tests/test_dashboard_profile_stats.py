@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""Handle profile stats snapshot related tests.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from datetime import datetime, timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+import pytz
+from dashboard.models import Activity, Bounty, BountyFulfillment, Profile, ProfileStats
+from test_plus.test import TestCase
+
+NUM_BOUNTIES = 2000
+
+
+def legacy_numbers(profile, network='mainnet'):
+    """Compute the numbers of a profile the way `Profile.to_dict` did before the snapshot."""
+    funded_bounties = profile.get_funded_bounties(network=network)
+    fulfilled_bounties = profile.get_fulfilled_bounties(network=network)
+    orgs_bounties = profile.get_orgs_bounties(network=network)
+    return {
+        'sum_eth_funded': profile.get_eth_sum(sum_type='funded', bounties=funded_bounties),
+        'works_with_funded': profile.get_who_works_with(work_type='funded', bounties=funded_bounties),
+        'count_bounties_on_repo': orgs_bounties.count(),
+        'sum_eth_on_repos': profile.get_eth_sum(bounties=orgs_bounties),
+        'works_with_org': profile.get_who_works_with(work_type='org', bounties=orgs_bounties),
+        'funded_bounties_count': funded_bounties.count(),
+        'card_desc': profile.get_desc(funded_bounties, fulfilled_bounties),
+    }
+
+
+def create_bounties(start, num_bounties):
+    """Create open gitcoinco/web bounties for the issues start to start + num_bounties."""
+    Bounty.objects.bulk_create([
+        Bounty(
+            title=f'foo {i}',
+            value_in_token=10**18,
+            value_in_eth=10**18,
+            value_in_usdt=2,
+            token_name='ETH',
+            web3_created=datetime(2008, 10, 1, tzinfo=pytz.UTC),
+            github_url=f'https://github.com/gitcoinco/web/issues/{i}',
+            github_org='gitcoinco',
+            github_repo='web',
+            github_issue_number=i,
+            token_address='0x0',
+            issue_description='hello world',
+            bounty_owner_github_username='gitcoinco',
+            is_open=True,
+            idx_status='open',
+            expires_date=timezone.now() + timedelta(days=30),
+            raw_data={},
+            current_bounty=True,
+            network='mainnet',
+        ) for i in range(start, start + num_bounties)
+    ])
+
+
+class ProfileStatsTest(TestCase):
+    """Define tests for the profile stats snapshot."""
+
+    def setUp(self):
+        self.org = Profile.objects.create(handle='gitcoinco', data={'type': 'Organization'})
+        create_bounties(0, 3)
+        bounties = list(Bounty.objects.order_by('pk'))
+        self.fred = Profile.objects.create(handle='fred', data={})
+        for bounty, handle in zip(bounties, ['fred', 'barney', 'fred']):
+            BountyFulfillment.objects.create(
+                fulfiller_github_username=handle, bounty=bounty, profile=self.fred, accepted=True,
+            )
+        self.bounty = bounties[0]
+
+    def test_org_profile(self):
+        """Test that the snapshot holds the numbers to_dict used to compute, for a fraction of the queries."""
+        create_bounties(3, NUM_BOUNTIES - 3)
+        with CaptureQueriesContext(connection) as before:
+            legacy = legacy_numbers(self.org)
+        with CaptureQueriesContext(connection) as cold:
+            self.org.to_dict(activities=False, leaderboards=False, tips=False, network='mainnet')
+        with CaptureQueriesContext(connection) as after:
+            params = self.org.to_dict(activities=False, leaderboards=False, tips=False, network='mainnet')
+
+        for key, value in legacy.items():
+            assert params[key] == value, key
+        assert params['count_bounties_on_repo'] == NUM_BOUNTIES
+        assert list(params['works_with_org'].items()) == [('fred', 2), ('barney', 1)]
+        assert params['profile_stats'].status_counts == {'open': NUM_BOUNTIES}
+        # the legacy numbers loaded every org bounty and its fulfillments one by one
+        assert len(before) > NUM_BOUNTIES
+        assert len(cold) < 30
+        assert len(after) < len(cold) - 10
+
+    def test_mark_stale(self):
+        """Test that activities mark the snapshots of their profile and org stale."""
+        stats = self.org.get_stats(network='mainnet')
+        fred_stats = self.fred.get_stats(network='mainnet')
+        assert stats.activity_counts == {}
+
+        Activity.objects.create(activity_type='start_work', bounty=self.bounty, profile=self.fred)
+        assert ProfileStats.objects.filter(pk__in=[stats.pk, fred_stats.pk], stale=True).count() == 2
+
+        stats = self.org.get_stats(network='mainnet')
+        assert not stats.stale
+        assert stats.get_activity_count('all') == 1
+        assert stats.get_activity_count('start_work') == 1
+        assert stats.get_activity_count('new_tip') == 0
+
+    def test_mark_stale_on_status_change(self):
+        """Test that saving a bounty only marks the snapshots stale when its status changes."""
+        stats = self.org.get_stats(network='mainnet')
+        self.bounty.refresh_from_db()
+
+        self.bounty.title = 'bar'
+        self.bounty.save()
+        stats.refresh_from_db()
+        assert not stats.stale
+
+        self.bounty.is_open = False
+        self.bounty.save()
+        stats.refresh_from_db()
+        assert stats.stale
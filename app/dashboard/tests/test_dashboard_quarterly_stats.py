@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""Handle quarterly stats related tests.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from datetime import datetime, timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+import pytz
+from dashboard.models import Bounty, BountyFulfillment, BountyStats, Profile, ProfileQuarterlyStats
+from dashboard.quarterly_stats import compute_quarterly_stats
+from marketing.models import EmailSubscriber
+from test_plus.test import TestCase
+
+
+def create_bounty(owner, i, keywords, **values):
+    bounty = Bounty.objects.create(
+        title=f'foo {i}',
+        value_in_token=3,
+        token_name='ETH',
+        web3_created=datetime(2008, 10, 1, tzinfo=pytz.UTC),
+        github_url=f'https://github.com/gitcoinco/web/issues/{i}',
+        token_address='0x0',
+        issue_description='hello world',
+        bounty_owner_github_username=owner,
+        is_open=True,
+        expires_date=timezone.now() + timedelta(days=30),
+        raw_data={},
+        metadata={'issueKeywords': keywords},
+        current_bounty=True,
+        network='mainnet',
+    )
+    return bounty
+
+
+class QuarterlyStatsTest(TestCase):
+    """Define tests for the batched quarterly stats."""
+
+    def setUp(self):
+        for handle in ['flintstone', 'fred', 'barney']:
+            Profile.objects.create(handle=handle, email=f'{handle}@bedrock.com', data={})
+        EmailSubscriber.objects.create(email='barney@bedrock.com', source='test', keywords=['Python'])
+
+        self.done = create_bounty('@Flintstone', 1, 'python,django')
+        self.open = create_bounty('flintstone', 2, 'python')
+        BountyFulfillment.objects.create(
+            fulfiller_github_username='fred', bounty=self.done, profile=Profile.objects.get(handle='fred'),
+            accepted=True, fulfiller_hours_worked=4,
+        )
+        # set the values the stats are computed from, after the signals have refreshed them
+        Bounty.objects.filter(pk=self.done.pk).update(idx_status='done', value_in_usdt=100, value_in_eth=2 * 10**18)
+        Bounty.objects.filter(pk=self.open.pk).update(idx_status='open', value_in_usdt=50)
+        BountyStats.refresh(Bounty.objects.filter(pk=self.done.pk))
+
+    def test_compute(self):
+        """Test the stats of funders, fulfillers and inactive profiles."""
+        stats = compute_quarterly_stats()
+
+        funder = stats['flintstone']
+        assert funder['user_funded_bounties_count'] == 2
+        assert funder['user_total_funded_usd'] == 150
+        assert funder['user_num_funded_fulfilled_bounties'] == 1
+        assert funder['user_funded_fulfilled_percentage'] == 50
+        assert funder['user_avg_hours_per_funded_bounty'] == 4
+        assert funder['user_avg_hourly_rate_per_funded_bounty'] == 25
+        assert funder['user_funded_bounty_developers'] == ['fred']
+        assert funder['user_bounty_completion_percentage'] == 100
+        assert funder['user_active_in_last_quarter']
+
+        fulfiller = stats['fred']
+        assert fulfiller['user_fulfilled_bounties_count'] == 1
+        assert fulfiller['user_total_earned_eth'] == 2
+        assert fulfiller['user_avg_usd_earned_per_bounty'] == 100
+        assert fulfiller['user_languages'] == ['django', 'python']
+        assert not fulfiller['user_funded_bounties']
+
+        inactive = stats['barney']
+        assert not inactive['user_active_in_last_quarter']
+        assert inactive['relevant_bounty_ids'] == [self.open.pk]
+
+    def test_query_count(self):
+        """Test that the number of queries doesn't grow with the number of profiles and bounties."""
+        with CaptureQueriesContext(connection) as before:
+            compute_quarterly_stats()
+        for i in range(3, 13):
+            Profile.objects.create(handle=f'dino{i}', email=f'dino{i}@bedrock.com', data={})
+            create_bounty(f'dino{i}', i, 'rust')
+        with CaptureQueriesContext(connection) as after:
+            stats = compute_quarterly_stats()
+
+        assert len(stats) == 13
+        assert len(after) == len(before)
+
+    def test_get_quarterly_stats(self):
+        """Test that get_quarterly_stats reads the materialized stats."""
+        ProfileQuarterlyStats.refresh()
+        profile = Profile.objects.get(handle='barney')
+        with self.assertNumQueries(2):
+            stats = profile.get_quarterly_stats
+        assert stats['relevant_bounties'] == [self.open]
+        assert stats['user_languages'] == set()
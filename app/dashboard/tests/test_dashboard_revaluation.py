@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Handle bulk bounty revaluation related tests.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from datetime import datetime, timedelta
+
+from django.utils import timezone
+
+import pytz
+from dashboard.models import Bounty
+from dashboard.revaluation import revalue_bounties
+from economy.models import ConversionRate
+from test_plus.test import TestCase
+
+
+class RevaluationTest(TestCase):
+    """Define tests for the bulk bounty revaluation."""
+
+    def setUp(self):
+        """Perform setup for the testcase."""
+        ConversionRate.objects.create(
+            from_amount=1,
+            to_amount=2,
+            source='etherdelta',
+            from_currency='ETH',
+            to_currency='USDT',
+        )
+        self.bounty = Bounty.objects.create(
+            title='foo',
+            value_in_token=10 ** 18,
+            token_name='ETH',
+            web3_created=datetime(2008, 10, 31, tzinfo=pytz.UTC),
+            github_url='https://github.com/gitcoinco/web/issues/11',
+            token_address='0x0000000000000000000000000000000000000000',
+            issue_description='hello world',
+            bounty_owner_github_username='flintstone',
+            is_open=True,
+            expires_date=timezone.now() + timedelta(days=30),
+            raw_data={},
+            current_bounty=True,
+            network='mainnet',
+        )
+
+    def test_revalue_bounties(self):
+        """Test that only bounties whose values changed are written."""
+        assert revalue_bounties(Bounty.objects.all()) == (1, 1)
+        self.bounty.refresh_from_db()
+        assert self.bounty.value_in_usdt_now == 2
+        assert self.bounty._val_usd_db == 2
+
+        assert revalue_bounties(Bounty.objects.all()) == (1, 0)
+
+        ConversionRate.objects.create(
+            from_amount=1,
+            to_amount=4,
+            source='etherdelta',
+            from_currency='ETH',
+            to_currency='USDT',
+        )
+        assert revalue_bounties(Bounty.objects.all()) == (1, 1)
+        self.bounty.refresh_from_db()
+        assert self.bounty.value_in_usdt_now == 4
+        assert self.bounty.token_value_in_usdt == 4
+
+    def test_revalue_bounties_matches_save(self):
+        """Test that the bulk revaluation computes the same values as saving the bounty."""
+        revalue_bounties(Bounty.objects.all())
+        revalued = Bounty.objects.get(pk=self.bounty.pk)
+        self.bounty.save()
+        self.bounty.refresh_from_db()
+        for field in ['_val_usd_db', '_val_usd_db_now', 'token_value_in_usdt', 'value_in_usdt_now', 'value_in_usdt',
+                      'value_in_eth', 'value_true']:
+            assert getattr(revalued, field) == getattr(self.bounty, field)
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""Handle v0.1 bounty api related tests.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from datetime import datetime, timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+import pytz
+from dashboard.models import Activity, Bounty, BountyFulfillment, Interest, Profile, Tip
+from economy.models import ConversionRate
+from test_plus.test import TestCase
+
+
+class BountyAPITest(TestCase):
+    """Define tests for the v0.1 bounty api."""
+
+    def setUp(self):
+        """Perform setup for the testcase."""
+        ConversionRate.objects.create(from_amount=1, to_amount=2, from_currency='DAI', to_currency='USDT')
+        for i in range(3):
+            self.create_bounty(i)
+
+    @staticmethod
+    def create_bounty(i):
+        profile = Profile.objects.create(handle=f'fred{i}', data={})
+        bounty = Bounty.objects.create(
+            title=f'foo {i}',
+            value_in_token=3,
+            token_name='ETH',
+            web3_created=datetime(2008, 10, 1 + i, tzinfo=pytz.UTC),
+            github_url=f'https://github.com/gitcoinco/web/issues/{i}',
+            token_address='0x0',
+            issue_description='hello world',
+            bounty_owner_github_username='flintstone',
+            is_open=False,
+            accepted=True,
+            expires_date=timezone.now() + timedelta(days=30),
+            raw_data={},
+            current_bounty=True,
+            network='mainnet',
+            privacy_preferences={'show_name_publicly': '1'},
+            bounty_owner_name='Fred',
+            bounty_owner_email='fred@bedrock.com',
+        )
+        BountyFulfillment.objects.create(
+            fulfiller_github_username=f'fred{i}', bounty=bounty, profile=profile, accepted=True,
+        )
+        bounty.interested.add(Interest.objects.create(profile=profile))
+        Activity.objects.create(activity_type='start_work', bounty=bounty, profile=profile)
+        Tip.objects.create(
+            emails=[], github_url=bounty.github_url, expires_date=timezone.now() + timedelta(days=1),
+            tokenName='DAI', amount=2, username=f'barney{i}', network='mainnet', tokenAddress='0x0',
+            txid='0x1', tx_status='success', is_for_bounty_fulfiller=True,
+        )
+        return bounty
+
+    def get_results(self, params=''):
+        with CaptureQueriesContext(connection) as queries:
+            results = self.client.get(f'/api/v0.1/bounties/?limit=100{params}').json()
+        for result in results:
+            result.pop('now')  # the time of serialization
+        return results, len(queries)
+
+    def test_fast_serializer(self):
+        """Test that the fast serializer returns the same data as the DRF one."""
+        results, __ = self.get_results()
+        fast_results, __ = self.get_results('&serializer=fast')
+
+        assert len(results) == 3
+        assert fast_results == results
+        assert results[0]['paid'] and results[0]['additional_funding_summary']['DAI']['ratio'] == 2
+        assert results[0]['bounty_owner_name'] == 'Fred'
+        assert results[0]['bounty_owner_email'] == 'Anonymous'
+
+    def test_fast_serializer_query_count(self):
+        """Test that the fast serializer makes the same number of queries for any number of bounties."""
+        __, num_queries = self.get_results('&serializer=fast')
+        for i in range(3, 10):
+            self.create_bounty(i)
+        results, more_num_queries = self.get_results('&serializer=fast')
+
+        assert len(results) == 10
+        assert more_num_queries == num_queries
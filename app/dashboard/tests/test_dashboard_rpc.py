@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Handle dashboard JSON-RPC batch client related tests.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from unittest.mock import MagicMock
+
+from dashboard.bounty_fetcher import BountyFetcher
+from dashboard.rpc import JSONRPCBatchClient, JSONRPCError
+from dashboard.utils import BountyNotFoundException
+from test_plus.test import TestCase
+
+
+def make_session(handler):
+    session = MagicMock()
+
+    def post(url, json=None, timeout=None):
+        response = MagicMock()
+        response.json.return_value = handler(json)
+        return response
+
+    session.post.side_effect = post
+    return session
+
+
+class JSONRPCBatchClientTest(TestCase):
+    """Define tests for the JSON-RPC batch client."""
+
+    def test_batch_preserves_request_order(self):
+        """Test that out of order batch responses are mapped back to their requests."""
+        def handler(payload):
+            return [{'jsonrpc': '2.0', 'id': item['id'], 'result': item['params'][0]} for item in reversed(payload)]
+
+        client = JSONRPCBatchClient('http://localhost:8545', session=make_session(handler))
+        assert client.batch([('eth_getBlockByNumber', [i]) for i in range(5)]) == [0, 1, 2, 3, 4]
+
+    def test_batch_splits_requests(self):
+        """Test that calls are split into HTTP requests of at most batch_size calls."""
+        def handler(payload):
+            return [{'jsonrpc': '2.0', 'id': item['id'], 'result': None} for item in payload]
+
+        session = make_session(handler)
+        client = JSONRPCBatchClient('http://localhost:8545', batch_size=2, session=session)
+        client.batch([('eth_blockNumber', [])] * 5)
+        assert session.post.call_count == 3
+
+    def test_batch_returns_errors_in_place(self):
+        """Test that a failed call doesn't fail the rest of the batch."""
+        def handler(payload):
+            return [
+                {'jsonrpc': '2.0', 'id': payload[0]['id'], 'error': {'code': -32000, 'message': 'execution reverted'}},
+                {'jsonrpc': '2.0', 'id': payload[1]['id'], 'result': '0x1'},
+            ]
+
+        client = JSONRPCBatchClient('http://localhost:8545', session=make_session(handler))
+        results = client.batch([('eth_call', []), ('eth_blockNumber', [])])
+        assert isinstance(results[0], JSONRPCError)
+        assert results[1] == '0x1'
+
+
+class BountyFetcherTest(TestCase):
+    """Define tests for the batched bounty fetcher."""
+
+    def test_iter_bounties_stops_at_reverted_call(self):
+        """Test that a node reporting the read past the last bounty as an error ends the iteration."""
+        rpc_client = MagicMock()
+        rpc_client.batch.side_effect = lambda calls: [JSONRPCError({'message': 'execution reverted'})] * len(calls)
+        fetcher = BountyFetcher('rinkeby', workers=1, batch_size=2, contract=MagicMock(), rpc_client=rpc_client)
+
+        results = list(fetcher.iter_bounties(0, 10))
+        assert len(results) == 1
+        assert isinstance(results[0][1], BountyNotFoundException)
+
+    def test_iter_bounties_continues_past_node_errors(self):
+        """Test that node errors other than a revert only fail the bounties they were returned for."""
+        rpc_client = MagicMock()
+        error = JSONRPCError({'code': 429, 'message': 'rate limited'})
+        rpc_client.batch.side_effect = lambda calls: [error] * len(calls)
+        fetcher = BountyFetcher('rinkeby', workers=1, batch_size=2, contract=MagicMock(), rpc_client=rpc_client)
+
+        results = list(fetcher.iter_bounties(0, 3))
+        assert [bounty_id for bounty_id, __ in results] == [0, 1, 2, 3]
+        assert all(isinstance(result, JSONRPCError) for __, result in results)
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Handle v1 bounty search api related tests.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import json
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+import pytz
+from dashboard.models import Bounty, Interest, Profile
+from dashboard.search_history import flush_search_history
+from test_plus.test import TestCase
+
+
+class BountySearchAPITest(TestCase):
+    """Define tests for the v1 bounty search api."""
+
+    def setUp(self):
+        """Perform setup for the testcase."""
+        self.bounties = []
+        for i in range(5):
+            self.bounties.append(self.create_bounty(i))
+
+    @staticmethod
+    def create_bounty(i):
+        return Bounty.objects.create(
+            title=f'foo {i}',
+            value_in_token=3,
+            token_name='ETH',
+            # two bounties share a creation time, to exercise the pk tie breaker
+            web3_created=datetime(2008, 10, 1 + min(i, 3), tzinfo=pytz.UTC),
+            github_url=f'https://github.com/gitcoinco/web/issues/{i}',
+            token_address='0x0',
+            issue_description='hello world',
+            bounty_owner_github_username='flintstone' if i % 2 else 'rubble',
+            is_open=True,
+            expires_date=timezone.now() + timedelta(days=30),
+            idx_project_length=5,
+            project_length='Months',
+            bounty_type='Feature',
+            experience_level='Intermediate',
+            raw_data={},
+            current_bounty=True,
+            network='mainnet',
+        )
+
+    def test_keyset_pagination(self):
+        """Test that following the cursors walks every bounty once, newest first."""
+        url, pks = '/api/v1/bounties/?limit=2', []
+        while url:
+            data = self.client.get(url).json()
+            assert len(data['results']) <= 2
+            pks += [result['pk'] for result in data['results']]
+            url = data['next']
+
+        expected = sorted(self.bounties, key=lambda bounty: (bounty.web3_created, bounty.pk), reverse=True)
+        assert pks == [bounty.pk for bounty in expected]
+
+    def test_fields_and_filters(self):
+        """Test that only the requested fields are returned and filters are exact matches."""
+        response = self.client.get('/api/v1/bounties/?fields=pk,title&bounty_owner_github_username=flintstone')
+        results = response.json()['results']
+
+        assert {result['pk'] for result in results} == {self.bounties[1].pk, self.bounties[3].pk}
+        assert all(set(result.keys()) == {'pk', 'title'} for result in results)
+
+    def test_invalid_cursor(self):
+        """Test that a malformed cursor is rejected."""
+        assert self.client.get('/api/v1/bounties/?cursor=garbage').status_code == 404
+
+    def test_status_query_count(self):
+        """Test that listing statuses doesn't query once per bounty."""
+        url = '/api/v1/bounties/?fields=pk,status&limit=100'
+        with CaptureQueriesContext(connection) as few_bounties:
+            assert len(self.client.get(url).json()['results']) == 5
+
+        profile = Profile.objects.create(handle='fred', data={})
+        for i in range(5, 15):
+            self.create_bounty(i).interested.add(Interest.objects.create(profile=profile))
+        with CaptureQueriesContext(connection) as many_bounties:
+            results = self.client.get(url).json()['results']
+
+        assert len(results) == 15
+        assert sum(result['status'] == 'started' for result in results) == 10
+        assert len(many_bounties) == len(few_bounties)
+
+
+class SearchHistoryTest(TestCase):
+    """Define tests for the deferred search history writes."""
+
+    @patch('dashboard.search_history.SearchHistory.objects.bulk_create')
+    @patch('dashboard.search_history.get_queue_client')
+    def test_flush_keeps_failed_batch(self, mock_get_queue_client, mock_bulk_create):
+        """Test that a batch stays queued when writing it fails, and is trimmed once it is written."""
+        item = json.dumps({'user_id': None, 'data': {'keywords': 'python'}, 'ip_address': '127.0.0.1'})
+        redis = MagicMock()
+        redis.lrange.side_effect = [[item], []]
+        mock_get_queue_client.return_value = redis
+        mock_bulk_create.side_effect = Exception('database unavailable')
+
+        with self.assertRaises(Exception):
+            flush_search_history()
+        redis.ltrim.assert_not_called()
+
+        mock_bulk_create.side_effect = None
+        redis.lrange.side_effect = [[item], []]
+        assert flush_search_history() == 1
+        redis.ltrim.assert_called_once_with('search_history_queue', 1, -1)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""Handle sync_listener related tests.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from unittest.mock import MagicMock, patch
+
+from dashboard.management.commands.sync_listener import get_checkpoint, process_block_range
+from test_plus.test import TestCase
+
+
+class SyncListenerTest(TestCase):
+    """Define tests for the event log driven bounty listener."""
+
+    @patch('dashboard.management.commands.sync_listener.web3_process_bounty')
+    @patch('dashboard.management.commands.sync_listener.get_changed_bounty_ids')
+    def test_failed_bounties_are_retried(self, mock_get_changed_bounty_ids, mock_web3_process_bounty):
+        """Test that bounties failing to sync are checkpointed along with the block range, and retried with the next."""
+        fetcher = MagicMock()
+        fetcher.fetch.side_effect = lambda bounty_ids: [
+            (bounty_id, Exception('ipfs timeout') if bounty_id == 2 else {'id': bounty_id}) for bounty_id in bounty_ids
+        ]
+        mock_get_changed_bounty_ids.return_value = [1, 2]
+
+        pending = process_block_range('rinkeby', fetcher, 10, 19, {})
+        assert pending == {2: 1}
+        assert get_checkpoint('rinkeby') == (19, {2: 1})
+
+        mock_get_changed_bounty_ids.return_value = [3]
+        fetcher.fetch.side_effect = lambda bounty_ids: [(bounty_id, {'id': bounty_id}) for bounty_id in bounty_ids]
+        pending = process_block_range('rinkeby', fetcher, 20, 29, pending)
+        fetcher.fetch.assert_called_with([2, 3])
+        assert pending == {}
+        assert get_checkpoint('rinkeby') == (29, {})
+        assert mock_web3_process_bounty.call_count == 3
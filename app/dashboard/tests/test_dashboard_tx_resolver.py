@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""Handle batched transaction receipt resolver related tests.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from datetime import datetime, timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+
+import pytz
+from dashboard.models import Tip
+from dashboard.rpc import JSONRPCError
+from dashboard.tx_resolver import ReceiptResolver, sync_tx_statuses
+from test_plus.test import TestCase
+
+
+class StubRPCClient:
+    """Answer receipt and block requests from dicts, recording every batch."""
+
+    def __init__(self, receipts, blocks):
+        self.receipts = receipts
+        self.blocks = blocks
+        self.batches = []
+
+    def batch(self, calls):
+        self.batches.append(calls)
+        results = []
+        for method, params in calls:
+            if method == 'eth_getTransactionReceipt':
+                results.append(self.receipts.get(params[0]))
+            else:
+                results.append(self.blocks.get(int(params[0], 16), JSONRPCError('unknown block')))
+        return results
+
+
+class ReceiptResolverTest(TestCase):
+    """Define tests for the receipt resolver."""
+
+    def setUp(self):
+        cache.clear()
+        self.rpc = StubRPCClient(
+            receipts={
+                '0x1': {'blockNumber': '0xa', 'blockHash': '0xaa', 'status': '0x1'},
+                '0x2': {'blockNumber': '0xa', 'blockHash': '0xaa', 'status': '0x0'},
+                '0x3': {'blockNumber': '0xb', 'blockHash': '0xbb'},
+                '0x5': JSONRPCError('boom'),
+            },
+            blocks={10: {'timestamp': hex(1546300800)}, 11: {'timestamp': hex(1546300815)}},
+        )
+        self.resolver = ReceiptResolver('rinkeby', rpc_client=self.rpc)
+
+    def test_resolve(self):
+        """Test that statuses are resolved with one batch of receipts and one of distinct blocks."""
+        now = timezone.now()
+        results = self.resolver.resolve([
+            ('0x1', now), ('0x2', now), ('0x3', now), ('0x4', now), ('0x4', now - timedelta(days=5)), ('0x5', now),
+            ('override', now), ('', now),
+        ])
+
+        mined_at = datetime(2019, 1, 1, tzinfo=pytz.UTC)
+        assert results == [
+            ('success', mined_at),
+            ('error', mined_at),
+            ('success', mined_at + timedelta(seconds=15)),
+            ('pending', None),
+            ('dropped', None),
+            ('unknown', None),
+            ('success', None),
+            ('unknown', None),
+        ]
+        assert len(self.rpc.batches) == 2
+        assert len(self.rpc.batches[0]) == 5
+        assert len(self.rpc.batches[1]) == 2
+
+    def test_block_timestamps_are_cached(self):
+        """Test that block timestamps are only requested once."""
+        self.resolver.resolve([('0x1', timezone.now())])
+        self.rpc.batches = []
+        assert self.resolver.resolve([('0x2', timezone.now())])[0][1] == datetime(2019, 1, 1, tzinfo=pytz.UTC)
+        assert len(self.rpc.batches) == 1
+
+    def test_sync_tx_statuses(self):
+        """Test that only the tips whose statuses changed are updated."""
+        tips = [
+            Tip.objects.create(
+                emails=[], tokenName='ETH', amount=1, username='fred', network='rinkeby', txid=txid,
+                receive_txid='', tx_status='pending', receive_tx_status=receive_tx_status,
+                expires_date=timezone.now() + timedelta(days=1),
+            )
+            for txid, receive_tx_status in [('0x1', 'na'), ('0x4', 'success')]
+        ]
+
+        changed = sync_tx_statuses(Tip, tips, resolvers={'rinkeby': self.resolver})
+
+        assert [tip.pk for tip in changed] == [tips[0].pk]
+        tips[0].refresh_from_db()
+        assert tips[0].tx_status == 'success'
+        assert tips[0].tx_time == datetime(2019, 1, 1, tzinfo=pytz.UTC)
+        assert tips[0].receive_tx_status == 'unknown'
+        tips[1].refresh_from_db()
+        assert tips[1].tx_status == 'pending'
@@ -17,13 +17,13 @@ You should have received a copy of the GNU Affero General Public License
 along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 """
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from django.test.client import RequestFactory
 
 from dashboard.utils import (
-    clean_bounty_url, create_user_action, get_bounty, get_ordinal_repr, get_web3, getBountyContract,
-    humanize_event_name,
+    clean_bounty_url, create_user_action, get_bounty, get_bounty_event_topics, get_changed_bounty_ids, get_ordinal_repr,
+    get_web3, getBountyContract, humanize_event_name,
 )
 from test_plus.test import TestCase
 from web3.main import Web3
@@ -52,6 +52,19 @@ class DashboardUtilsTest(TestCase):
     def test_get_bounty():
         assert get_bounty(100, 'rinkeby')['contract_deadline'] == 1515699751
 
+    @staticmethod
+    def test_get_changed_bounty_ids():
+        """Test that bounty ids are read from the event logs and deduplicated."""
+        topics = {name: topic for topic, name in get_bounty_event_topics().items()}
+        web3 = MagicMock()
+        web3.eth.getLogs.return_value = [
+            {'topics': [topics['BountyIssued']], 'data': '0x' + f'{7:064x}'},
+            {'topics': [topics['ContributionAdded']], 'data': '0x' + f'{7:064x}' + f'{10 ** 18:064x}'},
+            {'topics': [topics['BountyFulfilled']], 'data': '0x' + f'{3:064x}'},
+            {'topics': ['0x' + '0' * 64], 'data': '0x' + f'{99:064x}'},
+        ]
+        assert get_changed_bounty_ids('rinkeby', 1, 10, web3=web3) == [3, 7]
+
     @staticmethod
     def test_get_ordinal_repr():
         """Test the dashboard utility get_ordinal_repr."""
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Handle visit recorder related tests.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import json
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth.models import User
+
+import pytz
+from dashboard.models import Profile, UserAction
+from dashboard.visits import flush_visits, write_visits
+from test_plus.test import TestCase
+
+
+class VisitsTest(TestCase):
+    """Define tests for the visit recorder."""
+
+    def test_write_visits(self):
+        """Test that queued visits become UserActions and update the last visit of their profiles."""
+        user = User.objects.create(username='fred')
+        profile = Profile.objects.create(user=user, handle='fred', data={})
+        other_profile = Profile.objects.create(handle='barney', data={})
+        entries = [
+            {'user_id': user.pk, 'profile_id': profile.pk, 'ip_address': None, 'utm': {},
+             'created_on': '2019-03-01T10:00:00+00:00'},
+            {'user_id': user.pk, 'profile_id': profile.pk, 'ip_address': None, 'utm': {'utm_source': 'email'},
+             'created_on': '2019-03-01T12:00:00+00:00'},
+            {'user_id': None, 'profile_id': other_profile.pk, 'ip_address': None, 'utm': {},
+             'created_on': '2019-03-01T11:00:00+00:00'},
+        ]
+
+        with self.assertNumQueries(2):
+            write_visits(entries)
+
+        actions = UserAction.objects.filter(action='Visit').order_by('created_on')
+        assert [action.profile_id for action in actions] == [profile.pk, other_profile.pk, profile.pk]
+        assert actions.last().utm == {'utm_source': 'email'}
+        profile.refresh_from_db()
+        other_profile.refresh_from_db()
+        assert profile.last_visit == datetime(2019, 3, 1, 12, tzinfo=pytz.UTC)
+        assert other_profile.last_visit == datetime(2019, 3, 1, 11, tzinfo=pytz.UTC)
+
+    @patch('dashboard.visits.write_visits')
+    @patch('dashboard.visits.get_queue_client')
+    def test_flush_visits_keeps_failed_batch(self, mock_get_queue_client, mock_write_visits):
+        """Test that a batch stays queued when writing it fails, and is trimmed once it is written."""
+        redis = MagicMock()
+        redis.lrange.side_effect = [[json.dumps({'profile_id': 1})], []]
+        mock_get_queue_client.return_value = redis
+        mock_write_visits.side_effect = Exception('database unavailable')
+
+        with self.assertRaises(Exception):
+            flush_visits()
+        redis.ltrim.assert_not_called()
+
+        mock_write_visits.side_effect = None
+        redis.lrange.side_effect = [[json.dumps({'profile_id': 1})], []]
+        assert flush_visits() == 1
+        redis.ltrim.assert_called_once_with('visit_queue', 1, -1)
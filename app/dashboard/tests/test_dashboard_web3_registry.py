@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""Handle web3 registry related tests.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from dashboard.abi import erc20_abi, standard_bounties_abi
+from dashboard.web3_registry import RPCMetrics, Web3Registry, construct_metrics_middleware, rpc_metrics
+from test_plus.test import TestCase
+
+ADDRESS = '0x2af47a65da8cd66729b4209c22017d6a5c2d2400'
+
+
+class Web3RegistryTest(TestCase):
+    """Define tests for the web3 registry."""
+
+    def test_get_web3(self):
+        """Test that a network gets a single web3 instance per provider type."""
+        registry = Web3Registry()
+        assert registry.get_web3('mainnet') is registry.get_web3('mainnet')
+        assert registry.get_web3('mainnet') is not registry.get_web3('rinkeby')
+        assert registry.get_web3('mainnet') is not registry.get_web3('mainnet', sockets=True)
+        assert registry.get_web3('localhost', sockets=True) is registry.get_web3('localhost')
+        assert registry.get_web3('localhost').providers[0].endpoint_uri == 'http://testrpc:8545'
+
+    def test_get_contract(self):
+        """Test that contracts are kept per network, address and ABI."""
+        registry = Web3Registry()
+        contract = registry.get_contract('mainnet', ADDRESS, standard_bounties_abi)
+
+        assert contract.address == '0x2af47a65da8CD66729b4209C22017d6A5C2d2400'
+        assert registry.get_contract('mainnet', contract.address, list(standard_bounties_abi)) is contract
+        assert registry.get_contract('rinkeby', ADDRESS, standard_bounties_abi) is not contract
+        assert registry.get_contract('mainnet', ADDRESS, erc20_abi) is not contract
+
+    def test_metrics(self):
+        """Test that calls are counted per network and method, in latency buckets."""
+        metrics = RPCMetrics()
+        metrics.observe('mainnet', 'eth_call', 0.003)
+        metrics.observe('mainnet', 'eth_call', 0.2, failed=True)
+
+        metric = metrics.snapshot()[('mainnet', 'eth_call')]
+        assert metric['calls'] == 2
+        assert metric['errors'] == 1
+        assert metric['histogram'][0] == 1
+        assert metric['histogram'][metrics.buckets.index(0.25)] == 1
+        assert metrics.percentile(metric, 50) == 0.005
+        assert metrics.percentile(metric, 99) == 0.25
+
+    def test_metrics_middleware(self):
+        """Test that the middleware records error responses as failed calls."""
+        rpc_metrics.reset()
+        middleware = construct_metrics_middleware('test')(lambda method, params: {'error': 'nope'}, None)
+        middleware('eth_blockNumber', [])
+
+        assert rpc_metrics.snapshot()[('test', 'eth_blockNumber')]['errors'] == 1
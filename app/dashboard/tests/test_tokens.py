@@ -19,7 +19,8 @@ along with this program. If not, see <http://www.gnu.org/licenses/>.
 """
 from django.test import TestCase
 
-from dashboard.tokens import addr_to_token, get_tokens
+from dashboard.tokens import addr_to_token, get_tokens, token_by_name, token_registry
+from economy.models import Token
 
 
 class DashboardTokensTest(TestCase):
@@ -27,6 +28,9 @@ class DashboardTokensTest(TestCase):
 
     fixtures = ['tokens.json']
 
+    def setUp(self):
+        token_registry.clear()
+
     def test_tokens(self):
         """Test the dashboard tokens variable to ensure it can be read properly."""
         tokens = get_tokens()
@@ -47,3 +51,16 @@ class DashboardTokensTest(TestCase):
         token = addr_to_token('0xGITCOIN')
         assert isinstance(token, bool)
         assert token is False
+
+    def test_lookups_are_cached(self):
+        """Test that the tokens are loaded with one query, and reloaded when a token changes."""
+        with self.assertNumQueries(1):
+            assert addr_to_token('0x0000000000000000000000000000000000000000')['name'] == 'ETH'
+            assert token_by_name('eth')['addr'] == '0x0000000000000000000000000000000000000000'
+            assert token_by_name('ETH') == addr_to_token('0x0000000000000000000000000000000000000000')
+            assert get_tokens()
+
+        Token.objects.create(address='0x00000000000000000000000000000000000000AB', symbol='NEW', network='mainnet')
+        tokens = token_registry.resolve_many(['0x00000000000000000000000000000000000000ab', '0xGITCOIN'])
+        assert tokens['0x00000000000000000000000000000000000000ab']['name'] == 'NEW'
+        assert tokens['0xGITCOIN'] is False
@@ -15,22 +15,93 @@
     along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 '''
+import threading
+import time
+
+from django.conf import settings
+
+
+class TokenRegistry:
+    """Hold the approved tokens of every network in memory, indexed by address and by symbol.
+
+    All the tokens are loaded with a single query, and reloaded once they are older than
+    `ttl` seconds. Saving or deleting a Token clears the registry of the current process,
+    so other processes see the change within `ttl` seconds.
+
+    Lookups return copies of the `Token.to_dict` dicts, or False if there is no such token.
+
+    """
+
+    def __init__(self, ttl=None):
+        self.ttl = settings.TOKEN_REGISTRY_TTL if ttl is None else ttl
+        self._lock = threading.Lock()
+        self._indexes = None
+        self._loaded_at = 0
+
+    def get_indexes(self):
+        indexes = self._indexes
+        if indexes is None or time.time() - self._loaded_at >= self.ttl:
+            indexes = self._load()
+        return indexes
+
+    def _load(self):
+        from economy.models import Token
+        by_network, by_address, by_symbol = {}, {}, {}
+        for token in Token.objects.filter(approved=True).order_by('pk'):
+            token_dict = token.to_dict
+            by_network.setdefault(token.network, []).append(token_dict)
+            # the first token wins, as the linear scans this replaces did
+            by_address.setdefault((token.network, token.address.lower()), token_dict)
+            by_symbol.setdefault((token.network, token.symbol.lower()), token_dict)
+        indexes = by_network, by_address, by_symbol
+        with self._lock:
+            self._indexes = indexes
+            self._loaded_at = time.time()
+        return indexes
+
+    def clear(self):
+        with self._lock:
+            self._indexes = None
+
+    def get_tokens(self, network='mainnet'):
+        """Get the approved tokens of network."""
+        return [dict(token) for token in self.get_indexes()[0].get(network, [])]
+
+    def by_address(self, address, network='mainnet'):
+        """Get the token at address on network."""
+        token = self.get_indexes()[1].get((network, (address or '').lower()))
+        return dict(token) if token else False
+
+    def by_symbol(self, symbol, network='mainnet'):
+        """Get the token named symbol on network."""
+        token = self.get_indexes()[2].get((network, (symbol or '').lower()))
+        return dict(token) if token else False
+
+    def resolve_many(self, addresses, network='mainnet'):
+        """Get the tokens at many addresses on network.
+
+        Returns:
+            dict: address => token, or False for the addresses without a token.
+
+        """
+        by_address = self.get_indexes()[1]
+        tokens = {}
+        for address in addresses:
+            token = by_address.get((network, (address or '').lower()))
+            tokens[address] = dict(token) if token else False
+        return tokens
+
+
+token_registry = TokenRegistry()
 
 
 def get_tokens(network='mainnet'):
-    from economy.models import Token
-    return [token.to_dict for token in Token.objects.filter(network=network, approved=True).all()]
+    return token_registry.get_tokens(network)
 
 
 def addr_to_token(addr, network='mainnet'):
-    for token in get_tokens(network=network):
-        if(token['addr'].lower() == addr.lower()):
-            return token
-    return False
+    return token_registry.by_address(addr, network)
 
 
 def token_by_name(name):
-    for token in get_tokens():
-        if token['name'].lower() == name.lower():
-            return token
-    return False
+    return token_registry.by_symbol(name)
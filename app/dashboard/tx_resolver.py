@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""Define the batched transaction receipt resolver.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import logging
+from collections import OrderedDict
+from datetime import datetime
+
+from django.core.cache import cache
+from django.db.models.signals import post_save
+from django.utils import timezone
+
+import pytz
+from dashboard.rpc import JSONRPCBatchClient
+from dashboard.web3_registry import web3_registry
+
+logger = logging.getLogger(__name__)
+
+DROPPED_DAYS = 4
+NON_TERMINAL_STATES = ['pending', 'na', 'unknown']
+TX_STATUS_FIELDS = ['tx_status', 'tx_time', 'receive_tx_status', 'receive_tx_time', 'modified_on']
+BLOCK_TIMESTAMP_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+
+
+class ReceiptResolver:
+    """Get the status and mining time of many transactions with batched JSON-RPC requests.
+
+    All receipts are requested in batches of `batch_size`, then the blocks they were
+    mined in, each block once. Block timestamps don't change, so they are cached.
+
+    """
+
+    def __init__(self, network, rpc_client=None, batch_size=100):
+        self.network = network
+        if rpc_client is None:
+            provider = web3_registry.get_web3(network).providers[0]
+            rpc_client = JSONRPCBatchClient(
+                provider.endpoint_uri, batch_size=batch_size, session=getattr(provider, 'session', None)
+            )
+        self.rpc = rpc_client
+
+    def resolve(self, txs):
+        """Get the status and mining time of transactions.
+
+        Args:
+            txs (list): (txid, created_on) tuples.
+
+        Returns:
+            list: (status, timestamp) tuples in the order of txs, as `get_tx_status` returns them.
+
+        """
+        txids = list(OrderedDict.fromkeys(txid for txid, __ in txs if txid and txid != 'override'))
+        receipts = self.batch([('eth_getTransactionReceipt', [txid]) for txid in txids])
+        receipts = dict(zip(txids, receipts))
+
+        block_numbers = {
+            int(receipt['blockNumber'], 16) for receipt in receipts.values()
+            if isinstance(receipt, dict) and receipt.get('blockNumber')
+        }
+        timestamps = self.get_block_timestamps(block_numbers)
+        return [self.get_status(txid, created_on, receipts.get(txid), timestamps) for txid, created_on in txs]
+
+    def batch(self, calls):
+        if not calls:
+            return []
+        try:
+            return self.rpc.batch(calls)
+        except Exception as e:
+            return [e] * len(calls)
+
+    def get_status(self, txid, created_on, receipt, timestamps):
+        if txid == 'override':
+            return 'success', None  # overridden by admin
+        if not txid:
+            return 'unknown', None
+        if isinstance(receipt, Exception):
+            logger.error(f'Failure in get_tx_status for {txid} - ({receipt})')
+            return 'unknown', None
+        if not receipt:
+            if timezone.now() > created_on + timezone.timedelta(days=DROPPED_DAYS):
+                return 'dropped', None
+            return 'pending', None
+
+        block_number = receipt.get('blockNumber')
+        timestamp = timestamps.get(int(block_number, 16)) if block_number else None
+        if receipt.get('status') is None:
+            # receipts from before byzantium have no status
+            if block_number and receipt.get('blockHash'):
+                return 'success', timestamp
+            logger.error(f'Failure in get_tx_status for {txid} - (got a tx but no blockNumber or blockHash)')
+            return 'unknown', timestamp
+        status = int(receipt['status'], 16)
+        if status == 1:
+            return 'success', timestamp
+        if status == 0:
+            return 'error', timestamp
+        return 'unknown', timestamp
+
+    def get_block_timestamps(self, block_numbers):
+        """Get the timestamps of blocks, from the cache or with batched requests.
+
+        Returns:
+            dict: block number => aware datetime, for the blocks that could be read.
+
+        """
+        keys = {number: f'block_timestamp:{self.network}:{number}' for number in block_numbers}
+        try:
+            cached = cache.get_many(keys.values())
+        except Exception as e:
+            logger.warning(f'Could not read the block timestamp cache - ({e})')
+            cached = {}
+        timestamps = {number: cached[key] for number, key in keys.items() if key in cached}
+
+        missing = sorted(set(block_numbers) - set(timestamps))
+        blocks = self.batch([('eth_getBlockByNumber', [hex(number), False]) for number in missing])
+        fetched = {}
+        for number, block in zip(missing, blocks):
+            if isinstance(block, dict) and block.get('timestamp'):
+                fetched[number] = datetime.fromtimestamp(int(block['timestamp'], 16), tz=pytz.UTC)
+        if fetched:
+            try:
+                cache.set_many({keys[number]: timestamp for number, timestamp in fetched.items()},
+                               BLOCK_TIMESTAMP_CACHE_TIMEOUT)
+            except Exception as e:
+                logger.warning(f'Could not write the block timestamp cache - ({e})')
+        timestamps.update(fetched)
+        return timestamps
+
+
+def sync_tx_statuses(model, objs, batch_size=100, resolvers=None):
+    """Refresh the send and receive tx statuses of SendCryptoAsset objects of one model.
+
+    Only the non terminal statuses are refreshed. The objects whose statuses changed are
+    written with a single UPDATE, and `post_save` is sent for each of them so that the
+    receivers depending on the tx status (leaderboards, kudos popularity) still run.
+
+    Args:
+        model (SendCryptoAsset): The model of the objects.
+        objs (list): The objects to refresh.
+        batch_size (int): The number of calls per JSON-RPC batch request.
+        resolvers (dict): network => ReceiptResolver. Built for each network by default.
+
+    Returns:
+        list: The objects whose statuses changed.
+
+    """
+    from dashboard.revaluation import bulk_update
+    resolvers = resolvers or {}
+
+    requests_by_network = OrderedDict()
+    for obj in objs:
+        for prefix, txid in [('tx', obj.txid), ('receive_tx', obj.receive_txid)]:
+            if getattr(obj, f'{prefix}_status') in NON_TERMINAL_STATES:
+                requests_by_network.setdefault(obj.network, []).append((obj, prefix, txid))
+
+    changed = OrderedDict()
+    for network, requests in requests_by_network.items():
+        if network not in resolvers:
+            resolvers[network] = ReceiptResolver(network, batch_size=batch_size)
+        results = resolvers[network].resolve([(txid, obj.created_on) for obj, __, txid in requests])
+        for (obj, prefix, __), (status, timestamp) in zip(requests, results):
+            if (getattr(obj, f'{prefix}_status'), getattr(obj, f'{prefix}_time')) != (status, timestamp):
+                setattr(obj, f'{prefix}_status', status)
+                setattr(obj, f'{prefix}_time', timestamp)
+                changed[obj.pk] = obj
+
+    changed = list(changed.values())
+    now = timezone.now()
+    for obj in changed:
+        obj.modified_on = now
+    bulk_update(model, changed, TX_STATUS_FIELDS)
+    for obj in changed:
+        post_save.send(sender=model, instance=obj, created=False, update_fields=frozenset(TX_STATUS_FIELDS),
+                       raw=False, using=obj._state.db)
+    return changed
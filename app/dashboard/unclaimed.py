@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""Define the lookups of the tips and kudos a user hasn't claimed yet, and the cache of their counts.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+UNCLAIMED_COUNTS_TIMEOUT = 60 * 60
+
+
+def get_unclaimed_tips(handle):
+    from dashboard.models import Tip
+    tips = Tip.objects.filter(
+        expires_date__gte=timezone.now(),
+        receive_txid='',
+        username__iexact=handle,
+        web3_type='v3',
+    ).send_happy_path()
+    if not settings.DEBUG:
+        tips = tips.filter(network='mainnet')
+    return tips
+
+
+def get_unclaimed_kudos(handle):
+    from kudos.models import KudosTransfer
+    kudos = KudosTransfer.objects.filter(
+        receive_txid='', username__iexact="@" + handle, web3_type='v3',
+    ).send_happy_path()
+    if not settings.DEBUG:
+        kudos = kudos.filter(network='mainnet')
+    return kudos
+
+
+def get_unclaimed_counts_key(username):
+    return f'unclaimed_counts:{username.lstrip("@").lower()}'
+
+
+def get_unclaimed_counts(handle):
+    """Get the number of unclaimed tips and kudos of a user, from the cache when possible.
+
+    The counts are dropped from the cache whenever a tip or kudos sent to the user is saved.
+
+    Returns:
+        tuple: The number of unclaimed tips and the number of unclaimed kudos.
+
+    """
+    key = get_unclaimed_counts_key(handle)
+    try:
+        counts = cache.get(key)
+    except Exception as e:
+        logger.warning(f'Could not read the unclaimed counts of {handle} - ({e})')
+        counts = None
+    if counts is None:
+        counts = (get_unclaimed_tips(handle).count(), get_unclaimed_kudos(handle).count())
+        try:
+            cache.set(key, counts, UNCLAIMED_COUNTS_TIMEOUT)
+        except Exception as e:
+            logger.warning(f'Could not write the unclaimed counts of {handle} - ({e})')
+    return counts
+
+
+def forget_unclaimed_counts(username):
+    """Drop the cached unclaimed counts of the user a tip or kudos was sent to."""
+    if not username:
+        return
+    try:
+        cache.delete(get_unclaimed_counts_key(username))
+    except Exception as e:
+        logger.warning(f'Could not forget the unclaimed counts of {username} - ({e})')
@@ -27,21 +27,26 @@ from django.conf import settings
 import ipfsapi
 import requests
 from app.utils import sync_profile
+from dashboard.abi import standard_bounties_abi
 from dashboard.helpers import UnsupportedSchemaException, normalize_url, process_bounty_changes, process_bounty_details
+from dashboard.ipfs_cache import ipfs_cache
 from dashboard.models import Activity, BlockedUser, Bounty, Profile, UserAction
-from eth_utils import to_checksum_address
+from dashboard.web3_registry import get_contract, web3_registry
+from eth_utils import event_abi_to_log_topic, to_checksum_address
 from gas.utils import conf_time_spread, eth_usd_conv_rate, gas_advisories, recommend_min_gas_price_to_confirm_in_time
 from hexbytes import HexBytes
 from ipfsapi.exceptions import CommunicationError
-from web3 import HTTPProvider, Web3, WebsocketProvider
 from web3.exceptions import BadFunctionCallOutput
-from web3.middleware import geth_poa_middleware
 
 logger = logging.getLogger(__name__)
 
 SEMAPHORE_BOUNTY_SALT = '1'
 SEMAPHORE_BOUNTY_NS = 'bounty_processor'
 
+# reused across calls so that IPFS reads keep their connections alive
+ipfs_session = requests.Session()
+_ipfs_client = None
+
 
 def all_sendcryptoasset_models():
     from revenue.models import DigitalGoodPurchase
@@ -211,6 +216,15 @@ def get_ipfs(host=None, port=settings.IPFS_API_PORT):
 
 
 def ipfs_cat(key):
+    """Get the payload stored on IPFS under the provided hash.
+
+    Payloads are immutable, so they are served from the IPFS cache whenever possible.
+
+    """
+    return ipfs_cache.get(key, ipfs_cat_network)
+
+
+def ipfs_cat_network(key):
     try:
         # Attempt connecting to IPFS via Infura
         response, status_code = ipfs_cat_requests(key)
@@ -227,8 +241,19 @@ def ipfs_cat(key):
         logger.exception(e)
 
 
+def get_ipfs_client():
+    """Get the shared IPFS client, connecting on first use."""
+    global _ipfs_client
+    if _ipfs_client is None:
+        _ipfs_client = get_ipfs()
+    return _ipfs_client
+
+
 def ipfs_cat_ipfsapi(key):
-    ipfs = get_ipfs()
+    try:
+        ipfs = get_ipfs_client()
+    except IPFSCantConnectException:
+        return None
     if ipfs:
         try:
             return ipfs.cat(key)
@@ -239,7 +264,7 @@ def ipfs_cat_ipfsapi(key):
 def ipfs_cat_requests(key):
     try:
         url = f'https://ipfs.infura.io:5001/api/v0/cat/{key}'
-        response = requests.get(url, timeout=1)
+        response = ipfs_session.get(url, timeout=1)
         return response.text, response.status_code
     except:
         return None, 500
@@ -248,30 +273,18 @@ def ipfs_cat_requests(key):
 def get_web3(network, sockets=False):
     """Get a Web3 session for the provided network.
 
+    The session is shared by the whole process, see `dashboard.web3_registry`.
+    Any network but mainnet, rinkeby and ropsten is a local testrpc node.
+
     Attributes:
         network (str): The network to establish a session with.
-
-    Raises:
-        UnsupportedNetworkException: The exception is raised if the method
-            is passed an invalid network.
+        sockets (bool): Whether to use a websocket provider.
 
     Returns:
         web3.main.Web3: A web3 instance for the provided network.
 
     """
-    if network in ['mainnet', 'rinkeby', 'ropsten']:
-        if sockets:
-            provider = WebsocketProvider(f'wss://{network}.infura.io/ws')
-        else:
-            provider = HTTPProvider(f'https://{network}.infura.io')
-        w3 = Web3(provider)
-        if network == 'rinkeby':
-            w3.middleware_stack.inject(geth_poa_middleware, layer=0)
-        return w3
-    elif network == 'localhost' or 'custom network':
-        return Web3(Web3.HTTPProvider("http://testrpc:8545", request_kwargs={'timeout': 60}))
-
-    raise UnsupportedNetworkException(network)
+    return web3_registry.get_web3(network, sockets=sockets)
 
 
 def get_bounty_invite_url(handle, bounty_id):
@@ -318,12 +331,8 @@ def getStandardBountiesContractAddresss(network):
 
 # http://web3py.readthedocs.io/en/latest/contracts.html
 def getBountyContract(network):
-    web3 = get_web3(network)
-    standardbounties_abi = '[{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"}],"name":"killBounty","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[{"name":"_bountyId","type":"uint256"}],"name":"getBountyToken","outputs":[{"name":"","type":"address"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_data","type":"string"}],"name":"fulfillBounty","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newDeadline","type":"uint256"}],"name":"extendDeadline","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[],"name":"getNumBounties","outputs":[{"name":"","type":"uint256"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_fulfillmentId","type":"uint256"},{"name":"_data","type":"string"}],"name":"updateFulfillment","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newFulfillmentAmount","type":"uint256"},{"name":"_value","type":"uint256"}],"name":"increasePayout","outputs":[],"payable":true,"stateMutability":"payable","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newFulfillmentAmount","type":"uint256"}],"name":"changeBountyFulfillmentAmount","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newIssuer","type":"address"}],"name":"transferIssuer","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_value","type":"uint256"}],"name":"activateBounty","outputs":[],"payable":true,"stateMutability":"payable","type":"function"},{"constant":false,"inputs":[{"name":"_issuer","type":"address"},{"name":"_deadline","type":"uint256"},{"name":"_data","type":"string"},{"name":"_fulfillmentAmount","type":"uint256"},{"name":"_arbiter","type":"address"},{"name":"_paysTokens","type":"bool"},{"name":"_tokenContract","type":"address"}],"name":"issueBounty","outputs":[{"name":"","type":"uint256"}],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"_issuer","type":"address"},{"name":"_deadline","type":"uint256"},{"name":"_data","type":"string"},{"name":"_fulfillmentAmount","type":"uint256"},{"name":"_arbiter","type":"address"},{"name":"_paysTokens","type":"bool"},{"name":"_tokenContract","type":"address"},{"name":"_value","type":"uint256"}],"name":"issueAndActivateBounty","outputs":[{"name":"","type":"uint256"}],"payable":true,"stateMutability":"payable","type":"function"},{"constant":true,"inputs":[{"name":"_bountyId","type":"uint256"}],"name":"getBountyArbiter","outputs":[{"name":"","type":"address"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_value","type":"uint256"}],"name":"contribute","outputs":[],"payable":true,"stateMutability":"payable","type":"function"},{"constant":true,"inputs":[],"name":"owner","outputs":[{"name":"","type":"address"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newPaysTokens","type":"bool"},{"name":"_newTokenContract","type":"address"}],"name":"changeBountyPaysTokens","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[{"name":"_bountyId","type":"uint256"}],"name":"getBountyData","outputs":[{"name":"","type":"string"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":true,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_fulfillmentId","type":"uint256"}],"name":"getFulfillment","outputs":[{"name":"","type":"bool"},{"name":"","type":"address"},{"name":"","type":"string"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newArbiter","type":"address"}],"name":"changeBountyArbiter","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newDeadline","type":"uint256"}],"name":"changeBountyDeadline","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_fulfillmentId","type":"uint256"}],"name":"acceptFulfillment","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[{"name":"","type":"uint256"}],"name":"bounties","outputs":[{"name":"issuer","type":"address"},{"name":"deadline","type":"uint256"},{"name":"data","type":"string"},{"name":"fulfillmentAmount","type":"uint256"},{"name":"arbiter","type":"address"},{"name":"paysTokens","type":"bool"},{"name":"bountyStage","type":"uint8"},{"name":"balance","type":"uint256"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":true,"inputs":[{"name":"_bountyId","type":"uint256"}],"name":"getBounty","outputs":[{"name":"","type":"address"},{"name":"","type":"uint256"},{"name":"","type":"uint256"},{"name":"","type":"bool"},{"name":"","type":"uint256"},{"name":"","type":"uint256"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newData","type":"string"}],"name":"changeBountyData","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[{"name":"_bountyId","type":"uint256"}],"name":"getNumFulfillments","outputs":[{"name":"","type":"uint256"}],"payable":false,"stateMutability":"view","type":"function"},{"inputs":[{"name":"_owner","type":"address"}],"payable":false,"stateMutability":"nonpayable","type":"constructor"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"}],"name":"BountyIssued","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"},{"indexed":false,"name":"issuer","type":"address"}],"name":"BountyActivated","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"},{"indexed":true,"name":"fulfiller","type":"address"},{"indexed":true,"name":"_fulfillmentId","type":"uint256"}],"name":"BountyFulfilled","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"_bountyId","type":"uint256"},{"indexed":false,"name":"_fulfillmentId","type":"uint256"}],"name":"FulfillmentUpdated","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"},{"indexed":true,"name":"fulfiller","type":"address"},{"indexed":true,"name":"_fulfillmentId","type":"uint256"}],"name":"FulfillmentAccepted","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"},{"indexed":true,"name":"issuer","type":"address"}],"name":"BountyKilled","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"},{"indexed":true,"name":"contributor","type":"address"},{"indexed":false,"name":"value","type":"uint256"}],"name":"ContributionAdded","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"},{"indexed":false,"name":"newDeadline","type":"uint256"}],"name":"DeadlineExtended","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"}],"name":"BountyChanged","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"_bountyId","type":"uint256"},{"indexed":true,"name":"_newIssuer","type":"address"}],"name":"IssuerTransferred","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"_bountyId","type":"uint256"},{"indexed":false,"name":"_newFulfillmentAmount","type":"uint256"}],"name":"PayoutIncreased","type":"event"}]'
     standardbounties_addr = getStandardBountiesContractAddresss(network)
-    bounty_abi = json.loads(standardbounties_abi)
-    getBountyContract = web3.eth.contract(standardbounties_addr, abi=bounty_abi)
-    return getBountyContract
+    return get_contract(network, standardbounties_addr, standard_bounties_abi)
 
 
 def get_bounty(bounty_enum, network):
@@ -335,7 +344,7 @@ def get_bounty(bounty_enum, network):
     standard_bounties = getBountyContract(network)
 
     try:
-        issuer, contract_deadline, fulfillmentAmount, paysTokens, bountyStage, balance = standard_bounties.functions.getBounty(bounty_enum).call()
+        bounty_details = standard_bounties.functions.getBounty(bounty_enum).call()
     except BadFunctionCallOutput:
         raise BountyNotFoundException
     # pull from blockchain
@@ -343,17 +352,43 @@ def get_bounty(bounty_enum, network):
     arbiter = standard_bounties.functions.getBountyArbiter(bounty_enum).call()
     token = standard_bounties.functions.getBountyToken(bounty_enum).call()
     bounty_data_str = ipfs_cat(bountydata)
-    bounty_data = json.loads(bounty_data_str)
 
     # fulfillments
     num_fulfillments = int(standard_bounties.functions.getNumFulfillments(bounty_enum).call())
     fulfillments = []
     for fulfill_enum in range(0, num_fulfillments):
-
         # pull from blockchain
         accepted, fulfiller, data = standard_bounties.functions.getFulfillment(bounty_enum, fulfill_enum).call()
+        fulfillments.append((fulfill_enum, accepted, fulfiller, data, ipfs_cat(data)))
+
+    return assemble_bounty(bounty_enum, network, bounty_details, arbiter, token, bounty_data_str, fulfillments)
+
+
+def assemble_bounty(bounty_enum, network, bounty_details, arbiter, token, bounty_data_str, fulfillments):
+    """Assemble the bounty dict consumed by web3_process_bounty from raw contract and IPFS data.
+
+    Args:
+        bounty_enum (int): The standard bounties ID.
+        network (str): The network the bounty lives on.
+        bounty_details (list): The output of the `getBounty` contract call.
+        arbiter (str): The output of the `getBountyArbiter` contract call.
+        token (str): The output of the `getBountyToken` contract call.
+        bounty_data_str (str): The IPFS payload referenced by `getBountyData`.
+        fulfillments (list): (fulfill_enum, accepted, fulfiller, ipfs hash, IPFS payload) tuples.
+
+    Raises:
+        IPFSCantConnectException: The exception is raised if any IPFS payload is an IPFS error.
+
+    Returns:
+        dict: The bounty data.
+
+    """
+    issuer, contract_deadline, fulfillmentAmount, paysTokens, bountyStage, balance = bounty_details
+    bounty_data = json.loads(bounty_data_str)
+
+    bounty_fulfillments = []
+    for fulfill_enum, accepted, fulfiller, data, data_str in fulfillments:
         try:
-            data_str = ipfs_cat(data)
             data = json.loads(data_str)
         except JSONDecodeError:
             logger.error(f'Could not get {data} from ipfs')
@@ -363,7 +398,7 @@ def get_bounty(bounty_enum, network):
         if 'Failed to get block' in str(data_str):
             raise IPFSCantConnectException("Failed to connect to IPFS")
 
-        fulfillments.append({
+        bounty_fulfillments.append({
             'id': fulfill_enum,
             'accepted': accepted,
             'fulfiller': fulfiller,
@@ -394,12 +429,58 @@ def get_bounty(bounty_enum, network):
         'data': bounty_data,
         'arbiter': arbiter,
         'token': token,
-        'fulfillments': fulfillments,
+        'fulfillments': bounty_fulfillments,
         'network': network,
     }
     return bounty
 
 
+def get_bounty_event_topics():
+    """Get the log topics of every StandardBounties event.
+
+    Every StandardBounties event carries the bounty id as its first non-indexed
+    argument, so the id is always the first word of the log data.
+
+    Returns:
+        dict: A mapping of log topic (hex str) to event name.
+
+    """
+    return {
+        HexBytes(event_abi_to_log_topic(item)).hex(): item['name']
+        for item in standard_bounties_abi if item.get('type') == 'event'
+    }
+
+
+def get_changed_bounty_ids(network, from_block, to_block, web3=None):
+    """Get the ids of the bounties which emitted an event in the provided block range.
+
+    Args:
+        network (str): The network to read the logs from.
+        from_block (int): The first block of the range.
+        to_block (int): The last block of the range (inclusive).
+        web3 (web3.main.Web3): The web3 instance to use. Defaults to: get_web3(network).
+
+    Returns:
+        list: The sorted, deduplicated list of standard bounties ids.
+
+    """
+    web3 = web3 or get_web3(network)
+    topics = get_bounty_event_topics()
+    logs = web3.eth.getLogs({
+        'fromBlock': from_block,
+        'toBlock': to_block,
+        'address': getStandardBountiesContractAddresss(network),
+    })
+
+    bounty_ids = set()
+    for log in logs:
+        if not log['topics'] or HexBytes(log['topics'][0]).hex() not in topics:
+            continue
+        data = HexBytes(log['data'])
+        bounty_ids.add(int.from_bytes(data[:32], 'big'))
+    return sorted(bounty_ids)
+
+
 # processes a bounty returned by get_bounty
 def web3_process_bounty(bounty_data):
     """Process web3 bounty data by creating new or updated Bounty objects."""
@@ -701,50 +782,17 @@ def profile_helper(handle, suppress_profile_hidden_exception=False, current_user
 
 
 def get_tx_status(txid, network, created_on):
-    from django.utils import timezone
-    from dashboard.utils import get_web3
-    import pytz
+    """Get the status and mining time of a transaction.
 
-    DROPPED_DAYS = 4
+    Returns:
+        tuple: The status (pending, success, error, dropped or unknown) and the time the tx was mined.
 
-    # get status
-    status = None
-    if txid == 'override':
-        return 'success', None #overridden by admin
-    try:
-        web3 = get_web3(network)
-        tx = web3.eth.getTransactionReceipt(txid)
-        if not tx:
-            drop_dead_date = created_on + timezone.timedelta(days=DROPPED_DAYS)
-            if timezone.now() > drop_dead_date:
-                status = 'dropped'
-            else:
-                status = 'pending'
-        elif tx and 'status' not in tx.keys():
-            if bool(tx['blockNumber']) and bool(tx['blockHash']):
-                status = 'success'
-            else:
-                raise Exception("got a tx but no blockNumber or blockHash")
-        elif tx.status == 1:
-            status = 'success'
-        elif tx.status == 0:
-            status = 'error'
-        else:
-            status = 'unknown'
-    except Exception as e:
-        logger.error(f'Failure in get_tx_status for {txid} - ({e})')
-        status = 'unknown'
+    """
+    from dashboard.tx_resolver import ReceiptResolver
 
-    # get timestamp
-    timestamp = None
-    try:
-        if tx:
-            block = web3.eth.getBlock(tx['blockNumber'])
-            timestamp = block.timestamp
-            timestamp = timezone.datetime.fromtimestamp(timestamp).replace(tzinfo=pytz.UTC)
-    except:
-        pass
-    return status, timestamp
+    if txid == 'override':
+        return 'success', None  # overridden by admin
+    return ReceiptResolver(network).resolve([(txid, created_on)])[0]
 
 
 def is_blocked(handle):
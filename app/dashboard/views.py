@@ -1290,12 +1290,14 @@ def profile(request, handle):
 
         for tab, name in activity_tabs:
             activities = profile_filter_activities(all_activities, tab)
-            activities_count = activities.count()
+            activities_count = context['profile_stats'].get_activity_count(tab)
 
             if activities_count == 0:
                 continue
 
             paginator = Paginator(activities, 10)
+            # count is a cached_property, seed it from the snapshot instead of counting again
+            paginator.count = activities_count
 
             obj = {'id': tab,
                    'name': name,
@@ -1328,8 +1330,8 @@ def profile(request, handle):
     kudos_limit = 8
     context['kudos'] = owned_kudos[0:kudos_limit]
     context['sent_kudos'] = sent_kudos[0:kudos_limit]
-    context['kudos_count'] = owned_kudos.count()
-    context['sent_kudos_count'] = sent_kudos.count()
+    context['kudos_count'] = context['profile_stats'].kudos_count
+    context['sent_kudos_count'] = context['profile_stats'].sent_kudos_count
     context['verification'] = profile.get_my_verified_check
 
     currently_working_bounties = Bounty.objects.current().filter(interested__profile=profile).filter(interested__status='okay') \
@@ -1924,11 +1926,7 @@ def get_kudos(request):
         q = request.GET.get('term')
         network = request.GET.get('network', None)
         eth_to_usd = convert_token_to_usdt('ETH')
-        kudos_by_name = Token.objects.filter(name__icontains=q)
-        kudos_by_desc = Token.objects.filter(description__icontains=q)
-        kudos_by_tags = Token.objects.filter(tags__icontains=q)
-        kudos_pks = (kudos_by_desc | kudos_by_name | kudos_by_tags).values_list('pk', flat=True)
-        kudos = Token.objects.filter(pk__in=kudos_pks, hidden=False, num_clones_allowed__gt=0).order_by('name')
+        kudos = Token.objects.keyword(q).filter(hidden=False, num_clones_allowed__gt=0).order_by('name')
         is_staff = request.user.is_staff if request.user.is_authenticated else False
         if not is_staff:
             kudos = kudos.filter(send_enabled_for_non_gitcoin_admins=True)
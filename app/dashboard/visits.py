@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""Define the batched visit recorder.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import json
+import logging
+
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from app.geoip import geoip_resolver
+from dashboard.models import Profile, UserAction
+
+logger = logging.getLogger(__name__)
+
+QUEUE_KEY = 'visit_queue'
+RECORD_VISIT_EVERY_N_SECONDS = 60 * 60
+
+
+def get_queue_client():
+    from app.utils import get_raw_cache_client
+    return get_raw_cache_client()
+
+
+def record_visit(profile, ip_address, utm):
+    """Queue a visit of profile to be written by `flush_visits`, at most once per `RECORD_VISIT_EVERY_N_SECONDS`.
+
+    Falls back to writing the visit right away if the queue can't be reached.
+
+    Args:
+        profile (Profile): The profile of the visitor.
+        ip_address (str): The IP address of the request.
+        utm (dict): The UTM parameters of the visit.
+
+    """
+    entry = {
+        'user_id': profile.user_id,
+        'profile_id': profile.pk,
+        'ip_address': ip_address,
+        'utm': utm,
+        'created_on': timezone.now().isoformat(),
+    }
+    try:
+        # the profile's last_visit is only updated when the queue is flushed
+        if not cache.add(f'visit_recorded:{profile.pk}', True, RECORD_VISIT_EVERY_N_SECONDS):
+            return
+        get_queue_client().rpush(QUEUE_KEY, json.dumps(entry))
+    except Exception as e:
+        logger.warning(f'Could not queue visit - ({e})')
+        write_visits([entry])
+
+
+def write_visits(entries):
+    """Write visits as `Visit` UserActions, and update the `last_visit` of the profiles."""
+    locations = geoip_resolver.lookup_many(entry['ip_address'] for entry in entries)
+    actions = [
+        UserAction(
+            user_id=entry['user_id'],
+            profile_id=entry['profile_id'],
+            action='Visit',
+            location_data=locations[entry['ip_address']],
+            ip_address=entry['ip_address'],
+            utm=entry['utm'],
+            created_on=parse_datetime(entry['created_on']),
+        ) for entry in entries
+    ]
+    # bulk_create doesn't send pre_save
+    for action in actions:
+        action.normalize_location()
+    UserAction.objects.bulk_create(actions)
+
+    from dashboard.revaluation import bulk_update
+    last_visits = {}
+    for entry in entries:
+        created_on = parse_datetime(entry['created_on'])
+        last_visits[entry['profile_id']] = max(created_on, last_visits.get(entry['profile_id'], created_on))
+    profiles = [Profile(pk=pk, last_visit=last_visit) for pk, last_visit in last_visits.items()]
+    bulk_update(Profile, profiles, ['last_visit'])
+
+
+def flush_visits(batch_size=1000):
+    """Write the queued visits.
+
+    A batch is only removed from the queue once it is written, so a failed write leaves it for the next flush.
+    Visits are pushed to the tail of the queue, so trimming the head only removes the written batch.
+
+    Returns:
+        int: The number of visits written.
+
+    """
+    redis = get_queue_client()
+    written = 0
+    while True:
+        items = redis.lrange(QUEUE_KEY, 0, batch_size - 1)
+        if not items:
+            return written
+        entries = [json.loads(item) for item in items]
+        write_visits(entries)
+        redis.ltrim(QUEUE_KEY, len(items), -1)
+        written += len(entries)
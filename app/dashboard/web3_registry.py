@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""Define the pooled web3 provider and contract registry.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import bisect
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+import requests
+from eth_utils import to_checksum_address
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from web3 import HTTPProvider, Web3, WebsocketProvider
+from web3.middleware import geth_poa_middleware
+
+logger = logging.getLogger(__name__)
+
+INFURA_NETWORKS = ['mainnet', 'rinkeby', 'ropsten']
+
+
+class RPCMetrics:
+    """Count the JSON-RPC calls made by this process and their latency, per network and method."""
+
+    # upper bounds of the latency histogram buckets, in seconds
+    buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, float('inf'))
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._metrics = {}
+
+    def observe(self, network, method, seconds, failed=False):
+        """Record a call of method on network that took seconds."""
+        with self._lock:
+            metric = self._metrics.setdefault((network, method), {
+                'calls': 0,
+                'errors': 0,
+                'seconds': 0.0,
+                'histogram': [0] * len(self.buckets),
+            })
+            metric['calls'] += 1
+            metric['errors'] += int(failed)
+            metric['seconds'] += seconds
+            metric['histogram'][bisect.bisect_left(self.buckets, seconds)] += 1
+
+    def snapshot(self):
+        """Get a copy of the metrics.
+
+        Returns:
+            dict: (network, method) => {calls, errors, seconds, histogram}, where histogram[i]
+                is the number of calls that took at most `buckets[i]` seconds (and more than
+                `buckets[i - 1]`).
+
+        """
+        with self._lock:
+            return {key: dict(metric, histogram=list(metric['histogram'])) for key, metric in self._metrics.items()}
+
+    def report(self):
+        """Format the metrics as a table of calls, errors and latency percentiles."""
+        lines = []
+        for (network, method), metric in sorted(self.snapshot().items()):
+            percentiles = ' '.join(
+                f'p{p}<={self.percentile(metric, p)}s' for p in (50, 90, 99)
+            )
+            lines.append(
+                f"{network} {method}: {metric['calls']} calls, {metric['errors']} errors, "
+                f"avg {round(metric['seconds'] / metric['calls'], 4)}s, {percentiles}"
+            )
+        return '\n'.join(lines)
+
+    def percentile(self, metric, p):
+        """Get the upper bound of the bucket holding the pth percentile call."""
+        target = metric['calls'] * p / 100
+        seen = 0
+        for bound, count in zip(self.buckets, metric['histogram']):
+            seen += count
+            if seen >= target:
+                return bound
+        return self.buckets[-1]
+
+
+rpc_metrics = RPCMetrics()
+
+
+def construct_metrics_middleware(network):
+    """Build a web3 middleware recording every request made on network in `rpc_metrics`."""
+    def metrics_middleware(make_request, web3):
+        def middleware(method, params):
+            start_time = time.time()
+            try:
+                response = make_request(method, params)
+            except Exception:
+                rpc_metrics.observe(network, method, time.time() - start_time, failed=True)
+                raise
+            rpc_metrics.observe(network, method, time.time() - start_time, failed='error' in response)
+            return response
+        return middleware
+    return metrics_middleware
+
+
+def build_session(pool_size=None, max_retries=None):
+    """Build a keep-alive requests session for talking to a node.
+
+    Connection failures and 429/502/503/504 answers are retried with an exponential backoff.
+
+    """
+    pool_size = pool_size or settings.WEB3_POOL_SIZE
+    max_retries = settings.WEB3_MAX_RETRIES if max_retries is None else max_retries
+    # JSON-RPC is POST only, which urllib3 doesn't retry unless told to
+    methods = {'allowed_methods' if hasattr(Retry, 'DEFAULT_ALLOWED_METHODS') else 'method_whitelist': False}
+    retry = Retry(
+        total=max_retries,
+        read=0,
+        backoff_factor=settings.WEB3_RETRY_BACKOFF,
+        status_forcelist=(429, 502, 503, 504),
+        raise_on_status=False,
+        **methods,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+class PooledHTTPProvider(HTTPProvider):
+    """An HTTPProvider sending its requests through its own pooled session."""
+
+    def __init__(self, endpoint_uri, session, request_kwargs=None):
+        super().__init__(endpoint_uri, request_kwargs=request_kwargs)
+        self.session = session
+
+    def make_request(self, method, params):
+        request_data = self.encode_rpc_request(method, params)
+        response = self.session.post(self.endpoint_uri, data=request_data, **dict(self.get_request_kwargs()))
+        response.raise_for_status()
+        return self.decode_rpc_response(response.content)
+
+
+def get_endpoint_uri(network, sockets=False):
+    """Get the node url of network."""
+    if network in INFURA_NETWORKS:
+        return f'wss://{network}.infura.io/ws' if sockets else f'https://{network}.infura.io'
+    return 'http://testrpc:8545'
+
+
+class Web3Registry:
+    """Keep one long-lived web3 instance per network, and the contract objects built on them.
+
+    Building a provider opens a new HTTP connection and building a contract processes
+    its whole ABI, so both are done once per process instead of once per call.
+
+    Args:
+        endpoints (dict): network => node url, overriding `get_endpoint_uri`.
+        max_contracts (int): The number of contract objects to keep.
+
+    """
+
+    def __init__(self, endpoints=None, max_contracts=256):
+        self.endpoints = endpoints or {}
+        self.max_contracts = max_contracts
+        self._lock = threading.RLock()
+        self._web3s = {}
+        self._contracts = OrderedDict()
+        self._abi_hashes = {}
+
+    def get_web3(self, network, sockets=False):
+        """Get the web3 instance of network."""
+        # any network but the infura ones is a local testrpc node, which is only reached over http
+        sockets = sockets and network in INFURA_NETWORKS
+        key = (network, sockets)
+        web3 = self._web3s.get(key)
+        if web3 is None:
+            with self._lock:
+                web3 = self._web3s.get(key)
+                if web3 is None:
+                    web3 = self._web3s[key] = self.build_web3(network, sockets)
+        return web3
+
+    def build_web3(self, network, sockets=False):
+        endpoint_uri = self.endpoints.get(network) or get_endpoint_uri(network, sockets)
+        if endpoint_uri.startswith('ws'):
+            provider = WebsocketProvider(endpoint_uri)
+        else:
+            timeout = 60 if network not in INFURA_NETWORKS else settings.WEB3_TIMEOUT
+            provider = PooledHTTPProvider(endpoint_uri, build_session(), request_kwargs={'timeout': timeout})
+        web3 = Web3(provider)
+        if network == 'rinkeby':
+            web3.middleware_stack.inject(geth_poa_middleware, layer=0)
+        web3.middleware_stack.add(construct_metrics_middleware(network), 'rpc_metrics')
+        return web3
+
+    def get_contract(self, network, address, abi, sockets=False):
+        """Get the contract object at address on network.
+
+        Contract objects are kept per (network, address, ABI hash), so a contract whose
+        ABI changes gets a new object.
+
+        """
+        key = (network, sockets, to_checksum_address(address), self.get_abi_hash(abi))
+        with self._lock:
+            contract = self._contracts.get(key)
+            if contract is not None:
+                self._contracts.move_to_end(key)
+                return contract
+        contract = self.get_web3(network, sockets).eth.contract(key[2], abi=abi)
+        with self._lock:
+            self._contracts[key] = contract
+            while len(self._contracts) > self.max_contracts:
+                self._contracts.popitem(last=False)
+        return contract
+
+    def get_abi_hash(self, abi):
+        # ABIs are mostly module level constants, so remember the hash of the ones seen;
+        # keeping a reference to the ABI guarantees its id isn't reused by another object
+        cached = self._abi_hashes.get(id(abi))
+        if cached and cached[0] is abi:
+            return cached[1]
+        abi_hash = hashlib.sha1(json.dumps(abi, sort_keys=True).encode()).hexdigest()
+        with self._lock:
+            if len(self._abi_hashes) < self.max_contracts:
+                self._abi_hashes[id(abi)] = (abi, abi_hash)
+        return abi_hash
+
+    def clear(self):
+        with self._lock:
+            self._web3s = {}
+            self._contracts = OrderedDict()
+            self._abi_hashes = {}
+
+
+web3_registry = Web3Registry()
+
+
+def get_contract(network, address, abi, sockets=False):
+    """Get the contract object at address on network from the registry."""
+    return web3_registry.get_contract(network, address, abi, sockets=sockets)
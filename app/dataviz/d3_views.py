@@ -194,7 +194,7 @@ def viz_steamgraph(request, key='open'):
             next_date = current_date + timezone.timedelta(days=1)
             for org_name in org_names:
                 if org_name:
-                    _bounties = bounties.filter(github_url__contains=org_name)
+                    _bounties = bounties.for_org(org_name)
                     weight = round(
                         sum(
                             bounty.value_in_usdt_then for bounty in _bounties
@@ -465,7 +465,7 @@ def viz_graph_data_helper(_type, keyword, hide_pii):
     edges = []
     bounties = Bounty.objects.current().filter(network='mainnet')
     if keyword:
-        bounties = bounties.filter(raw_data__icontains=keyword)
+        bounties = bounties.with_keyword(keyword)
 
     for bounty in bounties:
         if bounty.value_in_usdt_then:
@@ -691,7 +691,7 @@ def viz_scatterplot_data_helper(keyword, hide_usernames=False):
     rows = [['hourlyRate', 'daysBack', 'username', 'weight']]
     fulfillments = BountyFulfillment.objects.filter(accepted=True).exclude(fulfiller_hours_worked=None)
     if keyword:
-        filter_bounties = Bounty.objects.filter(raw_data__icontains=keyword)
+        filter_bounties = Bounty.objects.with_keyword(keyword)
         fulfillments = fulfillments.filter(bounty__in=filter_bounties)
     for bf in fulfillments:
         #print(bf.pk, bf.created_on)
@@ -25,7 +25,9 @@ from django.core.management.base import BaseCommand
 import ccxt
 import cryptocompare as cc
 from dashboard.models import Bounty, Tip
+from dashboard.revaluation import revalue_bounties
 from economy.models import ConversionRate
+from economy.rate_index import conversion_rate_index
 from websocket import create_connection
 
 
@@ -113,17 +115,8 @@ def polo():
 
 
 def refresh_bounties():
-    for bounty in Bounty.objects.all():
-        print(f'refreshed {bounty.pk}')
-        try:
-            bounty._val_usd_db = bounty.value_in_usdt
-            bounty._val_usd_db_now = bounty.value_in_usdt_now
-            bounty.save()
-        except Exception as e:
-            print(e)
-            bounty._val_usd_db = 0
-            bounty._val_usd_db_now = 0
-            bounty.save()
+    total, updated = revalue_bounties(Bounty.objects.all())
+    print(f'refreshed {total} bounties, {updated} changed')
 
 
 def refresh_conv_rate(when, token_name):
@@ -194,6 +187,8 @@ class Command(BaseCommand):
         except Exception as e:
             print(e)
 
+        conversion_rate_index.invalidate()
+
         try:
             print('refresh')
             refresh_bounties()
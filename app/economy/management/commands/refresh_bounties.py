@@ -18,8 +18,11 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
 from django.core.management.base import BaseCommand
+from django.db.models import Exists, OuterRef
 
 from dashboard.models import Bounty
+from dashboard.revaluation import revalue_bounties
+from economy.utils import preload_usdt_rates
 
 
 class Command(BaseCommand):
@@ -36,6 +39,42 @@ class Command(BaseCommand):
             default=False,
             help='Pulls remote info about bounty too'
         )
+        parser.add_argument(
+            '-b', '--bulk',
+            action='store_true',
+            dest='bulk',
+            default=False,
+            help='Only revalues bounties, in bulk, without saving them one by one'
+        )
+        parser.add_argument(
+            '-e', '--expired',
+            action='store_true',
+            dest='expired',
+            default=False,
+            help='Only refreshes the status of the closed bounties past their expiration date'
+        )
+
+    def handle_bulk(self):
+        """Mark older versions of bounties as not current, then refresh the status and value of every bounty in bulk."""
+        newer_bounties = Bounty.objects.current().filter(
+            standard_bounties_id=OuterRef('standard_bounties_id'),
+            network=OuterRef('network'),
+            pk__gt=OuterRef('pk'),
+        )
+        old_bounties = Bounty.objects.current().filter(web3_type='bounties_network').annotate(
+            has_newer_bounty=Exists(newer_bounties)
+        ).filter(has_newer_bounty=True)
+        for old_bounty in old_bounties:
+            old_bounty.current_bounty = False
+            old_bounty.save()
+            print('stopgap fixed old_bounty', old_bounty.pk)
+
+        # bounties expire with time, without any write to refresh their status
+        refreshed = Bounty.objects.all().refresh_status()
+        print(f'refreshed the status of {len(refreshed)} bounties')
+
+        total, updated = revalue_bounties(Bounty.objects.all())
+        print(f'revalued {total} bounties, {updated} changed')
 
     def handle(self, *args, **options):
         """Refresh all bounties.
@@ -46,8 +85,16 @@ class Command(BaseCommand):
                 Defaults to: `False` unless user passes the remote option.
 
         """
+        if options['expired']:
+            refreshed = Bounty.objects.past_expiration().refresh_status()
+            print(f'refreshed the status of {len(refreshed)} bounties past their expiration date')
+            return
+        if options['bulk']:
+            return self.handle_bulk()
+
         all_bounties = Bounty.objects.all()
         fetch_remote = options['remote']
+        preload_usdt_rates(all_bounties.values_list('token_name', flat=True).distinct())
         for bounty in all_bounties:
 
             if bounty.current_bounty:
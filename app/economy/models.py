@@ -26,7 +26,7 @@ from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.db.models.fields.files import FieldFile
 from django.db.models.query import QuerySet
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.forms.models import model_to_dict
 from django.urls import reverse
@@ -159,6 +159,14 @@ def reverse_conversion_rate(sender, instance, **kwargs):
         )
 
 
+@receiver(post_save, sender=ConversionRate, dispatch_uid="psave_conversion_rate")
+@receiver(post_delete, sender=ConversionRate, dispatch_uid="pdelete_conversion_rate")
+def forget_conversion_rate(sender, instance, **kwargs):
+    """Drop the pair of a changed conversion rate from the in-memory rate index."""
+    from economy.rate_index import conversion_rate_index
+    conversion_rate_index.forget(instance.from_currency, instance.to_currency)
+
+
 class Token(SuperModel):
     """Define the Token model."""
 
@@ -187,3 +195,11 @@ class Token(SuperModel):
     @property
     def email(self):
         return self.metadata.get('email', None)
+
+
+@receiver(post_save, sender=Token, dispatch_uid="psave_token")
+@receiver(post_delete, sender=Token, dispatch_uid="pdelete_token")
+def forget_tokens(sender, instance, **kwargs):
+    """Clear the in-memory token registry when a token changes."""
+    from dashboard.tokens import token_registry
+    token_registry.clear()
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""Define the in-memory conversion rate index.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import logging
+import threading
+import time
+import uuid
+from bisect import bisect_left
+from datetime import date, datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max, Q
+from django.utils import timezone
+
+from economy.models import ConversionRate
+
+logger = logging.getLogger(__name__)
+
+
+class RateSeries:
+    """Hold the conversion rates of one currency pair, sorted by timestamp."""
+
+    def __init__(self, rows=()):
+        rows = sorted(rows, key=lambda row: row[0])
+        self.timestamps = [row[0] for row in rows]
+        self.from_amounts = [row[1] for row in rows]
+        self.to_amounts = [row[2] for row in rows]
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def rate_at(self, timestamp=None):
+        """Get the first rate at or after timestamp, or the latest rate if timestamp is None.
+
+        Returns:
+            float: The rate, or None if there is no such rate.
+
+        """
+        if not self.timestamps:
+            return None
+        if timestamp is None:
+            i = len(self.timestamps) - 1
+        else:
+            i = bisect_left(self.timestamps, timestamp)
+            if i == len(self.timestamps):
+                return None
+        return float(self.to_amounts[i]) / float(self.from_amounts[i])
+
+
+class ConversionRateIndex:
+    """Answer conversion rate lookups from memory instead of the database.
+
+    The rates of a (from_currency, to_currency) pair are loaded once, with a single
+    query, and kept sorted by timestamp so that a lookup is a binary search.
+
+    Saving a ConversionRate drops its pair from the index of the current process.
+    Every `check_interval` seconds each process compares the newest ConversionRate pk
+    and a version number kept in the shared django cache against the ones it last saw,
+    and drops every pair if either changed. `invalidate()` bumps that version number,
+    for changes that don't add rows.
+
+    """
+
+    version_key = 'conversion_rate_index_version'
+
+    def __init__(self, check_interval=None):
+        self.check_interval = settings.CONVERSION_RATE_INDEX_CHECK_INTERVAL if check_interval is None else check_interval
+        self._series = {}
+        self._lock = threading.Lock()
+        self._version = None
+        self._checked_at = 0
+
+    def rate(self, from_currency, to_currency, timestamp=None):
+        """Get the rate of a pair at timestamp (see `RateSeries.rate_at`)."""
+        self._check_version()
+        pair = (from_currency, to_currency)
+        series = self._series.get(pair)
+        if series is None:
+            series = self._load([pair])[pair]
+        return series.rate_at(self._normalize(timestamp))
+
+    def preload(self, pairs):
+        """Load the rates of all the given pairs that aren't loaded yet with a single query."""
+        self._check_version()
+        pairs = {pair for pair in pairs if pair not in self._series}
+        if pairs:
+            self._load(pairs)
+
+    def _load(self, pairs):
+        query = Q()
+        for from_currency, to_currency in pairs:
+            query |= Q(from_currency=from_currency, to_currency=to_currency)
+        rows = {pair: [] for pair in pairs}
+        values = ConversionRate.objects.filter(query).values_list(
+            'from_currency', 'to_currency', 'timestamp', 'from_amount', 'to_amount'
+        )
+        for from_currency, to_currency, timestamp, from_amount, to_amount in values:
+            rows[(from_currency, to_currency)].append((timestamp, from_amount, to_amount))
+
+        series = {pair: RateSeries(pair_rows) for pair, pair_rows in rows.items()}
+        with self._lock:
+            self._series.update(series)
+        return series
+
+    def forget(self, from_currency, to_currency):
+        """Drop a pair from the index of the current process."""
+        with self._lock:
+            self._series.pop((from_currency, to_currency), None)
+
+    def clear(self):
+        with self._lock:
+            self._series = {}
+
+    def invalidate(self):
+        """Drop every pair from the index of every process."""
+        self.clear()
+        try:
+            cache.set(self.version_key, uuid.uuid4().hex, None)
+        except Exception as e:
+            logger.warning(f'Conversion rate index invalidation failed - ({e})')
+        self._checked_at = 0
+
+    def _check_version(self):
+        """Drop every pair if rates were added or the index was invalidated since the last check."""
+        now = time.time()
+        if now - self._checked_at < self.check_interval:
+            return
+        self._checked_at = now
+        try:
+            shared_version = cache.get(self.version_key)
+        except Exception as e:
+            logger.warning(f'Conversion rate index version check failed - ({e})')
+            shared_version = None
+        version = (shared_version, ConversionRate.objects.aggregate(Max('pk'))['pk__max'])
+        if version != self._version:
+            self.clear()
+            self._version = version
+
+    def _normalize(self, timestamp):
+        if isinstance(timestamp, date) and not isinstance(timestamp, datetime):
+            timestamp = datetime.combine(timestamp, datetime.min.time())
+        if timestamp is not None and settings.USE_TZ and timezone.is_naive(timestamp):
+            return timezone.make_aware(timestamp)
+        return timestamp
+
+
+conversion_rate_index = ConversionRateIndex()
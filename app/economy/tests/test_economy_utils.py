@@ -22,7 +22,9 @@ from datetime import datetime
 from django.test.client import RequestFactory
 
 from economy.models import ConversionRate
-from economy.utils import convert_amount, etherscan_link
+from economy.utils import (
+    ConversionRateNotFoundError, convert_amount, convert_amounts, convert_amounts_to_usdt, etherscan_link,
+)
 from test_plus.test import TestCase
 
 
@@ -65,6 +67,47 @@ class EconomyUtilsTest(TestCase):
         result = convert_amount(2, 'ETH', 'USDT', datetime(2018, 1, 1))
         assert round(result, 1) == 10
 
+    def test_convert_amount_new_rate(self):
+        """Test the economy util convert_amount method picks up newly saved ConversionRates."""
+        assert round(convert_amount(2, 'ETH', 'USDT'), 1) == 6
+        ConversionRate.objects.create(
+            from_amount=1,
+            to_amount=4,
+            source='etherdelta',
+            from_currency='ETH',
+            to_currency='USDT',
+        )
+        assert round(convert_amount(2, 'ETH', 'USDT'), 1) == 8
+
+    def test_convert_amount_not_found(self):
+        """Test the economy util convert_amount method raises for missing ConversionRates."""
+        with self.assertRaises(ConversionRateNotFoundError):
+            convert_amount(2, 'ETH', 'DAI')
+        with self.assertRaises(ConversionRateNotFoundError):
+            convert_amount(2, 'ETH', 'USDT', datetime(2100, 1, 1))
+
+    def test_convert_amounts(self):
+        """Test the economy util convert_amounts method."""
+        result = convert_amounts([
+            (2, 'ETH', 'USDT', None),
+            (2, 'WETH', 'USDT', datetime(2018, 1, 1)),
+            (2, 'ETH', 'DAI', None),
+        ])
+        assert [round(amount, 1) if amount else amount for amount in result] == [6, 10, None]
+
+    def test_convert_amounts_to_usdt(self):
+        """Test the economy util convert_amounts_to_usdt method goes through ETH without a direct rate."""
+        ConversionRate.objects.create(
+            from_amount=1,
+            to_amount=0.5,
+            source='etherdelta',
+            from_currency='GIT',
+            to_currency='ETH',
+        )
+        result = convert_amounts_to_usdt([(4, 'GIT', None), (4, 'NOPE', None)])
+        assert round(result[0], 1) == 6
+        assert result[1] is None
+
     def test_etherscan_link(self):
         """Test the economy util etherscan_link method."""
         txid = '0xcb39900d98fa00de2936d2770ef3bfef2cc289328b068e580dc68b7ac1e2055b'
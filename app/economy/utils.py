@@ -17,8 +17,7 @@ You should have received a copy of the GNU Affero General Public License
 along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 """
-from cacheops import cached_as
-from economy.models import ConversionRate
+from economy.rate_index import conversion_rate_index
 
 
 # All Units in native currency
@@ -48,28 +47,81 @@ def convert_amount(from_amount, from_currency, to_currency, timestamp=None):
 
     """
 
-    # hack to handle WETH
-    if from_currency == 'WETH':
-        from_currency = 'ETH'
-    if to_currency == 'WETH':
-        to_currency = 'ETH'
-    
-    if timestamp:
-        conversion_rate = ConversionRate.objects.filter(
-            from_currency=from_currency,
-            to_currency=to_currency,
-            timestamp__gte=timestamp
-        ).order_by('-timestamp').last()
-    else:
-        conversion_rate = ConversionRate.objects.filter(
-            from_currency=from_currency,
-            to_currency=to_currency,
-        ).order_by('-timestamp').first()
-
-    if not conversion_rate:
+    from_currency, to_currency = normalize_currency(from_currency), normalize_currency(to_currency)
+    rate = conversion_rate_index.rate(from_currency, to_currency, timestamp)
+    if rate is None:
         raise ConversionRateNotFoundError(f"ConversionRate {from_currency}/{to_currency} @ {timestamp} not found")
 
-    return (float(conversion_rate.to_amount) / float(conversion_rate.from_amount)) * float(from_amount)
+    return rate * float(from_amount)
+
+
+def normalize_currency(currency):
+    """Map currencies that are priced as another currency (WETH is priced as ETH)."""
+    # hack to handle WETH
+    if currency == 'WETH':
+        return 'ETH'
+    return currency
+
+
+def convert_amounts(conversions):
+    """Convert many amounts at once.
+
+    The rates of all the currency pairs involved are loaded with a single query.
+
+    Args:
+        conversions (iterable): (from_amount, from_currency, to_currency, timestamp) tuples.
+
+    Returns:
+        list of float: The converted amounts, in order. None where no rate was found.
+
+    """
+    conversions = [
+        (from_amount, normalize_currency(from_currency), normalize_currency(to_currency), timestamp)
+        for from_amount, from_currency, to_currency, timestamp in conversions
+    ]
+    conversion_rate_index.preload((from_currency, to_currency) for __, from_currency, to_currency, __ in conversions)
+
+    amounts = []
+    for from_amount, from_currency, to_currency, timestamp in conversions:
+        rate = conversion_rate_index.rate(from_currency, to_currency, timestamp)
+        amounts.append(None if rate is None else rate * float(from_amount))
+    return amounts
+
+
+def preload_usdt_rates(tokens):
+    """Load every rate needed to convert the given tokens to USDT with a single query.
+
+    Args:
+        tokens (iterable of str): The token identifiers.
+
+    """
+    pairs = {('ETH', 'USDT')}
+    for token in tokens:
+        token = normalize_currency(token)
+        pairs.update([(token, 'USDT'), (token, 'ETH')])
+    conversion_rate_index.preload(pairs)
+
+
+def convert_amounts_to_usdt(conversions):
+    """Convert many token amounts to USDT at once, going through ETH where there is no direct rate.
+
+    Args:
+        conversions (iterable): (from_amount, from_token, timestamp) tuples.
+
+    Returns:
+        list of float: The amounts in USDT, in order. None where no rate was found.
+
+    """
+    conversions = list(conversions)
+    preload_usdt_rates(from_token for __, from_token, __ in conversions)
+
+    amounts = []
+    for from_amount, from_token, timestamp in conversions:
+        try:
+            amounts.append(convert_token_to_usdt(from_token, timestamp) * float(from_amount))
+        except ConversionRateNotFoundError:
+            amounts.append(None)
+    return amounts
 
 
 def convert_token_to_usdt(from_token, timestamp=None):
@@ -6,6 +6,7 @@ from django.shortcuts import redirect
 from django.template.response import TemplateResponse
 
 from dashboard.utils import get_nonce, get_web3
+from dashboard.web3_registry import get_contract
 from gas.utils import recommend_min_gas_price_to_confirm_in_time
 from kudos.models import BulkTransferCoupon, BulkTransferRedemption, KudosTransfer, Token
 from kudos.utils import kudos_abi
@@ -124,7 +125,7 @@ def receive_bulk_ethdenver(request, secret):
             kudos_owner_address = Web3.toChecksumAddress(settings.KUDOS_OWNER_ACCOUNT)
             w3 = get_web3(coupon.token.contract.network)
             nonce = w3.eth.getTransactionCount(kudos_owner_address)
-            contract = w3.eth.contract(Web3.toChecksumAddress(kudos_contract_address), abi=kudos_abi())
+            contract = get_contract(coupon.token.contract.network, kudos_contract_address, kudos_abi())
             tx = contract.functions.clone(address, coupon.token.token_id, 1).buildTransaction({
                 'nonce': nonce,
                 'gas': 500000,
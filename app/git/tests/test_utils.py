@@ -28,8 +28,8 @@ import responses
 from git.utils import (
     BASE_URI, HEADERS, JSON_HEADER, TOKEN_URL, build_auth_dict, delete_issue_comment, get_auth_url, get_github_emails,
     get_github_primary_email, get_github_user_data, get_github_user_token, get_issue_comments,
-    get_issue_timeline_events, get_user, is_github_token_valid, org_name, patch_issue_comment, post_issue_comment,
-    post_issue_comment_reaction, repo_url, reset_token, revoke_token, search,
+    get_issue_timeline_events, get_user, is_github_token_valid, org_name, parse_github_url, patch_issue_comment,
+    post_issue_comment, post_issue_comment_reaction, repo_url, reset_token, revoke_token, search,
 )
 from test_plus.test import TestCase
 
@@ -67,6 +67,15 @@ class GitUtilitiesTest(TestCase):
         assert org_name('https://github.com/gitcoinco/web/issues/1') == 'gitcoinco'
         assert org_name('https://github.com/gitcoinco/web/issues/1/') == 'gitcoinco'
 
+    def test_parse_github_url(self):
+        """Test the github utility parse_github_url method."""
+        assert parse_github_url('https://github.com/Gitcoinco/Web/issues/1#issuecomment-2') == ('gitcoinco', 'web', 1)
+        assert parse_github_url('https://github.com/gitcoinco/web/pull/12/') == ('gitcoinco', 'web', 12)
+        assert parse_github_url('https://github.com/gitcoinco/web') == ('gitcoinco', 'web', None)
+        assert parse_github_url('https://github.com/gitcoinco') == ('gitcoinco', '', None)
+        assert parse_github_url('https://example.com/gitcoinco/web/issues/1') == ('', '', None)
+        assert parse_github_url(None) == ('', '', None)
+
     @responses.activate
     def test_search(self):
         """Test the github utility search method."""
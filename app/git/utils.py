@@ -769,6 +769,27 @@ def issue_number(issue_url):
         return ''
 
 
+def parse_github_url(url):
+    """Get the lower-cased organization, repo and issue number of a Github URL.
+
+    Args:
+        url (str): The Github organization, repo or issue URL.
+
+    Returns:
+        tuple: The organization and repo names, '' when missing, and the issue
+            number, None when missing.
+
+    """
+    parts = (url or '').split('#')[0].split('?')[0].split('/')
+    if len(parts) < 4 or parts[2].lower() not in ('github.com', 'www.github.com'):
+        return '', '', None
+    org = parts[3].lower()
+    repo = parts[4].lower() if len(parts) > 4 else ''
+    issue = parts[6] if len(parts) > 6 else ''
+    issue = int(issue) if issue.isdigit() and int(issue) < 2 ** 31 else None
+    return org, repo, issue
+
+
 def get_current_ratelimit(token=None):
     """Get the current Github API ratelimit for the provided token."""
     gh_client = github_connect(token)
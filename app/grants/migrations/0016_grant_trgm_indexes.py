@@ -0,0 +1,30 @@
+# Generated by Django 2.1.7 on 2019-03-06 12:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('grants', '0015_merge_20190225_1422'),
+        # creates the pg_trgm extension
+        ('dashboard', '0018_bounty_search'),
+    ]
+
+    operations = [
+        # trigram indexes on the expressions `GrantQuerySet.keyword`'s icontains lookups compile to
+        migrations.RunSQL(
+            [
+                'CREATE INDEX grants_grant_title_trgm_idx ON grants_grant USING gin (UPPER(title) gin_trgm_ops);',
+                'CREATE INDEX grants_grant_description_trgm_idx ON grants_grant '
+                'USING gin (UPPER(description) gin_trgm_ops);',
+                'CREATE INDEX grants_grant_reference_url_trgm_idx ON grants_grant '
+                'USING gin (UPPER(reference_url) gin_trgm_ops);',
+            ],
+            [
+                'DROP INDEX grants_grant_title_trgm_idx;',
+                'DROP INDEX grants_grant_description_trgm_idx;',
+                'DROP INDEX grants_grant_reference_url_trgm_idx;',
+            ],
+        ),
+    ]
@@ -229,10 +229,8 @@ class Grant(SuperModel):
     @property
     def contract(self):
         """Return grants contract."""
-        from dashboard.utils import get_web3
-        web3 = get_web3(self.network)
-        grant_contract = web3.eth.contract(Web3.toChecksumAddress(self.contract_address), abi=self.abi)
-        return grant_contract
+        from dashboard.web3_registry import get_contract
+        return get_contract(self.network, self.contract_address, self.abi)
 
 
 class Milestone(SuperModel):
@@ -446,14 +444,13 @@ class Subscription(SuperModel):
 
     def get_debug_info(self):
         """Return grants contract."""
-        from dashboard.utils import get_web3
         from dashboard.abi import erc20_abi
         from dashboard.tokens import addr_to_token
+        from dashboard.web3_registry import get_contract
         try:
-            web3 = get_web3(self.network)
             if not self.token_address:
                 return "This subscription has no token_address"
-            token_contract = web3.eth.contract(Web3.toChecksumAddress(self.token_address), abi=erc20_abi)
+            token_contract = get_contract(self.network, self.token_address, erc20_abi)
             balance = token_contract.functions.balanceOf(Web3.toChecksumAddress(self.contributor_address)).call()
             allowance = token_contract.functions.allowance(Web3.toChecksumAddress(self.contributor_address), Web3.toChecksumAddress(self.grant.contract_address)).call()
             is_active = self.get_is_active_from_web3()
@@ -22,6 +22,7 @@ import warnings
 
 from django.core.management.base import BaseCommand
 
+from dashboard.tx_resolver import NON_TERMINAL_STATES, sync_tx_statuses
 from dashboard.utils import all_sendcryptoasset_models
 
 warnings.filterwarnings("ignore", category=DeprecationWarning)
@@ -33,18 +34,22 @@ class Command(BaseCommand):
 
     help = 'gets the tx status of all SendCryptoAssets'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', dest='batch_size', default=100, type=int,
+                            help="The number of transactions per JSON-RPC batch request")
+
     def handle(self, *args, **options):
-        non_terminal_states = ['pending', 'na', 'unknown']
+        batch_size = options['batch_size']
+        resolvers = {}
         for obj_type in all_sendcryptoasset_models():
-            sent_txs = obj_type.objects.filter(tx_status__in=non_terminal_states).exclude(txid='')
-            receive_txs = obj_type.objects.filter(receive_tx_status__in=non_terminal_states).exclude(txid='').exclude(receive_txid='')
-            objects = (sent_txs | receive_txs).distinct('id')
-            for obj in objects:
-                print(f"syncing {obj_type} / {obj.pk} / {obj.network}")
-                if obj.tx_status in non_terminal_states:
-                    obj.update_tx_status()
-                    print(f" - updated {obj.txid} to {obj.tx_status}")
-                if obj.receive_tx_status in non_terminal_states:
-                    obj.update_receive_tx_status()
-                    print(f" - updated {obj.receive_txid} to {obj.receive_tx_status}")
-                obj.save()
+            sent_txs = obj_type.objects.filter(tx_status__in=NON_TERMINAL_STATES).exclude(txid='')
+            receive_txs = obj_type.objects.filter(receive_tx_status__in=NON_TERMINAL_STATES).exclude(txid='').exclude(receive_txid='')
+            objects = list((sent_txs | receive_txs).distinct('id'))
+            print(f"syncing {len(objects)} {obj_type.__name__} objects")
+            # large chunks, so that most JSON-RPC batches are full
+            chunk_size = batch_size * 10
+            for i in range(0, len(objects), chunk_size):
+                changed = sync_tx_statuses(obj_type, objects[i:i + chunk_size], batch_size, resolvers)
+                for obj in changed:
+                    print(f" - updated {obj_type.__name__} / {obj.pk} / {obj.network} to "
+                          f"{obj.tx_status} / {obj.receive_tx_status}")
@@ -0,0 +1,29 @@
+# Generated by Django 2.1.7 on 2019-03-06 12:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kudos', '0002_transferenabledfor'),
+        # creates the pg_trgm extension
+        ('dashboard', '0018_bounty_search'),
+    ]
+
+    operations = [
+        # trigram indexes on the expressions `TokenQuerySet.keyword`'s icontains lookups compile to
+        migrations.RunSQL(
+            [
+                'CREATE INDEX kudos_token_name_trgm_idx ON kudos_token USING gin (UPPER(name) gin_trgm_ops);',
+                'CREATE INDEX kudos_token_description_trgm_idx ON kudos_token '
+                'USING gin (UPPER(description) gin_trgm_ops);',
+                'CREATE INDEX kudos_token_tags_trgm_idx ON kudos_token USING gin (UPPER(tags) gin_trgm_ops);',
+            ],
+            [
+                'DROP INDEX kudos_token_name_trgm_idx;',
+                'DROP INDEX kudos_token_description_trgm_idx;',
+                'DROP INDEX kudos_token_tags_trgm_idx;',
+            ],
+        ),
+    ]
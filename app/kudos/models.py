@@ -31,7 +31,7 @@ from django.utils.text import slugify
 
 import environ
 import pyvips
-from dashboard.models import SendCryptoAsset
+from dashboard.models import ProfileStats, SendCryptoAsset
 from economy.models import SuperModel
 from eth_utils import to_checksum_address
 from pyvips.error import Error as VipsError
@@ -375,6 +375,13 @@ class KudosTransfer(SendCryptoAsset):
 
 @receiver(post_save, sender=KudosTransfer, dispatch_uid="psave_kt")
 def psave_kt(sender, instance, **kwargs):
+    from dashboard.unclaimed import forget_unclaimed_counts
+    from marketing.leaderboards import update_incremental_leaderboards
+    update_incremental_leaderboards(instance)
+    forget_unclaimed_counts(instance.username)
+    ProfileStats.mark_stale(
+        handles=[instance.username], profile_ids=[instance.recipient_profile_id, instance.sender_profile_id],
+    )
     token = instance.kudos_token_cloned_from
     if token:
         all_transfers = KudosTransfer.objects.filter(kudos_token_cloned_from=token).send_happy_path()
@@ -41,6 +41,7 @@ from dashboard.models import Activity, Profile
 from dashboard.notifications import maybe_market_kudos_to_email, maybe_market_kudos_to_github
 from dashboard.utils import get_nonce, get_web3
 from dashboard.views import record_user_action
+from dashboard.web3_registry import get_contract
 from gas.utils import recommend_min_gas_price_to_confirm_in_time
 from git.utils import get_emails_by_category, get_emails_master, get_github_primary_email
 from kudos.utils import kudos_abi
@@ -92,7 +93,7 @@ def about(request):
     context = {
         'is_outside': True,
         'active': 'about',
-        'activities': [a.view_props for a in activities],
+        'activities': [a.view_props for a in activities.with_view_props()],
         'title': 'Kudos',
         'card_title': _('Each Kudos is a unique work of art.'),
         'card_desc': _('It can be sent to highlight, recognize, and show appreciation.'),
@@ -639,7 +640,7 @@ def receive_bulk(request, secret):
             kudos_contract_address = Web3.toChecksumAddress(settings.KUDOS_CONTRACT_MAINNET)
             kudos_owner_address = Web3.toChecksumAddress(settings.KUDOS_OWNER_ACCOUNT)
             w3 = get_web3(coupon.token.contract.network)
-            contract = w3.eth.contract(Web3.toChecksumAddress(kudos_contract_address), abi=kudos_abi())
+            contract = get_contract(coupon.token.contract.network, kudos_contract_address, kudos_abi())
             nonce = w3.eth.getTransactionCount(kudos_owner_address)
             tx = contract.functions.clone(address, coupon.token.token_id, 1).buildTransaction({
                 'nonce': nonce,
@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+"""Define the bulk mail engine, which sends one message to many recipients through SendGrid.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.utils.translation import gettext
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# the most personalizations SendGrid accepts in a single mail send request
+MAX_PERSONALIZATIONS = 1000
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+# the error fields SendGrid names for an invalid recipient address, e.g. `personalizations.3.to.0.email`
+RECIPIENT_ERROR_FIELD = re.compile(r'^personalizations\.\d+\.(to|cc|bcc)\b')
+
+
+def is_rejected_recipients(error):
+    """Tell whether SendGrid rejected a request over some of its recipient addresses.
+
+    Only then is it worth splitting the request; a request rejected over its content or its size is
+    rejected again whichever recipients it is sent to.
+
+    """
+    response = error.response
+    if getattr(response, 'status_code', None) != 400:
+        return False
+    try:
+        body = response.json()
+    except ValueError:
+        return False
+    errors = body.get('errors') if isinstance(body, dict) else None
+    return any(
+        isinstance(err, dict) and RECIPIENT_ERROR_FIELD.match(str(err.get('field') or '')) for err in errors or []
+    )
+
+
+class TokenBucket:
+    """Let through `rate` tokens per second on average, in bursts of up to `capacity` tokens.
+
+    Args:
+        rate (float): The number of tokens added per second.
+        capacity (float): The most tokens the bucket holds. Defaults to: `rate`.
+
+    """
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated_at = clock()
+
+    def acquire(self, tokens=1):
+        """Wait until `tokens` tokens are available, and take them."""
+        while True:
+            with self._lock:
+                now = self.clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            self.sleep(wait)
+
+
+class SendGridClient:
+    """Post mail send requests to SendGrid over a pooled, kept alive HTTP session.
+
+    Args:
+        api_key (str): The SendGrid API key. Defaults to: `settings.SENDGRID_API_KEY`.
+        host (str): The SendGrid API host. Defaults to: `settings.SENDGRID_API_HOST`.
+        pool_size (int): The number of connections to keep open.
+        retries (int): The number of times a request is retried when SendGrid is busy or failing.
+
+    """
+
+    def __init__(self, api_key=None, host=None, pool_size=10, retries=3, timeout=30):
+        self.url = f'{host or settings.SENDGRID_API_HOST}/v3/mail/send'
+        self.api_key = api_key or settings.SENDGRID_API_KEY
+        self.retries = retries
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.mount(self.url, HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+        self.session.headers.update({
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json',
+        })
+
+    def send(self, body):
+        """Send a mail send request body, retrying with a backoff when SendGrid is busy.
+
+        Raises:
+            requests.HTTPError: If the request is rejected, or still failing after the retries.
+
+        """
+        for attempt in range(self.retries + 1):
+            response = self.session.post(self.url, json=body, timeout=self.timeout)
+            if response.status_code not in RETRY_STATUS_CODES or attempt == self.retries:
+                break
+            time.sleep(float(response.headers.get('Retry-After', 2 ** attempt)))
+        response.raise_for_status()
+        return response
+
+
+class Checkpoint:
+    """Remember the recipients a bulk send has reached, so that an interrupted send resumes where it stopped.
+
+    Args:
+        key (str): The name of the send, e.g. `roundup:2019-10`.
+        ttl (int): The number of seconds the progress is kept.
+
+    """
+
+    def __init__(self, key, ttl=60 * 60 * 24 * 7, client=None):
+        self.key = f'bulk_mail_sent:{key}'
+        self.ttl = ttl
+        self.client = client
+
+    def get_client(self):
+        if self.client is None:
+            from app.utils import get_raw_cache_client
+            self.client = get_raw_cache_client()
+        return self.client
+
+    def pending(self, emails):
+        sent = {email.decode() for email in self.get_client().smembers(self.key)}
+        return [email for email in emails if email not in sent]
+
+    def mark_sent(self, emails):
+        if emails:
+            pipe = self.get_client().pipeline()
+            pipe.sadd(self.key, *emails)
+            pipe.expire(self.key, self.ttl)
+            pipe.execute()
+
+
+class BulkMailer:
+    """Send a message to many recipients, in requests of up to `MAX_PERSONALIZATIONS` personalizations.
+
+    The requests are sent by `max_workers` threads, at most `requests_per_second` per second.
+    In debug environments, each message is only sent to `settings.CONTACT_EMAIL`, as `send_mail` does.
+
+    Args:
+        client (SendGridClient): The client. Defaults to a client for `settings.SENDGRID_API_HOST`.
+        requests_per_second (float): Defaults to: `settings.BULK_MAIL_REQUESTS_PER_SECOND`.
+        max_workers (int): Defaults to: `settings.BULK_MAIL_MAX_WORKERS`.
+        batch_size (int): The number of recipients per request.
+        checkpoint (Checkpoint): Where to keep the progress of the send. Defaults to: None (not kept).
+        debug (bool): Whether to send to `settings.CONTACT_EMAIL` only. Defaults to: `settings.IS_DEBUG_ENV`.
+
+    """
+
+    def __init__(self, client=None, requests_per_second=None, max_workers=None, batch_size=MAX_PERSONALIZATIONS,
+                 checkpoint=None, debug=None):
+        self.max_workers = max_workers or settings.BULK_MAIL_MAX_WORKERS
+        self.client = client or SendGridClient(pool_size=self.max_workers)
+        self.rate_limiter = TokenBucket(requests_per_second or settings.BULK_MAIL_REQUESTS_PER_SECOND)
+        self.batch_size = min(batch_size, MAX_PERSONALIZATIONS)
+        self.checkpoint = checkpoint
+        self.debug = settings.IS_DEBUG_ENV if debug is None else debug
+
+    @staticmethod
+    def build_body(message, recipients):
+        """Build the mail send request body of a message to some recipients.
+
+        Args:
+            message (dict): The `from_email`, `from_name`, `subject`, `text`, `html` and `categories` of the message.
+            recipients (list of tuple): The email address of each recipient, with the substitutions
+                to make in the message for them.
+
+        Returns:
+            dict: The request body.
+
+        """
+        content = [{'type': 'text/plain', 'value': message['text']}]
+        if message.get('html'):
+            content.append({'type': 'text/html', 'value': message['html']})
+        personalizations = []
+        for email, substitutions in recipients:
+            personalization = {'to': [{'email': email}]}
+            if substitutions:
+                personalization['substitutions'] = substitutions
+            personalizations.append(personalization)
+        return {
+            'personalizations': personalizations,
+            'from': {'email': message['from_email'], 'name': str(message.get('from_name', 'Gitcoin.co'))},
+            'subject': str(message['subject']),
+            'content': content,
+            'categories': message.get('categories') or ['default'],
+        }
+
+    def send_batch(self, message, recipients):
+        """Send a message to a batch of recipients.
+
+        SendGrid rejects a whole request over a single invalid address, so a batch rejected over its recipients
+        is split in halves until the addresses it was rejected over are found, and only those are left out.
+        A batch failing for any other reason fails once, as a whole.
+
+        Returns:
+            int: The number of recipients the message was sent to.
+
+        """
+        self.rate_limiter.acquire()
+        try:
+            self.client.send(self.build_body(message, recipients))
+        except requests.RequestException as e:
+            if not is_rejected_recipients(e):
+                logger.error(f'-- Sendgrid bulk mail failure for {len(recipients)} recipients - {e}')
+                return 0
+            if len(recipients) == 1:
+                logger.warning(f'-- Sendgrid bulk mail rejected {recipients[0][0]} - {e}')
+                return 0
+            middle = len(recipients) // 2
+            return self.send_batch(message, recipients[:middle]) + self.send_batch(message, recipients[middle:])
+        if self.checkpoint:
+            self.checkpoint.mark_sent([email for email, __ in recipients])
+        return len(recipients)
+
+    def get_batches(self, message, recipients):
+        if self.checkpoint:
+            pending = set(self.checkpoint.pending([email for email, __ in recipients]))
+            recipients = [recipient for recipient in recipients if recipient[0] in pending]
+        return [(message, recipients[i:i + self.batch_size]) for i in range(0, len(recipients), self.batch_size)]
+
+    def send(self, message, recipients):
+        """Send a message to recipients, skipping those the checkpoint has already reached.
+
+        Args:
+            message (dict): The message, as `build_body` takes it.
+            recipients (list of tuple): The email address of each recipient, with their substitutions.
+
+        Returns:
+            int: The number of recipients the message was sent to.
+
+        """
+        return self.send_many([(message, recipients)])
+
+    def send_many(self, messages):
+        """Send several messages, each to its own recipients, sharing the workers between them.
+
+        Args:
+            messages (list of tuple): Each message with its recipients, as `send` takes them.
+
+        Returns:
+            int: The number of recipients the messages were sent to.
+
+        """
+        if not self.client.api_key:
+            logger.warning('No SendGrid API Key set. Not attempting to send email.')
+            return 0
+        batches = []
+        for message, recipients in messages:
+            if self.debug and recipients:
+                # just to be double secret sure of what were doing in dev
+                message = dict(message, subject=gettext("[DEBUG] ") + str(message['subject']))
+                recipients = [(settings.CONTACT_EMAIL, recipients[0][1])]
+            batches += self.get_batches(message, recipients)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return sum(executor.map(lambda batch: self.send_batch(*batch), batches))
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""Define an in-memory inverted index of bounty keywords, to match email subscribers to bounties.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import json
+from collections import defaultdict
+
+from dashboard.models import BountyKeyword, normalize_keyword
+
+
+class KeywordIndex:
+    """Map normalized keywords to the ids of the bounties they match.
+
+    A keyword matches a bounty when it is one of the issue keywords of the bounty, or when it appears
+    in both the issue keywords and the title or description of the bounty.
+    Keywords are resolved once each, so matching many subscribers costs a set union per subscriber.
+
+    Args:
+        bounties (iterable of dashboard.models.Bounty): The bounties to match.
+
+    """
+
+    def __init__(self, bounties):
+        self.index = defaultdict(set)
+        self.texts = {}
+        for bounty in bounties:
+            for keyword in BountyKeyword.get_keywords(bounty):
+                self.index[keyword].add(bounty.pk)
+            keywords = bounty.keywords
+            if keywords and not isinstance(keywords, str):
+                # how postgres renders non string issue keywords as text
+                keywords = json.dumps(keywords, ensure_ascii=False)
+            self.texts[bounty.pk] = (
+                (keywords or '').lower(),
+                (bounty.title_or_desc or '').lower(),
+                (bounty.issue_description or '').lower(),
+            )
+        self._keyword_matches = {}
+        self._matches = {}
+
+    def lookup(self, keyword):
+        """Get the ids of the bounties a keyword matches.
+
+        Returns:
+            frozenset of int: The bounty ids.
+
+        """
+        keyword = normalize_keyword(keyword)
+        if keyword not in self._keyword_matches:
+            bounty_ids = set(self.index.get(keyword, ()))
+            if keyword:
+                for pk, (keywords, title, description) in self.texts.items():
+                    if keyword in keywords and (keyword in title or keyword in description):
+                        bounty_ids.add(pk)
+            self._keyword_matches[keyword] = frozenset(bounty_ids)
+        return self._keyword_matches[keyword]
+
+    def match(self, keywords):
+        """Get the ids of the bounties any of the keywords match.
+
+        Returns:
+            frozenset of int: The bounty ids.
+
+        """
+        keywords = frozenset(normalize_keyword(keyword) for keyword in keywords or [])
+        if keywords not in self._matches:
+            self._matches[keywords] = frozenset().union(*[self.lookup(keyword) for keyword in keywords])
+        return self._matches[keywords]
+
+    def group_by_matches(self, keywords_by_key, new_bounty_ids):
+        """Group keys, e.g. subscriber emails, by the bounties their keywords match.
+
+        Args:
+            keywords_by_key (dict): key => list of keywords.
+            new_bounty_ids (frozenset of int): The ids of the new bounties.
+
+        Returns:
+            dict: (new bounty ids, other bounty ids) => list of keys, for the keys matching a new bounty.
+
+        """
+        groups = defaultdict(list)
+        for key, keywords in keywords_by_key.items():
+            matches = self.match(keywords)
+            new_matches = matches & new_bounty_ids
+            if new_matches:
+                groups[(new_matches, matches - new_matches)].append(key)
+        return groups
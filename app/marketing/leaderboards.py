@@ -0,0 +1,708 @@
+# -*- coding: utf-8 -*-
+"""Define the leaderboard aggregation engine.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import json
+import logging
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Prefetch, Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from marketing.models import LeaderboardRank
+from redis.exceptions import WatchError
+
+logger = logging.getLogger(__name__)
+
+# Constants
+IGNORE_PAYERS = []
+IGNORE_EARNERS = ['owocki']  # sometimes owocki pays to himself. what a jerk!
+
+ALL = 'all'
+
+WEEKLY = 'weekly'
+QUARTERLY = 'quarterly'
+YEARLY = 'yearly'
+MONTHLY = 'monthly'
+
+FULFILLED = 'fulfilled'
+PAYERS = 'payers'
+EARNERS = 'earners'
+ORGS = 'orgs'
+KUDOS = 'kudos'
+KEYWORDS = 'keywords'
+TOKENS = 'tokens'
+COUNTRIES = 'countries'
+CITIES = 'cities'
+CONTINENTS = 'continents'
+
+TIMES = [ALL, WEEKLY, QUARTERLY, YEARLY, MONTHLY]
+BREAKDOWNS = [FULFILLED, ALL, PAYERS, EARNERS, ORGS, KEYWORDS, KUDOS, TOKENS, COUNTRIES, CITIES, CONTINENTS]
+
+
+def default_ranks():
+    """Generate a dictionary of nested dictionaries defining default ranks.
+
+    Returns:
+        dict: A nested dictionary mapping of all default ranks with empty dicts.
+
+    """
+    return_dict = {}
+    for time in TIMES:
+        for breakdown in BREAKDOWNS:
+            key = f'{time}_{breakdown}'
+            return_dict[key] = {}
+    return return_dict
+
+
+def get_time_cutoffs(now=None):
+    """Get the created_on cutoff of every windowed leaderboard time."""
+    now = now or timezone.now()
+    return {
+        WEEKLY: now - timezone.timedelta(days=(30 if settings.DEBUG else 7)),
+        MONTHLY: now - timezone.timedelta(days=30),
+        QUARTERLY: now - timezone.timedelta(days=90),
+        YEARLY: now - timezone.timedelta(days=365),
+    }
+
+
+def location_values(locations, field):
+    return list(set(ele[field] for ele in locations if ele and ele.get(field)))
+
+
+def contribute(breakdowns, index_term, amount):
+    """Get the contributions of an amount to an index term for the provided breakdowns."""
+    index_term = index_term.replace('@', '') if index_term else index_term
+    if not index_term or index_term == "None" or amount is None:
+        return []
+    amount = round(float(amount), 2)
+    return [(breakdown, index_term, amount) for breakdown in breakdowns]
+
+
+def bounty_contribution_key(bounty):
+    # a bounty is re-created on every on-chain change, so key it by its standard bounties id
+    return f'bounty_{bounty.network}_{bounty.standard_bounties_id}'
+
+
+def get_github_names(org, repo):
+    """Get the names a keyword is not ranked under, as it's the github org or repo of a bounty."""
+    names = {name for name in [org, repo] if name}
+    if org and repo:
+        names.add(f'{org}/{repo}')
+    return names
+
+
+def is_org_or_repo_name(term):
+    """Tell whether a keyword is the github org or repo of a bounty, from the parsed github columns.
+
+    Only the bounties which may match are loaded, with an indexed query, and checked as `GithubRepoIndex` does.
+
+    """
+    from dashboard.models import Bounty
+    term = term.lower()
+    org, __, repo = term.partition('/')
+    candidates = Q(github_org=org, github_repo=repo) if repo else Q(github_org=term) | Q(github_repo=term)
+    org_repos = Bounty.objects.filter(candidates).values_list('github_org', 'github_repo').distinct()
+    return any(term in get_github_names(org, repo) for org, repo in org_repos)
+
+
+class GithubRepoIndex:
+    """Tell in memory whether keyword index terms are the github org or repo of any bounty.
+
+    Args:
+        org_repos (iterable of tuple): The parsed (github_org, github_repo) of the bounties.
+
+    """
+
+    def __init__(self, org_repos):
+        self.names = set()
+        for org, repo in org_repos:
+            self.names.update(get_github_names(org, repo))
+
+    def is_org_or_repo_name(self, term):
+        return term.lower() in self.names
+
+
+class LeaderboardEngine:
+    """Build every TIMES x BREAKDOWNS leaderboard in a single pass.
+
+    All the bounties, accepted fulfillments, tips, kudos, profiles and login locations are
+    loaded up front in a handful of queries, every bounty/tip/kudos is visited once and
+    added to all the buckets it belongs to, and the ranks are written with `bulk_create`.
+
+    """
+
+    def __init__(self, network='mainnet', now=None, record_contributions=False):
+        self.network = network
+        self.cutoffs = get_time_cutoffs(now)
+        self.ranks = default_ranks()
+        self.counts = default_ranks()
+        self.contributions = [] if record_contributions else None
+        self._profiles = {}
+        self._locations = {}
+        self._github_repos = None
+
+    def run(self):
+        self.aggregate()
+        return self.save()
+
+    def aggregate(self):
+        from dashboard.models import Bounty, BountyFulfillment, Tip
+        from kudos.models import KudosTransfer
+
+        accepted_fulfillments = BountyFulfillment.objects.filter(accepted=True).only(
+            'pk', 'bounty_id', 'fulfiller_github_username'
+        )
+        bounties = [
+            bounty for bounty in Bounty.objects.current().filter(network=self.network, idx_status='done').prefetch_related(
+                Prefetch('fulfillments', queryset=accepted_fulfillments, to_attr='accepted_fulfillments')
+            ).order_by('pk') if bounty._val_usd_db
+        ]
+        tips = []
+        for tip in Tip.objects.send_success().filter(network=self.network).order_by('pk'):
+            val_usd = tip.value_in_usdt_now
+            if val_usd:
+                tips.append((tip, val_usd))
+        kudos_transfers = KudosTransfer.objects.send_success().filter(network=self.network).select_related(
+            'kudos_token_cloned_from'
+        ).order_by('pk')
+
+        handles = set()
+        for bounty in bounties:
+            handles.add(bounty.bounty_owner_github_username)
+            handles.update(f.fulfiller_github_username for f in bounty.accepted_fulfillments)
+        for tip, _ in tips:
+            handles.update([tip.username, tip.from_username, tip.org_name, tip.tokenName])
+        self.load_profiles(handles)
+        self.load_locations(resolve=True)
+        self._github_repos = GithubRepoIndex(Bounty.objects.values_list('github_org', 'github_repo').distinct())
+
+        for bounty in bounties:
+            self.add_bounty(bounty)
+        for tip, val_usd in tips:
+            self.add_tip(tip, val_usd)
+        for kudos_transfer in kudos_transfers:
+            self.add_kudos(kudos_transfer)
+
+    def load_profiles(self, handles):
+        """Load the profiles matching the provided handles (case insensitively) in one query."""
+        from dashboard.models import Profile
+
+        handles = set(handle.lower() for handle in handles if handle) - set(self._profiles.keys())
+        if not handles:
+            return
+        for handle in handles:
+            self._profiles[handle] = []
+        profiles = Profile.objects.annotate(lower_handle=Lower('handle')).filter(lower_handle__in=handles)
+        for profile in profiles.order_by('pk'):
+            self._profiles[profile.lower_handle].append(profile)
+
+    def load_locations(self, resolve=False):
+        """Load the login locations of every loaded profile from the location columns, in one query.
+
+        Args:
+            resolve (bool): Whether to resolve the logins whose location was never resolved first.
+
+        """
+        from dashboard.models import UserAction
+
+        profile_ids = [profiles[0].pk for profiles in self._profiles.values() if profiles]
+        logins = UserAction.objects.filter(action='Login', profile_id__in=profile_ids)
+        if resolve:
+            UserAction.resolve_locations(logins.filter(location_data={}).exclude(ip_address=None))
+        locations = {}
+        for profile_id, city, country_name, continent_name in logins.values_list(
+            'profile_id', 'city', 'country_name', 'continent_name',
+        ):
+            location = {'city': city, 'country_name': country_name, 'continent_name': continent_name}
+            locations.setdefault(profile_id, []).append(location)
+        self._locations = locations
+
+    def get_profile(self, handle):
+        """Get the profile Profile.objects.filter(handle__iexact=handle).first() would return."""
+        profiles = self._profiles.get(handle.lower(), []) if handle else []
+        return profiles[0] if profiles else None
+
+    def get_latest_profile(self, handle):
+        profiles = self._profiles.get(handle.lower(), []) if handle else []
+        return profiles[-1] if profiles else None
+
+    def should_suppress(self, handle):
+        if not handle:
+            return True
+        profile = self.get_profile(handle)
+        return bool(profile and (profile.suppress_leaderboard or profile.hide_profile))
+
+    def get_locations(self, handle):
+        profile = self.get_profile(handle)
+        if not profile:
+            return []
+        return self._locations.get(profile.pk, [])
+
+    def is_org_or_repo_name(self, term):
+        if self._github_repos is None:
+            # a single object's contributions, ask the indexed columns rather than load every repo
+            return is_org_or_repo_name(term)
+        return self._github_repos.is_org_or_repo_name(term)
+
+    def get_times(self, created_on):
+        return [ALL] + [time for time in [WEEKLY, MONTHLY, QUARTERLY, YEARLY] if created_on > self.cutoffs[time]]
+
+    def add(self, times, contributions):
+        for breakdown, index_term, amount in contributions:
+            for time in times:
+                key = f'{time}_{breakdown}'
+                self.ranks[key][index_term] = self.ranks[key].get(index_term, 0) + amount
+                self.counts[key][index_term] = self.counts[key].get(index_term, 0) + 1
+
+    def add_bounty(self, bounty):
+        contributions = self.bounty_contributions(bounty)
+        self.add(self.get_times(bounty.created_on), contributions)
+        self.record(bounty_contribution_key(bounty), bounty.created_on, contributions)
+
+    def add_tip(self, tip, val_usd):
+        contributions = self.tip_contributions(tip, val_usd)
+        self.add(self.get_times(tip.created_on), contributions)
+        self.record(f'tip_{tip.pk}', tip.created_on, contributions)
+
+    def add_kudos(self, kudos_transfer):
+        contributions = self.kudos_contributions(kudos_transfer)
+        self.add(self.get_times(kudos_transfer.created_on), contributions)
+        self.record(f'kt_{kudos_transfer.pk}', kudos_transfer.created_on, contributions)
+
+    def record(self, key, created_on, contributions):
+        if self.contributions is not None:
+            self.contributions.append((key, created_on, contributions))
+
+    def bounty_contributions(self, bounty):
+        """Get the (breakdown, index_term, amount) tuples a done bounty adds to every leaderboard time."""
+        contributions = []
+        val_usd = bounty._val_usd_db
+        owner = bounty.bounty_owner_github_username
+        org_name = bounty.org_name
+        fulfillers = [f.fulfiller_github_username for f in bounty.accepted_fulfillments]
+        locations = self.get_locations(owner)
+        for fulfiller in fulfillers:
+            locations = locations + self.get_locations(fulfiller)
+        countries = location_values(locations, 'country_name')
+        cities = location_values(locations, 'city')
+        continents = location_values(locations, 'continent_name')
+        keywords = [keyword.lower() for keyword in bounty.keywords_list]
+
+        index_terms = []
+        if not self.should_suppress(owner):
+            index_terms.append(owner)
+        if org_name:
+            index_terms.append(org_name)
+        for fulfiller in fulfillers:
+            if not self.should_suppress(fulfiller):
+                index_terms.append(fulfiller)
+        index_terms.append(bounty.token_name)
+        index_terms += cities + continents + countries + keywords
+
+        for index_term in index_terms:
+            breakdowns = [ALL, FULFILLED]
+            if index_term == owner and index_term not in IGNORE_PAYERS:
+                breakdowns.append(PAYERS)
+            if index_term == org_name and index_term not in IGNORE_PAYERS:
+                breakdowns.append(ORGS)
+            if index_term in fulfillers and index_term not in IGNORE_EARNERS:
+                breakdowns.append(EARNERS)
+            if index_term == bounty.token_name:
+                breakdowns.append(TOKENS)
+            if index_term in countries:
+                breakdowns.append(COUNTRIES)
+            if index_term in cities:
+                breakdowns.append(CITIES)
+            if index_term in continents:
+                breakdowns.append(CONTINENTS)
+            contributions += contribute(breakdowns, index_term, val_usd)
+            if index_term.lower() in keywords and not self.is_org_or_repo_name(index_term):
+                contributions += contribute([KEYWORDS], index_term.lower(), val_usd)
+        return contributions
+
+    def tip_contributions(self, tip, val_usd):
+        """Get the (breakdown, index_term, amount) tuples a successful tip adds to every leaderboard time."""
+        contributions = []
+        org_name = tip.org_name
+        locations = self.get_locations(tip.username) + self.get_locations(tip.from_username)
+        countries = location_values(locations, 'country_name')
+        cities = location_values(locations, 'city')
+        continents = location_values(locations, 'continent_name')
+
+        index_terms = [
+            handle for handle in [tip.username, tip.from_username, org_name, tip.tokenName]
+            if not self.should_suppress(handle)
+        ]
+        index_terms += countries + cities + continents
+
+        for index_term in index_terms:
+            breakdowns = [ALL, FULFILLED]
+            if tip.username == index_term:
+                breakdowns.append(EARNERS)
+            if tip.from_username == index_term:
+                breakdowns.append(PAYERS)
+            if org_name == index_term:
+                breakdowns.append(ORGS)
+            if tip.tokenName == index_term:
+                breakdowns.append(TOKENS)
+            if index_term in countries:
+                breakdowns.append(COUNTRIES)
+            if index_term in cities:
+                breakdowns.append(CITIES)
+            if index_term in continents:
+                breakdowns.append(CONTINENTS)
+            contributions += contribute(breakdowns, index_term, val_usd)
+        return contributions
+
+    def kudos_contributions(self, kudos_transfer):
+        return contribute([KUDOS], kudos_transfer.kudos_token_cloned_from.url, kudos_transfer.value_in_usdt_now)
+
+    def contributions_for(self, instance):
+        """Get the leaderboard contributions of a single bounty, tip or kudos transfer.
+
+        Used to keep the incremental leaderboards up to date as objects change state.
+
+        Returns:
+            tuple: (contribution key, created_on, contributions), or None if the object
+                doesn't own a contribution (e.g. a bounty which is no longer current).
+
+        """
+        from dashboard.models import Bounty, Tip
+        from kudos.models import KudosTransfer
+
+        is_sent = getattr(instance, 'tx_status', None) == 'success' and getattr(instance, 'txid', '')
+        if isinstance(instance, Bounty):
+            if not instance.current_bounty:
+                return None
+            contributions = []
+            if instance.network == self.network and not instance.admin_override_and_hide and \
+                    instance.idx_status == 'done' and instance._val_usd_db:
+                instance.accepted_fulfillments = list(instance.fulfillments.filter(accepted=True))
+                self.load_profiles(
+                    [instance.bounty_owner_github_username] +
+                    [f.fulfiller_github_username for f in instance.accepted_fulfillments]
+                )
+                self.load_locations()
+                contributions = self.bounty_contributions(instance)
+            return bounty_contribution_key(instance), instance.created_on, contributions
+        if isinstance(instance, Tip):
+            contributions = []
+            val_usd = instance.value_in_usdt_now if instance.network == self.network and is_sent else None
+            if val_usd:
+                self.load_profiles([instance.username, instance.from_username, instance.org_name, instance.tokenName])
+                self.load_locations()
+                contributions = self.tip_contributions(instance, val_usd)
+            return f'tip_{instance.pk}', instance.created_on, contributions
+        if isinstance(instance, KudosTransfer):
+            contributions = []
+            if instance.network == self.network and is_sent and instance.kudos_token_cloned_from:
+                contributions = self.kudos_contributions(instance)
+            return f'kt_{instance.pk}', instance.created_on, contributions
+        return None
+
+    def build_ranks(self):
+        """Build the (unsaved) LeaderboardRank objects for the aggregated totals."""
+        self.load_profiles(set(index_term for rankings in self.ranks.values() for index_term in rankings.keys()))
+
+        leaderboard_ranks = []
+        for key, rankings in self.ranks.items():
+            ordered = sorted(rankings.items(), key=lambda x: x[1], reverse=True)
+            for rank, (index_term, amount) in enumerate(ordered, 1):
+                lbr_kwargs = {
+                    'count': self.counts[key][index_term],
+                    'active': True,
+                    'amount': amount,
+                    'rank': rank,
+                    'leaderboard': key,
+                    'github_username': index_term
+                }
+                profile = self.get_latest_profile(index_term)
+                if profile:
+                    lbr_kwargs['profile'] = profile
+                    lbr_kwargs['tech_keywords'] = profile.keywords
+                leaderboard_ranks.append(LeaderboardRank(**lbr_kwargs))
+        return leaderboard_ranks
+
+    def save(self):
+        """Replace the active leaderboard ranks with the aggregated ones.
+
+        Returns:
+            int: The number of LeaderboardRank objects created.
+
+        """
+        leaderboard_ranks = self.build_ranks()
+        with transaction.atomic():
+            LeaderboardRank.objects.filter(active=True).update(active=False)
+            LeaderboardRank.objects.bulk_create(leaderboard_ranks, batch_size=1000)
+        return len(leaderboard_ranks)
+
+
+def get_window_days():
+    return {
+        WEEKLY: 30 if settings.DEBUG else 7,
+        MONTHLY: 30,
+        QUARTERLY: 90,
+        YEARLY: 365,
+    }
+
+
+class LeaderboardStore:
+    """Keep running leaderboard totals in redis sorted sets.
+
+    Every bounty, tip and kudos transfer's contributions are added to an all-time sorted
+    set and to a sorted set for the day it was created on.  Windowed leaderboards are the
+    union of the day sets inside their window, so contributions age out of them on their
+    own.  The contributions applied for each object are remembered, so that when the
+    object changes state the old ones can be subtracted before the new ones are added.
+
+    The totals live under a version, so that `rebuild` can build a new version next to the
+    one being read and switch to it at once.
+
+    """
+
+    prefix = 'leaderboard'
+    day_ttl = 60 * 60 * 24 * 400
+    window_ttl = 60 * 5
+    rebuild_ttl = 60 * 60 * 6
+
+    def __init__(self, redis=None):
+        if redis is None:
+            from app.utils import get_raw_cache_client
+            redis = get_raw_cache_client()
+        self.redis = redis
+        self.version_key = f'{self.prefix}:version'
+        self.rebuilding_key = f'{self.prefix}:rebuilding'
+        self.journal_key = f'{self.prefix}:journal'
+
+    def get_version(self, redis=None):
+        version = (redis or self.redis).get(self.version_key)
+        return int(version) if version else 0
+
+    def _key(self, version, breakdown, day, kind):
+        return f'{self.prefix}:v{version}:{breakdown}:{day}:{kind}'
+
+    def _contribution_key(self, version, key):
+        return f'{self.prefix}:v{version}:contrib:{key}'
+
+    def _incr(self, pipe, version, breakdown, day, index_term, amount, count):
+        for _day in [ALL, day]:
+            pipe.zincrby(self._key(version, breakdown, _day, 'amount'), value=index_term, amount=amount)
+            pipe.zincrby(self._key(version, breakdown, _day, 'count'), value=index_term, amount=count)
+            if _day != ALL:
+                pipe.expire(self._key(version, breakdown, _day, 'amount'), self.day_ttl)
+                pipe.expire(self._key(version, breakdown, _day, 'count'), self.day_ttl)
+
+    def apply(self, key, created_on, contributions, version=None):
+        """Replace the contributions recorded for an object with the provided ones.
+
+        The read of the old contributions and the write of the new ones happen in a WATCH/MULTI
+        transaction, which is retried if another process changes them in between.  While a
+        `rebuild` is running, the object is also journaled, to be replayed on the rebuilt version.
+
+        Args:
+            version (int): The version to apply to, without journaling. Defaults to: the current version.
+
+        """
+        day = created_on.strftime('%Y%m%d')
+        with self.redis.pipeline() as pipe:
+            while True:
+                try:
+                    journal = version is None
+                    if journal:
+                        pipe.watch(self.version_key, self.rebuilding_key)
+                    _version = self.get_version(pipe) if journal else version
+                    contribution_key = self._contribution_key(_version, key)
+                    pipe.watch(contribution_key)
+                    old = pipe.get(contribution_key)
+                    old = json.loads(old) if old else None
+                    rebuilding = journal and pipe.exists(self.rebuilding_key)
+                    if not old and not contributions and not rebuilding:
+                        return
+
+                    # the change in the count of every index term the old contributions touched
+                    deltas = defaultdict(int)
+                    for breakdown, index_term, __ in old['items'] if old else []:
+                        for _day in [ALL, old['day']]:
+                            deltas[(breakdown, _day, index_term)] -= 1
+                    for breakdown, index_term, __ in contributions:
+                        for _day in [ALL, day]:
+                            deltas[(breakdown, _day, index_term)] += 1
+                    touched = [term for term, delta in deltas.items() if delta < 0]
+                    if touched:
+                        pipe.watch(*set(
+                            self._key(_version, breakdown, _day, 'count') for breakdown, _day, __ in touched
+                        ))
+                    counts = [pipe.zscore(self._key(_version, breakdown, _day, 'count'), index_term)
+                              for breakdown, _day, index_term in touched]
+
+                    pipe.multi()
+                    if old:
+                        for breakdown, index_term, amount in old['items']:
+                            self._incr(pipe, _version, breakdown, old['day'], index_term, -amount, -1)
+                    for breakdown, index_term, amount in contributions:
+                        self._incr(pipe, _version, breakdown, day, index_term, amount, 1)
+                    # drop the index terms which no longer have any contributions
+                    for (breakdown, _day, index_term), count in zip(touched, counts):
+                        if (count or 0) + deltas[(breakdown, _day, index_term)] <= 0:
+                            pipe.zrem(self._key(_version, breakdown, _day, 'amount'), index_term)
+                            pipe.zrem(self._key(_version, breakdown, _day, 'count'), index_term)
+                    if contributions:
+                        pipe.set(contribution_key, json.dumps({'day': day, 'items': contributions}))
+                    else:
+                        pipe.delete(contribution_key)
+                    if rebuilding:
+                        pipe.rpush(self.journal_key, json.dumps([key, created_on.isoformat(), contributions]))
+                    pipe.execute()
+                    return
+                except WatchError:
+                    continue
+
+    def replay_journal(self, version):
+        """Apply the objects journaled since the rebuild started to the version being built."""
+        while True:
+            pipe = self.redis.pipeline()
+            pipe.lrange(self.journal_key, 0, -1)
+            pipe.delete(self.journal_key)
+            entries, __ = pipe.execute()
+            if not entries:
+                return
+            for entry in entries:
+                key, created_on, contributions = json.loads(entry)
+                contributions = [tuple(contribution) for contribution in contributions]
+                self.apply(key, parse_datetime(created_on), contributions, version=version)
+
+    def rebuild(self, contributions, chunk_size=1000):
+        """Reconcile the store with the output of a full LeaderboardEngine aggregation.
+
+        The totals are built under a new version while the current one is still read, and the
+        objects applied meanwhile are replayed on the new version before it becomes current.
+
+        Returns:
+            bool: Whether the store was rebuilt, False if another rebuild is running.
+
+        """
+        if not self.redis.set(self.rebuilding_key, 1, nx=True, ex=self.rebuild_ttl):
+            logger.warning('A leaderboard rebuild is already running, not starting another.')
+            return False
+        try:
+            self.redis.delete(self.journal_key)
+            version = self.get_version() + 1
+            self.delete_version(version)
+            for offset in range(0, len(contributions), chunk_size):
+                pipe = self.redis.pipeline()
+                for key, created_on, items in contributions[offset:offset + chunk_size]:
+                    if not items:
+                        continue
+                    day = created_on.strftime('%Y%m%d')
+                    for breakdown, index_term, amount in items:
+                        self._incr(pipe, version, breakdown, day, index_term, amount, 1)
+                    pipe.set(self._contribution_key(version, key), json.dumps({'day': day, 'items': items}))
+                pipe.execute()
+
+            # switch versions once no object was journaled since the last replay
+            with self.redis.pipeline() as pipe:
+                while True:
+                    self.replay_journal(version)
+                    try:
+                        pipe.watch(self.journal_key)
+                        if pipe.llen(self.journal_key):
+                            pipe.unwatch()
+                            continue
+                        pipe.multi()
+                        pipe.set(self.version_key, version)
+                        pipe.delete(self.rebuilding_key)
+                        pipe.execute()
+                        break
+                    except WatchError:
+                        continue
+        except Exception:
+            self.redis.delete(self.rebuilding_key, self.journal_key)
+            raise
+        self.delete_version(version, keep=True)
+        return True
+
+    def delete_version(self, version, keep=False):
+        """Delete the keys of a version, or with `keep`, the keys of every other version."""
+        version_prefix = f'{self.prefix}:v{version}:'
+        control_keys = {self.version_key, self.rebuilding_key, self.journal_key}
+        for key in self.redis.scan_iter(match=f'{version_prefix}*' if not keep else f'{self.prefix}:*'):
+            key = key.decode('utf-8') if isinstance(key, bytes) else key
+            if keep and (key.startswith(version_prefix) or key in control_keys):
+                continue
+            self.redis.delete(key)
+
+    def get_leaderboard(self, leaderboard, limit=25):
+        """Get the top index terms of a leaderboard.
+
+        Args:
+            leaderboard (str): The leaderboard key, e.g. quarterly_earners.
+            limit (int): The number of rows to return.
+
+        Returns:
+            list: (index_term, amount, count) tuples ordered by amount.
+
+        """
+        version = self.get_version()
+        time, breakdown = leaderboard.split('_', 1)
+        if time == ALL:
+            amount_key = self._key(version, breakdown, ALL, 'amount')
+            count_key = self._key(version, breakdown, ALL, 'count')
+        else:
+            amount_key = f'{self.prefix}:v{version}:window:{leaderboard}:amount'
+            count_key = f'{self.prefix}:v{version}:window:{leaderboard}:count'
+            if not self.redis.exists(amount_key):
+                today = timezone.now().date()
+                days = [
+                    (today - timezone.timedelta(days=i)).strftime('%Y%m%d') for i in range(get_window_days()[time])
+                ]
+                pipe = self.redis.pipeline()
+                pipe.zunionstore(amount_key, [self._key(version, breakdown, day, 'amount') for day in days])
+                pipe.zunionstore(count_key, [self._key(version, breakdown, day, 'count') for day in days])
+                pipe.expire(amount_key, self.window_ttl)
+                pipe.expire(count_key, self.window_ttl)
+                pipe.execute()
+
+        rows = self.redis.zrevrange(amount_key, 0, int(limit) - 1, withscores=True)
+        pipe = self.redis.pipeline()
+        for index_term, _ in rows:
+            pipe.zscore(count_key, index_term)
+        counts = pipe.execute()
+        return [
+            (index_term.decode('utf-8') if isinstance(index_term, bytes) else index_term, round(amount, 2), int(count or 0))
+            for (index_term, amount), count in zip(rows, counts)
+        ]
+
+
+def update_incremental_leaderboards(instance):
+    """Apply the leaderboard deltas of a bounty, tip or kudos transfer which changed state."""
+    if not settings.LEADERBOARD_INCREMENTAL:
+        return
+    try:
+        store = LeaderboardStore()
+        if not store.redis:
+            return
+        result = LeaderboardEngine().contributions_for(instance)
+        if result:
+            store.apply(*result)
+    except Exception as e:
+        logger.error(f'Failed to update the incremental leaderboards for {instance} - ({e})')
@@ -18,6 +18,9 @@ along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 """
 import logging
+from collections import defaultdict
+from functools import lru_cache
+from types import SimpleNamespace
 
 from django.conf import settings
 from django.http import Http404, HttpResponse
@@ -47,6 +50,19 @@ from sendgrid.helpers.stats import Category
 
 logger = logging.getLogger(__name__)
 
+# substituted by SendGrid with the email settings key of each recipient of a bulk mail
+PRIV_SUBSTITUTION = '-priv-'
+# substituted with the keywords of each recipient, escaped in the html part and as they are in the text part
+KEYWORDS_SUBSTITUTION = '-keywords-'
+TEXT_KEYWORDS_SUBSTITUTION = '-text_keywords-'
+MAX_NEW_BOUNTIES = 10
+
+
+@lru_cache(maxsize=1)
+def get_sendgrid_client(api_key):
+    """Get the SendGrid client, created once per process."""
+    return sendgrid.SendGridAPIClient(apikey=api_key)
+
 
 def send_mail(from_email, _to_email, subject, body, html=False,
               from_name="Gitcoin.co", cc_emails=None, categories=None, debug_mode=False):
@@ -65,7 +81,7 @@ def send_mail(from_email, _to_email, subject, body, html=False,
     # setup
     from_name = str(from_name)
     subject = str(subject)
-    sg = sendgrid.SendGridAPIClient(apikey=settings.SENDGRID_API_KEY)
+    sg = get_sendgrid_client(settings.SENDGRID_API_KEY)
     from_email = Email(from_email, from_name)
     to_email = Email(to_email)
     contenttype = "text/plain" if not html else "text/html"
@@ -580,57 +596,126 @@ def reject_faucet_request(fr):
     finally:
         translation.activate(cur_language)
 
-def new_bounty_daily(bounties, old_bounties, to_emails=None):
-    if not bounties:
-        return
-    max_bounties = 10
-    if len(bounties) > max_bounties:
-        bounties = bounties[0:max_bounties]
-    if to_emails is None:
-        to_emails = []
+def get_new_bounty_daily_subject(bounties):
     plural = "s" if len(bounties) != 1 else ""
     worth = round(sum([bounty.value_in_usdt for bounty in bounties if bounty.value_in_usdt]), 2)
     worth = f" worth ${worth}" if worth else ""
-    subject = _(f"⚡️  {len(bounties)} New Open Funded Issue{plural}{worth} matching your profile")
+    return _(f"⚡️  {len(bounties)} New Open Funded Issue{plural}{worth} matching your profile")
+
+
+def get_bulk_recipients(to_emails, email_type):
+    """Get the recipients of a bulk mail, with a few queries for all of them.
 
+    Suppressed recipients are left out, and subscribers are saved for the others, as `send_mail` does.
+    Addresses differing only in case are sent to once.
+
+    Returns:
+        dict: language => list of (email, substitutions), as `BulkMailer.send` takes them.
+
+    """
+    from django.contrib.auth.models import User
+    from marketing.models import EmailSubscriber, EmailSupressionList
+
+    subscribers = {}
+    for subscriber in EmailSubscriber.objects.filter(email__in=to_emails).order_by('created_on'):
+        subscribers[subscriber.email.lower()] = subscriber
+    suppressed_emails = {email.lower() for email in EmailSupressionList.objects.values_list('email', flat=True)}
+    languages = dict(User.objects.filter(email__in=to_emails).values_list('email', 'profile__pref_lang_code'))
+
+    recipients = defaultdict(list)
+    seen_emails = set()
     for to_email in to_emails:
-        cur_language = translation.get_language()
-        try:
-            setup_lang(to_email)
-            from_email = settings.CONTACT_EMAIL
-            html, text = render_new_bounty(to_email, bounties, old_bounties)
+        if to_email.lower() in seen_emails:
+            continue
+        seen_emails.add(to_email.lower())
+        subscriber = subscribers.get(to_email.lower())
+        if subscriber and not subscriber.should_send_email_type_to(email_type, suppressed_emails=suppressed_emails):
+            continue
+        if not subscriber or not subscriber.priv:
+            subscriber = get_or_save_email_subscriber(to_email, 'internal')
+        language = languages.get(to_email) or settings.LANGUAGE_CODE
+        recipients[language].append((to_email, {PRIV_SUBSTITUTION: subscriber.priv}))
+    return recipients
 
-            if not should_suppress_notification_email(to_email, 'new_bounty_notifications'):
-                send_mail(from_email, to_email, subject, text, html, categories=['marketing', func_name()])
-        finally:
-            translation.activate(cur_language)
 
+def weekly_roundup(to_emails=None, checkpoint_key=None):
+    """Send the weekly roundup in bulk.
+
+    The roundup is rendered once per language, and sent with up to `MAX_PERSONALIZATIONS`
+    recipients per request, SendGrid filling in the email settings link of each recipient.
+
+    Args:
+        to_emails (list of str): The recipients.
+        checkpoint_key (str): The name the progress of the send is kept under, so that running it
+            again skips the recipients already sent to. Defaults to: None (not kept).
+
+    Returns:
+        int: The number of recipients the roundup was sent to.
+
+    """
+    from marketing.bulk_mail import BulkMailer, Checkpoint
 
-def weekly_roundup(to_emails=None):
     if to_emails is None:
         to_emails = []
 
-    for to_email in to_emails:
-        cur_language = translation.get_language()
-        try:
-            setup_lang(to_email)
-            html, text, subject = render_new_bounty_roundup(to_email)
-            from_email = settings.PERSONAL_CONTACT_EMAIL
+    mailer = BulkMailer(checkpoint=Checkpoint(checkpoint_key) if checkpoint_key else None)
+    sent = 0
+    cur_language = translation.get_language()
+    try:
+        for language, recipients in get_bulk_recipients(to_emails, 'roundup').items():
+            translation.activate(language)
+            html, text, subject = render_new_bounty_roundup(None, subscriber=SimpleNamespace(priv=PRIV_SUBSTITUTION))
+            message = {
+                'from_email': settings.PERSONAL_CONTACT_EMAIL,
+                'from_name': "Kevin Owocki (Gitcoin.co)",
+                'subject': subject,
+                'text': text,
+                'html': html,
+                'categories': ['marketing', 'weekly_roundup'],
+            }
+            logger.info(f"-- Sending Mail '{subject}' to {len(recipients)} recipients in {language}")
+            sent += mailer.send(message, recipients)
+    finally:
+        translation.activate(cur_language)
+    return sent
 
-            if not should_suppress_notification_email(to_email, 'roundup'):
-                send_mail(
-                    from_email,
-                    to_email,
-                    subject,
-                    text,
-                    html,
-                    from_name="Kevin Owocki (Gitcoin.co)",
-                    categories=['marketing', func_name()],
+
+def new_bounty_daily_messages(groups):
+    """Render the daily new bounties email once per group of recipients matching the same bounties.
+
+    SendGrid fills in the keywords and the email settings link of each recipient.
+
+    Args:
+        groups (iterable of tuple): The new bounties, the other bounties, and the recipients matching them,
+            as language => list of (email, substitutions).
+
+    Returns:
+        list of tuple: Each message, as `BulkMailer.send` takes it, with its recipients.
+
+    """
+    messages = []
+    subscriber = SimpleNamespace(priv=PRIV_SUBSTITUTION)
+    cur_language = translation.get_language()
+    try:
+        for bounties, old_bounties, recipients in groups:
+            bounties = bounties[0:MAX_NEW_BOUNTIES]
+            for language, language_recipients in recipients.items():
+                translation.activate(language)
+                html, text = render_new_bounty(
+                    None, bounties, old_bounties, subscriber=subscriber, keywords=KEYWORDS_SUBSTITUTION,
+                    text_keywords=TEXT_KEYWORDS_SUBSTITUTION,
                 )
-            else:
-                print('supressed')
-        finally:
-            translation.activate(cur_language)
+                message = {
+                    'from_email': settings.CONTACT_EMAIL,
+                    'subject': get_new_bounty_daily_subject(bounties),
+                    'text': text,
+                    'html': html,
+                    'categories': ['marketing', 'new_bounty_daily'],
+                }
+                messages.append((message, language_recipients))
+    finally:
+        translation.activate(cur_language)
+    return messages
 
 
 def weekly_recap(to_emails=None):
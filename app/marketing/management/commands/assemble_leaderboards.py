@@ -25,54 +25,18 @@ from django.utils import timezone
 from cacheops import CacheMiss, cache
 from dashboard.models import Bounty, Profile, Tip
 from kudos.models import KudosTransfer
+from marketing.leaderboards import (
+    ALL, BREAKDOWNS, CITIES, CONTINENTS, COUNTRIES, EARNERS, FULFILLED, IGNORE_EARNERS, IGNORE_PAYERS, KEYWORDS, KUDOS,
+    MONTHLY, ORGS, PAYERS, QUARTERLY, TIMES, TOKENS, WEEKLY, YEARLY, LeaderboardEngine, LeaderboardStore, default_ranks,
+)
 from marketing.models import LeaderboardRank
 
-# Constants
-IGNORE_PAYERS = []
-IGNORE_EARNERS = ['owocki']  # sometimes owocki pays to himself. what a jerk!
-
-ALL = 'all'
-
-WEEKLY = 'weekly'
-QUARTERLY = 'quarterly'
-YEARLY = 'yearly'
-MONTHLY = 'monthly'
-
-FULFILLED = 'fulfilled'
-PAYERS = 'payers'
-EARNERS = 'earners'
-ORGS = 'orgs'
-KUDOS = 'kudos'
-KEYWORDS = 'keywords'
-TOKENS = 'tokens'
-COUNTRIES = 'countries'
-CITIES = 'cities'
-CONTINENTS = 'continents'
-
-TIMES = [ALL, WEEKLY, QUARTERLY, YEARLY, MONTHLY]
-BREAKDOWNS = [FULFILLED, ALL, PAYERS, EARNERS, ORGS, KEYWORDS, KUDOS, TOKENS, COUNTRIES, CITIES, CONTINENTS]
-
 WEEKLY_CUTOFF = timezone.now() - timezone.timedelta(days=(30 if settings.DEBUG else 7))
 MONTHLY_CUTOFF = timezone.now() - timezone.timedelta(days=30)
 QUARTERLY_CUTOFF = timezone.now() - timezone.timedelta(days=90)
 YEARLY_CUTOFF = timezone.now() - timezone.timedelta(days=365)
 
 
-def default_ranks():
-    """Generate a dictionary of nested dictionaries defining default ranks.
-
-    Returns:
-        dict: A nested dictionary mapping of all default ranks with empty dicts.
-
-    """
-    return_dict = {}
-    for time in TIMES:
-        for breakdown in BREAKDOWNS:
-            key = f'{time}_{breakdown}'
-            return_dict[key] = {}
-    return return_dict
-
-
 ranks = default_ranks()
 counts = default_ranks()
 
@@ -211,8 +175,8 @@ def sum_bounty_helper(b, time, index_term, val_usd):
     if index_term in bounty_to_continent(b):
         add_element(f'{time}_{CONTINENTS}', index_term, val_usd)
     if index_term.lower() in (k.lower() for k in b.keywords_list):
-        is_github_org_name = Bounty.objects.filter(github_url__icontains=f'https://github.com/{index_term}').exists()
-        is_github_repo_name = Bounty.objects.filter(github_url__icontains=f'/{index_term}/').exists()
+        is_github_org_name = Bounty.objects.for_org(index_term).exists()
+        is_github_repo_name = Bounty.objects.filter(github_repo=index_term.lower()).exists()
         if not is_github_repo_name and not is_github_org_name:
             add_element(f'{time}_{KEYWORDS}', index_term.lower(), val_usd)
 
@@ -300,63 +264,76 @@ class Command(BaseCommand):
     help = 'creates leaderboard objects'
 
     def handle(self, *args, **options):
-        # get bounties
-        bounties = Bounty.objects.current().filter(network='mainnet')
-
-        # iterate
-        for b in bounties:
-            if not b._val_usd_db:
-                continue
-
-            index_terms = bounty_index_terms(b)
-            sum_bounties(b, index_terms)
-
-        # get tips
-        tips = Tip.objects.send_success().filter(network='mainnet')
-
-        # iterate
-        for t in tips:
-            if not t.value_in_usdt_now:
-                continue
-            index_terms = tip_index_terms(t)
-            sum_tips(t, index_terms)
-
-        # kudos'
-        for kt in KudosTransfer.objects.send_success().filter(network='mainnet'):
-            sum_kudos(kt)
-
-        # set old LR as inactive
-        with transaction.atomic():
-            lrs = LeaderboardRank.objects.active()
-            lrs.update(active=False)
-
-            # save new LR in DB
-            for key, rankings in ranks.items():
-                rank = 1
-                for index_term, amount in sorted(rankings.items(), key=lambda x: x[1], reverse=True):
-                    count = counts[key][index_term]
-                    lbr_kwargs = {
-                        'count': count,
-                        'active': True,
-                        'amount': amount,
-                        'rank': rank,
-                        'leaderboard': key,
-                        'github_username': index_term
-                    }
-
-                    try:
-                        profile = Profile.objects.get(handle__iexact=index_term)
-                        lbr_kwargs['profile'] = profile
-                        lbr_kwargs['tech_keywords'] = profile.keywords
-                    except Profile.MultipleObjectsReturned:
-                        profile = Profile.objects.filter(handle__iexact=index_term).latest('id')
-                        lbr_kwargs['profile'] = profile
-                        lbr_kwargs['tech_keywords'] = profile.keywords
-                        print(f'Multiple profiles found for username: {index_term}')
-                    except Profile.DoesNotExist:
-                        print(f'No profiles found for username: {index_term}')
-
-                    # TODO: Bucket LeaderboardRank objects and .bulk_create
-                    LeaderboardRank.objects.create(**lbr_kwargs)
-                    rank += 1
-                    print(key, index_term, amount, count, rank)
+        engine = LeaderboardEngine(record_contributions=settings.LEADERBOARD_INCREMENTAL)
+        engine.aggregate()
+        num_ranks = engine.save()
+        print(f'created {num_ranks} leaderboard ranks')
+
+        # reconcile the incremental leaderboards with the full recompute
+        if settings.LEADERBOARD_INCREMENTAL:
+            store = LeaderboardStore()
+            if store.redis:
+                store.rebuild(engine.contributions)
+
+
+# the per-row implementation the engine replaced, which benchmark_leaderboards and the tests compare against
+def assemble_leaderboards_legacy():
+    # get bounties
+    bounties = Bounty.objects.current().filter(network='mainnet')
+
+    # iterate
+    for b in bounties:
+        if not b._val_usd_db:
+            continue
+
+        index_terms = bounty_index_terms(b)
+        sum_bounties(b, index_terms)
+
+    # get tips
+    tips = Tip.objects.send_success().filter(network='mainnet')
+
+    # iterate
+    for t in tips:
+        if not t.value_in_usdt_now:
+            continue
+        index_terms = tip_index_terms(t)
+        sum_tips(t, index_terms)
+
+    # kudos'
+    for kt in KudosTransfer.objects.send_success().filter(network='mainnet'):
+        sum_kudos(kt)
+
+    # set old LR as inactive
+    with transaction.atomic():
+        lrs = LeaderboardRank.objects.active()
+        lrs.update(active=False)
+
+        # save new LR in DB
+        for key, rankings in ranks.items():
+            rank = 1
+            for index_term, amount in sorted(rankings.items(), key=lambda x: x[1], reverse=True):
+                count = counts[key][index_term]
+                lbr_kwargs = {
+                    'count': count,
+                    'active': True,
+                    'amount': amount,
+                    'rank': rank,
+                    'leaderboard': key,
+                    'github_username': index_term
+                }
+
+                try:
+                    profile = Profile.objects.get(handle__iexact=index_term)
+                    lbr_kwargs['profile'] = profile
+                    lbr_kwargs['tech_keywords'] = profile.keywords
+                except Profile.MultipleObjectsReturned:
+                    profile = Profile.objects.filter(handle__iexact=index_term).latest('id')
+                    lbr_kwargs['profile'] = profile
+                    lbr_kwargs['tech_keywords'] = profile.keywords
+                    print(f'Multiple profiles found for username: {index_term}')
+                except Profile.DoesNotExist:
+                    print(f'No profiles found for username: {index_term}')
+
+                LeaderboardRank.objects.create(**lbr_kwargs)
+                rank += 1
+                print(key, index_term, amount, count, rank)
@@ -0,0 +1,87 @@
+'''
+    Copyright (C) 2019 Gitcoin Core
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+'''
+
+import time
+
+from django.core.management.base import BaseCommand
+
+import sendgrid
+from marketing.bulk_mail import BulkMailer, SendGridClient
+from marketing.mails import PRIV_SUBSTITUTION
+from marketing.sendgrid_stub import StubSendGridServer
+from sendgrid.helpers.mail import Content, Email, Mail
+
+MESSAGE = {
+    'from_email': 'founders@localhost',
+    'subject': 'Benchmark roundup',
+    'text': f'Manage your email settings at /settings/email/{PRIV_SUBSTITUTION}',
+    'html': '<p>' + 'Hi Gitcoiners, ' * 2000 + f'<a href="/settings/email/{PRIV_SUBSTITUTION}">settings</a></p>',
+    'categories': ['marketing', 'benchmark'],
+}
+
+
+def send_one_per_request(host, recipients):
+    # what send_mail did for each recipient of the roundup: a new client and a request per email
+    for to_email, __ in recipients:
+        client = sendgrid.SendGridAPIClient(apikey='stub', host=host)
+        mail = Mail(Email(MESSAGE['from_email']), MESSAGE['subject'], Email(to_email),
+                    Content('text/html', MESSAGE['html']))
+        client.client.mail.send.post(request_body=mail.get())
+    return len(recipients)
+
+
+class Command(BaseCommand):
+
+    help = 'benchmarks the throughput of the bulk mailer against one request per email, on a local SendGrid stub'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--emails', default=10000, type=int, help="The number of recipients of the bulk mailer")
+        parser.add_argument('--legacy-emails', dest='legacy_emails', default=200, type=int,
+                            help="The number of recipients sent one request per email")
+        parser.add_argument('--latency', default=0.05, type=float, help="The seconds the stub takes per request")
+        parser.add_argument('--workers', default=4, type=int)
+        parser.add_argument('--rate', default=50, type=float, help="The requests per second of the bulk mailer")
+
+    def handle(self, *args, **options):
+        server = StubSendGridServer(latency=options['latency']).start()
+        try:
+            def recipients(num):
+                return [(f'user{i}@localhost', {PRIV_SUBSTITUTION: f'priv{i}'}) for i in range(num)]
+
+            mailer = BulkMailer(
+                client=SendGridClient(api_key='stub', host=server.host, pool_size=options['workers']),
+                requests_per_second=options['rate'],
+                max_workers=options['workers'],
+                debug=False,
+            )
+            for name, fn, num in [
+                ('one request per email', lambda batch: send_one_per_request(server.host, batch),
+                 options['legacy_emails']),
+                ('bulk mailer', lambda batch: mailer.send(MESSAGE, batch), options['emails']),
+            ]:
+                server.reset()
+                batch = recipients(num)
+                start_time = time.time()
+                sent = fn(batch)
+                elapsed = time.time() - start_time
+                print(
+                    f'{name}: {sent} emails in {round(elapsed, 2)}s => {round(sent / elapsed)} emails/sec '
+                    f'({server.num_requests} requests, {len(server.connections)} connections)'
+                )
+        finally:
+            server.stop()
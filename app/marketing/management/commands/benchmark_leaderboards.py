@@ -0,0 +1,124 @@
+'''
+    Copyright (C) 2019 Gitcoin Core
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+'''
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from dashboard.models import Bounty, BountyFulfillment, Profile, UserAction
+from marketing.leaderboards import LeaderboardEngine, default_ranks
+from marketing.management.commands import assemble_leaderboards
+
+KEYWORDS = ['python', 'javascript', 'solidity', 'rust', 'go', 'shell', 'css', 'html']
+LOCATIONS = [
+    {'city': 'London', 'country_name': 'United Kingdom', 'continent_name': 'Europe'},
+    {'city': 'Cuyahoga Falls', 'country_name': 'United States', 'continent_name': 'North America'},
+    {'city': 'Sydney', 'country_name': 'Australia', 'continent_name': 'Oceania'},
+]
+
+
+class Rollback(Exception):
+    pass
+
+
+def create_fixture(num_bounties, num_profiles):
+    """Create a synthetic set of done bounties, fulfillments, profiles and logins."""
+    now = timezone.now()
+    profiles = Profile.objects.bulk_create([
+        Profile(data={}, handle=f'leaderboard-bench-{i}', hide_profile=False) for i in range(num_profiles)
+    ])
+    if not profiles[0].pk:
+        # bulk_create only returns primary keys on postgres
+        profiles = list(Profile.objects.filter(handle__startswith='leaderboard-bench-').order_by('pk'))
+    UserAction.objects.bulk_create([
+        UserAction(profile=profile, action='Login', ip_address='127.0.0.1', location_data=LOCATIONS[i % len(LOCATIONS)])
+        for i, profile in enumerate(profiles)
+    ])
+
+    bounties = Bounty.objects.bulk_create([
+        Bounty(
+            title=f'leaderboard benchmark {i}',
+            value_in_token=10 ** 18,
+            token_name='ETH',
+            web3_created=now,
+            github_url=f'https://github.com/bench-org-{i % 50}/repo-{i % 200}/issues/{i}',
+            token_address='0x0',
+            issue_description='benchmark',
+            bounty_owner_github_username=profiles[i % num_profiles].handle,
+            is_open=False,
+            accepted=True,
+            expires_date=now + timezone.timedelta(days=1),
+            idx_project_length=5,
+            project_length='Months',
+            bounty_type='Feature',
+            experience_level='Intermediate',
+            raw_data={},
+            idx_status='done',
+            current_bounty=True,
+            network='mainnet',
+            metadata={'issueKeywords': ', '.join(KEYWORDS[i % len(KEYWORDS):i % len(KEYWORDS) + 3])},
+            _val_usd_db=100 + i % 1000,
+            created_on=now - timezone.timedelta(days=i % 400),
+        ) for i in range(num_bounties)
+    ])
+    if not bounties[0].pk:
+        bounties = list(Bounty.objects.filter(title__startswith='leaderboard benchmark ').order_by('pk'))
+    BountyFulfillment.objects.bulk_create([
+        BountyFulfillment(
+            fulfiller_address='0x0000000000000000000000000000000000000000',
+            fulfiller_github_username=profiles[(i + 1) % num_profiles].handle,
+            bounty=bounty,
+            accepted=True,
+            profile=profiles[(i + 1) % num_profiles],
+        ) for i, bounty in enumerate(bounties)
+    ])
+
+
+def measure(name, fn):
+    start_time = time.time()
+    with CaptureQueriesContext(connection) as queries:
+        fn()
+    elapsed = time.time() - start_time
+    print(f'{name}: {len(queries)} queries in {round(elapsed, 2)}s')
+
+
+class Command(BaseCommand):
+
+    help = 'benchmarks assemble_leaderboards (legacy vs engine) against a synthetic fixture, then rolls it back'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--bounties', default=1000, type=int)
+        parser.add_argument('--profiles', default=200, type=int)
+        parser.add_argument('--skip-legacy', dest='skip_legacy', action='store_true', default=False)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                create_fixture(options['bounties'], options['profiles'])
+                print(f"fixture: {options['bounties']} bounties, {options['profiles']} profiles")
+
+                if not options['skip_legacy']:
+                    assemble_leaderboards.ranks = default_ranks()
+                    assemble_leaderboards.counts = default_ranks()
+                    measure('legacy', assemble_leaderboards.assemble_leaderboards_legacy)
+                measure('engine', lambda: LeaderboardEngine().run())
+                raise Rollback
+        except Rollback:
+            pass
@@ -0,0 +1,161 @@
+'''
+    Copyright (C) 2019 Gitcoin Core
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+'''
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from dashboard.models import Bounty
+from marketing.bulk_mail import BulkMailer, SendGridClient
+from marketing.management.commands import new_bounties_email
+from marketing.models import EmailSubscriber
+from marketing.sendgrid_stub import StubSendGridServer
+
+KEYWORDS = [
+    'python', 'javascript', 'solidity', 'rust', 'go', 'shell', 'css', 'html', 'react', 'vyper', 'django', 'web3',
+]
+
+
+# the query per subscriber keyword that new_bounties_email used before the keyword index
+def does_bounty_match_keyword(bounty, keyword):
+    if keyword.lower() in [keyword.lower() for keyword in bounty.keywords_list]:
+        return True
+
+    if keyword.lower() in bounty.title_or_desc.lower():
+        return True
+
+    if keyword.lower() in bounty.issue_description.lower():
+        return True
+
+    return False
+
+
+def get_bounties_for_keywords(keywords, hours_back):
+    new_bounties_pks = []
+    all_bounties_pks = []
+    for keyword in keywords:
+        relevant_bounties = Bounty.objects.current().filter(
+            network='mainnet',
+            metadata__issueKeywords__icontains=keyword,
+            idx_status__in=['open'],
+            )
+        for bounty in relevant_bounties.filter(web3_created__gt=(timezone.now() - timezone.timedelta(hours=hours_back))):
+            if does_bounty_match_keyword(bounty, keyword):
+                    new_bounties_pks.append(bounty.pk)
+        for bounty in relevant_bounties:
+            if does_bounty_match_keyword(bounty, keyword):
+                all_bounties_pks.append(bounty.pk)
+    new_bounties = Bounty.objects.filter(pk__in=new_bounties_pks).order_by('-_val_usd_db')
+    all_bounties = Bounty.objects.filter(pk__in=all_bounties_pks).exclude(pk__in=new_bounties_pks).order_by('-_val_usd_db')
+
+    new_bounties = new_bounties.order_by('-admin_mark_as_remarket_ready')
+    all_bounties = all_bounties.order_by('-admin_mark_as_remarket_ready')
+
+    return new_bounties, all_bounties
+
+
+class Rollback(Exception):
+    pass
+
+
+def create_fixture(num_bounties, num_subscribers, hours_back):
+    """Create a synthetic set of open bounties, a tenth of them new, and of subscribers to their keywords."""
+    now = timezone.now()
+    Bounty.objects.bulk_create([
+        Bounty(
+            title=f'new bounties benchmark {i} in {KEYWORDS[i % len(KEYWORDS)]}',
+            value_in_token=10 ** 18,
+            token_name='ETH',
+            web3_created=now - timezone.timedelta(hours=hours_back * (2 if i % 10 else 0.5)),
+            github_url=f'https://github.com/bench-org-{i % 50}/repo-{i % 200}/issues/{i}',
+            token_address='0x0',
+            issue_description='benchmark',
+            bounty_owner_github_username='benchmark',
+            is_open=True,
+            expires_date=now + timezone.timedelta(days=30),
+            raw_data={},
+            idx_status='open',
+            current_bounty=True,
+            network='mainnet',
+            metadata={'issueKeywords': ', '.join(KEYWORDS[i % len(KEYWORDS):i % len(KEYWORDS) + 3])},
+            _val_usd_db=100 + i % 1000,
+        ) for i in range(num_bounties)
+    ])
+    EmailSubscriber.objects.bulk_create([
+        EmailSubscriber(
+            email=f'new-bounties-bench-{i}@localhost',
+            source='benchmark',
+            priv=f'bench{i}',
+            keywords=[KEYWORDS[i % len(KEYWORDS)], KEYWORDS[(i // len(KEYWORDS)) % len(KEYWORDS)]],
+        ) for i in range(num_subscribers)
+    ], batch_size=5000)
+
+
+class Command(BaseCommand):
+
+    help = 'benchmarks new_bounties_email against a synthetic fixture and a local SendGrid stub, then rolls it back'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--bounties', default=500, type=int)
+        parser.add_argument('--subscribers', default=200000, type=int)
+        parser.add_argument('--legacy-subscribers', dest='legacy_subscribers', default=200, type=int,
+                            help="The number of subscribers matched with a query per keyword")
+        parser.add_argument('--latency', default=0.05, type=float, help="The seconds the stub takes per request")
+        parser.add_argument('--workers', default=4, type=int)
+        parser.add_argument('--rate', default=50, type=float, help="The requests per second of the bulk mailer")
+
+    def handle(self, *args, **options):
+        hours_back = 24
+        server = StubSendGridServer(latency=options['latency']).start()
+        try:
+            with transaction.atomic():
+                create_fixture(options['bounties'], options['subscribers'], hours_back)
+                print(f"fixture: {options['bounties']} bounties, {options['subscribers']} subscribers")
+
+                timings = {}
+                with new_bounties_email.timed(timings, 'load'):
+                    bounties = new_bounties_email.load_bounties()
+                    keywords_by_email = new_bounties_email.load_subscribers()
+
+                if options['legacy_subscribers']:
+                    start_time = time.time()
+                    legacy = list(keywords_by_email.values())[:options['legacy_subscribers']]
+                    for keywords in legacy:
+                        get_bounties_for_keywords(keywords, hours_back)
+                    elapsed = time.time() - start_time
+                    print(f"query per keyword: {len(legacy)} subscribers matched in {round(elapsed, 2)}s => "
+                          f"{round(len(legacy) / elapsed)} subscriber matches/sec")
+
+                mailer = BulkMailer(
+                    client=SendGridClient(api_key='stub', host=server.host, pool_size=options['workers']),
+                    requests_per_second=options['rate'],
+                    max_workers=options['workers'],
+                    debug=False,
+                )
+                num_matched, num_messages, sent = new_bounties_email.send_new_bounty_emails(
+                    bounties, keywords_by_email, hours_back, mailer, timings
+                )
+                print(f"keyword index: {num_matched} subscribers matched new bounties, {num_messages} distinct emails, "
+                      f"{sent} emails sent in {server.num_requests} requests")
+                new_bounties_email.print_timings(timings, len(keywords_by_email))
+                raise Rollback
+        except Rollback:
+            pass
+        finally:
+            server.stop()
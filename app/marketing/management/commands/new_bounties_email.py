@@ -15,52 +15,119 @@
     along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 '''
-import logging
+import time
+from collections import defaultdict
+from contextlib import contextmanager
 
 from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.utils import timezone
+from django.utils.html import escape
 
 from dashboard.models import Bounty
-from marketing.mails import new_bounty_daily
+from marketing.bulk_mail import BulkMailer
+from marketing.keyword_index import KeywordIndex
+from marketing.mails import (
+    KEYWORDS_SUBSTITUTION, TEXT_KEYWORDS_SUBSTITUTION, get_bulk_recipients, new_bounty_daily_messages,
+)
 from marketing.models import EmailSubscriber
 
+PHASES = ['load', 'match', 'render', 'send']
 
-def does_bounty_match_keyword(bounty, keyword):
-    if keyword.lower() in [keyword.lower() for keyword in bounty.keywords_list]:
-        return True
 
-    if keyword.lower() in bounty.title_or_desc.lower():
-        return True
+@contextmanager
+def timed(timings, phase):
+    start_time = time.time()
+    yield
+    timings[phase] = time.time() - start_time
 
-    if keyword.lower() in bounty.issue_description.lower():
-        return True
 
-    return False
+def load_bounties():
+    return list(Bounty.objects.current().filter(network='mainnet', idx_status__in=['open']))
 
 
-def get_bounties_for_keywords(keywords, hours_back):
-    new_bounties_pks = []
-    all_bounties_pks = []
-    for keyword in keywords:
-        relevant_bounties = Bounty.objects.current().filter(
-            network='mainnet',
-            metadata__issueKeywords__icontains=keyword,
-            idx_status__in=['open'],
-            )
-        for bounty in relevant_bounties.filter(web3_created__gt=(timezone.now() - timezone.timedelta(hours=hours_back))):
-            if does_bounty_match_keyword(bounty, keyword):
-                    new_bounties_pks.append(bounty.pk)
-        for bounty in relevant_bounties:
-            if does_bounty_match_keyword(bounty, keyword):
-                all_bounties_pks.append(bounty.pk)
-    new_bounties = Bounty.objects.filter(pk__in=new_bounties_pks).order_by('-_val_usd_db')
-    all_bounties = Bounty.objects.filter(pk__in=all_bounties_pks).exclude(pk__in=new_bounties_pks).order_by('-_val_usd_db')
+def load_subscribers():
+    return dict(EmailSubscriber.objects.filter(active=True).exclude(keywords=[]).values_list('email', 'keywords'))
 
-    new_bounties = new_bounties.order_by('-admin_mark_as_remarket_ready')
-    all_bounties = all_bounties.order_by('-admin_mark_as_remarket_ready')
 
-    return new_bounties, all_bounties
+def get_recipients(keywords_by_email):
+    """Get the language and substitutions of each subscriber the new bounties email may be sent to.
+
+    Returns:
+        dict: email => (language, substitutions).
+
+    """
+    recipients = {}
+    bulk_recipients = get_bulk_recipients(list(keywords_by_email), 'new_bounty_notifications')
+    for language, language_recipients in bulk_recipients.items():
+        for email, substitutions in language_recipients:
+            keywords = ",".join(keywords_by_email[email])
+            # the html part is not escaped again once SendGrid substitutes the keywords in
+            substitutions[KEYWORDS_SUBSTITUTION] = escape(keywords)
+            substitutions[TEXT_KEYWORDS_SUBSTITUTION] = keywords
+            recipients[email] = (language, substitutions)
+    return recipients
+
+
+def order_bounties(bounties):
+    return sorted(bounties, key=lambda bounty: (bounty.admin_mark_as_remarket_ready, bounty._val_usd_db), reverse=True)
+
+
+def match_subscribers(bounties, keywords_by_email, hours_back):
+    """Group the subscribers by the new and other open bounties their keywords match.
+
+    Returns:
+        list of tuple: The new bounties, the other bounties, and the emails of the subscribers matching them.
+
+    """
+    new_since = timezone.now() - timezone.timedelta(hours=hours_back)
+    index = KeywordIndex(bounties)
+    new_bounty_ids = frozenset(bounty.pk for bounty in bounties if bounty.web3_created > new_since)
+    bounties = {bounty.pk: bounty for bounty in bounties}
+    return [
+        (order_bounties(bounties[pk] for pk in new_ids), order_bounties(bounties[pk] for pk in other_ids), emails)
+        for (new_ids, other_ids), emails in index.group_by_matches(keywords_by_email, new_bounty_ids).items()
+    ]
+
+
+def send_new_bounty_emails(bounties, keywords_by_email, hours_back, mailer, timings):
+    """Match, render and send the new bounties emails, timing each phase.
+
+    Args:
+        bounties (list of dashboard.models.Bounty): The open bounties.
+        keywords_by_email (dict): email => keywords, of the subscribers.
+        hours_back (int): How recent a bounty has to be to be new.
+        mailer (BulkMailer): The mailer.
+        timings (dict): Where the seconds each phase took are kept.
+
+    Returns:
+        tuple: The number of subscribers matching new bounties, of distinct emails rendered, and of emails sent.
+
+    """
+    with timed(timings, 'match'):
+        groups = match_subscribers(bounties, keywords_by_email, hours_back)
+    with timed(timings, 'render'):
+        matched = {email for __, __, emails in groups for email in emails}
+        recipients = get_recipients({email: keywords_by_email[email] for email in matched})
+        messages = []
+        for new_bounties, other_bounties, emails in groups:
+            group_recipients = defaultdict(list)
+            for email in emails:
+                if email in recipients:
+                    language, substitutions = recipients[email]
+                    group_recipients[language].append((email, substitutions))
+            messages.append((new_bounties, other_bounties, group_recipients))
+        messages = new_bounty_daily_messages(messages)
+    with timed(timings, 'send'):
+        sent = mailer.send_many(messages)
+    return sum(len(emails) for __, __, emails in groups), len(messages), sent
+
+
+def print_timings(timings, num_subscribers):
+    total = sum(timings.values())
+    print(", ".join(f"{phase}: {round(timings[phase], 2)}s" for phase in PHASES if phase in timings))
+    print(f"{num_subscribers} subscribers matched in {round(timings['match'], 2)}s => "
+          f"{round(num_subscribers / max(timings['match'], 1e-6))} subscriber matches/sec; {round(total, 2)}s total")
 
 
 class Command(BaseCommand):
@@ -72,20 +139,13 @@ class Command(BaseCommand):
             print("not active in non prod environments")
             return
         hours_back = 24
-        eses = EmailSubscriber.objects.filter(active=True)
-        print("got {} emails".format(eses.count()))
-        for es in eses:
-            try:
-                keywords = es.keywords
-                if not keywords:
-                    continue
-                to_email = es.email
-                new_bounties, all_bounties = get_bounties_for_keywords(keywords, hours_back)
-                print("{}/{}: got {} new bounties & {} all bounties".format(to_email, keywords, new_bounties.count(), all_bounties.count()))
-                if new_bounties.count():
-                    print(f"sending to {to_email}")
-                    new_bounty_daily(new_bounties, all_bounties, [to_email])
-                    print(f"/sent to {to_email}")
-            except Exception as e:
-                logging.exception(e)
-                print(e)
+        timings = {}
+        with timed(timings, 'load'):
+            bounties = load_bounties()
+            keywords_by_email = load_subscribers()
+        print("got {} emails & {} bounties".format(len(keywords_by_email), len(bounties)))
+        num_matched, num_messages, sent = send_new_bounty_emails(
+            bounties, keywords_by_email, hours_back, BulkMailer(), timings
+        )
+        print(f"{num_matched} subscribers matched new bounties, sent {sent} emails of {num_messages} distinct emails")
+        print_timings(timings, len(keywords_by_email))
@@ -15,10 +15,10 @@
     along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 '''
-import time
 import warnings
 
 from django.core.management.base import BaseCommand
+from django.utils import timezone
 
 from marketing.mails import weekly_roundup
 from marketing.models import EmailSubscriber
@@ -31,7 +31,6 @@ check_already_sent = False
 
 def is_already_sent_this_week(email):
     from marketing.models import EmailEvent
-    from django.utils import timezone
     then = timezone.now() - timezone.timedelta(hours=12)
     QS = EmailEvent.objects.filter(created_on__gt=then)
     QS = QS.filter(category__contains='weekly_roundup', email__iexact=email, event='processed')
@@ -81,17 +80,9 @@ class Command(BaseCommand):
 
         print("got {} emails".format(len(email_list)))
 
-        counter = 0
-        for to_email in email_list:
-            counter += 1
-            print("-sending {} / {}".format(counter, to_email))
-            if options['live']:
-                try:
-                    if check_already_sent and is_already_sent_this_week(to_email):
-                        print(' -- already sent')
-                    else:
-                        weekly_roundup([to_email])
-                        time.sleep(1)
-                except Exception as e:
-                    print(e)
-                    time.sleep(5)
+        if options['live']:
+            if check_already_sent:
+                email_list = [to_email for to_email in email_list if not is_already_sent_this_week(to_email)]
+            # sending again this week resumes where the last run stopped
+            sent = weekly_roundup(email_list, checkpoint_key=f"roundup:{timezone.now().strftime('%G-%V')}")
+            print(f"sent to {sent} emails")
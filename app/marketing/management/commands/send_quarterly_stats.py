@@ -20,7 +20,7 @@ import warnings
 
 from django.core.management.base import BaseCommand
 
-from dashboard.models import Profile
+from dashboard.models import Profile, ProfileQuarterlyStats
 from marketing.mails import quarterly_stats
 from marketing.models import EmailSubscriber, LeaderboardRank
 from marketing.utils import get_platform_wide_stats
@@ -53,6 +53,8 @@ class Command(BaseCommand):
 
         print(len(email_list))
         platform_wide_stats = get_platform_wide_stats()
+        # the stats of every recipient are computed at once here, the emails read them back
+        ProfileQuarterlyStats.refresh(profiles)
 
         for counter, to_email in enumerate(email_list):
             print(f"-sending {counter+1} / {to_email}")
@@ -68,8 +68,11 @@ class EmailSubscriber(SuperModel):
     def set_priv(self):
         self.priv = token_hex(16)[:29]
 
-    def should_send_email_type_to(self, email_type):
-        is_on_global_suppression_list = EmailSupressionList.objects.filter(email__iexact=self.email).exists()
+    def should_send_email_type_to(self, email_type, suppressed_emails=None):
+        if suppressed_emails is not None:
+            is_on_global_suppression_list = self.email.lower() in suppressed_emails
+        else:
+            is_on_global_suppression_list = EmailSupressionList.objects.filter(email__iexact=self.email).exists()
         if is_on_global_suppression_list:
             return False
 
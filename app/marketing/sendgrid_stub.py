@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Define a local stand-in for the SendGrid mail send API, to benchmark mail throughput offline.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubSendGridHandler(BaseHTTPRequestHandler):
+    # keep connections alive, as SendGrid does
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        if self.path != '/v3/mail/send':
+            self.respond(404)
+            return
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        errors = self.server.get_errors(body)
+        if errors:
+            self.respond(400, {'errors': errors})
+            return
+        self.server.record(self.headers, body)
+        self.respond(202)
+
+    def respond(self, status, body=None):
+        content = json.dumps(body).encode() if body is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(content)))
+        if content:
+            self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubSendGridServer(ThreadingHTTPServer):
+    """Accept mail send requests on localhost, and count them and their recipients.
+
+    Args:
+        port (int): The port to listen on. Defaults to: 0 (any free port).
+        latency (float): The number of seconds each request takes.
+        rejected_emails (iterable of str): The addresses a request is rejected over, as invalid.
+        rejected_subjects (iterable of str): The subjects a request is rejected over, whoever it is sent to.
+
+    """
+
+    daemon_threads = True
+
+    def __init__(self, port=0, latency=0, rejected_emails=(), rejected_subjects=()):
+        super().__init__(('127.0.0.1', port), StubSendGridHandler)
+        self.latency = latency
+        self.rejected_emails = set(rejected_emails)
+        self.rejected_subjects = set(rejected_subjects)
+        self.num_requests = 0
+        self.num_rejected = 0
+        self.recipients = []
+        self.connections = set()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def host(self):
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+    def get_errors(self, body):
+        """Get the errors SendGrid would reject a request body with, in the shape of its error responses."""
+        errors = [
+            {'message': 'Does not contain a valid address.', 'field': f'personalizations.{i}.to.{j}.email'}
+            for i, personalization in enumerate(body.get('personalizations', []))
+            for j, to in enumerate(personalization.get('to', [])) if to['email'] in self.rejected_emails
+        ]
+        if body.get('subject') in self.rejected_subjects:
+            errors.append({'message': 'The subject is invalid.', 'field': 'subject'})
+        if errors:
+            with self._lock:
+                self.num_rejected += 1
+        return errors
+
+    def record(self, headers, body):
+        with self._lock:
+            self.num_requests += 1
+            for personalization in body.get('personalizations', []):
+                self.recipients += [to['email'] for to in personalization.get('to', [])]
+
+    def process_request(self, request, client_address):
+        with self._lock:
+            self.connections.add(client_address)
+        super().process_request(request, client_address)
+
+    def reset(self):
+        with self._lock:
+            self.num_requests = 0
+            self.num_rejected = 0
+            self.recipients = []
+            self.connections = set()
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
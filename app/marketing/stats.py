@@ -20,6 +20,7 @@ import logging
 from datetime import datetime, timedelta
 
 from django.conf import settings
+from django.db.models import Count, Sum
 from django.utils import timezone
 
 from marketing.models import Stat
@@ -319,26 +320,38 @@ def bounties_hourly_rate():
 
 
 def bounties_by_status_and_keyword(created_before=timezone.now()):
-    from dashboard.models import Bounty
+    from dashboard.models import Bounty, BountyKeyword
     from retail.utils import programming_languages
     keywords = [''] + programming_languages
     statuses = Bounty.objects.distinct('idx_status').values_list('idx_status', flat=True)
     days_back = 9999
     created_after = created_before - timezone.timedelta(days=days_back)
+    eligible_bounties = Bounty.objects.current().filter(network='mainnet', web3_created__gt=created_after, web3_created__lt=created_before)
+    eligible_bounties = eligible_bounties.order_by()
+
+    # (keyword, status) => (count, value), for all the keywords in two GROUP BY queries
+    counts = {}
+    for row in eligible_bounties.values('idx_status').annotate(total=Count('pk'), value=Sum('_val_usd_db')):
+        counts[('', row['idx_status'])] = (row['total'], row['value'] or 0)
+    keyword_rows = BountyKeyword.objects.filter(
+        bounty__in=eligible_bounties.values('pk'), normalized_keyword__in=programming_languages
+    ).values('normalized_keyword', 'bounty__idx_status').annotate(
+        total=Count('bounty_id'), value=Sum('bounty___val_usd_db'),
+    )
+    for row in keyword_rows:
+        counts[(row['normalized_keyword'], row['bounty__idx_status'])] = (row['total'], row['value'] or 0)
+
     for status in statuses:
         for keyword in keywords:
-            eligible_bounties = Bounty.objects.current().filter(network='mainnet', web3_created__gt=created_after, web3_created__lt=created_before)
-            if keyword:
-                eligible_bounties = eligible_bounties.filter(raw_data__icontains=keyword)
-            numerator_bounties = eligible_bounties.filter(idx_status=status)
-            val = int(100 * (numerator_bounties.count()) / (eligible_bounties.count()))
-            val_rev = sum(numerator_bounties.values_list('_val_usd_db', flat=True))
+            num_eligible = sum(count for (_keyword, __), (count, __) in counts.items() if _keyword == keyword)
+            num_bounties, val_rev = counts.get((keyword, status), (0, 0))
+            val = int(100 * num_bounties / num_eligible) if num_eligible else 0
 
             key_connector = '_' if keyword else ''
             key_prefix = f'bounties_{status}{key_connector}{keyword}'
             stats_to_create = [
                 (f'{key_prefix}_pct', val),
-                (f'{key_prefix}_total', numerator_bounties.count()),
+                (f'{key_prefix}_total', num_bounties),
                 (f'{key_prefix}_value', val_rev),
                 ]
 
@@ -373,13 +386,15 @@ def joe_dominance_index(created_before=timezone.now()):
         for keyword in keywords:
             all_bounties = Bounty.objects.current().filter(network='mainnet', web3_created__gt=created_after, web3_created__lt=created_before)
             if keyword:
-                all_bounties = all_bounties.filter(raw_data__icontains=keyword)
+                all_bounties = all_bounties.with_keyword(keyword)
             joe_bounties = all_bounties.filter(bounty_owner_address__in=joe_addresses)
             if not all_bounties.count():
                 continue
 
             val = int(100 * (joe_bounties.count()) / (all_bounties.count()))
-            val_val = int(100 * sum([(b.value_in_usdt_now if b.value_in_usdt_now else 0) for b in joe_bounties]) / sum([(b.value_in_usdt_now if b.value_in_usdt_now else 0) for b in all_bounties]))
+            joe_value = joe_bounties.aggregate(value=Sum('value_in_usdt_now'))['value'] or 0
+            all_value = all_bounties.aggregate(value=Sum('value_in_usdt_now'))['value'] or 0
+            val_val = int(100 * joe_value / all_value) if all_value else 0
 
             key_connector = '_' if keyword else ''
             key_prefix = f'joe_dominance_index_{days}{key_connector}{keyword}'
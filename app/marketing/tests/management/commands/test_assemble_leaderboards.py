@@ -19,10 +19,15 @@ along with this program. If not, see <http://www.gnu.org/licenses/>.
 """
 from datetime import date, datetime, timedelta
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from dashboard.models import Bounty, BountyFulfillment, Profile, Tip, UserAction
+from marketing.leaderboards import LeaderboardEngine
 from marketing.management.commands import assemble_leaderboards
 from marketing.management.commands.assemble_leaderboards import (
-    BREAKDOWNS, TIMES, Command, bounty_index_terms, default_ranks, sum_bounties, sum_tips, tip_index_terms,
+    BREAKDOWNS, TIMES, Command, assemble_leaderboards_legacy, bounty_index_terms, default_ranks, sum_bounties, sum_tips,
+    tip_index_terms,
 )
 from marketing.models import LeaderboardRank
 from pytz import UTC
@@ -35,6 +40,7 @@ class TestAssembleLeaderboards(TestCase):
     def setUp(self):
         """Perform setup for the testcase."""
         assemble_leaderboards.ranks = default_ranks()
+        assemble_leaderboards.counts = default_ranks()
 
         self.bounty_value = 3
         self.bounty_payer_handle = 'flintstone'
@@ -289,3 +295,32 @@ class TestAssembleLeaderboards(TestCase):
         assert LeaderboardRank.objects.filter(leaderboard="all_tokens").count() == 1
         assert LeaderboardRank.objects.filter(leaderboard="all_countries").count() == 3
         assert LeaderboardRank.objects.filter(leaderboard="all_keywords").count() == 2
+
+    def test_engine_matches_legacy(self):
+        """Test that the single pass engine builds the same leaderboards as the per-row implementation."""
+        Bounty.objects.filter(pk=self.bounty.pk).update(idx_status='done', _val_usd_db=self.bounty_value)
+        assemble_leaderboards_legacy()
+
+        engine = LeaderboardEngine()
+        engine.aggregate()
+
+        assert engine.ranks == assemble_leaderboards.ranks
+        assert engine.counts == assemble_leaderboards.counts
+        assert engine.ranks['all_keywords'] == {'python': self.bounty_value, 'shell': self.bounty_value}
+
+    def test_engine_query_count(self):
+        """Test that the engine's query count doesn't scale with the number of bounties."""
+        Bounty.objects.filter(pk=self.bounty.pk).update(idx_status='done', _val_usd_db=self.bounty_value)
+        with CaptureQueriesContext(connection) as one_bounty:
+            LeaderboardEngine().run()
+
+        for i in range(10):
+            bounty = Bounty.objects.get(pk=self.bounty.pk)
+            bounty.pk = None
+            bounty.github_url = f'https://github.com/gitcoinco/web/issues/{i}'
+            bounty.save()
+            Bounty.objects.filter(pk=bounty.pk).update(idx_status='done', _val_usd_db=self.bounty_value)
+        with CaptureQueriesContext(connection) as many_bounties:
+            LeaderboardEngine().run()
+
+        assert len(many_bounties) <= len(one_bounty)
@@ -17,7 +17,7 @@ You should have received a copy of the GNU Affero General Public License
 along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 """
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from marketing.management.commands.roundup import Command
 from marketing.models import EmailSubscriber
@@ -65,4 +65,4 @@ class TestRoundup(TestCase):
 
         assert mock_weekly_roundup.call_count == 1
 
-        mock_weekly_roundup.assert_called_once_with(['jackson@bar.com'])
+        mock_weekly_roundup.assert_called_once_with(['jackson@bar.com'], checkpoint_key=ANY)
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""Handle bulk mail related tests.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from marketing.bulk_mail import BulkMailer, Checkpoint, SendGridClient, TokenBucket
+from marketing.sendgrid_stub import StubSendGridServer
+from test_plus.test import TestCase
+
+MESSAGE = {'from_email': 'founders@localhost', 'subject': 'Hi', 'text': 'Settings: -priv-', 'html': '<p>Hi</p>'}
+
+
+class FakeRedis:
+
+    def __init__(self):
+        self.sets = {}
+
+    def smembers(self, key):
+        return {member.encode() for member in self.sets.get(key, set())}
+
+    def pipeline(self):
+        return self
+
+    def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(members)
+
+    def expire(self, key, ttl):
+        pass
+
+    def execute(self):
+        pass
+
+
+class BulkMailTest(TestCase):
+    """Define tests for the bulk mailer."""
+
+    def setUp(self):
+        self.server = StubSendGridServer().start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def get_mailer(self, **kwargs):
+        client = SendGridClient(api_key='stub', host=self.server.host, pool_size=2)
+        kwargs.setdefault('debug', False)
+        return BulkMailer(client=client, requests_per_second=1000, max_workers=2, **kwargs)
+
+    def test_send(self):
+        """Test that recipients are sent in batches of up to 1000 personalizations over kept alive connections."""
+        recipients = [(f'user{i}@localhost', {'-priv-': f'priv{i}'}) for i in range(2500)]
+
+        assert self.get_mailer().send(MESSAGE, recipients) == 2500
+        assert self.server.num_requests == 3
+        assert sorted(self.server.recipients) == sorted(email for email, __ in recipients)
+        assert len(self.server.connections) <= 2
+
+    def test_rejected_recipients(self):
+        """Test that a rejected batch is split until only the addresses it was rejected over are left out."""
+        self.server.stop()
+        self.server = StubSendGridServer(rejected_emails=['user3@localhost', 'user6@localhost']).start()
+        recipients = [(f'user{i}@localhost', {}) for i in range(8)]
+
+        assert self.get_mailer().send(MESSAGE, recipients) == 6
+        assert sorted(self.server.recipients) == [f'user{i}@localhost' for i in [0, 1, 2, 4, 5, 7]]
+
+    def test_rejected_content(self):
+        """Test that a batch rejected over its content fails once, without being split."""
+        self.server.stop()
+        self.server = StubSendGridServer(rejected_subjects=['Hi']).start()
+        recipients = [(f'user{i}@localhost', {}) for i in range(8)]
+
+        assert self.get_mailer().send(MESSAGE, recipients) == 0
+        assert self.server.num_rejected == 1
+        assert self.server.recipients == []
+
+    def test_debug(self):
+        """Test that a debug send only reaches the contact email, and that nothing is sent without an API key."""
+        recipients = [(f'user{i}@localhost', {'-priv-': f'priv{i}'}) for i in range(10)]
+
+        with self.settings(CONTACT_EMAIL='founders@localhost'):
+            assert self.get_mailer(debug=True).send(MESSAGE, recipients) == 1
+        assert self.server.recipients == ['founders@localhost']
+
+        self.server.reset()
+        with self.settings(SENDGRID_API_KEY=''):
+            client = SendGridClient(host=self.server.host)
+            assert BulkMailer(client=client, requests_per_second=1000, debug=False).send(MESSAGE, recipients) == 0
+        assert self.server.num_requests == 0
+
+    def test_checkpoint(self):
+        """Test that a send resumes where an earlier one stopped."""
+        checkpoint = Checkpoint('test', client=FakeRedis())
+        recipients = [(f'user{i}@localhost', {}) for i in range(10)]
+        self.get_mailer(checkpoint=checkpoint, batch_size=4).send(MESSAGE, recipients[:6])
+        self.server.reset()
+
+        assert self.get_mailer(checkpoint=checkpoint).send(MESSAGE, recipients) == 4
+        assert sorted(self.server.recipients) == [f'user{i}@localhost' for i in range(6, 10)]
+
+    def test_token_bucket(self):
+        """Test that the token bucket waits for the tokens it is short of."""
+        now = [0]
+        waits = []
+
+        def sleep(seconds):
+            waits.append(seconds)
+            now[0] += seconds
+
+        bucket = TokenBucket(2, clock=lambda: now[0], sleep=sleep)
+        for __ in range(4):
+            bucket.acquire()
+        assert waits == [0.5, 0.5]
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Handle keyword index related tests.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from dashboard.models import Bounty
+from marketing.keyword_index import KeywordIndex
+from test_plus.test import TestCase
+
+
+class KeywordIndexTest(TestCase):
+    """Define tests for the keyword index."""
+
+    def setUp(self):
+        self.index = KeywordIndex([
+            Bounty(pk=1, title='Port the CLI', issue_description='', metadata={'issueKeywords': 'Python, Django'}),
+            Bounty(pk=2, title='Fix javascript builds', issue_description='', metadata={'issueKeywords': 'javascript'}),
+            Bounty(pk=3, title='Write docs', issue_description='in java', metadata={'issueKeywords': 'javascript'}),
+            Bounty(pk=4, title='Add a python binding', issue_description='', metadata={}),
+        ])
+
+    def test_lookup(self):
+        """Test that keywords match issue keywords, or issue keywords that also appear in the title or description."""
+        assert self.index.lookup(' PYTHON ') == {1}
+        assert self.index.lookup('java') == {2, 3}
+        assert self.index.lookup('script') == {2}
+        assert self.index.lookup('rust') == set()
+        assert self.index.lookup('') == set()
+
+    def test_group_by_matches(self):
+        """Test that subscribers matching the same bounties are grouped, and those matching no new bounty left out."""
+        groups = self.index.group_by_matches({
+            'a@localhost': ['python', 'java'],
+            'b@localhost': ['Django', 'JAVA'],
+            'c@localhost': ['script'],
+            'd@localhost': ['rust'],
+        }, new_bounty_ids=frozenset([1, 3]))
+
+        assert groups == {
+            (frozenset([1, 3]), frozenset([2])): ['a@localhost', 'b@localhost'],
+        }
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""Handle incremental leaderboard related tests.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.utils import timezone
+
+from app.utils import get_raw_cache_client
+from dashboard.models import Bounty
+from marketing.leaderboards import KEYWORDS, GithubRepoIndex, LeaderboardEngine, LeaderboardStore, is_org_or_repo_name
+from test_plus.test import TestCase
+
+
+class TestLeaderboardStore(LeaderboardStore):
+    prefix = 'test_leaderboard'
+
+
+class LeaderboardStoreTest(TestCase):
+    """Define tests for the incremental leaderboard store."""
+
+    def setUp(self):
+        self.store = TestLeaderboardStore(get_raw_cache_client())
+        self.store.rebuild([])
+
+    def tearDown(self):
+        self.store.rebuild([])
+
+    def test_apply_adds_contributions(self):
+        """Test that contributions are added to the all time and windowed leaderboards."""
+        now = timezone.now()
+        self.store.apply('tip_1', now, [('earners', 'john', 7.0), ('payers', 'johnny', 7.0)])
+        self.store.apply('tip_2', now, [('earners', 'john', 3.0)])
+
+        assert self.store.get_leaderboard('all_earners') == [('john', 10.0, 2)]
+        assert self.store.get_leaderboard('weekly_earners') == [('john', 10.0, 2)]
+        assert self.store.get_leaderboard('all_payers') == [('johnny', 7.0, 1)]
+
+    def test_apply_replaces_contributions(self):
+        """Test that re-applying an object's contributions subtracts the old ones."""
+        now = timezone.now()
+        self.store.apply('bounty_mainnet_1', now, [('earners', 'freddy', 3.0)])
+        self.store.apply('bounty_mainnet_1', now, [('earners', 'bambam', 5.0)])
+
+        assert self.store.get_leaderboard('all_earners') == [('bambam', 5.0, 1)]
+
+        self.store.apply('bounty_mainnet_1', now, [])
+        assert self.store.get_leaderboard('all_earners') == []
+
+    def test_old_contributions_age_out(self):
+        """Test that contributions older than a window are not part of it."""
+        self.store.apply('tip_1', timezone.now() - timezone.timedelta(days=60), [('earners', 'john', 7.0)])
+
+        assert self.store.get_leaderboard('all_earners') == [('john', 7.0, 1)]
+        assert self.store.get_leaderboard('quarterly_earners') == [('john', 7.0, 1)]
+        assert self.store.get_leaderboard('monthly_earners') == []
+
+    def test_rebuild_replays_concurrent_applies(self):
+        """Test that the store stays readable during a rebuild, and keeps the objects applied meanwhile."""
+        now = timezone.now()
+        self.store.apply('tip_1', now, [('earners', 'john', 7.0)])
+        replay_journal = self.store.replay_journal
+
+        def replay_then_apply(version):
+            replay_journal(version)
+            if not replayed:
+                # an object applied after the replay, so the rebuild has to replay again before switching
+                self.store.apply('tip_2', now, [('earners', 'jane', 9.0)])
+                assert self.store.get_leaderboard('all_earners') == [('jane', 9.0, 1), ('john', 7.0, 1)]
+            replayed.append(version)
+
+        replayed = []
+        with patch.object(self.store, 'replay_journal', side_effect=replay_then_apply):
+            assert self.store.rebuild([('tip_1', now, [('earners', 'john', 7.0)])])
+
+        assert len(replayed) == 2
+        assert self.store.get_leaderboard('all_earners') == [('jane', 9.0, 1), ('john', 7.0, 1)]
+
+
+class LeaderboardEngineTest(TestCase):
+    """Define tests for the contributions of a single object."""
+
+    def test_contributions_for_skips_org_keywords(self):
+        """Test that keywords naming a github org or repo of a bounty are not ranked."""
+        bounty = Bounty.objects.create(
+            title='foo',
+            value_in_token=3,
+            token_name='USDT',
+            web3_created=timezone.now(),
+            github_url='https://github.com/gitcoinco/web/issues/1',
+            token_address='0x0',
+            issue_description='hello world',
+            bounty_owner_github_username='flintstone',
+            is_open=False,
+            accepted=True,
+            expires_date=timezone.now() + timedelta(days=1),
+            raw_data={},
+            current_bounty=True,
+            network='mainnet',
+            metadata={'issueKeywords': 'Python, Gitcoinco, Web'},
+        )
+        bounty.idx_status = 'done'
+        bounty._val_usd_db = 3
+
+        __, __, contributions = LeaderboardEngine().contributions_for(bounty)
+        assert [index_term for breakdown, index_term, __ in contributions if breakdown == KEYWORDS] == ['python']
+
+    def test_org_or_repo_name_paths_agree(self):
+        """Test that the incremental and the full aggregation tell github org and repo names apart the same way."""
+        Bounty.objects.create(
+            title='foo',
+            value_in_token=3,
+            token_name='USDT',
+            web3_created=timezone.now(),
+            github_url='https://github.com/web3/py/issues/1',
+            token_address='0x0',
+            issue_description='hello world',
+            bounty_owner_github_username='flintstone',
+            expires_date=timezone.now() + timedelta(days=1),
+            raw_data={},
+            current_bounty=True,
+            network='mainnet',
+        )
+        index = GithubRepoIndex(Bounty.objects.values_list('github_org', 'github_repo').distinct())
+
+        for term, expected in [('Web3', True), ('py', True), ('web3/py', True), ('web', False), ('issues', False)]:
+            assert is_org_or_repo_name(term) == expected, term
+            assert index.is_org_or_repo_name(term) == expected, term
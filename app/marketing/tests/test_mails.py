@@ -22,7 +22,7 @@ from unittest.mock import patch
 from django.utils import timezone
 
 from dashboard.models import Profile
-from marketing.mails import nth_day_email_campaign, setup_lang
+from marketing.mails import get_bulk_recipients, nth_day_email_campaign, setup_lang
 from retail.emails import render_nth_day_email_campaign
 from test_plus.test import TestCase
 
@@ -77,3 +77,10 @@ class MarketingMailsTest(TestCase):
 
         nth_day_email_campaign(self.days[2], self.user)
         assert mock_send_mail.call_count == 1
+
+    def test_get_bulk_recipients(self):
+        """Test that addresses differing only in case are sent to once, with the language of their user."""
+        recipients = get_bulk_recipients([self.email, 'USER1@gitcoin.co', 'user2@gitcoin.co'], 'roundup')
+
+        assert list(recipients) == ['en-us']
+        assert [email for email, __ in recipients['en-us']] == [self.email, 'user2@gitcoin.co']
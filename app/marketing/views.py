@@ -27,6 +27,7 @@ from django.contrib import messages
 from django.contrib.admin.views.decorators import staff_member_required
 from django.core.validators import validate_email
 from django.db.models import Max
+from django.db.models.functions import Lower
 from django.http import Http404, HttpResponse
 from django.shortcuts import redirect
 from django.template.response import TemplateResponse
@@ -42,6 +43,7 @@ from dashboard.utils import create_user_action
 from enssubdomain.models import ENSSubdomainRegistration
 from gas.utils import recommend_min_gas_price_to_confirm_in_time
 from mailchimp3 import MailChimp
+from marketing.leaderboards import LeaderboardStore
 from marketing.mails import new_feedback
 from marketing.models import AccountDeletionRequest, EmailSubscriber, Keyword, LeaderboardRank
 from marketing.utils import get_or_save_email_subscriber, validate_discord_integration, validate_slack_integration
@@ -707,6 +709,18 @@ def leaderboard(request, key=''):
         raise Http404
 
     title = titles[key]
+    if not keyword_search and settings.LEADERBOARD_INCREMENTAL:
+        items = get_incremental_leaderboard(key, limit)
+        if items is not None:
+            top_earners = ''
+            if items:
+                top_earners = ['@' + item.github_username for item in items[0:3]]
+                top_earners = f'The top earners of this period are {", ".join(top_earners)}'
+            technologies = set(tech for item in items for tech in item.tech_keywords)
+            return leaderboard_response(
+                request, key, title, titles, items, items[0].amount if items else 0, top_earners, technologies
+            )
+
     if keyword_search:
         ranks = LeaderboardRank.objects.filter(active=True, leaderboard=key, tech_keywords__icontains=keyword_search)
     else:
@@ -730,11 +744,55 @@ def leaderboard(request, key=''):
     else:
         amount_max = 0
 
+    return leaderboard_response(request, key, title, titles, items[0:limit], amount_max, top_earners, technologies)
+
+
+def get_incremental_leaderboard(key, limit):
+    """Get the leaderboard rows from the incremental (redis) leaderboards.
+
+    Returns:
+        list: Unsaved LeaderboardRank objects, or None if the incremental leaderboards are unavailable.
+
+    """
+    store = LeaderboardStore()
+    if not store.redis:
+        return None
+    try:
+        rows = store.get_leaderboard(key, limit)
+    except Exception as e:
+        logger.error(f'Failed to read the incremental leaderboard {key} - ({e})')
+        return None
+    if not rows:
+        # fall back to the LeaderboardRank table until the store has been built
+        return None
+
+    profiles = {}
+    handles = [index_term.lower() for index_term, _, _ in rows]
+    for profile in Profile.objects.annotate(lower_handle=Lower('handle')).filter(lower_handle__in=handles).order_by('pk'):
+        profiles[profile.lower_handle] = profile
+
+    items = []
+    for rank, (index_term, amount, count) in enumerate(rows, 1):
+        profile = profiles.get(index_term.lower())
+        items.append(LeaderboardRank(
+            leaderboard=key,
+            github_username=index_term,
+            amount=amount,
+            count=count,
+            rank=rank,
+            active=True,
+            profile=profile,
+            tech_keywords=profile.keywords if profile else [],
+        ))
+    return items
+
+
+def leaderboard_response(request, key, title, titles, items, amount_max, top_earners, technologies):
     profile_keys = ['_tokens', '_keywords', '_cities', '_countries', '_continents']
     is_linked_to_profile = any(sub in key for sub in profile_keys)
 
     context = {
-        'items': items[0:limit],
+        'items': items,
         'titles': titles,
         'selected': title,
         'is_linked_to_profile': is_linked_to_profile,
@@ -746,7 +804,7 @@ def leaderboard(request, key=''):
         'podium_items': items[:3] if items else [],
         'technologies': technologies
     }
-    
+
     return TemplateResponse(request, 'leaderboard.html', context)
 
 @staff_member_required
@@ -15,47 +15,18 @@
     along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 '''
-
 from django.core.management.base import BaseCommand
-from django.db import transaction
-from django.utils import timezone
 
-from dashboard.gas_views import lines
-from gas.utils import gas_history
-from perftools.models import JSONStore
+from perftools.page_cache import build
 
 
 class Command(BaseCommand):
 
     help = 'generates some gas history objects for the gitcoin gas station'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', dest='workers', default=None, type=int,
+                            help='number of processes to build histories with (default: number of CPUs)')
+
     def handle(self, *args, **options):
-        hour = int(timezone.now().strftime('%H'))
-        day = int(timezone.now().weekday())
-        print(hour, day)
-
-        # hourly all the time
-        # daily once a day
-        # weekly once a week
-        breakdowns = ['hourly']
-        if hour <= 0:
-            breakdowns.append('daily')
-            if day <= 0:
-                breakdowns.append('weekly')
-
-        with transaction.atomic():
-            items = []
-            for breakdown in breakdowns:
-                JSONStore.objects.filter(key__startswith=breakdown).all().delete()
-                for i, __ in lines.items():
-                    view = 'gas_history'
-                    key = f"{breakdown}:{i}"
-                    print(f"- executing {breakdown} {key}")
-                    data = gas_history(breakdown, i)
-                    print("- creating")
-                    items.append(JSONStore(
-                        view=view,
-                        key=key,
-                        data=data,
-                        ))
-            JSONStore.objects.bulk_create(items)
+        build(['gas_history'], options['workers'])
@@ -15,71 +15,18 @@
     along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 '''
-
-import json
-
-from django.conf import settings
 from django.core.management.base import BaseCommand
-from django.core.serializers.json import DjangoJSONEncoder
-from django.db import models, transaction
-from django.db.models.query import QuerySet
-from django.forms.models import model_to_dict
-from django.utils.encoding import force_text
-from django.utils.functional import Promise
-
-from economy.models import EncodeAnything, SuperModel
-from perftools.models import JSONStore
-from retail.utils import build_stat_results, programming_languages
-
-
-def create_results_cache():
-    print('results')
-    keywords = [''] + programming_languages
-    if settings.DEBUG:
-        keywords = ['']
-    view = 'results'
-    with transaction.atomic():
-        items = []
-        JSONStore.objects.filter(view=view).all().delete()
-        for keyword in keywords:
-            print(f"- executing {keyword}")
-            data = build_stat_results(keyword)
-            print("- creating")
-            items.append(JSONStore(
-                view=view,
-                key=keyword,
-                data=json.loads(json.dumps(data, cls=EncodeAnything)),
-                ))
-        JSONStore.objects.bulk_create(items)
-
-
-def create_contributor_landing_page_context():
-    print('create_contributor_landing_page_context')
-    keywords = [''] + programming_languages
-    if settings.DEBUG:
-        keywords = ['']
-    view = 'contributor_landing_page'
-    from retail.views import get_contributor_landing_page_context
-    with transaction.atomic():
-        items = []
-        JSONStore.objects.filter(view=view).all().delete()
-        for keyword in keywords:
-            print(f"- executing {keyword}")
-            data = get_contributor_landing_page_context(keyword)
-            print("- creating")
-            items.append(JSONStore(
-                view=view,
-                key=keyword,
-                data=json.loads(json.dumps(data, cls=EncodeAnything)),
-                ))
-        JSONStore.objects.bulk_create(items)
 
+from perftools.page_cache import build
 
 
 class Command(BaseCommand):
 
     help = 'generates some /results data'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', dest='workers', default=None, type=int,
+                            help='number of processes to build pages with (default: number of CPUs)')
+
     def handle(self, *args, **options):
-        create_results_cache()
-        create_contributor_landing_page_context()
+        build(['results', 'contributor_landing_page'], options['workers'])
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""Define the page cache builder.
+
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import json
+import multiprocessing
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils import timezone
+
+from economy.models import EncodeAnything
+from perftools.models import JSONStore
+
+CacheEntry = namedtuple('CacheEntry', ['view', 'key', 'producer', 'args'])
+
+# name => (function returning the CacheEntry list of a group of pages, whether to prune keys it didn't produce)
+registry = OrderedDict()
+
+
+def register(name, prune=True):
+    """Register a function returning the (view, key) entries of a group of cached pages.
+
+    Args:
+        name (str): The name of the group.
+        prune (bool): Whether to delete the entries of its views it no longer produces after a build.
+
+    """
+    def decorator(fn):
+        registry[name] = (fn, prune)
+        return fn
+    return decorator
+
+
+def swap_in(view, key, data):
+    """Replace the JSONStore entry for view/key.
+
+    The new row is written before the old ones are deleted, in one transaction, so
+    readers keep getting the old entry until the new one is committed.
+
+    """
+    with transaction.atomic():
+        entry = JSONStore.objects.create(view=view, key=key, data=data)
+        JSONStore.objects.filter(view=view, key=key).exclude(pk=entry.pk).delete()
+    return entry
+
+
+def build_entry(entry):
+    """Produce and store a single entry.
+
+    Returns:
+        tuple: The number of seconds it took and the error, if any.
+
+    """
+    start_time = time.time()
+    try:
+        data = entry.producer(*entry.args)
+        swap_in(entry.view, entry.key, json.loads(json.dumps(data, cls=EncodeAnything)))
+    except Exception as e:
+        # exceptions are passed back from the worker processes as text, as they might not be picklable
+        return time.time() - start_time, repr(e)
+    return time.time() - start_time, None
+
+
+def prune(entries):
+    """Delete the entries of the built views whose keys were not produced this time."""
+    keys_by_view = {}
+    for entry in entries:
+        keys_by_view.setdefault(entry.view, set()).add(entry.key)
+    for view, keys in keys_by_view.items():
+        JSONStore.objects.filter(view=view).exclude(key__in=keys).delete()
+
+
+def build(names, workers=None):
+    """Build the given groups of cached pages, in parallel across a pool of processes.
+
+    Every entry is built and swapped in on its own. A failing entry is reported and
+    leaves its previous version in place.
+
+    Args:
+        names (list of str): The registered groups to build.
+        workers (int): The number of processes. Defaults to the number of CPUs.
+
+    Returns:
+        bool: Whether every entry was built.
+
+    """
+    groups = [(registry[name][0](), registry[name][1]) for name in names]
+    entries = [entry for group_entries, __ in groups for entry in group_entries]
+    workers = workers or multiprocessing.cpu_count()
+    start_time = time.time()
+
+    if workers <= 1:
+        results = zip(entries, map(build_entry, entries))
+    else:
+        # forked workers must not share the parent's database connections
+        connections.close_all()
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'))
+        with executor:
+            futures = {executor.submit(build_entry, entry): entry for entry in entries}
+            results = [(futures[future], future.result()) for future in as_completed(futures)]
+
+    failures = 0
+    for entry, (elapsed, error) in results:
+        if error:
+            failures += 1
+            print(f"- failed {entry.view} {entry.key} after {round(elapsed, 2)}s: {error}")
+        else:
+            print(f"- built {entry.view} {entry.key} in {round(elapsed, 2)}s")
+
+    if not failures:
+        for group_entries, should_prune in groups:
+            if should_prune:
+                prune(group_entries)
+    print(f"built {len(entries) - failures}/{len(entries)} entries with {workers} workers "
+          f"in {round(time.time() - start_time, 2)}s")
+    return not failures
+
+
+def get_keywords():
+    from retail.utils import programming_languages
+    if settings.DEBUG:
+        return ['']
+    return [''] + programming_languages
+
+
+@register('results')
+def results_entries():
+    from retail.utils import build_stat_results
+    return [CacheEntry('results', keyword, build_stat_results, (keyword, )) for keyword in get_keywords()]
+
+
+@register('contributor_landing_page')
+def contributor_landing_page_entries():
+    from retail.views import get_contributor_landing_page_context
+    return [
+        CacheEntry('contributor_landing_page', keyword, get_contributor_landing_page_context, (keyword, ))
+        for keyword in get_keywords()
+    ]
+
+
+@register('d3')
+def d3_entries():
+    from dataviz.d3_views import get_all_type_options, viz_graph_data_helper, viz_scatterplot_data_helper
+    from retail.utils import programming_languages
+    keywords = [''] + programming_languages
+    entries = []
+    for keyword in keywords:
+        for hide_username in [True, False]:
+            entries.append(CacheEntry(
+                'd3_scatterplot', f"{keyword}_{hide_username}", viz_scatterplot_data_helper, (keyword, hide_username)
+            ))
+    for keyword in keywords:
+        for _type in get_all_type_options():
+            for hide_pii in [True, False]:
+                entries.append(CacheEntry(
+                    'd3_graph', f"{_type}_{keyword}_{hide_pii}", viz_graph_data_helper, (_type, keyword, hide_pii)
+                ))
+    return entries
+
+
+def get_gas_history_breakdowns(now=None):
+    """Get the gas history breakdowns due: hourly all the time, daily once a day, weekly once a week."""
+    now = now or timezone.now()
+    breakdowns = ['hourly']
+    if now.hour <= 0:
+        breakdowns.append('daily')
+        if now.weekday() <= 0:
+            breakdowns.append('weekly')
+    return breakdowns
+
+
+@register('gas_history', prune=False)
+def gas_history_entries():
+    from dashboard.gas_views import lines
+    from gas.utils import gas_history
+    return [
+        CacheEntry('gas_history', f"{breakdown}:{i}", gas_history, (breakdown, i))
+        for breakdown in get_gas_history_breakdowns() for i in lines.keys()
+    ]
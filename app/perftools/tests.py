@@ -1,3 +1,62 @@
-from django.test import TestCase
+# -*- coding: utf-8 -*-
+"""Handle page cache builder related tests.
 
-# Create your tests here.
+Copyright (C) 2019 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from unittest.mock import patch
+
+from perftools.models import JSONStore
+from perftools.page_cache import CacheEntry, build, swap_in
+from test_plus.test import TestCase
+
+
+def produce(key):
+    if key == 'broken':
+        raise ValueError(key)
+    return {'key': key}
+
+
+class PageCacheTest(TestCase):
+    """Define tests for the page cache builder."""
+
+    def test_swap_in(self):
+        """Test that swapping in an entry replaces the previous one."""
+        swap_in('results', 'python', {'version': 1})
+        swap_in('results', 'python', {'version': 2})
+
+        assert JSONStore.objects.get(view='results', key='python').data == {'version': 2}
+
+    def test_build(self):
+        """Test that a build stores every entry and prunes keys that are no longer produced."""
+        swap_in('test_view', 'gone', {})
+        registry = {'test': (lambda: [CacheEntry('test_view', key, produce, (key, )) for key in ['a', 'b']], True)}
+        with patch('perftools.page_cache.registry', registry):
+            assert build(['test'], workers=1)
+
+        assert sorted(JSONStore.objects.filter(view='test_view').values_list('key', flat=True)) == ['a', 'b']
+        assert JSONStore.objects.get(view='test_view', key='a').data == {'key': 'a'}
+
+    def test_build_failure_keeps_previous_entries(self):
+        """Test that a failing entry leaves the previous version in place."""
+        swap_in('test_view', 'broken', {'version': 1})
+        swap_in('test_view', 'gone', {})
+        registry = {'test': (lambda: [CacheEntry('test_view', key, produce, (key, )) for key in ['a', 'broken']], True)}
+        with patch('perftools.page_cache.registry', registry):
+            assert not build(['test'], workers=1)
+
+        assert JSONStore.objects.get(view='test_view', key='broken').data == {'version': 1}
+        assert JSONStore.objects.filter(view='test_view', key='gone').exists()
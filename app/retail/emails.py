@@ -512,16 +512,18 @@ appreciate you being a part of the community and let me know if you'd like some
     return response_html, response_txt
 
 
-def render_new_bounty(to_email, bounties, old_bounties):
-    sub = get_or_save_email_subscriber(to_email, 'internal')
+def render_new_bounty(to_email, bounties, old_bounties, subscriber=None, keywords=None, text_keywords=None):
+    sub = subscriber or get_or_save_email_subscriber(to_email, 'internal')
     params = {
         'old_bounties': old_bounties,
         'bounties': bounties,
         'subscriber': sub,
-        'keywords': ",".join(sub.keywords),
+        'keywords': keywords if keywords is not None else ",".join(sub.keywords),
     }
 
     response_html = premailer_transform(render_to_string("emails/new_bounty.html", params))
+    if text_keywords is not None:
+        params = dict(params, keywords=text_keywords)
     response_txt = render_to_string("emails/new_bounty.txt", params)
 
     return response_html, response_txt
@@ -907,7 +909,7 @@ def render_start_work_applicant_expired(interest, bounty):
 
 
 # ROUNDUP_EMAIL
-def render_new_bounty_roundup(to_email):
+def render_new_bounty_roundup(to_email, subscriber=None):
     from dashboard.models import Bounty
     subject = "$40K To OSS | Gitcoin's ETHDenver "
     new_kudos_pks = [1839, 1838, 1837]
@@ -1010,8 +1012,8 @@ Back to shipping,
     bounties = []
     for nb in bounties_spec:
         try:
-            bounty = Bounty.objects.current().filter(
-                github_url__iexact=nb['url'],
+            bounty = Bounty.objects.current().for_github_url(
+                nb['url'],
             ).order_by('-web3_created').first()
             if bounty:
                 bounties.append({
@@ -1029,7 +1031,7 @@ Back to shipping,
         'invert_footer': False,
         'hide_header': False,
         'highlights': highlights,
-        'subscriber': get_or_save_email_subscriber(to_email, 'internal'),
+        'subscriber': subscriber or get_or_save_email_subscriber(to_email, 'internal'),
         'kudos_highlights': kudos_highlights,
     }
 
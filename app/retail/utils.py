@@ -24,6 +24,7 @@ import statistics
 import time
 
 from django.conf import settings
+from django.db.models import Aggregate, FloatField
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -209,7 +210,7 @@ def get_completion_rate(keyword):
     from dashboard.models import Bounty
     base_bounties = Bounty.objects.current().filter(network='mainnet', idx_status__in=['done', 'expired', 'cancelled'])
     if keyword:
-        base_bounties = base_bounties.filter(raw_data__icontains=keyword)
+        base_bounties = base_bounties.with_keyword(keyword)
     eligible_bounties = base_bounties.filter(created_on__gt=(timezone.now() - timezone.timedelta(days=60)))
     eligible_bounties = eligible_bounties.exclude(interested__isnull=True)
     completed_bounties = eligible_bounties.filter(idx_status__in=['done']).count()
@@ -226,7 +227,7 @@ def get_funder_receiver_stats(keyword):
     from dashboard.models import Bounty, BountyFulfillment, Tip
     base_bounties = Bounty.objects.current().filter(network='mainnet')
     if keyword:
-        base_bounties = base_bounties.filter(raw_data__icontains=keyword)
+        base_bounties = base_bounties.with_keyword(keyword)
 
     eligible_bounties = base_bounties
     eligible_bounty_fulfillments = BountyFulfillment.objects.filter(bounty__in=base_bounties)
@@ -252,37 +253,49 @@ def get_base_done_bounties(keyword):
     from dashboard.models import Bounty
     base_bounties = Bounty.objects.current().filter(network='mainnet', idx_status__in=['done', 'expired', 'cancelled'])
     if keyword:
-        base_bounties = base_bounties.filter(raw_data__icontains=keyword)
+        base_bounties = base_bounties.with_keyword(keyword)
     return base_bounties
 
 
-def is_valid_bounty_for_headline_hourly_rate(bounty):
-    hourly_rate = bounty.hourly_rate
-    if None is hourly_rate:
-        return False
+def get_base_done_bounty_stats(keyword):
+    """Get the stats of the bounties behind the results page (see `get_base_done_bounties`)."""
+    from dashboard.models import Bounty, BountyStats
+    base_stats = BountyStats.objects.filter(
+        bounty__current_bounty=True,
+        bounty__admin_override_and_hide=False,
+        bounty__network='mainnet',
+        bounty__idx_status__in=['done', 'expired', 'cancelled'],
+    )
+    if keyword:
+        base_stats = base_stats.filter(bounty_id__in=Bounty.objects.with_keyword(keyword).values('pk'))
+    return base_stats
+
 
-    # smaller bounties were skewing the results
-    min_hours = 3
-    min_value_usdt = 300
-    if bounty.value_in_usdt < min_value_usdt:
-        return False
-    for ful in bounty.fulfillments.filter(accepted=True):
-        if ful.fulfiller_hours_worked and ful.fulfiller_hours_worked < min_hours:
-            return False
+class Median(Aggregate):
+    """Compute the median of an expression with postgres' percentile_cont."""
 
-    return True
+    function = 'percentile_cont'
+    name = 'Median'
+    template = '%(function)s(0.5) WITHIN GROUP (ORDER BY %(expressions)s)'
+
+    def __init__(self, expression, **extra):
+        super().__init__(expression, output_field=FloatField(), **extra)
 
 
 def get_hourly_rate_distribution(keyword, bounty_value_range=None, methodology=None):
     if not methodology:
         methodology = 'quartile' if not keyword else 'minmax'
-    base_bounties = get_base_done_bounties(keyword)
+    base_stats = get_base_done_bounty_stats(keyword).filter(hourly_rate__isnull=False)
     if bounty_value_range:
-        base_bounties = base_bounties.filter(_val_usd_db__lt=bounty_value_range[1], _val_usd_db__gt=bounty_value_range[0])
-        hourly_rates = [ele.hourly_rate for ele in base_bounties if ele.hourly_rate is not None]
-        # print(bounty_value_range, len(hourly_rates))
+        base_stats = base_stats.filter(
+            bounty___val_usd_db__lt=bounty_value_range[1], bounty___val_usd_db__gt=bounty_value_range[0]
+        )
     else:
-        hourly_rates = [ele.hourly_rate for ele in base_bounties if is_valid_bounty_for_headline_hourly_rate(ele)]
+        # smaller bounties were skewing the results
+        min_hours = 3
+        min_value_usdt = 300
+        base_stats = base_stats.filter(value_in_usdt__gte=min_value_usdt).exclude(min_hours_worked__lt=min_hours)
+    hourly_rates = list(base_stats.values_list('hourly_rate', flat=True))
     if len(hourly_rates) == 1:
         return f"${round(hourly_rates[0], 2)}"
     if len(hourly_rates) < 2:
@@ -310,20 +323,13 @@ def get_hourly_rate_distribution(keyword, bounty_value_range=None, methodology=N
 
 
 def get_bounty_median_turnaround_time(func='turnaround_time_started', keyword=None):
-    base_bounties = get_base_done_bounties(keyword)
-    eligible_bounties = base_bounties.exclude(idx_status='open') \
-        .filter(created_on__gt=(timezone.now() - timezone.timedelta(days=60)))
-    pickup_time_hours = []
-    for bounty in eligible_bounties:
-        tat = getattr(bounty, func)
-        if tat:
-            pickup_time_hours.append(tat / 60 / 60)
-
-    pickup_time_hours.sort()
-    try:
-        return statistics.median(pickup_time_hours)
-    except statistics.StatisticsError:
+    eligible_stats = get_base_done_bounty_stats(keyword).exclude(bounty__idx_status='open') \
+        .filter(bounty__created_on__gt=(timezone.now() - timezone.timedelta(days=60))) \
+        .filter(**{f'{func}__isnull': False}).exclude(**{func: 0})
+    median = eligible_stats.aggregate(median=Median(func))['median']
+    if median is None:
         return 0
+    return median / 60 / 60
 
 
 def get_bounty_history(keyword=None, cumulative=True):
@@ -396,7 +402,7 @@ def build_stat_results(keyword=None):
     if keyword:
         base_email_subscribers = EmailSubscriber.objects.filter(keywords__icontains=keyword).cache()
         base_profiles = base_email_subscribers.select_related('profile')
-        base_bounties = base_bounties.filter(raw_data__icontains=keyword).cache()
+        base_bounties = base_bounties.with_keyword(keyword).cache()
         profile_pks = base_profiles.values_list('profile', flat=True)
         profile_usernames = base_profiles.values_list('profile__handle', flat=True)
         profile_usernames = list(profile_usernames) + list([bounty.github_repo_name for bounty in base_bounties])
@@ -463,8 +469,8 @@ def build_stat_results(keyword=None):
     bounty_abandonment_rate = round(100 - completion_rate, 1)
     total_bounties_usd = sum(base_bounties.exclude(idx_status__in=['expired', 'cancelled', 'canceled', 'unknown']).values_list('_val_usd_db', flat=True))
     total_tips_usd = sum([
-        tip.value_in_usdt
-        for tip in Tip.objects.filter(network='mainnet').send_happy_path() if tip.value_in_usdt
+        value
+        for value in Tip.objects.filter(network='mainnet').send_happy_path().values_in_usdt() if value
     ])
     total_grants_usd = get_grants_history_at_date(timezone.now(), [])
     total_kudos_usd = get_kudos_history_at_date(timezone.now(), [])
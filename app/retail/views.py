@@ -62,7 +62,7 @@ def get_activities(tech_stack=None, num_activities=15):
     if tech_stack:
         activities = activities.filter(bounty__metadata__icontains=tech_stack)
     activities = activities[0:num_activities]
-    return [a.view_props for a in activities]
+    return [a.view_props for a in activities.with_view_props()]
 
 @staff_member_required
 def index(request):
@@ -910,7 +910,7 @@ def activity(request):
         'page': p.get_page(page),
         'title': _('Activity Feed'),
     }
-    context["activities"] = [a.view_props for a in p.get_page(page)]
+    context["activities"] = [a.view_props for a in context['page'].object_list.with_view_props()]
 
     return TemplateResponse(request, 'activity.html', context)
 